@@ -9,7 +9,8 @@ from django.utils import timezone
 from django import forms
 from django.forms import DateTimeInput
 from django.conf import settings
-from django.db.models import Count, Q
+from django.db.models import Count, Max, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 import logging
 import datetime
 
@@ -19,7 +20,7 @@ from .models import (
     SubscriptionProductDetail, StandardProductDetail, ProductCustomField,
     ProductCustomValue, ParticipantConsent, PhoneVerification, Banner, Event,
     Review, NoShowReport, BidToken, BidTokenPurchase, BidTokenAdjustmentLog,
-    Notification, PushToken, NotificationSetting
+    Notification, PushToken, NotificationSetting, BackgroundJob
 )
 from .models_payment import Payment, RefundRequest
 from .models_verification import BusinessNumberVerification
@@ -30,6 +31,7 @@ from .admin_notice import NoticeAdmin, NoticeCommentAdmin
 from .models_popup import Popup
 from .admin_popup import PopupAdmin
 from .models_region import Region
+from .admin_pagination import EstimatedCountPaginator
 from .views_auth import kakao_unlink
 from .forms import UserCreationForm, UserChangeForm
 
@@ -309,9 +311,27 @@ class UserAdmin(admin.ModelAdmin):
     search_fields = ['username', 'email', 'business_number', 'nickname', 'phone_number', 'first_name', 'last_name', 'representative_name']
     ordering = ['-date_joined']  # 최신 가입자 순으로 정렬
     list_per_page = 50  # 50명 단위로 변경 (검색 성능 향상)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False  # 필터 적용 시 전체 회원 수 COUNT 생략
     readonly_fields = ('display_business_reg_file_preview', 'sns_type', 'sns_id', 'get_bid_tokens_summary', 'get_adjustment_history', 'get_quick_token_adjustment')
     autocomplete_fields = []  # 자동완성 필드 초기화
     
+    def get_queryset(self, request):
+        """목록 컬럼(입찰권 수, 구독권, 전문가 업종)을 행마다 조회하지 않도록 미리 집계"""
+        qs = super().get_queryset(request).select_related('expert_profile__category')
+        # 페이지에 표시되는 행에 대해서만 계산되도록 GROUP BY 대신 상관 서브쿼리 사용
+        tokens = BidToken.objects.filter(seller=OuterRef('pk'), status='active').order_by()
+        return qs.annotate(
+            active_single_tokens=Coalesce(
+                Subquery(tokens.filter(token_type='single').values('seller').annotate(c=Count('id')).values('c')),
+                0
+            ),
+            subscription_expires_at=Subquery(
+                tokens.filter(token_type='unlimited', expires_at__gt=timezone.now())
+                .values('seller').annotate(m=Max('expires_at')).values('m')
+            ),
+        )
+
     def get_search_help_text(self):
         """검색 도움말 텍스트"""
         return '이름, 이메일, 전화번호, 사업자번호, 닉네임, ID 등으로 검색 가능'
@@ -394,11 +414,13 @@ class UserAdmin(admin.ModelAdmin):
         """활성 입찰권 수 표시"""
         if obj.role != 'seller':
             return '-'
-        count = BidToken.objects.filter(
-            seller=obj,
-            status='active',
-            token_type='single'
-        ).count()
+        count = getattr(obj, 'active_single_tokens', None)
+        if count is None:
+            count = BidToken.objects.filter(
+                seller=obj,
+                status='active',
+                token_type='single'
+            ).count()
         if count > 0:
             return mark_safe(f'<span style="color: green; font-weight: bold;">{count}개</span>')
         return mark_safe('<span style="color: gray;">0개</span>')
@@ -408,14 +430,17 @@ class UserAdmin(admin.ModelAdmin):
         """구독권 상태 표시"""
         if obj.role != 'seller':
             return '-'
-        active_subscription = BidToken.objects.filter(
-            seller=obj,
-            token_type='unlimited',
-            status='active',
-            expires_at__gt=timezone.now()
-        ).first()
-        if active_subscription:
-            days_left = (active_subscription.expires_at - timezone.now()).days
+        if hasattr(obj, 'subscription_expires_at'):
+            expires_at = obj.subscription_expires_at
+        else:
+            expires_at = BidToken.objects.filter(
+                seller=obj,
+                token_type='unlimited',
+                status='active',
+                expires_at__gt=timezone.now()
+            ).order_by('-expires_at').values_list('expires_at', flat=True).first()
+        if expires_at:
+            days_left = (expires_at - timezone.now()).days
             return mark_safe(f'<span style="color: blue; font-weight: bold;">활성 ({days_left}일 남음)</span>')
         return mark_safe('<span style="color: gray;">없음</span>')
     get_subscription_status.short_description = '구독권'
@@ -1274,6 +1299,8 @@ class GroupBuyAdmin(admin.ModelAdmin):
     exclude = ['region']  # 기존 단일 region 필드는 제외
     list_filter = ('status', 'start_time', 'end_time')
     list_per_page = 30  # 한 페이지에 표시할 항목 수
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False  # 필터 적용 시 전체 공구 수 COUNT 생략
     search_fields = ('title', 'product__name', 'creator__username', 'creator__email')
     
     # 한글화
@@ -1281,9 +1308,20 @@ class GroupBuyAdmin(admin.ModelAdmin):
         self.list_display_links = ('product',)
         super().__init__(model, admin_site)
         
+    def get_queryset(self, request):
+        """목록 컬럼(상품, 생성자, 지역, 선정 판매자)을 행마다 조회하지 않도록 미리 로드"""
+        return super().get_queryset(request).select_related('product', 'creator').prefetch_related(
+            Prefetch('regions', queryset=GroupBuyRegion.objects.select_related('region')),
+            Prefetch(
+                'bid_set',
+                queryset=Bid.objects.filter(is_selected=True).select_related('seller'),
+                to_attr='selected_bids'
+            ),
+        )
+
     def get_regions(self, obj):
-        """목록에서 지역 표시"""
-        regions = obj.regions.select_related('region').all()
+        """목록에서 지역 표시 (get_queryset에서 미리 로드한 지역 사용)"""
+        regions = obj.regions.all()
         return ', '.join([r.region.full_name for r in regions]) if regions else '-'
     get_regions.short_description = '공구 지역'
     
@@ -1297,7 +1335,10 @@ class GroupBuyAdmin(admin.ModelAdmin):
 
     def get_selected_seller(self, obj):
         """목록에서 최종 선정된 판매자 표시"""
-        selected_bid = obj.bid_set.filter(is_selected=True).select_related('seller').first()
+        if hasattr(obj, 'selected_bids'):
+            selected_bid = obj.selected_bids[0] if obj.selected_bids else None
+        else:
+            selected_bid = obj.bid_set.filter(is_selected=True).select_related('seller').first()
         if selected_bid:
             return f"{selected_bid.seller.username} ({selected_bid.seller.email})"
         return '-'
@@ -1516,7 +1557,20 @@ class ReferralRecordAdmin(admin.ModelAdmin):
         return name
     get_member_name.short_description = '회원명'
     
-    actions = ['mark_as_settled']
+    actions = ['mark_as_settled', 'export_as_csv']
+    
+    def export_as_csv(self, request, queryset):
+        """선택한 기록을 CSV로 내보내기 (행을 모으지 않고 스트리밍)"""
+        from .utils.streaming_export import export_response
+        return export_response(
+            queryset.order_by('-created_at'),
+            ['partner__partner_name', 'referred_user__username', 'subscription_status', 'total_amount',
+             'commission_amount', 'settlement_status', 'created_at'],
+            ['파트너사', '회원 아이디', '구독 상태', '총 결제 금액', '수수료 금액', '정산 상태', '생성일'],
+            filename='referral_records',
+            format_row=lambda row: [*row[:6], row[6].strftime('%Y-%m-%d %H:%M')]
+        )
+    export_as_csv.short_description = '선택한 기록 CSV 내보내기'
     
     def mark_as_settled(self, request, queryset):
         """선택한 기록들을 정산 완료로 처리"""
@@ -2398,5 +2452,20 @@ class NotificationSettingAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'user__nickname']
 
 
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'job_type', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'created_at']
+    list_filter = ['status', 'job_type']
+    search_fields = ['idempotency_key', 'last_error']
+    readonly_fields = ['created_at', 'completed_at', 'locked_at', 'locked_by', 'attempts']
+    ordering = ['-created_at']
+    actions = ['retry_jobs']
+
+    def retry_jobs(self, request, queryset):
+        updated = queryset.filter(status='failed').update(status='pending', attempts=0, run_at=timezone.now())
+        self.message_user(request, f'{updated}개의 실패 작업을 다시 대기 상태로 변경했습니다.')
+    retry_jobs.short_description = '실패한 작업 재시도'
+
+
 # 전문가 프로필 및 상담 매칭 Admin 등록
 from .admin_expert import ExpertProfileAdmin, ConsultationMatchAdmin
@@ -0,0 +1,42 @@
+"""
+대용량 테이블 관리자 목록용 페이지네이터
+
+필터/검색 없는 전체 목록에서는 COUNT(*) 대신 PostgreSQL 통계(pg_class.reltuples)의 추정 행 수를 사용합니다.
+추정치가 작거나(통계가 없거나 작은 테이블) 필터가 걸린 경우에는 기존처럼 정확히 셉니다.
+ModelAdmin에서 show_full_result_count = False와 함께 사용해야 전체 건수 COUNT도 생략됩니다.
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """필터 없는 목록은 reltuples 추정 행 수로 페이지 수 계산"""
+
+    # 이보다 작은 추정치는 정확히 셈 (통계가 오래됐거나 ANALYZE 전인 작은 테이블)
+    EXACT_COUNT_THRESHOLD = 10000
+
+    def _estimated_count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is None or query.where or query.distinct or query.low_mark or query.high_mark is not None:
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [connection.ops.quote_name(queryset.model._meta.db_table)]
+            )
+            row = cursor.fetchone()
+        if not row or row[0] is None or row[0] < self.EXACT_COUNT_THRESHOLD:
+            return None
+        return int(row[0])
+
+    @cached_property
+    def count(self):
+        estimated = self._estimated_count()
+        if estimated is not None:
+            return estimated
+        return super().count
@@ -2,10 +2,25 @@
 통합 찜/후기/끌올 Django Admin 설정
 """
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.utils.html import format_html
 from django.utils import timezone
 from datetime import timedelta
 from .models_unified_simple import UnifiedFavorite, UnifiedReview, UnifiedBump
+from .utils.unified_items import bulk_get_items
+
+
+class UnifiedItemChangeList(ChangeList):
+    """목록 페이지의 상품을 타입별로 한 번에 조회해 item_link의 get_item()이 행마다 조회하지 않도록 하는 ChangeList"""
+
+    def get_results(self, request):
+        super().get_results(request)
+        bulk_get_items(
+            self.result_list,
+            exclude_status=self.model_admin.item_exclude_status,
+            select_related=(),
+            prefetch_related=(),
+        )
 
 
 @admin.register(UnifiedFavorite)
@@ -16,6 +31,11 @@ class UnifiedFavoriteAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'user__email']
     date_hierarchy = 'created_at'
     ordering = ['-created_at']
+    # 찜 목록은 삭제된 상품을 표시하지 않음 (UnifiedFavorite.get_item과 동일)
+    item_exclude_status = 'deleted'
+
+    def get_changelist(self, request, **kwargs):
+        return UnifiedItemChangeList
 
     def item_type_display(self, obj):
         """상품 타입 표시"""
@@ -149,6 +169,10 @@ class UnifiedBumpAdmin(admin.ModelAdmin):
     date_hierarchy = 'bumped_at'
     ordering = ['-bumped_at']
     readonly_fields = ['bumped_at']
+    item_exclude_status = None
+
+    def get_changelist(self, request, **kwargs):
+        return UnifiedItemChangeList
 
     def item_type_display(self, obj):
         """상품 타입 표시"""
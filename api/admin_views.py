@@ -426,7 +426,7 @@ class AdminViewSet(viewsets.ViewSet):
             
             # 이메일 알림 발송
             try:
-                EmailSender.send_notification_email(
+                EmailSender.queue_notification_email(
                     recipient_email=user.email,
                     subject='[둥지마켓] 사업자 인증이 승인되었습니다',
                     template_name='emails/business_verification_approved.html',
@@ -467,7 +467,7 @@ class AdminViewSet(viewsets.ViewSet):
             
             # 이메일 알림 발송
             try:
-                EmailSender.send_notification_email(
+                EmailSender.queue_notification_email(
                     recipient_email=user.email,
                     subject='[둥지마켓] 사업자 인증이 거절되었습니다',
                     template_name='emails/business_verification_rejected.html',
@@ -560,48 +560,14 @@ class AdminViewSet(viewsets.ViewSet):
     def statistics(self, request):
         """
         관리자 대시보드용 통계 정보
+        주기적으로 갱신되는 스냅샷을 응답하고, ?live=1이면 바로 집계
         """
         try:
-            from django.db.models import Count, Sum, Avg
-            
-            # 사용자 통계
-            total_users = User.objects.count()
-            buyers = User.objects.filter(role='buyer').count()
-            sellers = User.objects.filter(role='seller').count()
-            verified_sellers = User.objects.filter(role='seller', is_business_verified=True).count()
-            
-            # 공구 통계
-            total_groupbuys = GroupBuy.objects.count()
-            active_groupbuys = GroupBuy.objects.filter(status__in=['recruiting', 'bidding']).count()
-            completed_groupbuys = GroupBuy.objects.filter(status='completed').count()
-            
-            # 입찰 통계
-            total_bids = Bid.objects.count()
-            successful_bids = Bid.objects.filter(status='selected').count()
-            
-            return Response({
-                'users': {
-                    'total': total_users,
-                    'buyers': buyers,
-                    'sellers': sellers,
-                    'verified_sellers': verified_sellers,
-                    'pending_verifications': User.objects.filter(
-                        role='seller',
-                        business_reg_number__isnull=False,
-                        is_business_verified=False
-                    ).exclude(business_reg_number='').count()
-                },
-                'groupbuys': {
-                    'total': total_groupbuys,
-                    'active': active_groupbuys,
-                    'completed': completed_groupbuys
-                },
-                'bids': {
-                    'total': total_bids,
-                    'successful': successful_bids,
-                    'success_rate': round((successful_bids / total_bids * 100) if total_bids > 0 else 0, 2)
-                }
-            })
+            from .services.admin_statistics import AdminStatistics
+
+            live = request.query_params.get('live') in ('1', 'true')
+            data, computed_at = AdminStatistics.get(live=live)
+            return Response({**data, 'computed_at': computed_at})
             
         except Exception as e:
             logger.error(f"관리자 통계 조회 오류: {str(e)}")
@@ -616,13 +582,12 @@ class AdminViewSet(viewsets.ViewSet):
         판매회원 목록 조회 (입찰권, 구독권 상태 포함)
         """
         try:
-            from django.db.models import Count, Q, F
-            from datetime import datetime
+            from django.db.models import Count, Max, Q
             
+            # 구독권 만료일까지 한 번에 집계 (판매자별 추가 조회 없음)
             sellers = User.objects.filter(role='seller').annotate(
-                total_bid_tokens=Count('bid_tokens', filter=Q(bid_tokens__status='active')),
                 single_tokens=Count('bid_tokens', filter=Q(bid_tokens__status='active', bid_tokens__token_type='single')),
-                has_subscription=Count('bid_tokens', filter=Q(
+                subscription_expires_at=Max('bid_tokens__expires_at', filter=Q(
                     bid_tokens__status='active',
                     bid_tokens__token_type='unlimited',
                     bid_tokens__expires_at__gt=timezone.now()
@@ -631,14 +596,6 @@ class AdminViewSet(viewsets.ViewSet):
             
             sellers_data = []
             for seller in sellers:
-                # 구독권 상태 확인
-                active_subscription = BidToken.objects.filter(
-                    seller=seller,
-                    token_type='unlimited',
-                    status='active',
-                    expires_at__gt=timezone.now()
-                ).first()
-                
                 # 실제 사용자 이름 결정 (카카오 사용자 처리)
                 actual_username = seller.username
                 if hasattr(seller, 'sns_type') and seller.sns_type == 'kakao':
@@ -653,8 +610,8 @@ class AdminViewSet(viewsets.ViewSet):
                     'nickname': seller.nickname,
                     'email': seller.email,
                     'bid_tokens_count': seller.single_tokens,
-                    'has_subscription': bool(active_subscription),
-                    'subscription_expires_at': active_subscription.expires_at if active_subscription else None,
+                    'has_subscription': seller.subscription_expires_at is not None,
+                    'subscription_expires_at': seller.subscription_expires_at,
                     'is_business_verified': seller.is_business_verified,
                     'date_joined': seller.date_joined
                 })
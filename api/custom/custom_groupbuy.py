@@ -17,6 +17,8 @@ from api.serializers_custom import (
     CustomFavoriteSerializer
 )
 from api.services.image_service import ImageService
+from api.pagination import BumpFeedPagination
+from api.services.view_counter import ViewCounter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,7 @@ def get_custom_categories(request):
 
 class CustomGroupBuyViewSet(viewsets.ModelViewSet):
     queryset = CustomGroupBuy.objects.all()
+    pagination_class = BumpFeedPagination
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -324,13 +327,8 @@ class CustomGroupBuyViewSet(viewsets.ModelViewSet):
             else:
                 queryset = queryset.filter(seller_id=seller_id)
 
-        # 끌올 기능: last_bumped_at이 있으면 우선, 없으면 created_at 기준
-        from django.db.models import F
-        from django.db.models.functions import Coalesce
-
-        return queryset.order_by(
-            Coalesce('last_bumped_at', 'created_at').desc()
-        )
+        # 끌올 기능: effective_date(last_bumped_at이 있으면 끌올 시각, 없으면 created_at) 기준
+        return queryset.order_by('-effective_date', '-id')
 
     def list(self, request, *args, **kwargs):
         # 목록 조회 시 만료된 공구들 일괄 체크
@@ -354,9 +352,7 @@ class CustomGroupBuyViewSet(viewsets.ModelViewSet):
         if instance.status == 'recruiting':
             instance.check_expiration()
 
-        instance.view_count = F('view_count') + 1
-        instance.save(update_fields=['view_count'])
-        instance.refresh_from_db()
+        ViewCounter.record_view(instance)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
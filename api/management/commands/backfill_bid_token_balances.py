@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand
+from api.models import BidToken, BidTokenBalance
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '기존 BidToken 행에서 판매자별 견적이용권 잔액(BidTokenBalance)을 집계해 생성/점검합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 집계할 판매자 수'
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='저장하지 않고 기존 잔액과 원본의 차이만 출력'
+        )
+
+    @staticmethod
+    def _drifted(row, expected):
+        """
+        잔액이 원본과 다른지 확인
+        가장 빠른 단품 만료일은 사용/삭제 후 다음 재집계까지 더 이른 값으로 남을 수 있으므로 (입찰 시 재집계 유도)
+        실제보다 늦거나 비어 있는 경우만 불일치로 봄
+        """
+        if row['single_count'] != expected['single_count']:
+            return True
+        if row['unlimited_expires_at'] != expected['unlimited_expires_at']:
+            return True
+        stored, actual = row['single_expires_at'], expected['single_expires_at']
+        return actual is not None and (stored is None or stored > actual)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = BidTokenBalance.BALANCE_FIELDS
+        processed = 0
+        drifted = 0
+        last_seller_id = 0
+
+        while True:
+            seller_ids = list(
+                BidToken.objects.filter(seller_id__gt=last_seller_id)
+                .order_by('seller_id')
+                .values_list('seller_id', flat=True)
+                .distinct()[:batch_size]
+            )
+            if not seller_ids:
+                break
+            last_seller_id = seller_ids[-1]
+            processed += len(seller_ids)
+
+            stored = {
+                row['seller_id']: row
+                for row in BidTokenBalance.objects.filter(seller_id__in=seller_ids).values('seller_id', *fields)
+            }
+            computed = BidTokenBalance.compute(seller_ids)
+            changed = []
+            for seller_id in seller_ids:
+                expected = computed[seller_id]
+                row = stored.get(seller_id)
+                if row is not None and not self._drifted(row, expected):
+                    continue
+                changed.append(seller_id)
+                if row is not None:
+                    drifted += 1
+                    detail = ', '.join(
+                        f'{field} {row[field]}→{expected[field]}' for field in fields if row[field] != expected[field]
+                    )
+                    self.stdout.write(f'  seller {seller_id}: {detail}')
+
+            if changed and not options['check']:
+                BidTokenBalance.recompute(changed)
+
+        if drifted:
+            logger.warning(f"[이용권 잔액 점검] {processed}명 중 {drifted}명 불일치")
+        if options['check']:
+            self.stdout.write(self.style.WARNING(f'{processed}명 점검, 불일치 {drifted}명'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{processed}명 이용권 잔액 집계 완료 (불일치 수정 {drifted}명)'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from api.services.view_counter import ViewCounter
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '캐시에 모인 상세 조회수 증가분과 업체 조회 기록을 DB에 일괄 반영합니다'
+
+    def handle(self, *args, **options):
+        result = ViewCounter.flush()
+        views = result.pop('views')
+        total = sum(result.values())
+
+        if total or views:
+            logger.info(f"조회수 반영: {result}, 업체 조회 기록 {views}건")
+        self.stdout.write(self.style.SUCCESS(
+            f'조회수 {total}회, 업체 조회 기록 {views}건 반영 완료'
+        ))
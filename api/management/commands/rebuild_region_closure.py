@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+import glob
+import os
+from api.services.region_index import RegionIndex
+
+
+class Command(BaseCommand):
+    help = '지역 클로저 테이블(RegionClosure)을 재생성합니다 (선택: 전국행정구역정보 파일 반영)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--admsect-dir',
+            nargs='?',
+            const=os.path.join(settings.BASE_DIR, '전국행정구역정보'),
+            help='ACMM_ADMSECT_*.txt 파일 디렉토리 (값 없이 지정하면 저장소의 전국행정구역정보 사용)'
+        )
+        parser.add_argument(
+            '--max-level',
+            type=int,
+            default=1,
+            help='가져올 최대 레벨 (0: 시/도, 1: 시/군/구, 2: 읍/면/동)'
+        )
+
+    def handle(self, *args, **options):
+        admsect_dir = options['admsect_dir']
+        if admsect_dir:
+            paths = sorted(glob.glob(os.path.join(admsect_dir, 'ACMM_ADMSECT_*.txt')))
+            if not paths:
+                raise CommandError(f'{admsect_dir}에서 ACMM_ADMSECT_*.txt 파일을 찾을 수 없습니다.')
+            imported = RegionIndex.import_admin_sections(paths, options['max_level'])
+            self.stdout.write(f'전국행정구역정보 {len(paths)}개 파일에서 지역 {imported}개 반영')
+        else:
+            RegionIndex.rebuild_closure()
+
+        self.stdout.write(self.style.SUCCESS('지역 클로저 재생성 완료'))
@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+from api.models import UserTradeStats
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '사용자 거래 통계(UserTradeStats)를 원본 테이블과 비교해 차이를 점검합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 비교할 사용자 수'
+        )
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='차이가 있는 사용자의 통계를 원본 기준으로 다시 저장'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = UserTradeStats.COUNTER_FIELDS
+        checked = 0
+        drifted = {}
+        last_user_id = 0
+
+        while True:
+            batch = list(
+                UserTradeStats.objects.filter(user_id__gt=last_user_id)
+                .order_by('user_id')
+                .values('user_id', *fields)[:batch_size]
+            )
+            if not batch:
+                break
+            last_user_id = batch[-1]['user_id']
+            checked += len(batch)
+
+            computed = UserTradeStats.compute([row['user_id'] for row in batch])
+            for row in batch:
+                expected = computed[row['user_id']]
+                diff = {
+                    field: (row[field], expected[field])
+                    for field in fields
+                    if row[field] != expected[field]
+                }
+                if diff:
+                    drifted[row['user_id']] = diff
+
+        for user_id, diff in list(drifted.items())[:50]:
+            detail = ', '.join(f'{field} {stored}→{expected}' for field, (stored, expected) in diff.items())
+            self.stdout.write(f'  user {user_id}: {detail}')
+
+        if drifted:
+            logger.warning(f"[거래 통계 점검] {checked}명 중 {len(drifted)}명 불일치")
+            if options['fix']:
+                UserTradeStats.recompute(drifted)
+                self.stdout.write(self.style.SUCCESS(f'불일치 {len(drifted)}명 통계 재집계 완료'))
+            else:
+                self.stdout.write(self.style.WARNING(
+                    f'{checked}명 중 {len(drifted)}명 불일치 (--fix로 재집계)'
+                ))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{checked}명 통계 일치'))
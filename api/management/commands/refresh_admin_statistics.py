@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from api.services.admin_statistics import AdminStatistics
+
+
+class Command(BaseCommand):
+    help = '관리자 대시보드 통계(StatsSnapshot)를 다시 집계해 저장합니다'
+
+    def handle(self, *args, **options):
+        snapshot = AdminStatistics.refresh()
+        users = snapshot.data['users']
+        self.stdout.write(self.style.SUCCESS(
+            f"관리자 통계 갱신 완료 ({snapshot.computed_at:%Y-%m-%d %H:%M:%S}, 회원 {users['total']}명)"
+        ))
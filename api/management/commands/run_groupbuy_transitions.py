@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+import time
+import logging
+from api.services.groupbuy_transition_service import GroupBuyTransitionService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '마감 시간(next_deadline)이 지난 공구의 상태를 전환합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='밀린 공구를 한 번 처리하고 종료 (cron 실행용)'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=30,
+            help='폴링 간격(초 단위)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=GroupBuyTransitionService.DEFAULT_BATCH_SIZE,
+            help='한 번에 처리할 공구 수'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        if options['once']:
+            self._run(batch_size)
+            return
+
+        interval = options['interval']
+        self.stdout.write(self.style.SUCCESS(f'공구 상태전환 워커 시작 - {interval}초마다 실행'))
+        try:
+            while True:
+                try:
+                    self._run(batch_size)
+                except Exception as e:
+                    logger.error(f"공구 상태전환 워커 오류: {str(e)}", exc_info=True)
+                    self.stdout.write(self.style.ERROR(f'오류 발생: {str(e)}'))
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('\n공구 상태전환 워커 종료'))
+
+    def _run(self, batch_size):
+        start_time = timezone.now()
+        result = GroupBuyTransitionService.process_all_due(batch_size=batch_size)
+        duration = (timezone.now() - start_time).total_seconds()
+        if result['processed']:
+            self.stdout.write(self.style.SUCCESS(
+                f"[{start_time:%Y-%m-%d %H:%M:%S}] 공구 {result['processed']}개 확인, "
+                f"{result['transitioned']}개 상태 전환, {result['failed']}개 실패 "
+                f"(소요 시간: {duration:.2f}초)"
+            ))
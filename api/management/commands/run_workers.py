@@ -0,0 +1,100 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+import time
+import logging
+from api.services.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '백그라운드 작업 큐(푸시/SMS/이메일)를 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 처리하고 종료 (cron 실행용)'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=5,
+            help='대기 작업이 없을 때 폴링 간격(초 단위)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='한 번에 가져올 작업 수'
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='동시에 실행할 작업 수'
+        )
+        parser.add_argument(
+            '--types',
+            nargs='*',
+            help='처리할 작업 타입 (기본값: 등록된 전체)'
+        )
+        parser.add_argument(
+            '--purge-older-than',
+            type=int,
+            metavar='DAYS',
+            help='완료/실패 후 DAYS일이 지난 작업을 삭제하고 종료 (보관 기간 정리용 cron 실행)'
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        self.threads = options['threads']
+        self.job_types = options['types'] or None
+        self.worker_id = JobQueue.default_worker_id()
+
+        if options['purge_older_than'] is not None:
+            deleted = JobQueue.purge_finished(timedelta(days=options['purge_older_than']))
+            self.stdout.write(self.style.SUCCESS(
+                f"{options['purge_older_than']}일이 지난 끝난 작업 {deleted}개 삭제"
+            ))
+            return
+
+        if options['once']:
+            while self._run():
+                pass
+            return
+
+        interval = options['interval']
+        self.stdout.write(self.style.SUCCESS(
+            f'작업 큐 워커 시작 - {self.worker_id}, 동시 실행 {self.threads}개, 대기 시 {interval}초마다 폴링'
+        ))
+        try:
+            while True:
+                try:
+                    claimed = self._run()
+                except Exception as e:
+                    logger.error(f"작업 큐 워커 오류: {str(e)}", exc_info=True)
+                    self.stdout.write(self.style.ERROR(f'오류 발생: {str(e)}'))
+                    claimed = 0
+                # 처리할 작업이 남아 있으면 바로 다음 배치 실행
+                if not claimed:
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('\n작업 큐 워커 종료'))
+
+    def _run(self):
+        start_time = timezone.now()
+        result = JobQueue.run_pending(
+            worker_id=self.worker_id,
+            batch_size=self.batch_size,
+            threads=self.threads,
+            job_types=self.job_types,
+        )
+        if result['claimed']:
+            duration = (timezone.now() - start_time).total_seconds()
+            self.stdout.write(
+                f"[{start_time:%Y-%m-%d %H:%M:%S}] 작업 {result['claimed']}개 실행, "
+                f"{result['succeeded']}개 성공, {result['failed']}개 실패 (소요 시간: {duration:.2f}초)"
+            )
+        return result['claimed']
@@ -1,119 +1,226 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import RowNumber
+from django.db.models.expressions import Window
 from django.utils import timezone
 from datetime import timedelta
-from api.models import GroupBuy, Participation
-from django.db.models import Count
+from api.models import GroupBuy, Participation, Bid, UserTradeStats
+from api.services.groupbuy_list_cache import GroupBuyListCache
+from api.services.notification_dispatcher import NotificationDispatcher
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+
 class Command(BaseCommand):
     help = '공구 상태를 자동으로 업데이트합니다'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 트랜잭션에서 처리할 공구 수'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='변경 대상만 집계하고 실제 변경은 롤백'
+        )
+
     def handle(self, *args, **options):
+        self.batch_size = options['batch_size']
+        self.dry_run = options['dry_run']
         now = timezone.now()
+        started = time.monotonic()
+
+        # (단계명, 대상 쿼리셋, 처리 함수)
+        steps = [
+            (
+                '모집 마감',
+                # 1. 시간이 지난 recruiting/bidding 상태의 공구를 final_selection_buyers로 변경
+                GroupBuy.objects.filter(status__in=['recruiting', 'bidding'], end_time__lte=now),
+                self._close_recruiting,
+            ),
+            (
+                '구매자 최종선택 마감',
+                # 2. 최종선택 시간이 종료된 final_selection_buyers 상태의 공구 처리
+                GroupBuy.objects.filter(status='final_selection_buyers', final_selection_end__lte=now),
+                self._close_buyer_selection,
+            ),
+            (
+                '판매자 최종선택 마감',
+                # 3. 판매자 확정 시간이 종료된 final_selection_seller 상태의 공구 처리
+                GroupBuy.objects.filter(status='final_selection_seller', seller_selection_end__lt=now),
+                self._close_seller_selection,
+            ),
+        ]
+
         updated_count = 0
-        
-        # 1. 시간이 지난 recruiting/bidding 상태의 공구를 final_selection_buyers로 변경
-        time_expired_groupbuys = GroupBuy.objects.filter(
-            status__in=['recruiting', 'bidding'],
-            end_time__lte=now
+        for name, queryset, handler in steps:
+            step_started = time.monotonic()
+            checked, updated = self._run_in_batches(queryset, handler, now)
+            updated_count += updated
+            self.stdout.write(
+                f'  - {name}: {checked}개 확인, {updated}개 변경 ({time.monotonic() - step_started:.2f}초)'
+            )
+
+        elapsed = time.monotonic() - started
+        if self.dry_run:
+            self.stdout.write(self.style.WARNING(
+                f'[dry-run] 총 {updated_count}개의 공구 상태가 변경될 예정입니다. (소요 시간: {elapsed:.2f}초)'
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'총 {updated_count}개의 공구 상태가 업데이트되었습니다. (소요 시간: {elapsed:.2f}초)'
+            ))
+
+    def _run_in_batches(self, queryset, handler, now):
+        """
+        대상 공구를 id 순으로 batch_size씩 잠그고 처리합니다.
+        상태전환 워커가 잠근 공구는 건너뛰며, dry-run이면 각 배치를 롤백합니다.
+        """
+        checked = updated = 0
+        last_id = 0
+        while True:
+            with transaction.atomic():
+                ids = list(
+                    queryset.filter(id__gt=last_id)
+                    .select_for_update(skip_locked=True)
+                    .order_by('id')
+                    .values_list('id', flat=True)[:self.batch_size]
+                )
+                if not ids:
+                    break
+                batch_updated = handler(ids, now)
+                updated += batch_updated
+                if self.dry_run:
+                    transaction.set_rollback(True)
+                elif batch_updated:
+                    # queryset.update()는 post_save 신호가 없으므로 목록 캐시를 직접 무효화
+                    GroupBuyListCache.invalidate_all()
+
+            checked += len(ids)
+            last_id = ids[-1]
+            if len(ids) < self.batch_size:
+                break
+        return checked, updated
+
+    @staticmethod
+    def _top_bid_by_groupbuy(bids):
+        """공구별 최고 입찰 (금액 내림차순, 먼저 입찰한 순) - {groupbuy_id: bid_id}"""
+        ranked = bids.annotate(
+            rank=Window(
+                expression=RowNumber(),
+                partition_by=[F('groupbuy_id')],
+                order_by=[F('amount').desc(), F('created_at').asc()],
+            )
+        ).filter(rank=1).order_by()
+        return dict(ranked.values_list('groupbuy_id', 'id'))
+
+    def _close_recruiting(self, ids, now):
+        # 대기중 입찰 중 최고 입찰자를 낙찰자로 선정
+        winners = self._top_bid_by_groupbuy(Bid.objects.filter(groupbuy_id__in=ids, status='pending'))
+        winner_ids = list(winners.values())
+
+        Bid.objects.filter(id__in=winner_ids).update(status='selected', is_selected=True, updated_at=now)
+        # 다른 입찰자들의 상태 변경
+        Bid.objects.filter(groupbuy_id__in=list(winners), status='pending').exclude(
+            id__in=winner_ids
+        ).update(status='not_selected', is_selected=False, updated_at=now)
+        # queryset.update()는 신호가 없으므로 입찰 상태가 바뀐 판매자의 거래 통계를 다시 집계
+        UserTradeStats.recompute(
+            Bid.objects.filter(groupbuy_id__in=list(winners)).values_list('seller_id', flat=True)
         )
-        
-        for groupbuy in time_expired_groupbuys:
-            # 입찰이 있는 경우에만 final_selection_buyers로 변경
-            bids = groupbuy.bid_set.filter(status='pending').order_by('-amount', 'created_at')
-            if bids.exists():
-                # 최고 입찰자를 낙찰자로 선정
-                winning_bid = bids.first()
-                winning_bid.status = 'selected'
-                winning_bid.is_selected = True
-                winning_bid.save()
-                
-                # 다른 입찰자들의 상태 변경
-                bids.exclude(id=winning_bid.id).update(status='not_selected', is_selected=False)
-                
-                groupbuy.status = 'final_selection_buyers'
-                # 최종선택 종료 시간 설정 (공구 마감 후 12시간)
-                groupbuy.final_selection_end = groupbuy.end_time + timedelta(hours=12)
-                groupbuy.save()
-                logger.info(f"공구 {groupbuy.id}의 상태를 final_selection_buyers로 변경하고 최종선택 종료 시간을 설정했습니다.")
-                updated_count += 1
-            else:
-                # 입찰이 없으면 cancelled로 변경
-                groupbuy.status = 'cancelled'
-                groupbuy.save()
-                logger.info(f"입찰이 없는 공구 {groupbuy.id}를 취소 처리했습니다.")
-                updated_count += 1
-        
-        # 2. 최종선택 시간이 종료된 final_selection_buyers 상태의 공구 처리
-        final_selection_expired = GroupBuy.objects.filter(
+
+        # 최종선택 종료 시간 설정 (공구 마감 후 12시간)
+        final_selection_end = F('end_time') + timedelta(hours=12)
+        selected = GroupBuy.objects.filter(id__in=list(winners)).update(
             status='final_selection_buyers',
-            final_selection_end__lte=now
+            final_selection_end=final_selection_end,
+            next_deadline=final_selection_end,
+        )
+
+        # 입찰이 없으면 cancelled로 변경
+        no_bid_ids = [groupbuy_id for groupbuy_id in ids if groupbuy_id not in winners]
+        cancelled = GroupBuy.objects.filter(id__in=no_bid_ids).update(status='cancelled', next_deadline=None)
+
+        self._notify_status_change(list(winners), 'final_selection_buyers')
+        self._notify_status_change(no_bid_ids, 'cancelled')
+        logger.info(f"모집 마감 처리: final_selection_buyers {selected}건, 입찰 없음 취소 {cancelled}건")
+        return selected + cancelled
+
+    def _close_buyer_selection(self, ids, now):
+        # 확정한 참여자가 있는 공구
+        confirmed_ids = set(
+            Participation.objects.filter(groupbuy_id__in=ids, final_decision='confirmed')
+            .order_by().values_list('groupbuy_id', flat=True).distinct()
+        )
+
+        # 이미 선정된 낙찰자가 있는 공구
+        has_winner = set(
+            Bid.objects.filter(groupbuy_id__in=list(confirmed_ids), status='selected', is_selected=True)
+            .order_by().values_list('groupbuy_id', flat=True).distinct()
+        )
+
+        # 낙찰자가 없는 경우에만 새로 선정
+        new_winners = self._top_bid_by_groupbuy(
+            Bid.objects.filter(groupbuy_id__in=list(confirmed_ids - has_winner))
+        )
+        Bid.objects.filter(id__in=list(new_winners.values())).update(
+            status='selected', is_selected=True, updated_at=now
+        )
+        UserTradeStats.recompute(
+            Bid.objects.filter(id__in=list(new_winners.values())).values_list('seller_id', flat=True)
+        )
+
+        # 낙찰자가 있는 공구만 판매자 최종선택 단계로 (입찰이 없는 공구는 그대로 둠)
+        seller_selection_end = now + timedelta(hours=6)
+        to_seller_ids = list(has_winner | set(new_winners))
+        to_seller = GroupBuy.objects.filter(id__in=to_seller_ids).update(
+            status='final_selection_seller',
+            seller_selection_end=seller_selection_end,
+            next_deadline=seller_selection_end,
         )
-        
-        for groupbuy in final_selection_expired:
-            # 확정한 참여자가 있는지 확인
-            confirmed_participants = groupbuy.participation_set.filter(final_decision='confirmed').count()
-
-            if confirmed_participants > 0:
-                # 이미 선정된 낙찰자가 있는지 확인
-                winning_bid = groupbuy.bid_set.filter(status='selected', is_selected=True).first()
-
-                if not winning_bid:
-                    # 낙찰자가 없는 경우에만 새로 선정
-                    winning_bid = groupbuy.bid_set.order_by('-amount', 'created_at').first()
-                    if winning_bid:
-                        winning_bid.status = 'selected'
-                        winning_bid.is_selected = True
-                        winning_bid.save()
-
-                if winning_bid:
-                    groupbuy.status = 'final_selection_seller'
-                    groupbuy.seller_selection_end = now + timedelta(hours=6)
-                    groupbuy.save()
-                    logger.info(f"공구 {groupbuy.id}를 판매자 확정 대기 상태로 변경했습니다. (낙찰자: {winning_bid.seller.username})")
-                    updated_count += 1
-            else:
-                # 확정한 참여자가 없으면 취소
-                groupbuy.status = 'cancelled'
-                groupbuy.save()
-                logger.info(f"확정한 참여자가 없는 공구 {groupbuy.id}를 취소 처리했습니다.")
-                updated_count += 1
-        
-        # 3. 판매자 확정 시간이 종료된 final_selection_seller 상태의 공구 처리
-        seller_confirmation_expired = GroupBuy.objects.filter(
-            status='final_selection_seller'
+
+        # 확정한 참여자가 없으면 취소
+        cancel_ids = [groupbuy_id for groupbuy_id in ids if groupbuy_id not in confirmed_ids]
+        cancelled = GroupBuy.objects.filter(id__in=cancel_ids).update(status='cancelled', next_deadline=None)
+
+        self._notify_status_change(to_seller_ids, 'final_selection_seller')
+        self._notify_status_change(cancel_ids, 'cancelled')
+        logger.info(f"구매자 최종선택 마감 처리: final_selection_seller {to_seller}건, 확정자 없음 취소 {cancelled}건")
+        return to_seller + cancelled
+
+    def _close_seller_selection(self, ids, now):
+        # 공구별 낙찰 입찰 (status='selected' 중 첫 번째)
+        ranked = Bid.objects.filter(groupbuy_id__in=ids, status='selected').annotate(
+            rank=Window(expression=RowNumber(), partition_by=[F('groupbuy_id')], order_by=[F('id').asc()])
+        ).filter(rank=1).order_by()
+        winning_bids = list(ranked.values_list('groupbuy_id', 'id', 'final_decision'))
+
+        # 판매자가 시간 내에 선택하지 않은 경우 자동으로 판매포기 처리
+        pending_bid_ids = [bid_id for _, bid_id, decision in winning_bids if decision == 'pending']
+        Bid.objects.filter(id__in=pending_bid_ids).update(
+            final_decision='rejected', final_decision_at=now, updated_at=now
         )
-        
-        for groupbuy in seller_confirmation_expired:
-            # seller_selection_end가 지났는지 확인
-            if groupbuy.seller_selection_end and now > groupbuy.seller_selection_end:
-                winning_bid = groupbuy.bid_set.filter(status='selected').first()
-                
-                if winning_bid:
-                    # 판매자가 시간 내에 선택하지 않은 경우 자동으로 판매포기 처리
-                    if winning_bid.final_decision == 'pending':
-                        winning_bid.final_decision = 'rejected'
-                        winning_bid.final_decision_at = now
-                        winning_bid.save()
-                        logger.info(f"공구 {groupbuy.id}의 판매자가 시간 내 미선택으로 자동 판매포기 처리되었습니다.")
-                    
-                    if winning_bid.final_decision == 'confirmed':
-                        # 판매자가 확정했으면 진행중 상태로
-                        groupbuy.status = 'in_progress'
-                        groupbuy.save()
-                        logger.info(f"공구 {groupbuy.id}를 거래 진행중 상태로 변경했습니다.")
-                    else:
-                        # 판매자가 포기했으면 취소
-                        groupbuy.status = 'cancelled'
-                        groupbuy.save()
-                        logger.info(f"판매자가 판매포기한 공구 {groupbuy.id}를 취소 처리했습니다.")
-                else:
-                    # 낙찰자가 없으면 취소
-                    groupbuy.status = 'cancelled'
-                    groupbuy.save()
-                    logger.info(f"낙찰자가 없는 공구 {groupbuy.id}를 취소 처리했습니다.")
-                updated_count += 1
-        
-        self.stdout.write(self.style.SUCCESS(f'총 {updated_count}개의 공구 상태가 업데이트되었습니다.'))
\ No newline at end of file
+
+        # 판매자가 확정했으면 진행중 상태로, 포기/미선택/낙찰자 없음은 취소
+        confirmed_ids = [groupbuy_id for groupbuy_id, _, decision in winning_bids if decision == 'confirmed']
+        cancel_ids = [groupbuy_id for groupbuy_id in ids if groupbuy_id not in confirmed_ids]
+        in_progress = GroupBuy.objects.filter(id__in=confirmed_ids).update(status='in_progress', next_deadline=None)
+        cancelled = GroupBuy.objects.filter(id__in=cancel_ids).update(status='cancelled', next_deadline=None)
+
+        self._notify_status_change(confirmed_ids, 'in_progress')
+        self._notify_status_change(cancel_ids, 'cancelled')
+        logger.info(f"판매자 최종선택 마감 처리: in_progress {in_progress}건, 취소 {cancelled}건 (자동 판매포기 {len(pending_bid_ids)}건)")
+        return in_progress + cancelled
+
+    def _notify_status_change(self, groupbuy_ids, status):
+        """
+        queryset.update()는 post_save 신호를 발생시키지 않으므로
+        GroupBuy.notify_status_change와 같은 알림을 참여자 전체에 한 번에 생성합니다.
+        """
+        NotificationDispatcher.notify_groupbuy_status(groupbuy_ids, status)
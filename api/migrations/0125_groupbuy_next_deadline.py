@@ -0,0 +1,40 @@
+# 공구 상태전환 워커가 폴링할 next_deadline 컬럼 추가
+# 상태별 마감 시간(end_time / final_selection_end / seller_selection_end)을 하나의 인덱스 컬럼으로 관리
+
+from django.db import migrations, models
+from django.db.models import Case, F, When
+
+
+def backfill_next_deadline(apps, schema_editor):
+    GroupBuy = apps.get_model('api', 'GroupBuy')
+    GroupBuy.objects.update(
+        next_deadline=Case(
+            When(status__in=['recruiting', 'bidding'], then=F('end_time')),
+            When(status='final_selection_buyers', then=F('final_selection_end')),
+            When(status='final_selection_seller', then=F('seller_selection_end')),
+            default=None,
+            output_field=models.DateTimeField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0124_fix_groupbuy_creator_on_delete'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupbuy',
+            name='next_deadline',
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                null=True,
+                verbose_name='다음 상태전환 시각'
+            ),
+        ),
+        migrations.RunPython(backfill_next_deadline, migrations.RunPython.noop),
+    ]
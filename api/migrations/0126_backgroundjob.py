@@ -0,0 +1,39 @@
+# 푸시/SMS/이메일 발송을 위한 DB 기반 백그라운드 작업 테이블
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0125_groupbuy_next_deadline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_type', models.CharField(max_length=50, verbose_name='작업 타입')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='작업 데이터')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '처리중'), ('succeeded', '완료'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('idempotency_key', models.CharField(blank=True, max_length=200, null=True, unique=True, verbose_name='중복 방지 키')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=5, verbose_name='최대 시도 횟수')),
+                ('run_at', models.DateTimeField(verbose_name='실행 예정 시각')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='처리 시작 시각')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='처리 워커')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일')),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업 관리',
+                'indexes': [
+                    models.Index(fields=['status', 'run_at'], name='bgjob_status_run_at_idx'),
+                    models.Index(fields=['job_type', 'status'], name='bgjob_type_status_idx'),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,106 @@
+# 공구 통합/지역 검색용 비정규화 검색 문서 컬럼 추가
+# PostgreSQL에서는 pg_trgm GIN 인덱스로 한글 부분 일치(LIKE '%검색어%')도 인덱스를 사용하도록 함
+
+import logging
+import re
+
+from django.db import migrations, models, transaction
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_INDEXES = {
+    'groupbuy_search_doc_trgm_idx': 'search_document',
+    'groupbuy_region_doc_trgm_idx': 'region_search_document',
+}
+
+
+def _normalize(text):
+    return re.sub(r'\s+', ' ', str(text or '')).strip().lower()
+
+
+def _join(parts):
+    return '\n'.join(dict.fromkeys(value for value in map(_normalize, parts) if value))
+
+
+def backfill_search_documents(apps, schema_editor):
+    # GroupBuySearch.build_documents와 같은 규칙 (마이그레이션에서는 과거 모델을 사용해야 하므로 복제)
+    GroupBuy = apps.get_model('api', 'GroupBuy')
+    GroupBuyRegion = apps.get_model('api', 'GroupBuyRegion')
+    GroupBuyTelecomDetail = apps.get_model('api', 'GroupBuyTelecomDetail')
+    carrier_names = dict(GroupBuyTelecomDetail._meta.get_field('telecom_carrier').choices)
+
+    region_names = {}
+    for groupbuy_id, name in GroupBuyRegion.objects.order_by('id').values_list('groupbuy_id', 'region__name'):
+        region_names.setdefault(groupbuy_id, []).append(name)
+    carriers = dict(GroupBuyTelecomDetail.objects.values_list('groupbuy_id', 'telecom_carrier'))
+
+    batch = []
+    for groupbuy in GroupBuy.objects.select_related('product', 'region').iterator(chunk_size=500):
+        region_document = _join([
+            groupbuy.region.name if groupbuy.region else '',
+            groupbuy.region_name,
+            *region_names.get(groupbuy.id, []),
+        ])
+        carrier = carriers.get(groupbuy.id)
+        groupbuy.region_search_document = region_document
+        groupbuy.search_document = _join([
+            groupbuy.title,
+            groupbuy.product.name if groupbuy.product else '',
+            groupbuy.product_name,
+            region_document,
+            carrier,
+            carrier_names.get(carrier, '') if carrier else '',
+            groupbuy.description,
+        ])
+        batch.append(groupbuy)
+        if len(batch) >= 500:
+            GroupBuy.objects.bulk_update(batch, ['search_document', 'region_search_document'])
+            batch = []
+    if batch:
+        GroupBuy.objects.bulk_update(batch, ['search_document', 'region_search_document'])
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('api', 'GroupBuy')._meta.db_table
+    try:
+        # 확장 생성 권한이 없는 환경에서도 마이그레이션은 진행 (검색은 인덱스 없이 동작)
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except Exception as e:
+        logger.warning(f"pg_trgm 확장을 생성하지 못해 검색 인덱스를 건너뜁니다: {e}")
+        return
+    for index_name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" USING gin ("{column}" gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0126_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupbuy',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='검색 문서'),
+        ),
+        migrations.AddField(
+            model_name='groupbuy',
+            name='region_search_document',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='지역 검색 문서'),
+        ),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
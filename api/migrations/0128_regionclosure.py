@@ -0,0 +1,47 @@
+# 지역 필터용 클로저 테이블 (조상-자손-단계) 추가 및 기존 Region 계층으로 초기 생성
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_region_closure(apps, schema_editor):
+    # RegionIndex.build_closure_rows와 같은 규칙 (마이그레이션에서는 과거 모델을 사용해야 하므로 복제)
+    Region = apps.get_model('api', 'Region')
+    RegionClosure = apps.get_model('api', 'RegionClosure')
+
+    parents = dict(Region.objects.values_list('code', 'parent_id'))
+    rows = []
+    for code in parents:
+        ancestor, depth, seen = code, 0, set()
+        while ancestor in parents and ancestor not in seen:
+            seen.add(ancestor)
+            rows.append(RegionClosure(ancestor_id=ancestor, descendant_id=code, depth=depth))
+            ancestor = parents[ancestor]
+            depth += 1
+    RegionClosure.objects.bulk_create(rows, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0127_groupbuy_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegionClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField(verbose_name='단계 차이')),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='api.region', verbose_name='상위 지역')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='api.region', verbose_name='하위 지역')),
+            ],
+            options={
+                'verbose_name': '지역 계층',
+                'verbose_name_plural': '지역 계층 목록',
+                'unique_together': {('ancestor', 'descendant')},
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='region_closure_desc_idx')],
+            },
+        ),
+        migrations.RunPython(build_region_closure, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# 주기 작업(스위퍼) 워터마크 저장 테이블
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0129_customgroupbuy_effective_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='작업 이름')),
+                ('position', models.DateTimeField(blank=True, null=True, verbose_name='처리 기준 시각')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '작업 워터마크',
+                'verbose_name_plural': '작업 워터마크 관리',
+            },
+        ),
+    ]
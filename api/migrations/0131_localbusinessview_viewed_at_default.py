@@ -0,0 +1,19 @@
+# 업체 조회 기록을 버퍼에 모았다가 일괄 저장하므로 조회 시각을 직접 지정할 수 있도록 변경
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0130_jobcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='localbusinessview',
+            name='viewed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='조회 시간'),
+        ),
+    ]
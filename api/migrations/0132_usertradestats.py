@@ -0,0 +1,44 @@
+# 사용자별 거래 통계 (중고폰/찜/후기/입찰 수를 신호로 증분 유지)
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('api', '0131_localbusinessview_viewed_at_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTradeStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trade_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('phone_active_count', models.IntegerField(default=0, verbose_name='판매중 중고폰 수')),
+                ('phone_trading_count', models.IntegerField(default=0, verbose_name='거래중 중고폰 수')),
+                ('phone_sold_count', models.IntegerField(default=0, verbose_name='판매완료 중고폰 수')),
+                ('phone_received_offer_count', models.IntegerField(default=0, verbose_name='받은 대기 제안 수')),
+                ('phone_pending_offer_count', models.IntegerField(default=0, verbose_name='보낸 대기 제안 수')),
+                ('phone_accepted_offer_count', models.IntegerField(default=0, verbose_name='수락된 제안 수')),
+                ('phone_favorite_count', models.IntegerField(default=0, verbose_name='휴대폰 찜 수')),
+                ('electronics_favorite_count', models.IntegerField(default=0, verbose_name='전자제품 찜 수')),
+                ('review_count', models.IntegerField(default=0, verbose_name='받은 후기 수')),
+                ('review_rating_sum', models.IntegerField(default=0, verbose_name='받은 후기 평점 합계')),
+                ('seller_review_count', models.IntegerField(default=0, verbose_name='받은 판매자 리뷰 수')),
+                ('seller_review_rating_sum', models.IntegerField(default=0, verbose_name='받은 판매자 리뷰 평점 합계')),
+                ('bid_count', models.IntegerField(default=0, verbose_name='입찰 수')),
+                ('bid_pending_count', models.IntegerField(default=0, verbose_name='대기중 입찰 수')),
+                ('bid_selected_count', models.IntegerField(default=0, verbose_name='선정된 입찰 수')),
+                ('bid_rejected_count', models.IntegerField(default=0, verbose_name='포기한 입찰 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='업데이트일')),
+            ],
+            options={
+                'verbose_name': '사용자 거래 통계',
+                'verbose_name_plural': '사용자 거래 통계',
+                'db_table': 'user_trade_stats',
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# 판매자별 견적이용권 잔액 (입찰 시 조건부 UPDATE 한 번으로 차감)
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('api', '0132_usertradestats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BidTokenBalance',
+            fields=[
+                ('seller', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='bid_token_balance', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='판매자')),
+                ('single_count', models.IntegerField(default=0, verbose_name='사용 가능한 단품 이용권 수')),
+                ('single_expires_at', models.DateTimeField(blank=True, null=True, verbose_name='가장 빠른 단품 이용권 만료일')),
+                ('unlimited_expires_at', models.DateTimeField(blank=True, null=True, verbose_name='구독권 만료일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='업데이트일')),
+            ],
+            options={
+                'verbose_name': '견적이용권 잔액',
+                'verbose_name_plural': '견적이용권 잔액',
+                'db_table': 'bid_token_balance',
+            },
+        ),
+    ]
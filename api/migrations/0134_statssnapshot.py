@@ -0,0 +1,26 @@
+# 관리자 대시보드 통계 스냅샷 (refresh_admin_statistics 명령으로 갱신)
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0133_bidtokenbalance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatsSnapshot',
+            fields=[
+                ('key', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='통계 키')),
+                ('data', models.JSONField(default=dict, verbose_name='집계 결과')),
+                ('computed_at', models.DateTimeField(verbose_name='집계 시각')),
+            ],
+            options={
+                'verbose_name': '통계 스냅샷',
+                'verbose_name_plural': '통계 스냅샷',
+                'db_table': 'stats_snapshot',
+            },
+        ),
+    ]
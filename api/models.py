@@ -4,14 +4,14 @@ from django.utils import timezone
 from django.utils.timezone import now
 from datetime import timedelta
 from django.db.models import Case, When, F
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils.text import slugify
 from django.conf import settings
 import logging
 
 # 지역 정보 모델 import
-from .models_region import Region
+from .models_region import Region, RegionClosure
 # 문의사항 모델 import
 from .models_inquiry import Inquiry
 # 팝업 모델 import
@@ -48,20 +48,17 @@ class User(AbstractUser):
     
     @property
     def average_rating(self):
-        """판매자가 받은 평균 별점 계산"""
-        from django.db.models import Avg
+        """판매자가 받은 평균 별점 (거래 통계 행에서 조회)"""
         if self.role != 'seller':
             return None
-        
-        avg = self.received_reviews.aggregate(avg_rating=Avg('rating'))['avg_rating']
-        return round(avg, 1) if avg else None
+        return UserTradeStats.for_user(self).seller_review_average
     
     @property
     def review_count(self):
-        """판매자가 받은 리뷰 개수"""
+        """판매자가 받은 리뷰 개수 (거래 통계 행에서 조회)"""
         if self.role != 'seller':
             return 0
-        return self.received_reviews.count()
+        return UserTradeStats.for_user(self).seller_review_count
     SNS_TYPE_CHOICES = (
         ('google', 'Google'),
         ('kakao', 'Kakao'),
@@ -411,6 +408,7 @@ class GroupBuy(models.Model):
     end_time = models.DateTimeField(verbose_name='종료 시간')  # 종료 시간 명시적 관리
     final_selection_end = models.DateTimeField(null=True, blank=True, verbose_name='구매자 최종선택 종료 시간')  # 공구 마감 후 12시간
     seller_selection_end = models.DateTimeField(null=True, blank=True, verbose_name='판매자 최종선택 종료 시간')  # 구매자 선택 완료 후 6시간
+    next_deadline = models.DateTimeField(null=True, blank=True, db_index=True, editable=False, verbose_name='다음 상태전환 시각')  # 상태전환 워커 폴링용
     status = models.CharField(max_length=30, choices=STATUS_CHOICES, default='recruiting', verbose_name='상태')
     cancellation_reason = models.CharField(max_length=200, blank=True, null=True, verbose_name='취소 사유')
     current_participants = models.PositiveIntegerField(default=0, verbose_name='현재 참여자 수')
@@ -429,6 +427,10 @@ class GroupBuy(models.Model):
     buyer_completed = models.BooleanField(default=False, verbose_name='구매자 거래완료')
     seller_completed = models.BooleanField(default=False, verbose_name='판매자 거래완료')
     completed_at = models.DateTimeField(null=True, blank=True, verbose_name='거래 완료 시간')
+
+    # 검색용 비정규화 문서 (GroupBuySearch가 저장 시 갱신, 소문자)
+    search_document = models.TextField(blank=True, default='', editable=False, verbose_name='검색 문서')  # 제목/상품명/지역명/통신사/설명
+    region_search_document = models.TextField(blank=True, default='', editable=False, verbose_name='지역 검색 문서')  # 지역명
     
     def save(self, *args, **kwargs):
         # 상품 이름 백업
@@ -516,24 +518,21 @@ class GroupBuy(models.Model):
             self.status = 'cancelled'
             self.save()
 
-    def notify_status_change(self):
+    @classmethod
+    def build_status_message(cls, product_name, status):
+        """상태 변경 알림 메시지 생성"""
         # STATUS_CHOICES에서 현재 상태의 한글 표시 가져오기
-        status_display = dict(self.STATUS_CHOICES).get(self.status, self.status)
+        status_display = dict(cls.STATUS_CHOICES).get(status, status)
         
         # 더 구체적인 메시지 생성
-        if self.status == 'final_selection_buyers':
-            message = f"공구 {self.product.name}의 구매자 최종선택이 시작되었습니다. 12시간 내에 구매 확정/포기를 선택해주세요."
-        elif self.status == 'final_selection_seller':
-            message = f"공구 {self.product.name}의 상태가 {status_display}로 변경되었습니다."
-        else:
-            message = f"공구 {self.product.name}의 상태가 {status_display}로 변경되었습니다."
-        
-        for participant in self.participants.all():
-            Notification.objects.create(
-                user=participant,
-                groupbuy=self,
-                message=message
-            )
+        if status == 'final_selection_buyers':
+            return f"공구 {product_name}의 구매자 최종선택이 시작되었습니다. 12시간 내에 구매 확정/포기를 선택해주세요."
+        return f"공구 {product_name}의 상태가 {status_display}로 변경되었습니다."
+
+    def notify_status_change(self):
+        """참여자 전체에 현재 상태 알림 (일괄 생성, 짧은 시간 내 중복은 생략)"""
+        from api.services.notification_dispatcher import NotificationDispatcher
+        NotificationDispatcher.notify_groupbuy_status([self.id], self.status)
     
     def start_consent_process(self, selected_bid, consent_hours=24):
         """선택된 입찰에 대한 참여자 동의 프로세스 시작"""
@@ -595,9 +594,48 @@ class GroupBuy(models.Model):
             else:
                 raise ValidationError(f"유효하지 않은 상태값입니다: {self.status}")
     
+    # 상태별로 다음 자동 전환의 기준이 되는 시간 필드
+    DEADLINE_FIELD_BY_STATUS = {
+        'recruiting': 'end_time',
+        'bidding': 'end_time',
+        'final_selection_buyers': 'final_selection_end',
+        'final_selection_seller': 'seller_selection_end',
+    }
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 상태가 실제로 바뀐 저장에서만 알림을 보내기 위해 로드 시점의 상태 기록 (지연 로딩 필드면 None)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def compute_next_deadline(self):
+        """현재 상태에서 다음 자동 상태전환이 일어나야 하는 시각 (없으면 None)"""
+        field_name = self.DEADLINE_FIELD_BY_STATUS.get(self.status)
+        return getattr(self, field_name) if field_name else None
+
     def save(self, *args, **kwargs):
         """저장 시 검증 수행"""
         self.clean()
+        self.next_deadline = self.compute_next_deadline()
+
+        # update_fields로 상태/마감시간만 저장하는 경우에도 next_deadline을 함께 갱신
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            deadline_sources = {'status', *self.DEADLINE_FIELD_BY_STATUS.values()}
+            if deadline_sources.intersection(update_fields) and 'next_deadline' not in update_fields:
+                kwargs['update_fields'] = list(update_fields) + ['next_deadline']
+
+        # 검색 대상 필드가 저장될 때만 검색 문서 재생성
+        from api.services.groupbuy_search import GroupBuySearch
+        if update_fields is None or GroupBuySearch.SOURCE_FIELDS.intersection(update_fields):
+            self.search_document, self.region_search_document = GroupBuySearch.build_documents(self)
+            if update_fields is not None:
+                kwargs['update_fields'] = [
+                    *kwargs['update_fields'],
+                    *(name for name in GroupBuySearch.DOCUMENT_FIELDS if name not in kwargs['update_fields']),
+                ]
+
         super().save(*args, **kwargs)
     
     class Meta:
@@ -1550,10 +1588,76 @@ class NoShowObjection(models.Model):
 
 
 @receiver(post_save, sender=GroupBuy)
-def handle_status_change(sender, instance, **kwargs):
+def handle_status_change(sender, instance, created, **kwargs):
+    """상태가 바뀐 저장에서만 참여자 알림 (current_participants 동기화 등 다른 필드 저장은 무시)"""
     update_fields = kwargs.get('update_fields')
-    if update_fields is None or 'status' in update_fields:
-        instance.notify_status_change()
+    if update_fields is not None and 'status' not in update_fields:
+        return
+
+    previous_status = getattr(instance, '_loaded_status', None)
+    instance._loaded_status = instance.status
+    # 생성 직후에는 참여자가 없으므로 알림 대상도 없음
+    if created or previous_status == instance.status:
+        return
+    instance.notify_status_change()
+
+
+@receiver(post_save, sender=Region)
+def link_region_closure(sender, instance, created, raw=False, **kwargs):
+    """지역 추가/수정 시 지역 클로저와 이름 인덱스 갱신 (fixture 로드 중에는 rebuild_region_closure 사용)"""
+    if raw:
+        return
+    from api.services.region_index import RegionIndex
+    RegionIndex.link_region(instance, created)
+
+
+@receiver(post_delete, sender=Region)
+def invalidate_region_index(sender, instance, **kwargs):
+    """지역 삭제 시 이름 인덱스 폐기 (클로저 행은 FK CASCADE로 삭제)"""
+    from api.services.region_index import RegionIndex
+    RegionIndex.invalidate()
+
+
+@receiver(post_save, sender=GroupBuyRegion)
+@receiver(post_delete, sender=GroupBuyRegion)
+@receiver(post_save, sender=GroupBuyTelecomDetail)
+def refresh_groupbuy_search_document(sender, instance, **kwargs):
+    """공구 지역/통신사 변경 시 검색 문서 갱신"""
+    from api.services.groupbuy_search import GroupBuySearch
+    GroupBuySearch.refresh(instance.groupbuy_id)
+
+
+@receiver(post_save, sender=GroupBuy)
+@receiver(post_delete, sender=GroupBuy)
+def invalidate_groupbuy_list_cache(sender, instance, **kwargs):
+    """공구 목록 응답 캐시 무효화"""
+    from api.services.groupbuy_list_cache import GroupBuyListCache
+    GroupBuyListCache.invalidate_groupbuy(instance)
+
+
+@receiver(post_save, sender=Participation)
+@receiver(post_delete, sender=Participation)
+@receiver(post_save, sender=Bid)
+@receiver(post_delete, sender=Bid)
+def invalidate_groupbuy_list_cache_for_related(sender, instance, **kwargs):
+    """참여/입찰 변경 시 해당 공구가 속한 목록 캐시 무효화 (참여자 수, 최고 지원금 정렬 등)"""
+    from api.services.groupbuy_list_cache import GroupBuyListCache
+    if instance.groupbuy_id:
+        GroupBuyListCache.invalidate_groupbuy(instance.groupbuy)
+
+
+@receiver(post_save, sender=Bid)
+@receiver(post_delete, sender=Bid)
+@receiver(post_save, sender=BidToken)
+@receiver(post_delete, sender=BidToken)
+@receiver(post_save, sender=Settlement)
+@receiver(post_delete, sender=Settlement)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_seller_summary(sender, instance, **kwargs):
+    """견적/제안권/정산/리뷰 변경 시 해당 판매자의 홈 요약 캐시 무효화"""
+    from api.services.seller_summary import SellerSummary
+    SellerSummary.invalidate(instance.seller_id)
 
 # Import verification models
 from .models_verification import PhoneVerification, BusinessNumberVerification, EmailVerification
@@ -1567,3 +1671,19 @@ from .models_partner import Partner, ReferralRecord, PartnerSettlement, PartnerL
 from .models_unified_simple import UnifiedFavorite, UnifiedReview
 # Import Expert models
 from .models_expert import ExpertProfile, ConsultationMatch
+# Import background job queue model
+from .models_jobs import BackgroundJob, JobCheckpoint
+# Import per-user trade statistics (incrementally maintained by signals)
+from .models_user_stats import UserTradeStats
+# Import per-seller bid token balance (consumed atomically on the bid path)
+from .models_bid_token_balance import BidTokenBalance
+# Import admin dashboard statistics snapshots
+from .models_stats_snapshot import StatsSnapshot
+
+
+@receiver(post_save, sender=ReferralRecord)
+@receiver(post_delete, sender=ReferralRecord)
+def invalidate_partner_stats(sender, instance, **kwargs):
+    """추천 기록 변경 시 해당 파트너의 대시보드 요약/월별 통계 캐시 무효화"""
+    from api.services.partner_stats import PartnerStats
+    PartnerStats.invalidate(instance.partner_id)
@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from .utils.s3_upload import upload_to_s3
+from .utils.s3_upload import upload_to_s3, upload_many_to_s3
 
 User = get_user_model()
 
@@ -105,20 +105,18 @@ class Event(models.Model):
         return f"{self.title} ({self.get_status_display()})"
     
     def save(self, *args, **kwargs):
-        # S3에 이미지 업로드
-        # 썸네일 이미지 처리 - 새 이미지가 있으면 무조건 업로드
-        if self.thumbnail:
-            thumbnail_url = upload_to_s3(self.thumbnail, 'events/thumbnails')
-            if thumbnail_url:
-                self.thumbnail_url = thumbnail_url
-                self.thumbnail = None
-                
-        # 본문 이미지 처리 - 새 이미지가 있으면 무조건 업로드        
-        if self.content_image:
-            content_image_url = upload_to_s3(self.content_image, 'events/content')
-            if content_image_url:
-                self.content_image_url = content_image_url
-                self.content_image = None
+        # S3에 이미지 업로드 - 새 썸네일/본문 이미지가 있으면 무조건 업로드 (동시 전송)
+        uploads = [
+            (field_name, folder)
+            for field_name, folder in (('thumbnail', 'events/thumbnails'), ('content_image', 'events/content'))
+            if getattr(self, field_name)
+        ]
+        if uploads:
+            urls = upload_many_to_s3((getattr(self, field_name), folder) for field_name, folder in uploads)
+            for (field_name, _), url in zip(uploads, urls):
+                if url:
+                    setattr(self, f'{field_name}_url', url)
+                    setattr(self, field_name, None)
                 
         # 슬러그 자동 생성
         if not self.slug:
@@ -0,0 +1,278 @@
+"""
+판매자별 견적이용권 잔액 (증분 유지)
+
+입찰할 때마다 BidToken 행을 검색하지 않도록 판매자당 한 행에
+사용 가능한 단품 이용권 수와 구독권 만료일을 미리 집계해 둡니다.
+
+- 입찰 경로는 BidTokenBalance.consume()의 SQL 한 문장으로 잔액 조건부 차감,
+  이용권 행 사용 처리, 입찰 연결을 함께 수행 (잔액 행 잠금으로 같은 판매자의 입찰은 직렬화)
+- BidToken 저장/삭제 신호에서 잔액을 갱신하고 (삭제 시에는 있는 행만 갱신), bulk_create/queryset.update() 후에는 recompute()로 다시 집계
+- 잔액과 이용권 행이 어긋났거나 단품 이용권 만료 시각이 지나 잔액이 맞지 않으면
+  consume()이 다시 집계한 뒤 한 번 재시도
+- 기존 BidToken 행은 backfill_bid_token_balances 명령으로 일괄 집계
+"""
+from django.conf import settings
+from django.db import connection, models
+from django.db.models import Count, F, Max, Min, Q, Value
+from django.db.models.functions import Coalesce, Least
+from django.db.models.signals import post_init, post_save, post_delete
+from django.utils import timezone
+
+
+class BidTokenBalance(models.Model):
+    """판매자 견적이용권 잔액 (입찰 시 차감용)"""
+
+    seller = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='bid_token_balance',
+        verbose_name='판매자'
+    )
+    single_count = models.IntegerField(default=0, verbose_name='사용 가능한 단품 이용권 수')
+    single_expires_at = models.DateTimeField(null=True, blank=True, verbose_name='가장 빠른 단품 이용권 만료일')
+    unlimited_expires_at = models.DateTimeField(null=True, blank=True, verbose_name='구독권 만료일')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='업데이트일')
+
+    BALANCE_FIELDS = ('single_count', 'single_expires_at', 'unlimited_expires_at')
+
+    class Meta:
+        db_table = 'bid_token_balance'
+        verbose_name = '견적이용권 잔액'
+        verbose_name_plural = '견적이용권 잔액'
+
+    def __str__(self):
+        return f"{self.seller_id} - 단품 {self.single_count}개"
+
+    @classmethod
+    def compute(cls, seller_ids, now=None):
+        """
+        BidToken 행에서 잔액 집계 (쿼리 1개)
+
+        Returns:
+            dict: {seller_id: {필드: 값}}
+        """
+        from api.models import BidToken
+
+        now = now or timezone.now()
+        seller_ids = list(set(seller_ids))
+        values = {
+            seller_id: {'single_count': 0, 'single_expires_at': None, 'unlimited_expires_at': None}
+            for seller_id in seller_ids
+        }
+        single = Q(token_type='single') & (Q(expires_at__isnull=True) | Q(expires_at__gt=now))
+        rows = BidToken.objects.filter(seller_id__in=seller_ids, status='active').values('seller_id').annotate(
+            single_count=Count('id', filter=single),
+            single_expires_at=Min('expires_at', filter=Q(token_type='single', expires_at__gt=now)),
+            unlimited_expires_at=Max('expires_at', filter=Q(token_type='unlimited', expires_at__gt=now)),
+        ).order_by()
+        for row in rows:
+            values[row.pop('seller_id')].update(row)
+        return values
+
+    @classmethod
+    def recompute(cls, seller_ids):
+        """
+        BidToken 행에서 다시 집계해 저장 (bulk_create/queryset.update() 등 신호 없는 변경 후 호출)
+
+        Returns:
+            dict: {seller_id: BidTokenBalance}
+        """
+        seller_ids = [seller_id for seller_id in set(seller_ids) if seller_id]
+        if not seller_ids:
+            return {}
+        rows = [cls(seller_id=seller_id, **values) for seller_id, values in cls.compute(seller_ids).items()]
+        cls.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['seller'],
+            update_fields=list(cls.BALANCE_FIELDS) + ['updated_at'],
+        )
+        return {row.seller_id: row for row in rows}
+
+    @classmethod
+    def refresh(cls, seller_ids):
+        """
+        이미 있는 잔액 행만 원본 기준으로 갱신 (BidToken 삭제 시 호출)
+
+        없는 행은 만들지 않습니다. 판매자 삭제 CASCADE에서는 잔액 행이 먼저 지워진 뒤
+        BidToken이 삭제되므로, 여기서 행을 만들면 삭제된 판매자를 가리키는 행이 남습니다.
+        """
+        seller_ids = [seller_id for seller_id in set(seller_ids) if seller_id]
+        existing = list(cls.objects.filter(seller_id__in=seller_ids).values_list('seller_id', flat=True))
+        if not existing:
+            return
+        now = timezone.now()
+        for seller_id, values in cls.compute(existing, now=now).items():
+            cls.objects.filter(seller_id=seller_id).update(updated_at=now, **values)
+
+    @classmethod
+    def add_single(cls, seller_id, count, expires_at):
+        """단품 이용권 count개가 사용 가능해졌을 때 (행이 없으면 원본에서 집계)"""
+        changes = {'single_count': F('single_count') + count}
+        if expires_at is not None:
+            changes['single_expires_at'] = Least(Coalesce(F('single_expires_at'), Value(expires_at)), Value(expires_at))
+        if not cls.objects.filter(seller_id=seller_id).update(**changes):
+            cls.recompute([seller_id])
+
+    @classmethod
+    def remove_single(cls, seller_id, count):
+        """단품 이용권 count개가 사용/만료/삭제됐을 때 (가장 빠른 만료일은 다음 재집계까지 그대로 둠)"""
+        if not cls.objects.filter(seller_id=seller_id).update(single_count=F('single_count') - count):
+            cls.recompute([seller_id])
+
+    @classmethod
+    def _consume_sql(cls):
+        from api.models import Bid, BidToken
+
+        qn = connection.ops.quote_name
+
+        def column(model, name):
+            return qn(model._meta.get_field(name).column)
+
+        balance, token, bid = (qn(model._meta.db_table) for model in (cls, BidToken, Bid))
+        single_count = column(cls, 'single_count')
+        single_expires_at = column(cls, 'single_expires_at')
+        unlimited_expires_at = column(cls, 'unlimited_expires_at')
+        token_id = column(BidToken, 'id')
+        token_seller = column(BidToken, 'seller')
+        token_status = column(BidToken, 'status')
+        token_type = column(BidToken, 'token_type')
+        token_expires_at = column(BidToken, 'expires_at')
+        token_used_at = column(BidToken, 'used_at')
+        return (
+            # 1) 잔액 조건부 차감: 유효한 구독권이 있으면 차감 없이 통과, 아니면 단품 잔액이 있을 때만 1 차감
+            f"WITH balance AS ("
+            f"UPDATE {balance} SET "
+            f"{single_count} = {single_count} - CASE WHEN {unlimited_expires_at} > %(now)s THEN 0 ELSE 1 END, "
+            f"{column(cls, 'updated_at')} = %(now)s "
+            f"WHERE {column(cls, 'seller')} = %(seller)s "
+            f"AND ({unlimited_expires_at} > %(now)s "
+            f"OR ({single_count} > 0 AND ({single_expires_at} IS NULL OR {single_expires_at} > %(now)s))) "
+            f"RETURNING COALESCE({unlimited_expires_at} > %(now)s, FALSE) AS unlimited"
+            f"), "
+            # 2) 이용권 행 사용 처리: 단품은 만료가 가장 빠른 것부터 사용, 구독권은 사용처만 기록
+            f"used_token AS ("
+            f"UPDATE {token} SET "
+            f"{token_status} = CASE WHEN balance.unlimited THEN {token}.{token_status} ELSE 'used' END, "
+            f"{token_used_at} = CASE WHEN balance.unlimited THEN {token}.{token_used_at} ELSE %(now)s END, "
+            f"{column(BidToken, 'used_for')} = %(bid)s "
+            f"FROM balance "
+            f"WHERE {token}.{token_id} = ("
+            f"SELECT candidate.{token_id} FROM {token} candidate "
+            f"WHERE candidate.{token_seller} = %(seller)s AND candidate.{token_status} = 'active' "
+            f"AND candidate.{token_type} = CASE WHEN balance.unlimited THEN 'unlimited' ELSE 'single' END "
+            f"AND (candidate.{token_expires_at} > %(now)s "
+            f"OR (NOT balance.unlimited AND candidate.{token_expires_at} IS NULL)) "
+            f"ORDER BY candidate.{token_expires_at} ASC NULLS LAST, candidate.{token_id} "
+            f"LIMIT 1 FOR UPDATE"
+            f") "
+            f"RETURNING {token}.{token_id} AS id"
+            f") "
+            # 3) 입찰에 사용한 이용권 연결
+            f"UPDATE {bid} SET {column(Bid, 'bid_token')} = (SELECT id FROM used_token) "
+            f"WHERE {column(Bid, 'id')} = %(bid)s "
+            f"RETURNING {column(Bid, 'bid_token')}, EXISTS (SELECT 1 FROM balance)"
+        )
+
+    @classmethod
+    def _try_consume(cls, seller_id, bid_id):
+        with connection.cursor() as cursor:
+            cursor.execute(cls._consume_sql(), {'seller': seller_id, 'bid': bid_id, 'now': timezone.now()})
+            return cursor.fetchone()
+
+    @classmethod
+    def consume(cls, seller_id, bid_id):
+        """
+        입찰 1건에 이용권 사용 (트랜잭션 안에서, 입찰 저장 후 호출)
+
+        평소에는 SQL 한 문장으로 끝나고, 잔액 행이 없거나 원본과 어긋난 경우에만 다시 집계 후 재시도합니다.
+
+        Returns:
+            int: 사용한(구독권이면 기록한) BidToken id, 사용 가능한 이용권이 없으면 None
+        """
+        row = cls._try_consume(seller_id, bid_id)
+        if row and row[0]:
+            return row[0]
+        cls.recompute([seller_id])
+        row = cls._try_consume(seller_id, bid_id)
+        if row and row[0]:
+            return row[0]
+        if row and row[1]:
+            # 재집계 직후에도 잔액만 차감되고 이용권 행을 찾지 못한 경우 잔액을 원본 기준으로 되돌림
+            cls.recompute([seller_id])
+        return None
+
+
+# 잔액에 영향을 주는 BidToken 필드
+TRACKED_FIELDS = ('seller_id', 'token_type', 'status', 'expires_at')
+
+# 지연 로딩(defer/only)으로 값을 알 수 없는 필드
+_UNKNOWN = object()
+
+
+def _snapshot(instance):
+    return {field: instance.__dict__.get(field, _UNKNOWN) for field in TRACKED_FIELDS}
+
+
+def _usable_single(values):
+    """잔액의 단품 수에 포함되는 상태인지"""
+    expires_at = values['expires_at']
+    return (
+        values['token_type'] == 'single'
+        and values['status'] == 'active'
+        and (expires_at is None or expires_at > timezone.now())
+    )
+
+
+def _stash_snapshot(sender, instance, **kwargs):
+    instance._token_balance_snapshot = _snapshot(instance) if instance.pk else None
+
+
+def _update_balance_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None:
+        names = set(TRACKED_FIELDS) | {'seller'}
+        if not names & set(update_fields):
+            return
+
+    before = None if created else getattr(instance, '_token_balance_snapshot', None)
+    after = _snapshot(instance)
+    instance._token_balance_snapshot = after
+    if before == after:
+        return
+
+    simple_single_change = (
+        after['token_type'] == 'single'
+        and (created or (
+            before is not None
+            and _UNKNOWN not in before.values()
+            and before['token_type'] == 'single'
+            and before['seller_id'] == after['seller_id']
+            and before['expires_at'] == after['expires_at']
+        ))
+    )
+    if not simple_single_change:
+        # 구독권 변경, 만료일/판매자 변경, 저장 전 값을 모르는 경우는 원본에서 다시 집계
+        seller_ids = {after['seller_id']}
+        if before is not None and before['seller_id'] is not _UNKNOWN:
+            seller_ids.add(before['seller_id'])
+        BidTokenBalance.recompute(seller_ids)
+        return
+
+    was_usable = not created and _usable_single(before)
+    is_usable = _usable_single(after)
+    if is_usable and not was_usable:
+        BidTokenBalance.add_single(after['seller_id'], 1, after['expires_at'])
+    elif was_usable and not is_usable:
+        BidTokenBalance.remove_single(after['seller_id'], 1)
+
+
+def _update_balance_on_delete(sender, instance, **kwargs):
+    BidTokenBalance.refresh([instance.seller_id])
+
+
+post_init.connect(_stash_snapshot, sender='api.BidToken', dispatch_uid='bid_token_balance_init')
+post_save.connect(_update_balance_on_save, sender='api.BidToken', dispatch_uid='bid_token_balance_save')
+post_delete.connect(_update_balance_on_delete, sender='api.BidToken', dispatch_uid='bid_token_balance_delete')
@@ -9,6 +9,7 @@ from datetime import timedelta
 import uuid
 import logging
 from api.models_region import Region
+from api.utils.bump import sync_effective_date
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -224,6 +225,7 @@ class CustomGroupBuy(models.Model):
     # 끌올 정보 (UnifiedBump와 연동)
     last_bumped_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 끌올 시간')
     bump_count = models.PositiveIntegerField(default=0, verbose_name='총 끌올 횟수')
+    effective_date = models.DateTimeField(default=timezone.now, editable=False, verbose_name='목록 정렬 기준')  # 마지막 끌올 또는 생성 시각
 
     class Meta:
         db_table = 'custom_groupbuy'
@@ -237,6 +239,7 @@ class CustomGroupBuy(models.Model):
             models.Index(fields=['-created_at']),
             models.Index(fields=['expired_at'], name='idx_custom_expired'),
             models.Index(fields=['seller_decision_deadline'], name='idx_custom_seller_decision'),
+            models.Index(fields=['status', '-effective_date', '-id'], name='idx_custom_feed'),
         ]
 
     def __str__(self):
@@ -301,6 +304,7 @@ class CustomGroupBuy(models.Model):
         if not self.pk and not self.expired_at and self.max_wait_hours:
             self.expired_at = timezone.now() + timedelta(hours=self.max_wait_hours)
 
+        sync_effective_date(self, kwargs)
         super().save(*args, **kwargs)
 
     def complete_groupbuy(self):
@@ -379,8 +383,7 @@ class CustomGroupBuy(models.Model):
     def finalize_completed_groupbuy(self):
         """판매자가 확정한 후 실제 완료 처리 (할인 발급 + 알림)"""
         from django.db import transaction
-        from api.utils.notification_helper import send_custom_groupbuy_notification
-        import threading
+        from api.services.job_queue import JobQueue
 
         logger.info(f"[FINALIZE] 시작 - groupbuy_id:{self.id}, title:{self.title}")
 
@@ -410,51 +413,52 @@ class CustomGroupBuy(models.Model):
             logger.error(f"[COMPLETE] 할인 발급 실패 (상태는 completed 유지) - error:{str(e)}", exc_info=True)
             # SMS 실패해도 계속 진행
 
-        # 3단계: Push 알림 발송을 백그라운드 스레드로 실행
-        def send_notifications_async():
-            """Push 알림을 비동기로 발송하는 내부 함수"""
-            try:
-                logger.info(f"[COMPLETE] Push 알림 발송 시작 (백그라운드)")
-                participants = self.participants.filter(status='confirmed')
-                logger.info(f"[COMPLETE] 참여자 수: {participants.count()}명")
+        # 3단계: Push 알림 발송은 작업 큐에 등록 (run_workers가 처리, 워커 재시작에도 유실되지 않음)
+        JobQueue.enqueue(
+            'custom_groupbuy.completion_notifications',
+            {'custom_groupbuy_id': self.id},
+            idempotency_key=f'custom_groupbuy:{self.id}:completion_notifications'
+        )
+        logger.info(f"[COMPLETE] Push 알림 발송 작업 등록됨")
 
-                for i, participant in enumerate(participants):
-                    try:
-                        send_custom_groupbuy_notification(
-                            user=participant.user,
-                            custom_groupbuy=self,
-                            notification_type='custom_completed',
-                            message=f'"{self.title}" 공구가 마감되었습니다! 할인코드를 확인해주세요.',
-                            push_title='커스텀 공구 마감'
-                        )
-                        logger.info(f"[COMPLETE] Push 알림 {i+1}/{participants.count()} 발송 완료 - user:{participant.user.username}")
-                    except Exception as e:
-                        logger.error(f"[COMPLETE] Push 알림 발송 실패 - user:{participant.user.username}, error:{e}")
+        logger.info(f"[COMPLETE] 완료 - {self.title} ({self.current_participants}명)")
 
-                # 판매자에게도 알림
-                if self.seller:
-                    try:
-                        send_custom_groupbuy_notification(
-                            user=self.seller,
-                            custom_groupbuy=self,
-                            notification_type='custom_completed',
-                            message=f'"{self.title}" 공구가 성공적으로 마감되었습니다! (참여자 {self.current_participants}명)',
-                            push_title='커스텀 공구 마감'
-                        )
-                        logger.info(f"[COMPLETE] 판매자 Push 알림 발송 완료 - seller:{self.seller.username}")
-                    except Exception as e:
-                        logger.error(f"[COMPLETE] 판매자 Push 알림 발송 실패 - error:{e}")
+    def send_completion_notifications(self):
+        """마감 알림 발송 (참여자 + 판매자) - 작업 큐에서 호출"""
+        from api.utils.notification_helper import send_custom_groupbuy_notification
+
+        logger.info(f"[COMPLETE] Push 알림 발송 시작")
+        participants = self.participants.filter(status='confirmed').select_related('user')
+        logger.info(f"[COMPLETE] 참여자 수: {len(participants)}명")
 
-                logger.info(f"[COMPLETE] 백그라운드 알림 발송 완료 - {self.title}")
+        for i, participant in enumerate(participants):
+            try:
+                send_custom_groupbuy_notification(
+                    user=participant.user,
+                    custom_groupbuy=self,
+                    notification_type='custom_completed',
+                    message=f'"{self.title}" 공구가 마감되었습니다! 할인코드를 확인해주세요.',
+                    push_title='커스텀 공구 마감'
+                )
+                logger.info(f"[COMPLETE] Push 알림 {i+1}/{len(participants)} 발송 완료 - user:{participant.user.username}")
             except Exception as e:
-                logger.error(f"[COMPLETE] Push 알림 발송 중 예외 (백그라운드) - error:{str(e)}")
+                logger.error(f"[COMPLETE] Push 알림 발송 실패 - user:{participant.user.username}, error:{e}")
 
-        # 백그라운드 스레드로 알림 발송 시작
-        notification_thread = threading.Thread(target=send_notifications_async, daemon=True)
-        notification_thread.start()
-        logger.info(f"[COMPLETE] Push 알림 백그라운드 스레드 시작됨")
+        # 판매자에게도 알림
+        if self.seller:
+            try:
+                send_custom_groupbuy_notification(
+                    user=self.seller,
+                    custom_groupbuy=self,
+                    notification_type='custom_completed',
+                    message=f'"{self.title}" 공구가 성공적으로 마감되었습니다! (참여자 {self.current_participants}명)',
+                    push_title='커스텀 공구 마감'
+                )
+                logger.info(f"[COMPLETE] 판매자 Push 알림 발송 완료 - seller:{self.seller.username}")
+            except Exception as e:
+                logger.error(f"[COMPLETE] 판매자 Push 알림 발송 실패 - error:{e}")
 
-        logger.info(f"[COMPLETE] 완료 - {self.title} ({self.current_participants}명)")
+        logger.info(f"[COMPLETE] 알림 발송 완료 - {self.title}")
 
     def issue_discounts(self):
         """할인코드/링크 발급"""
@@ -558,8 +562,10 @@ class CustomGroupBuy(models.Model):
                         f"dungjimarket.com/custom-deals/my"
                     )
 
-                    sms_success_count, sms_fail_count = sms_service.send_bulk_sms(phone_numbers, message)
-                    logger.info(f"[ISSUE] SMS 대량 발송 완료: {self.title} - 성공:{sms_success_count}, 실패:{sms_fail_count}")
+                    job = sms_service.enqueue_bulk_sms(
+                        phone_numbers, message, idempotency_key=f'sms:custom_groupbuy:{self.id}:completed'
+                    )
+                    logger.info(f"[ISSUE] SMS 대량 발송 등록: {self.title} - {len(phone_numbers)}명, job:{job.id}")
                 except Exception as e:
                     logger.error(f"[ISSUE] SMS 대량 발송 실패: {str(e)}", exc_info=True)
             else:
@@ -570,7 +576,7 @@ class CustomGroupBuy(models.Model):
             if hasattr(self.seller, 'phone_number') and self.seller.phone_number:
                 try:
                     logger.info(f"[ISSUE] 판매자 SMS 발송 시도 - phone:{self.seller.phone_number}")
-                    success, error = sms_service.send_custom_groupbuy_completion_seller(
+                    sms_service.enqueue_custom_groupbuy_completion_seller(
                         phone_number=self.seller.phone_number,
                         title=self.title,
                         participants_count=participant_count,
@@ -579,10 +585,7 @@ class CustomGroupBuy(models.Model):
                         user=self.seller,
                         custom_groupbuy=self
                     )
-                    if success:
-                        logger.info(f"[ISSUE] 판매자 SMS 발송 성공: {self.seller.username} ({self.seller.phone_number})")
-                    else:
-                        logger.warning(f"[ISSUE] 판매자 SMS 발송 실패: {self.seller.username} - {error}")
+                    logger.info(f"[ISSUE] 판매자 SMS 발송 등록: {self.seller.username} ({self.seller.phone_number})")
                 except Exception as e:
                     logger.error(f"[ISSUE] 판매자 SMS 발송 예외: {self.seller.username} - {str(e)}", exc_info=True)
             else:
@@ -686,8 +689,10 @@ class CustomGroupBuy(models.Model):
                     f"dungjimarket.com/custom-deals/my"
                 )
 
-                sms_success_count, sms_fail_count = sms_service.send_bulk_sms(phone_numbers, message)
-                logger.info(f"SMS 대량 발송 완료: {self.title} - 성공:{sms_success_count}, 실패:{sms_fail_count}")
+                job = sms_service.enqueue_bulk_sms(
+                    phone_numbers, message, idempotency_key=f'sms:custom_groupbuy:{self.id}:completed'
+                )
+                logger.info(f"SMS 대량 발송 등록: {self.title} - {len(phone_numbers)}명, job:{job.id}")
             except Exception as e:
                 logger.error(f"SMS 대량 발송 실패: {str(e)}", exc_info=True)
         else:
@@ -711,7 +716,7 @@ class CustomGroupBuy(models.Model):
                     # 전품목 할인: 할인율 사용
                     discount_rate = self.discount_rate
 
-                success, error = sms_service.send_custom_groupbuy_completion_seller(
+                sms_service.enqueue_custom_groupbuy_completion_seller(
                     phone_number=self.seller.phone_number,
                     title=self.title,
                     participants_count=participant_count,
@@ -720,10 +725,7 @@ class CustomGroupBuy(models.Model):
                     user=self.seller,
                     custom_groupbuy=self
                 )
-                if success:
-                    logger.info(f"판매자 SMS 발송 성공: {self.seller.username} ({self.seller.phone_number})")
-                else:
-                    logger.warning(f"판매자 SMS 발송 실패: {self.seller.username} - {error}")
+                logger.info(f"판매자 SMS 발송 등록: {self.seller.username} ({self.seller.phone_number})")
             except Exception as e:
                 logger.error(f"판매자 SMS 발송 예외: {self.seller.username} - {str(e)}")
         else:
@@ -870,8 +872,10 @@ class CustomGroupBuy(models.Model):
                 try:
                     short_title = self.title[:20] if len(self.title) > 20 else self.title
                     sms_message = f"[둥지마켓] {short_title} 공구가 인원미달로 종료되었습니다"
-                    sms_success_count, sms_fail_count = sms_service.send_bulk_sms(phone_numbers, sms_message)
-                    logger.info(f"참여자 SMS 발송 완료 (인원미달): 성공 {sms_success_count}건, 실패 {sms_fail_count}건")
+                    sms_service.enqueue_bulk_sms(
+                        phone_numbers, sms_message, idempotency_key=f'sms:custom_groupbuy:{self.id}:expired'
+                    )
+                    logger.info(f"참여자 SMS 발송 등록 (인원미달): {len(phone_numbers)}명")
                 except Exception as e:
                     logger.error(f"참여자 SMS 발송 실패 (인원미달): {e}")
 
@@ -935,8 +939,10 @@ class CustomGroupBuy(models.Model):
                 try:
                     short_title = self.title[:20] if len(self.title) > 20 else self.title
                     sms_message = f"[둥지마켓] {short_title} 공구가 인원미달로 취소되었습니다"
-                    sms_success_count, sms_fail_count = sms_service.send_bulk_sms(phone_numbers, sms_message)
-                    logger.info(f"참여자 SMS 발송 완료 (판매결정 취소): 성공 {sms_success_count}건, 실패 {sms_fail_count}건")
+                    sms_service.enqueue_bulk_sms(
+                        phone_numbers, sms_message, idempotency_key=f'sms:custom_groupbuy:{self.id}:cancelled'
+                    )
+                    logger.info(f"참여자 SMS 발송 등록 (판매결정 취소): {len(phone_numbers)}명")
                 except Exception as e:
                     logger.error(f"참여자 SMS 발송 실패 (판매결정 취소): {e}")
 
@@ -0,0 +1,73 @@
+from django.db import models
+
+
+class BackgroundJob(models.Model):
+    """
+    DB 기반 백그라운드 작업 (푸시/SMS/이메일 등 외부 발송)
+
+    요청 트랜잭션 안에서 생성되므로 롤백되면 작업도 사라지고,
+    커밋된 작업은 run_workers 명령이 SKIP LOCKED로 가져가 처리합니다.
+    """
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('running', '처리중'),
+        ('succeeded', '완료'),
+        ('failed', '실패'),
+    ]
+
+    job_type = models.CharField(max_length=50, verbose_name='작업 타입')
+    payload = models.JSONField(default=dict, blank=True, verbose_name='작업 데이터')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name='상태')
+    idempotency_key = models.CharField(
+        max_length=200,
+        unique=True,
+        null=True,
+        blank=True,
+        verbose_name='중복 방지 키'
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    max_attempts = models.PositiveSmallIntegerField(default=5, verbose_name='최대 시도 횟수')
+    run_at = models.DateTimeField(verbose_name='실행 예정 시각')
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name='처리 시작 시각')
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name='처리 워커')
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    completed_at = models.DateTimeField(null=True, blank=True, verbose_name='완료일')
+
+    class Meta:
+        verbose_name = '백그라운드 작업'
+        verbose_name_plural = '백그라운드 작업 관리'
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='bgjob_status_run_at_idx'),
+            models.Index(fields=['job_type', 'status'], name='bgjob_type_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_type} #{self.id} ({self.get_status_display()})"
+
+
+class JobCheckpoint(models.Model):
+    """
+    주기 작업(스위퍼 등)의 워터마크
+
+    다음 실행은 position 이후에 해당하는 데이터만 확인하면 되도록 마지막 처리 기준 시각을 저장합니다.
+    행이 없으면 처음부터 처리합니다.
+    """
+    name = models.CharField(max_length=100, unique=True, verbose_name='작업 이름')
+    position = models.DateTimeField(null=True, blank=True, verbose_name='처리 기준 시각')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '작업 워터마크'
+        verbose_name_plural = '작업 워터마크 관리'
+
+    def __str__(self):
+        return f"{self.name} ({self.position})"
+
+    @classmethod
+    def get_position(cls, name):
+        return cls.objects.filter(name=name).values_list('position', flat=True).first()
+
+    @classmethod
+    def set_position(cls, name, position):
+        cls.objects.update_or_create(name=name, defaults={'position': position})
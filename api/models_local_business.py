@@ -4,6 +4,7 @@ Google Places API 기반 지역별 업체 정보 제공
 """
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class LocalBusinessCategory(models.Model):
@@ -327,8 +328,10 @@ class LocalBusinessView(models.Model):
         verbose_name='IP 주소'
     )
 
+    # 조회 기록은 버퍼에 모았다가 일괄 저장하므로 조회 시각을 직접 지정 (auto_now_add는 저장 시각으로 덮어씀)
     viewed_at = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         verbose_name='조회 시간'
     )
 
@@ -44,3 +44,25 @@ class Region(models.Model):
             ancestors.insert(0, current)
             current = current.parent
         return ancestors
+
+
+class RegionClosure(models.Model):
+    """
+    지역 계층의 클로저 테이블 (조상-자손 쌍을 모두 저장, 자기 자신은 depth 0)
+    상위 지역으로 필터링할 때 하위 지역 전체를 한 번의 조인으로 찾기 위해 사용
+    RegionIndex.rebuild_closure()로 재생성
+    """
+    ancestor = models.ForeignKey(Region, on_delete=models.CASCADE, related_name='descendant_links', verbose_name='상위 지역')
+    descendant = models.ForeignKey(Region, on_delete=models.CASCADE, related_name='ancestor_links', verbose_name='하위 지역')
+    depth = models.PositiveSmallIntegerField(verbose_name='단계 차이')
+
+    class Meta:
+        verbose_name = '지역 계층'
+        verbose_name_plural = '지역 계층 목록'
+        unique_together = ('ancestor', 'descendant')
+        indexes = [
+            models.Index(fields=['descendant', 'depth'], name='region_closure_desc_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
@@ -0,0 +1,23 @@
+"""
+관리자 대시보드 통계 스냅샷
+
+회원/공구/입찰 통계를 요청마다 세지 않도록 집계 결과를 키별 한 행에 저장해 둡니다.
+refresh_admin_statistics 명령이 주기적으로 갱신하고, 관리자 통계 API는 이 스냅샷을 그대로 응답합니다.
+"""
+from django.db import models
+
+
+class StatsSnapshot(models.Model):
+    """통계 집계 결과 (키당 최신 한 행)"""
+
+    key = models.CharField(max_length=50, primary_key=True, verbose_name='통계 키')
+    data = models.JSONField(default=dict, verbose_name='집계 결과')
+    computed_at = models.DateTimeField(verbose_name='집계 시각')
+
+    class Meta:
+        db_table = 'stats_snapshot'
+        verbose_name = '통계 스냅샷'
+        verbose_name_plural = '통계 스냅샷'
+
+    def __str__(self):
+        return f"{self.key} ({self.computed_at:%Y-%m-%d %H:%M})"
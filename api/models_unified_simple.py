@@ -44,7 +44,9 @@ class UnifiedFavorite(models.Model):
         return f"{self.user.username} - {item_type_display} #{self.item_id}"
 
     def get_item(self):
-        """실제 상품 객체 반환 (삭제된 상품 제외)"""
+        """실제 상품 객체 반환 (삭제된 상품 제외, bulk_get_items로 미리 조회했으면 그 결과)"""
+        if hasattr(self, '_prefetched_item'):
+            return self._prefetched_item
         if self.item_type == 'phone':
             from used_phones.models import UsedPhone
             return UsedPhone.objects.filter(id=self.item_id).exclude(status='deleted').first()
@@ -192,7 +194,9 @@ class UnifiedReport(models.Model):
         return f"[{self.get_report_type_display()}] {target} - {self.reporter.username}"
 
     def get_item(self):
-        """신고된 상품 객체 반환"""
+        """신고된 상품 객체 반환 (bulk_get_items로 미리 조회했으면 그 결과)"""
+        if hasattr(self, '_prefetched_item'):
+            return self._prefetched_item
         if not self.item_type or not self.item_id:
             return None
 
@@ -250,7 +254,9 @@ class UnifiedBump(models.Model):
         return f"{self.user.username} - {item_type_display} #{self.item_id} - {self.bumped_at.strftime('%Y-%m-%d %H:%M')}"
 
     def get_item(self):
-        """실제 상품 객체 반환"""
+        """실제 상품 객체 반환 (bulk_get_items로 미리 조회했으면 그 결과)"""
+        if hasattr(self, '_prefetched_item'):
+            return self._prefetched_item
         if self.item_type == 'phone':
             from used_phones.models import UsedPhone
             return UsedPhone.objects.filter(id=self.item_id).first()
@@ -0,0 +1,382 @@
+"""
+사용자별 거래 통계 (증분 유지)
+
+중고폰 판매/제안, 찜, 후기, 입찰 수를 사용자당 한 행에 미리 집계해 두고
+각 원본 모델의 저장/삭제 신호에서 변경분만 반영합니다.
+queryset.update()처럼 신호가 없는 일괄 변경 후에는 UserTradeStats.recompute()로 다시 집계하고,
+매일 reconcile_user_trade_stats 명령이 원본과의 차이를 점검합니다.
+"""
+from collections import defaultdict
+from django.conf import settings
+from django.db import models
+from django.db.models import Count, F, Q, Sum
+from django.db.models.signals import post_init, post_save, post_delete
+
+
+class UserTradeStats(models.Model):
+    """사용자 거래 통계 (프로필/판매자 카드/마이페이지 조회용)"""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trade_stats',
+        verbose_name='사용자'
+    )
+
+    # 중고폰 판매 (판매자 기준)
+    phone_active_count = models.IntegerField(default=0, verbose_name='판매중 중고폰 수')
+    phone_trading_count = models.IntegerField(default=0, verbose_name='거래중 중고폰 수')
+    phone_sold_count = models.IntegerField(default=0, verbose_name='판매완료 중고폰 수')
+    phone_received_offer_count = models.IntegerField(default=0, verbose_name='받은 대기 제안 수')
+
+    # 중고폰 구매 (구매자 기준)
+    phone_pending_offer_count = models.IntegerField(default=0, verbose_name='보낸 대기 제안 수')
+    phone_accepted_offer_count = models.IntegerField(default=0, verbose_name='수락된 제안 수')
+
+    # 찜
+    phone_favorite_count = models.IntegerField(default=0, verbose_name='휴대폰 찜 수')
+    electronics_favorite_count = models.IntegerField(default=0, verbose_name='전자제품 찜 수')
+
+    # 중고거래 후기 (받은 후기)
+    review_count = models.IntegerField(default=0, verbose_name='받은 후기 수')
+    review_rating_sum = models.IntegerField(default=0, verbose_name='받은 후기 평점 합계')
+
+    # 공구 판매자 리뷰 (받은 리뷰)
+    seller_review_count = models.IntegerField(default=0, verbose_name='받은 판매자 리뷰 수')
+    seller_review_rating_sum = models.IntegerField(default=0, verbose_name='받은 판매자 리뷰 평점 합계')
+
+    # 공구 입찰 (판매자 기준)
+    bid_count = models.IntegerField(default=0, verbose_name='입찰 수')
+    bid_pending_count = models.IntegerField(default=0, verbose_name='대기중 입찰 수')
+    bid_selected_count = models.IntegerField(default=0, verbose_name='선정된 입찰 수')
+    bid_rejected_count = models.IntegerField(default=0, verbose_name='포기한 입찰 수')
+
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='업데이트일')
+
+    COUNTER_FIELDS = (
+        'phone_active_count', 'phone_trading_count', 'phone_sold_count', 'phone_received_offer_count',
+        'phone_pending_offer_count', 'phone_accepted_offer_count',
+        'phone_favorite_count', 'electronics_favorite_count',
+        'review_count', 'review_rating_sum',
+        'seller_review_count', 'seller_review_rating_sum',
+        'bid_count', 'bid_pending_count', 'bid_selected_count', 'bid_rejected_count',
+    )
+
+    class Meta:
+        db_table = 'user_trade_stats'
+        verbose_name = '사용자 거래 통계'
+        verbose_name_plural = '사용자 거래 통계'
+
+    def __str__(self):
+        return f"{self.user_id} 거래 통계"
+
+    @property
+    def review_average(self):
+        """받은 중고거래 후기 평균 평점 (소수점 1자리, 후기 없으면 None)"""
+        if not self.review_count:
+            return None
+        return round(self.review_rating_sum / self.review_count, 1)
+
+    @property
+    def seller_review_average(self):
+        """받은 공구 판매자 리뷰 평균 평점 (소수점 1자리, 리뷰 없으면 None)"""
+        if not self.seller_review_count:
+            return None
+        return round(self.seller_review_rating_sum / self.seller_review_count, 1)
+
+    @classmethod
+    def for_user(cls, user):
+        """사용자 통계 행 (없으면 원본에서 집계해 생성)"""
+        try:
+            return user.trade_stats
+        except cls.DoesNotExist:
+            stats = cls.recompute([user.pk])[user.pk]
+            user.trade_stats = stats
+            return stats
+
+    @classmethod
+    def compute(cls, user_ids):
+        """
+        원본 테이블에서 통계를 집계 (원본 모델당 쿼리 1개)
+
+        Returns:
+            dict: {user_id: {필드: 값}}
+        """
+        from api.models import Bid, Review
+        from api.models_unified_simple import UnifiedFavorite, UnifiedReview
+        from used_phones.models import UsedPhone, UsedPhoneOffer
+
+        user_ids = list(set(user_ids))
+        values = {user_id: dict.fromkeys(cls.COUNTER_FIELDS, 0) for user_id in user_ids}
+
+        def collect(queryset, key):
+            for row in queryset:
+                user_id = row.pop(key)
+                if user_id in values:
+                    values[user_id].update({field: value or 0 for field, value in row.items()})
+
+        collect(
+            UsedPhone.objects.filter(seller_id__in=user_ids).values('seller_id').annotate(
+                phone_active_count=Count('id', filter=Q(status='active')),
+                phone_trading_count=Count('id', filter=Q(status='trading')),
+                phone_sold_count=Count('id', filter=Q(status='sold')),
+            ).order_by(),
+            'seller_id'
+        )
+        collect(
+            UsedPhoneOffer.objects.filter(
+                phone__seller_id__in=user_ids,
+                phone__status__in=OPEN_PHONE_STATUSES,
+                status='pending',
+            ).values('phone__seller_id').annotate(phone_received_offer_count=Count('id')).order_by(),
+            'phone__seller_id'
+        )
+        collect(
+            UsedPhoneOffer.objects.filter(buyer_id__in=user_ids).values('buyer_id').annotate(
+                phone_pending_offer_count=Count('id', filter=Q(status='pending')),
+                phone_accepted_offer_count=Count('id', filter=Q(status='accepted')),
+            ).order_by(),
+            'buyer_id'
+        )
+        collect(
+            UnifiedFavorite.objects.filter(user_id__in=user_ids).values('user_id').annotate(
+                phone_favorite_count=Count('id', filter=Q(item_type='phone')),
+                electronics_favorite_count=Count('id', filter=Q(item_type='electronics')),
+            ).order_by(),
+            'user_id'
+        )
+        collect(
+            UnifiedReview.objects.filter(reviewee_id__in=user_ids).values('reviewee_id').annotate(
+                review_count=Count('id'),
+                review_rating_sum=Sum('rating'),
+            ).order_by(),
+            'reviewee_id'
+        )
+        collect(
+            Review.objects.filter(seller_id__in=user_ids).values('seller_id').annotate(
+                seller_review_count=Count('id'),
+                seller_review_rating_sum=Sum('rating'),
+            ).order_by(),
+            'seller_id'
+        )
+        collect(
+            Bid.objects.filter(seller_id__in=user_ids).values('seller_id').annotate(
+                bid_count=Count('id'),
+                bid_pending_count=Count('id', filter=Q(status='pending')),
+                bid_selected_count=Count('id', filter=Q(status='selected')),
+                bid_rejected_count=Count('id', filter=Q(status='rejected')),
+            ).order_by(),
+            'seller_id'
+        )
+        return values
+
+    @classmethod
+    def recompute(cls, user_ids):
+        """
+        원본에서 다시 집계해 저장 (queryset.update() 등 신호 없는 일괄 변경 후 호출)
+
+        Returns:
+            dict: {user_id: UserTradeStats}
+        """
+        user_ids = [user_id for user_id in set(user_ids) if user_id]
+        if not user_ids:
+            return {}
+        rows = [cls(user_id=user_id, **values) for user_id, values in cls.compute(user_ids).items()]
+        cls.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=list(cls.COUNTER_FIELDS) + ['updated_at'],
+        )
+        return {row.user_id: row for row in rows}
+
+    @classmethod
+    def apply_deltas(cls, deltas, create_missing=True):
+        """
+        변경분 반영
+
+        Args:
+            deltas: {user_id: {필드: 증감}}
+            create_missing: 통계 행이 없는 사용자를 원본에서 집계해 생성할지 여부
+                (삭제 시에는 False - 사용자 삭제 CASCADE 중 삭제된 사용자의 행을 다시 만들지 않음,
+                 없는 행은 for_user()가 조회 시 집계)
+        """
+        missing = []
+        for user_id, changes in deltas.items():
+            changes = {field: delta for field, delta in changes.items() if delta}
+            if not user_id or not changes:
+                continue
+            updated = cls.objects.filter(user_id=user_id).update(
+                **{field: F(field) + delta for field, delta in changes.items()}
+            )
+            if not updated and create_missing:
+                # 아직 통계 행이 없는 사용자는 이번 변경까지 포함해 원본에서 집계
+                missing.append(user_id)
+        cls.recompute(missing)
+
+
+# 받은 제안 수에 포함하는 중고폰 상태 (판매중/거래중)
+OPEN_PHONE_STATUSES = ('active', 'trading')
+
+PHONE_STATUS_FIELDS = {
+    'active': 'phone_active_count',
+    'trading': 'phone_trading_count',
+    'sold': 'phone_sold_count',
+}
+OFFER_STATUS_FIELDS = {
+    'pending': 'phone_pending_offer_count',
+    'accepted': 'phone_accepted_offer_count',
+}
+FAVORITE_TYPE_FIELDS = {
+    'phone': 'phone_favorite_count',
+    'electronics': 'electronics_favorite_count',
+}
+BID_STATUS_FIELDS = {
+    'pending': 'bid_pending_count',
+    'selected': 'bid_selected_count',
+    'rejected': 'bid_rejected_count',
+}
+
+
+def _phone_contributions(values):
+    field = PHONE_STATUS_FIELDS.get(values['status'])
+    return {(values['seller_id'], field): 1} if field else {}
+
+
+def _offer_contributions(values):
+    result = {}
+    field = OFFER_STATUS_FIELDS.get(values['status'])
+    if field:
+        result[(values['buyer_id'], field)] = 1
+    if values['status'] == 'pending':
+        from used_phones.models import UsedPhone
+        phone = UsedPhone.objects.filter(pk=values['phone_id']).values_list('seller_id', 'status').first()
+        if phone and phone[1] in OPEN_PHONE_STATUSES:
+            result[(phone[0], 'phone_received_offer_count')] = 1
+    return result
+
+
+def _favorite_contributions(values):
+    field = FAVORITE_TYPE_FIELDS.get(values['item_type'])
+    return {(values['user_id'], field): 1} if field else {}
+
+
+def _review_contributions(values):
+    return {
+        (values['reviewee_id'], 'review_count'): 1,
+        (values['reviewee_id'], 'review_rating_sum'): values['rating'] or 0,
+    }
+
+
+def _seller_review_contributions(values):
+    return {
+        (values['seller_id'], 'seller_review_count'): 1,
+        (values['seller_id'], 'seller_review_rating_sum'): values['rating'] or 0,
+    }
+
+
+def _bid_contributions(values):
+    result = {(values['seller_id'], 'bid_count'): 1}
+    field = BID_STATUS_FIELDS.get(values['status'])
+    if field:
+        result[(values['seller_id'], field)] = 1
+    return result
+
+
+# 모델 라벨: (통계에 영향을 주는 필드, 행 하나의 기여분 계산 함수)
+TRACKED_MODELS = {
+    'used_phones.UsedPhone': (('seller_id', 'status'), _phone_contributions),
+    'used_phones.UsedPhoneOffer': (('phone_id', 'buyer_id', 'status'), _offer_contributions),
+    'api.UnifiedFavorite': (('user_id', 'item_type'), _favorite_contributions),
+    'api.UnifiedReview': (('reviewee_id', 'rating'), _review_contributions),
+    'api.Review': (('seller_id', 'rating'), _seller_review_contributions),
+    'api.Bid': (('seller_id', 'status'), _bid_contributions),
+}
+
+
+def _tracked(instance):
+    return TRACKED_MODELS[instance._meta.label]
+
+
+# 지연 로딩(defer/only)으로 값을 알 수 없는 필드
+_UNKNOWN = object()
+
+
+def _snapshot(instance):
+    """저장 전 값 (지연 로딩 필드는 조회하지 않고 _UNKNOWN으로 둠)"""
+    fields, _ = _tracked(instance)
+    return {field: instance.__dict__.get(field, _UNKNOWN) for field in fields}
+
+
+def _collect(deltas, contributions, sign):
+    for (user_id, field), value in contributions.items():
+        if user_id:
+            deltas[user_id][field] += sign * value
+
+
+def _phone_received_offer_delta(instance, before, after, deltas):
+    """중고폰이 판매중/거래중 ↔ 그 외 상태로 바뀌면 대기 제안 수만큼 판매자의 받은 제안 수 증감"""
+    was_open = before is not None and before['status'] in OPEN_PHONE_STATUSES
+    is_open = after is not None and after['status'] in OPEN_PHONE_STATUSES
+    if was_open == is_open:
+        return
+    pending = instance.offers.filter(status='pending').count()
+    if pending:
+        deltas[instance.seller_id]['phone_received_offer_count'] += pending if is_open else -pending
+
+
+def _apply_change(instance, before, after, create_missing=True):
+    _, contributions = _tracked(instance)
+    deltas = defaultdict(lambda: defaultdict(int))
+    if before is not None:
+        _collect(deltas, contributions(before), -1)
+    if after is not None:
+        _collect(deltas, contributions(after), 1)
+    if instance._meta.label == 'used_phones.UsedPhone' and instance.pk:
+        _phone_received_offer_delta(instance, before, after, deltas)
+    UserTradeStats.apply_deltas(deltas, create_missing=create_missing)
+
+
+def _stash_snapshot(sender, instance, **kwargs):
+    instance._trade_stats_snapshot = _snapshot(instance) if instance.pk else None
+
+
+def _update_stats_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    fields, contributions = _tracked(instance)
+    if update_fields is not None:
+        names = set(fields) | {field.removesuffix('_id') for field in fields}
+        if not names & set(update_fields):
+            return
+
+    before = None if created else getattr(instance, '_trade_stats_snapshot', None)
+    after = _snapshot(instance)
+    instance._trade_stats_snapshot = after
+    if before == after:
+        return
+    if not created and (before is None or _UNKNOWN in before.values()):
+        # 저장 전 값을 알 수 없으면 관련 사용자를 원본에서 다시 집계
+        user_ids = {user_id for user_id, _ in contributions(after)}
+        if instance._meta.label == 'used_phones.UsedPhone':
+            user_ids.add(instance.seller_id)
+        UserTradeStats.recompute(user_ids)
+        return
+    _apply_change(instance, before, after)
+
+
+def _update_stats_on_delete(sender, instance, **kwargs):
+    before = getattr(instance, '_trade_stats_snapshot', None)
+    if before is None or _UNKNOWN in before.values():
+        before = _snapshot(instance)
+    if _UNKNOWN in before.values():
+        instance.refresh_from_db(fields=[field for field, value in before.items() if value is _UNKNOWN])
+        before = _snapshot(instance)
+    _apply_change(instance, before, None, create_missing=False)
+
+
+for _label in TRACKED_MODELS:
+    post_init.connect(_stash_snapshot, sender=_label, dispatch_uid=f'trade_stats_init_{_label}')
+    post_save.connect(_update_stats_on_save, sender=_label, dispatch_uid=f'trade_stats_save_{_label}')
+    post_delete.connect(_update_stats_on_delete, sender=_label, dispatch_uid=f'trade_stats_delete_{_label}')
@@ -0,0 +1,44 @@
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+
+class BumpFeedCursorPagination(CursorPagination):
+    """끌올 목록 커서 페이지네이션 (effective_date, id 역순 - 상태별 복합 인덱스 사용)"""
+    ordering = ('-effective_date', '-id')
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+
+class BumpFeedPagination(LimitOffsetPagination):
+    """
+    끌올 목록(중고폰/전자제품/커스텀 특가) 페이지네이션
+
+    기존 클라이언트를 위해 기본은 limit/offset을 유지하고,
+    cursor 파라미터가 있거나 pagination=cursor로 요청하면 커서 페이지네이션을 사용합니다.
+    offset은 깊은 페이지일수록 앞 행을 모두 건너뛰어야 하지만 커서는 인덱스에서 바로 이어서 읽습니다.
+    커서는 끌올 기준 정렬일 때만 사용할 수 있으며, 가격순 등 다른 정렬은 limit/offset으로 처리합니다.
+    """
+
+    CURSOR_MODE = 'cursor'
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def use_cursor(self, queryset, request):
+        cursor = BumpFeedCursorPagination
+        requested = (
+            cursor.cursor_query_param in request.query_params
+            or request.query_params.get('pagination') == self.CURSOR_MODE
+        )
+        return requested and tuple(queryset.query.order_by) == cursor.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(queryset, request):
+            self.cursor_paginator = BumpFeedCursorPagination()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from django.db import models
+import copy
 from .models import Product, Category, GroupBuy, Participation, TelecomProductDetail, ElectronicsProductDetail, RentalProductDetail, SubscriptionProductDetail, StandardProductDetail, ProductCustomValue, Wishlist, Review, GroupBuyTelecomDetail, GroupBuyInternetDetail, Bid, ParticipantConsent, NoShowReport
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
@@ -175,6 +177,11 @@ class ProductSerializer(serializers.ModelSerializer):
                 'subscription_detail', 'standard_detail', 'custom_values']
 
     def get_active_groupbuy(self, obj):
+        # 목록 조회에서는 GroupBuyListSerializer가 페이지 단위로 미리 계산한 값을 사용
+        active_groupbuys = self.context.get('active_groupbuys')
+        if active_groupbuys is not None:
+            return active_groupbuys.get(obj.id)
+
         active = GroupBuy.objects.filter(
             product=obj,
             status__in=['recruiting', 'bidding', 'final_selection']
@@ -278,7 +285,7 @@ class GroupBuySerializer(serializers.ModelSerializer):
         4. ProductCustomValue의 커스텀 필드 정보 포함
         """
         # 기본 상품 정보 가져오기
-        product_info = ProductSerializer(obj.product).data
+        product_info = self._get_product_data(obj.product)
         
         # 통신 상품인 경우 telecom_detail 정보 확인
         if 'telecom_detail' in product_info:
@@ -342,6 +349,10 @@ class GroupBuySerializer(serializers.ModelSerializer):
         
         # 최종 product_details 반환
         return product_info
+
+    def _get_product_data(self, product):
+        """product_details의 기본이 되는 상품 정보 (호출 측에서 수정해도 되는 새 dict)"""
+        return ProductSerializer(product).data
     
     def get_creator_name(self, obj):
         """
@@ -365,8 +376,11 @@ class GroupBuySerializer(serializers.ModelSerializer):
         
         # GroupBuyRegion 모델을 통해 연결된 지역 정보 가져오기
         regions = GroupBuyRegion.objects.filter(groupbuy=obj).select_related('region', 'region__parent')
-        
-        # 지역 정보 포맷팅
+        return self._format_regions(regions)
+
+    @staticmethod
+    def _format_regions(regions):
+        """GroupBuyRegion 목록을 프론트엔드 응답 형식으로 변환"""
         result = []
         for region_link in regions:
             region = region_link.region
@@ -437,6 +451,78 @@ class GroupBuySerializer(serializers.ModelSerializer):
         
         return data
 
+
+class GroupBuyListListSerializer(serializers.ListSerializer):
+    """페이지 전체를 한 번에 준비한 뒤 각 공구를 직렬화하는 ListSerializer"""
+
+    def to_representation(self, data):
+        groupbuys = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.child.prepare_page(groupbuys)
+        return [self.child.to_representation(groupbuy) for groupbuy in groupbuys]
+
+
+class GroupBuyListSerializer(GroupBuySerializer):
+    """
+    공구 목록(list/popular/recent) 전용 직렬화
+
+    응답 형식은 GroupBuySerializer와 동일하며, 아래 데이터를 페이지 단위로 재사용합니다.
+    - 상품별 진행중 공구(active_groupbuy): 페이지 전체를 한 번의 쿼리로 조회
+    - 상품 직렬화 결과: 같은 상품은 한 번만 직렬화
+    - 지역 정보: regions__region__parent prefetch 결과 사용
+    GroupBuyViewSet.optimize_list_queryset()으로 준비된 쿼리셋과 함께 사용해야 합니다.
+    """
+    product_info = serializers.SerializerMethodField()
+
+    class Meta(GroupBuySerializer.Meta):
+        list_serializer_class = GroupBuyListListSerializer
+
+    ACTIVE_GROUPBUY_STATUSES = ['recruiting', 'bidding', 'final_selection']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._active_groupbuys = None
+        self._product_info_cache = {}
+        self._product_details_cache = {}
+
+    def prepare_page(self, groupbuys):
+        product_ids = {groupbuy.product_id for groupbuy in groupbuys if groupbuy.product_id}
+
+        # 상품별 진행중 공구 (ProductSerializer.get_active_groupbuy와 동일한 결과)
+        active_groupbuys = {product_id: None for product_id in product_ids}
+        active_rows = GroupBuy.objects.filter(
+            product_id__in=product_ids,
+            status__in=self.ACTIVE_GROUPBUY_STATUSES
+        ).order_by('product_id', 'id').values(
+            'id', 'product_id', 'status', 'current_participants', 'max_participants'
+        )
+        for row in active_rows:
+            product_id = row.pop('product_id')
+            if active_groupbuys.get(product_id) is None:
+                active_groupbuys[product_id] = row
+
+        self._active_groupbuys = active_groupbuys
+        self._product_info_cache = {}
+        self._product_details_cache = {}
+
+    def _serialize_product(self, product, cache, context):
+        if product is None:
+            return ProductSerializer(product).data
+        if product.id not in cache:
+            context = dict(context, active_groupbuys=self._active_groupbuys)
+            cache[product.id] = ProductSerializer(product, context=context).data
+        return cache[product.id]
+
+    def get_product_info(self, obj):
+        return self._serialize_product(obj.product, self._product_info_cache, self.context)
+
+    def _get_product_data(self, product):
+        # get_product_details가 결과를 수정하므로 캐시된 dict를 복사해서 반환
+        return copy.deepcopy(self._serialize_product(product, self._product_details_cache, {}))
+
+    def get_regions(self, obj):
+        return self._format_regions(obj.regions.all())
+
+
 class ParticipationSerializer(serializers.ModelSerializer):
     user_name = serializers.CharField(source='user.first_name', read_only=True)
     groupbuy_status = serializers.CharField(source='groupbuy.status', read_only=True)
@@ -6,6 +6,7 @@ from .models_partner import (
 )
 from django.utils import timezone
 from datetime import timedelta
+from .services.partner_stats import PartnerStats
 
 User = get_user_model()
 
@@ -161,6 +162,8 @@ class PartnerSettlementRequestSerializer(serializers.ModelSerializer):
             partner=partner,
             settlement_status='pending'
         ).update(settlement_status='requested')
+        # update()는 post_save를 보내지 않으므로 정산 가능 금액 캐시를 직접 무효화
+        PartnerStats.invalidate(partner.pk)
         
         return settlement
 
@@ -0,0 +1,79 @@
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Q
+from django.utils import timezone
+from api.models import Bid, GroupBuy, StatsSnapshot
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdminStatistics:
+    """
+    관리자 대시보드 통계 (회원/공구/입찰)
+
+    - 테이블마다 조건부 집계(Count(filter=Q(...))) 한 번씩만 조회 (쿼리 3개)
+    - 결과는 StatsSnapshot 한 행에 저장하고 대시보드는 스냅샷을 응답
+      (refresh_admin_statistics 명령이 주기적으로 갱신, 스냅샷이 없거나 오래되면 요청 시 다시 집계)
+    - ?live=1 요청은 스냅샷 없이 바로 집계
+    """
+
+    SNAPSHOT_KEY = 'admin_dashboard'
+
+    @staticmethod
+    def max_age():
+        """스냅샷을 그대로 응답할 최대 경과 시간 (초)"""
+        return getattr(settings, 'ADMIN_STATS_SNAPSHOT_MAX_AGE', 15 * 60)
+
+    @classmethod
+    def compute(cls):
+        """원본 테이블에서 통계 집계"""
+        User = get_user_model()
+        users = User.objects.aggregate(
+            total=Count('id'),
+            buyers=Count('id', filter=Q(role='buyer')),
+            sellers=Count('id', filter=Q(role='seller')),
+            verified_sellers=Count('id', filter=Q(role='seller', is_business_verified=True)),
+            pending_verifications=Count('id', filter=Q(
+                role='seller',
+                business_reg_number__isnull=False,
+                is_business_verified=False
+            ) & ~Q(business_reg_number='')),
+        )
+        groupbuys = GroupBuy.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=['recruiting', 'bidding'])),
+            completed=Count('id', filter=Q(status='completed')),
+        )
+        bids = Bid.objects.aggregate(
+            total=Count('id'),
+            successful=Count('id', filter=Q(status='selected')),
+        )
+        bids['success_rate'] = round((bids['successful'] / bids['total'] * 100) if bids['total'] > 0 else 0, 2)
+        return {'users': users, 'groupbuys': groupbuys, 'bids': bids}
+
+    @classmethod
+    def refresh(cls):
+        """다시 집계해 스냅샷 저장"""
+        snapshot, _ = StatsSnapshot.objects.update_or_create(
+            key=cls.SNAPSHOT_KEY,
+            defaults={'data': cls.compute(), 'computed_at': timezone.now()}
+        )
+        return snapshot
+
+    @classmethod
+    def get(cls, live=False):
+        """
+        대시보드 통계
+
+        Returns:
+            tuple: (통계 dict, 집계 시각)
+        """
+        if live:
+            return cls.compute(), timezone.now()
+        snapshot = StatsSnapshot.objects.filter(key=cls.SNAPSHOT_KEY).first()
+        if snapshot is None or snapshot.computed_at < timezone.now() - timedelta(seconds=cls.max_age()):
+            logger.info("관리자 통계 스냅샷이 없거나 오래되어 다시 집계")
+            snapshot = cls.refresh()
+        return snapshot.data, snapshot.computed_at
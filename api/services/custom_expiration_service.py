@@ -79,8 +79,11 @@ class CustomExpirationService:
                         try:
                             short_title = groupbuy.title[:20] if len(groupbuy.title) > 20 else groupbuy.title
                             sms_message = f"[둥지마켓] {short_title} 공구가 판매결정시간 초과로 취소되었습니다"
-                            sms_success_count, sms_fail_count = sms_service.send_bulk_sms(phone_numbers, sms_message)
-                            logger.info(f"참여자 SMS 발송 완료 (판매결정시간 초과): 성공 {sms_success_count}건, 실패 {sms_fail_count}건")
+                            sms_service.enqueue_bulk_sms(
+                                phone_numbers, sms_message,
+                                idempotency_key=f'sms:custom_groupbuy:{groupbuy.id}:seller_decision_expired'
+                            )
+                            logger.info(f"참여자 SMS 발송 등록 (판매결정시간 초과): {len(phone_numbers)}명")
                         except Exception as sms_error:
                             logger.error(f"참여자 SMS 발송 실패 (판매결정시간 초과): {sms_error}")
 
@@ -0,0 +1,99 @@
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+from api.models import GroupBuy, Participation
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JoinRejected(Exception):
+    """공구 참여 불가 (메시지는 그대로 사용자에게 응답)"""
+
+
+class GroupBuyAdmissionService:
+    """
+    공구 참여(join) 처리
+
+    마감 직전 동시에 몰리는 참여 요청에서도 max_participants를 넘지 않도록
+    조건부 UPDATE ... RETURNING으로 자리를 먼저 예약하고 같은 트랜잭션에서 참여를 생성합니다.
+    예약 UPDATE가 공구 행을 잠그므로 같은 공구의 참여는 커밋 순서대로 직렬화되고,
+    참여 생성이 실패하면 예약도 함께 롤백됩니다.
+    """
+
+    JOINABLE_STATUSES = ('recruiting', 'bidding')
+
+    @classmethod
+    def check_duplicates(cls, user, groupbuy):
+        """이미 참여 중인 공구 / 동일 상품의 진행중 공구 참여 여부를 한 번의 쿼리로 확인"""
+        joined_groupbuy_ids = list(
+            Participation.objects.filter(user=user)
+            .filter(
+                Q(groupbuy_id=groupbuy.id)
+                | Q(groupbuy__product_id=groupbuy.product_id, groupbuy__status__in=cls.JOINABLE_STATUSES)
+            )
+            .values_list('groupbuy_id', flat=True)[:2]
+        )
+        if groupbuy.id in joined_groupbuy_ids:
+            raise JoinRejected('이미 참여 중인 공구입니다.')
+        if joined_groupbuy_ids:
+            raise JoinRejected('이미 동일한 상품의 다른 공구에 참여중입니다.')
+
+    @classmethod
+    def _reserve_seat(cls, groupbuy_id, now):
+        """
+        빈 자리가 있고 참여 가능한 상태일 때만 current_participants를 1 증가
+
+        Returns:
+            int: 증가된 참여자 수 (예약 실패 시 None)
+        """
+        qn = connection.ops.quote_name
+        opts = GroupBuy._meta
+        current = qn(opts.get_field('current_participants').column)
+        status_placeholders = ', '.join(['%s'] * len(cls.JOINABLE_STATUSES))
+        sql = (
+            f"UPDATE {qn(opts.db_table)} SET {current} = {current} + 1 "
+            f"WHERE {qn(opts.pk.column)} = %s "
+            f"AND {current} < {qn(opts.get_field('max_participants').column)} "
+            f"AND {qn(opts.get_field('status').column)} IN ({status_placeholders}) "
+            f"AND {qn(opts.get_field('end_time').column)} >= %s "
+            f"RETURNING {current}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [groupbuy_id, *cls.JOINABLE_STATUSES, now])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    @classmethod
+    def join(cls, user, groupbuy):
+        """
+        공구 참여
+
+        Returns:
+            tuple: (Participation, 참여 후 current_participants)
+
+        Raises:
+            JoinRejected: 중복 참여, 모집 종료, 정원 초과
+        """
+        cls.check_duplicates(user, groupbuy)
+
+        # 공구 상태 확인 - recruiting 또는 bidding 상태에서만 참여 가능
+        now = timezone.now()
+        if groupbuy.status not in cls.JOINABLE_STATUSES or now > groupbuy.end_time:
+            raise JoinRejected('참여할 수 없는 공구입니다. 모집이 종료되었거나 마감되었습니다.')
+
+        with transaction.atomic():
+            current_participants = cls._reserve_seat(groupbuy.id, now)
+            if current_participants is None:
+                # 예약 실패 사유 구분 (정원 초과 외에는 그 사이 상태가 바뀐 경우)
+                latest = GroupBuy.objects.filter(pk=groupbuy.id).values('status', 'end_time').first()
+                if latest and latest['status'] in cls.JOINABLE_STATUSES and now <= latest['end_time']:
+                    raise JoinRejected('최대 참여자 수에 도달했습니다.')
+                raise JoinRejected('참여할 수 없는 공구입니다. 모집이 종료되었거나 마감되었습니다.')
+
+            # 중복 확인은 위에서 끝났으므로 save()의 중복 조회는 생략 (동시 중복 요청은 unique 제약으로 차단)
+            participation = Participation(user=user, groupbuy=groupbuy, is_leader=False)
+            participation.save(skip_duplicate_check=True)
+
+        groupbuy.current_participants = current_participants
+        return participation, current_participants
@@ -0,0 +1,150 @@
+from collections import namedtuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+import hashlib
+import time
+
+# 서빙 시점에 calculated_status / remaining_seconds를 다시 계산하기 위해 캐시에 함께 저장하는 값
+ListItemState = namedtuple('ListItemState', ['end_time', 'status', 'current_participants', 'min_participants'])
+
+
+class GroupBuyListCache:
+    """
+    비로그인 사용자도 조회하는 공구 목록(list/popular/recent) 응답 캐시
+
+    - 캐시 키: 정규화한 쿼리 파라미터 + 카테고리별 세대(generation) 번호
+    - 무효화: GroupBuy/Participation/Bid 저장 시 해당 카테고리와 전체 세대 번호를 증가
+      (이전 세대의 키는 조회되지 않고 TTL로 자연 만료)
+    - 백엔드: settings.CACHES의 default (테스트는 local-memory, 운영은 Redis)
+    """
+
+    KEY_PREFIX = 'groupbuy_list'
+    ALL_CATEGORIES = 'all'
+
+    # 순서와 무관한 합집합 필터 - 쉼표 구분 값을 정렬해서 같은 키로 취급
+    SET_VALUED_PARAMS = {
+        'status', 'telecom_carrier', 'internet_carrier', 'subscription_type',
+        'internet_subscription_type', 'plan_info', 'internet_speed', 'manufacturer',
+    }
+    # 검색어는 조합이 너무 많아 캐시하지 않음
+    UNCACHEABLE_PARAMS = {'search', 'region_search'}
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'GROUPBUY_LIST_CACHE_TIMEOUT', 30)
+
+    @classmethod
+    def _generation_key(cls, category):
+        return f'{cls.KEY_PREFIX}:gen:{category}'
+
+    @classmethod
+    def get_generation(cls, category):
+        key = cls._generation_key(category)
+        generation = cache.get(key)
+        if generation is None:
+            # 캐시에서 밀려난 경우에도 이전 번호를 재사용하지 않도록 시간 기반 초기값 사용
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key)
+        return generation
+
+    @classmethod
+    def bump_generation(cls, category):
+        key = cls._generation_key(category)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+    @classmethod
+    def normalize_params(cls, query_params):
+        """쿼리 파라미터를 정렬된 (키, 값) 목록으로 정규화. 캐시하지 않을 요청이면 None"""
+        normalized = []
+        for name in sorted(query_params.keys()):
+            values = [value.strip() for value in query_params.getlist(name) if value.strip()]
+            if not values:
+                continue
+            if name in cls.UNCACHEABLE_PARAMS:
+                return None
+            if name in cls.SET_VALUED_PARAMS:
+                parts = sorted({part.strip() for value in values for part in value.split(',') if part.strip()})
+                values = [','.join(parts)]
+            normalized.append((name, values))
+        return normalized
+
+    @classmethod
+    def build_key(cls, request, action):
+        normalized = cls.normalize_params(request.query_params)
+        if normalized is None:
+            return None
+
+        # 카테고리 필터가 있으면 해당 카테고리 세대만, 없으면 전체 세대를 사용
+        category = request.query_params.get('category', '').strip()
+        generation = cls.get_generation(f'cat:{category}' if category else cls.ALL_CATEGORIES)
+
+        # next/previous 링크와 로컬 이미지 URL이 호스트를 포함하므로 키에 반영
+        raw = f'{request.get_host()}|{normalized!r}'
+        digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+        return f'{cls.KEY_PREFIX}:{action}:{generation}:{digest}'
+
+    @staticmethod
+    def get(key):
+        if key is None:
+            return None
+        return cache.get(key)
+
+    @classmethod
+    def set(cls, key, data, instances):
+        """직렬화 결과와 각 항목의 시간 계산용 상태를 함께 저장"""
+        if key is None:
+            return
+        states = [
+            ListItemState(obj.end_time, obj.status, obj.current_participants, obj.min_participants)
+            for obj in instances
+        ]
+        cache.set(key, {'data': data, 'states': states}, cls.timeout())
+
+    @classmethod
+    def invalidate_categories(cls, category_id=None, category_name=None):
+        """
+        해당 카테고리(id/이름 모두)와 전체 목록의 세대를 증가시킵니다.
+        트랜잭션 커밋 전에 증가시키면 다른 요청이 이전 데이터를 새 세대로 캐시할 수 있으므로 커밋 후 실행합니다.
+        """
+        categories = [cls.ALL_CATEGORIES]
+        if category_id is not None:
+            categories.append(f'cat:{category_id}')
+        if category_name:
+            categories.append(f'cat:{category_name}')
+
+        def bump():
+            for category in categories:
+                cls.bump_generation(category)
+
+        transaction.on_commit(bump)
+
+    @classmethod
+    def invalidate_groupbuy(cls, groupbuy):
+        """공구가 속한 카테고리와 전체 목록 캐시를 무효화"""
+        category = groupbuy.product.category if groupbuy and groupbuy.product_id else None
+        if category:
+            cls.invalidate_categories(category.id, category.name)
+        else:
+            cls.invalidate_categories()
+
+    @classmethod
+    def invalidate_all(cls):
+        """
+        카테고리를 특정할 수 없는 대량 변경(queryset.update 등) 후 사용.
+        전체 목록과 모든 카테고리의 세대를 증가시킵니다.
+        """
+        from api.models import Category
+
+        categories = list(Category.objects.values_list('id', 'name'))
+
+        def bump():
+            cls.bump_generation(cls.ALL_CATEGORIES)
+            for category_id, category_name in categories:
+                cls.bump_generation(f'cat:{category_id}')
+                cls.bump_generation(f'cat:{category_name}')
+
+        transaction.on_commit(bump)
@@ -0,0 +1,146 @@
+from django.db import connection
+from django.db.models import Case, IntegerField, Value, When
+import re
+
+
+class GroupBuySearch:
+    """
+    공구 통합 검색 / 지역 검색
+
+    여러 테이블(상품, 지역, 통신 정보)을 조인해 icontains로 OR 검색하던 방식 대신
+    공구 저장 시 검색 대상 문자열을 하나의 컬럼(search_document, region_search_document)에
+    소문자로 합쳐 두고 부분 문자열(LIKE '%검색어%')로 검색합니다.
+
+    - PostgreSQL: 0127 마이그레이션의 pg_trgm GIN 인덱스를 사용하므로 한글 부분 일치도 인덱스로 처리
+    - 그 외(SQLite 등): 같은 컬럼을 LIKE로 검색 (인덱스 없이 동작)
+    - 랭킹 모드(search_mode=ranked): pg_trgm이 있으면 word_similarity 점수, 없으면 제목/상품명 일치 우선
+    """
+
+    # 이 필드들이 바뀌는 저장에서만 검색 문서를 다시 만듦
+    SOURCE_FIELDS = {'title', 'description', 'product', 'product_name', 'region', 'region_name'}
+    DOCUMENT_FIELDS = ['search_document', 'region_search_document']
+
+    RANKED_MODE = 'ranked'
+
+    _trigram_available = {}
+
+    @staticmethod
+    def normalize(text):
+        """소문자 변환 + 공백 정리 (한글은 대소문자가 없으므로 그대로 유지)"""
+        return re.sub(r'\s+', ' ', str(text or '')).strip().lower()
+
+    @classmethod
+    def tokenize(cls, term):
+        return [token for token in cls.normalize(term).split(' ') if token]
+
+    @classmethod
+    def build_documents(cls, groupbuy):
+        """
+        공구의 검색 문서 생성
+
+        Returns:
+            tuple: (search_document, region_search_document)
+        """
+        from api.models import GroupBuyRegion, GroupBuyTelecomDetail
+
+        region_names = []
+        if groupbuy.region_id and groupbuy.region:
+            region_names.append(groupbuy.region.name)
+        if groupbuy.region_name:
+            region_names.append(groupbuy.region_name)
+
+        carrier_parts = []
+        if groupbuy.pk:
+            region_names.extend(
+                GroupBuyRegion.objects.filter(groupbuy_id=groupbuy.pk)
+                .order_by('id').values_list('region__name', flat=True)
+            )
+            carrier = GroupBuyTelecomDetail.objects.filter(
+                groupbuy_id=groupbuy.pk
+            ).values_list('telecom_carrier', flat=True).first()
+            if carrier:
+                carrier_parts = [carrier, dict(GroupBuyTelecomDetail.TELECOM_CARRIER_CHOICES).get(carrier, '')]
+
+        product_name = groupbuy.product.name if groupbuy.product_id and groupbuy.product else ''
+        region_document = cls._join(region_names)
+        search_document = cls._join([
+            groupbuy.title,
+            product_name,
+            groupbuy.product_name,
+            region_document,
+            *carrier_parts,
+            groupbuy.description,
+        ])
+        return search_document, region_document
+
+    @classmethod
+    def _join(cls, parts):
+        # 중복 제거 (순서 유지), 필드 경계를 넘는 부분 일치를 막기 위해 줄바꿈으로 구분
+        return '\n'.join(dict.fromkeys(value for value in map(cls.normalize, parts) if value))
+
+    @classmethod
+    def refresh(cls, groupbuy_id):
+        """지역/통신 정보처럼 공구 밖에서 바뀌는 값이 변경됐을 때 검색 문서 재생성"""
+        from api.models import GroupBuy
+
+        groupbuy = GroupBuy.objects.select_related('product', 'region').filter(pk=groupbuy_id).first()
+        if groupbuy is None:
+            return
+        search_document, region_document = cls.build_documents(groupbuy)
+        # save()를 거치지 않아 상태 알림/목록 캐시 무효화가 일어나지 않음 (검색 결과는 캐시하지 않음)
+        GroupBuy.objects.filter(pk=groupbuy_id).update(
+            search_document=search_document,
+            region_search_document=region_document,
+        )
+
+    @classmethod
+    def filter(cls, queryset, term):
+        """통합 검색: 공백으로 나눈 검색어가 모두 포함된 공구"""
+        for token in cls.tokenize(term):
+            queryset = queryset.filter(search_document__contains=token)
+        return queryset
+
+    @classmethod
+    def filter_region(cls, queryset, term):
+        """지역 검색: 지역명에 검색어가 포함된 공구 (전국 비대면 제외)"""
+        for token in cls.tokenize(term):
+            queryset = queryset.filter(region_search_document__contains=token)
+        return queryset.exclude(region_type='nationwide')
+
+    @classmethod
+    def trigram_available(cls):
+        """현재 DB에서 pg_trgm 확장을 사용할 수 있는지 (연결별로 한 번만 확인)"""
+        if connection.vendor != 'postgresql':
+            return False
+        alias = connection.alias
+        if alias not in cls._trigram_available:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                cls._trigram_available[alias] = cursor.fetchone() is not None
+        return cls._trigram_available[alias]
+
+    @classmethod
+    def rank(cls, queryset, term):
+        """검색 결과를 관련도 순으로 정렬 (search_rank 주석 추가)"""
+        normalized = cls.normalize(term)
+        if not normalized:
+            return queryset
+
+        # 제목 > 상품명 순으로 일치한 공구 우선 (pg_trgm이 없을 때의 기준이자 동점 처리용)
+        field_rank = Case(
+            When(title__icontains=normalized, then=Value(2)),
+            When(product_name__icontains=normalized, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        if cls.trigram_available():
+            from django.contrib.postgres.search import TrigramWordSimilarity
+
+            queryset = queryset.annotate(
+                search_rank=TrigramWordSimilarity(Value(normalized), 'search_document'),
+                search_field_rank=field_rank,
+            )
+            return queryset.order_by('-search_rank', '-search_field_rank', '-start_time')
+
+        queryset = queryset.annotate(search_rank=field_rank)
+        return queryset.order_by('-search_rank', '-start_time')
@@ -0,0 +1,95 @@
+from django.db import transaction
+from django.utils import timezone
+from api.models import GroupBuy
+from api.utils import update_groupbuy_status
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GroupBuyTransitionService:
+    """
+    마감 시간(next_deadline)이 지난 공구의 상태를 전환하는 서비스
+
+    recruiting -> final_selection_buyers -> final_selection_seller -> in_progress/cancelled
+    전환 규칙 자체는 api.utils.update_groupbuy_status를 그대로 사용하고,
+    여기서는 처리 대상 선정과 행 잠금만 담당합니다.
+    """
+
+    DEFAULT_BATCH_SIZE = 100
+
+    @staticmethod
+    def get_due_groupbuy_ids(now=None, limit=DEFAULT_BATCH_SIZE):
+        """마감 시간이 지난 공구 ID를 마감이 오래된 순으로 조회 (next_deadline 인덱스 사용)"""
+        now = now or timezone.now()
+        return list(
+            GroupBuy.objects.filter(next_deadline__lt=now)
+            .order_by('next_deadline')
+            .values_list('id', flat=True)[:limit]
+        )
+
+    @staticmethod
+    def process_due_groupbuys(batch_size=DEFAULT_BATCH_SIZE, now=None):
+        """
+        마감된 공구 한 배치를 처리합니다.
+
+        각 공구는 개별 트랜잭션에서 select_for_update(skip_locked=True)로 잠그므로
+        워커를 여러 개 실행해도 같은 공구를 중복 처리하지 않습니다.
+
+        Returns:
+            dict: processed(조회한 공구 수), transitioned(상태 변경 수),
+                  rescheduled(전환 없이 next_deadline만 보정한 수), failed(오류 수)
+        """
+        now = now or timezone.now()
+        due_ids = GroupBuyTransitionService.get_due_groupbuy_ids(now=now, limit=batch_size)
+        result = {'processed': len(due_ids), 'transitioned': 0, 'rescheduled': 0, 'failed': 0}
+
+        for groupbuy_id in due_ids:
+            try:
+                with transaction.atomic():
+                    groupbuy = (
+                        GroupBuy.objects.select_for_update(skip_locked=True)
+                        .filter(id=groupbuy_id, next_deadline__lt=now)
+                        .first()
+                    )
+                    if groupbuy is None:
+                        # 다른 워커가 처리 중이거나 이미 처리됨
+                        continue
+
+                    if update_groupbuy_status(groupbuy):
+                        result['transitioned'] += 1
+                    else:
+                        # queryset.update()로 상태가 바뀌어 next_deadline이 남아있는 경우 등 보정
+                        # 다시 계산해도 이미 지난 시각이면 전환할 수 없는 공구이므로 비워서
+                        # 마감순 조회의 앞자리를 계속 차지하지 않게 함
+                        next_deadline = groupbuy.compute_next_deadline()
+                        if next_deadline is not None and next_deadline < now:
+                            logger.warning(
+                                f"공구 {groupbuy_id} ({groupbuy.status}) 마감 후 전환 불가, next_deadline 해제"
+                            )
+                            next_deadline = None
+                        GroupBuy.objects.filter(id=groupbuy.id).update(next_deadline=next_deadline)
+                        result['rescheduled'] += 1
+            except Exception as e:
+                result['failed'] += 1
+                logger.error(f"공구 {groupbuy_id} 상태 전환 실패: {str(e)}", exc_info=True)
+
+        if result['transitioned']:
+            logger.info(
+                f"공구 상태 전환 완료: {result['transitioned']}/{result['processed']}건 "
+                f"(실패 {result['failed']}건)"
+            )
+        return result
+
+    @staticmethod
+    def process_all_due(batch_size=DEFAULT_BATCH_SIZE):
+        """밀린 공구가 없을 때까지 배치를 반복 처리합니다."""
+        total = {'processed': 0, 'transitioned': 0, 'rescheduled': 0, 'failed': 0}
+        while True:
+            result = GroupBuyTransitionService.process_due_groupbuys(batch_size=batch_size)
+            for key in total:
+                total[key] += result[key]
+            # 배치가 가득 차지 않았거나 진전이 없으면 (오류 반복 등) 종료
+            # next_deadline만 보정한 공구도 다음 조회 대상에서 빠지므로 진전으로 봄
+            if result['processed'] < batch_size or not (result['transitioned'] or result['rescheduled']):
+                return total
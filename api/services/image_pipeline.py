@@ -0,0 +1,216 @@
+"""
+중고거래 이미지 처리 파이프라인
+업로드 원본을 한 번만 디코딩해 고정 크기 WebP 변형(상세/목록/썸네일)을 만들고 병렬로 저장
+"""
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps
+from django.conf import settings
+from django.core.files.base import ContentFile
+import io
+import threading
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ImagePipeline:
+    """
+    WebP 변형 이미지 생성 및 업로드
+
+    - JPEG는 Image.draft로 가장 큰 변형 크기에 맞춰 축소 디코딩 (원본 전체 디코딩 생략)
+    - 큰 변형부터 차례로 축소해 상세(1280) / 목록(640) / 썸네일(320) WebP 생성
+    - 변환과 업로드는 프로세스 공용 스레드 풀(IMAGE_PIPELINE_WORKERS)에서 병렬 처리
+
+    모델은 IMAGE_VARIANT_FIELDS = {변형 이름: (파일 필드, URL 필드 또는 None)}로 저장 위치를 지정합니다.
+    """
+
+    # (변형 이름, 최대 가로/세로) - 큰 순서
+    VARIANTS = (
+        ('detail', 1280),
+        ('list', 640),
+        ('thumb', 320),
+    )
+    WEBP_QUALITY = 80
+    WEBP_METHOD = 4  # 6은 용량이 조금 작지만 인코딩이 몇 배 느림
+
+    # create_kwargs에서 이미 변환을 시도했다가 원본으로 저장하기로 한 파일 표시 (save()에서 재변환 방지)
+    FALLBACK_MARKER = '_image_pipeline_fallback'
+
+    EXIF_ORIENTATION = 0x0112
+    EXIF_ROTATED = (5, 6, 7, 8)  # 90/270도 회전 (가로/세로가 바뀜)
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def executor(cls):
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=getattr(settings, 'IMAGE_PIPELINE_WORKERS', 4),
+                        thread_name_prefix='image-pipeline',
+                    )
+        return cls._executor
+
+    @classmethod
+    def decode(cls, image_file, max_size):
+        """
+        이미지를 열어 max_size 이상 크기로 디코딩
+
+        Returns:
+            tuple: (RGB/RGBA 이미지, 원본 (가로, 세로))
+        """
+        if hasattr(image_file, 'seek'):
+            image_file.seek(0)
+        img = Image.open(image_file)
+        original_size = img.size
+        if img.getexif().get(cls.EXIF_ORIENTATION) in cls.EXIF_ROTATED:
+            original_size = original_size[::-1]
+        if img.format == 'JPEG':
+            # libjpeg DCT 스케일링으로 필요한 크기(이상)까지만 디코딩
+            img.draft('RGB', (max_size, max_size))
+
+        img = ImageOps.exif_transpose(img)
+
+        if img.mode in ('P', 'LA', 'PA'):
+            img = img.convert('RGBA')
+        elif img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGB')
+        return img, original_size
+
+    @classmethod
+    def render(cls, image_file):
+        """
+        WebP 변형 생성
+
+        Returns:
+            tuple: ({변형 이름: WebP bytes}, (원본 가로, 원본 세로))
+        """
+        img, original_size = cls.decode(image_file, cls.VARIANTS[0][1])
+        variants = {}
+        for name, max_size in cls.VARIANTS:
+            if img.width > max_size or img.height > max_size:
+                img = img.copy()
+                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            output = io.BytesIO()
+            img.save(output, format='WEBP', quality=cls.WEBP_QUALITY, method=cls.WEBP_METHOD)
+            variants[name] = output.getvalue()
+        return variants, original_size
+
+    @classmethod
+    def _render_or_none(cls, image_file):
+        try:
+            return cls.render(image_file)
+        except Exception as e:
+            logger.warning(f"이미지 변환 실패 (원본 저장): {e}")
+            return None
+
+    @staticmethod
+    def _store(field, name, data):
+        return field.storage.save(name, ContentFile(data))
+
+    @staticmethod
+    def _discard(stored):
+        """이미 업로드된 변형 삭제 (원본으로 저장하게 된 파일의 변형은 참조되지 않음)"""
+        for field, name in stored:
+            try:
+                field.storage.delete(name)
+            except Exception as e:
+                logger.warning(f"이미지 변형 삭제 실패 ({name}): {e}")
+
+    @classmethod
+    def process(cls, model, image_files):
+        """
+        업로드 파일들을 병렬로 변환/저장하고 모델 필드 값을 반환
+
+        Args:
+            model: IMAGE_VARIANT_FIELDS를 가진 이미지 모델 클래스
+            image_files: 업로드 파일 목록
+
+        Returns:
+            list: 파일별 {필드 이름: 값} (변환/업로드에 실패한 파일은 None - 원본 그대로 저장,
+                  이미 올라간 다른 변형은 삭제)
+        """
+        executor = cls.executor()
+        rendered = list(executor.map(cls._render_or_none, image_files))
+
+        uploads = []
+        for index, result in enumerate(rendered):
+            if result is None:
+                continue
+            variants, _ = result
+            for variant, data in variants.items():
+                file_field_name, _ = model.IMAGE_VARIANT_FIELDS[variant]
+                field = model._meta.get_field(file_field_name)
+                name = field.generate_filename(None, f'{uuid.uuid4().hex}.webp')
+                uploads.append((index, variant, field, name, data))
+
+        futures = [
+            (index, variant, field, executor.submit(cls._store, field, name, data))
+            for index, variant, field, name, data in uploads
+        ]
+
+        values = [None if result is None else {} for result in rendered]
+        stored = [[] for _ in rendered]
+        model_fields = {field.name for field in model._meta.get_fields()}
+        use_s3 = getattr(settings, 'USE_S3', False)
+        for index, variant, field, future in futures:
+            try:
+                stored_name = future.result()
+            except Exception as e:
+                # 변형 업로드에 실패한 파일은 원본 그대로 저장
+                logger.error(f"이미지 변형 업로드 실패 ({variant}): {e}")
+                rendered[index] = values[index] = None
+                continue
+            stored[index].append((field, stored_name))
+            if values[index] is None:
+                continue
+            file_field_name, url_field_name = model.IMAGE_VARIANT_FIELDS[variant]
+            values[index][file_field_name] = stored_name
+            if url_field_name and use_s3:
+                values[index][url_field_name] = field.storage.url(stored_name)
+
+        for index, result in enumerate(rendered):
+            if result is None:
+                cls._discard(stored[index])
+                continue
+            variants, (width, height) = result
+            extra = {'width': width, 'height': height, 'file_size': len(variants['detail'])}
+            values[index].update({key: value for key, value in extra.items() if key in model_fields})
+        return values
+
+    @classmethod
+    def apply(cls, instance):
+        """
+        아직 저장되지 않은 업로드 이미지(instance.image)를 변형으로 바꿔 인스턴스에 설정
+
+        Returns:
+            bool: 변환 여부 (False면 원본이 그대로 저장됨)
+        """
+        if getattr(instance.image.file, cls.FALLBACK_MARKER, False):
+            return False
+        values = cls.process(type(instance), [instance.image])[0]
+        if not values:
+            return False
+        for field_name, value in values.items():
+            setattr(instance, field_name, value)
+        return True
+
+    @classmethod
+    def create_kwargs(cls, model, image_files):
+        """
+        여러 업로드를 한 번에 병렬 변환/업로드해 objects.create()에 넘길 이미지 필드 값 목록
+
+        변환하지 못한 파일은 {'image': 원본}으로 반환되어 기존처럼 원본이 저장됩니다.
+        (원본에는 FALLBACK_MARKER를 표시해 모델 save()에서 다시 변환하지 않음)
+        """
+        image_files = list(image_files)
+        kwargs = []
+        for image_file, values in zip(image_files, cls.process(model, image_files)):
+            if not values:
+                setattr(image_file, cls.FALLBACK_MARKER, True)
+                values = {'image': image_file}
+            kwargs.append(values)
+        return kwargs
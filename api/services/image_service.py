@@ -2,12 +2,13 @@
 이미지 업로드 서비스
 S3 업로드 및 이미지 압축 처리
 """
-import boto3
 import uuid
 import io
 from PIL import Image
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from api.services.image_pipeline import ImagePipeline
+from api.utils.s3_utils import get_s3_client, get_transfer_config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,8 +43,10 @@ class ImageService:
             str: 파일 확장자
         """
         try:
-            # PIL Image로 열기
+            # PIL Image로 열기 (JPEG는 필요한 크기까지만 축소 디코딩)
             img = Image.open(image_file)
+            if img.format == 'JPEG':
+                img.draft('RGB', (max_width, max_height))
 
             # EXIF 회전 정보 적용
             try:
@@ -145,13 +148,8 @@ class ImageService:
             # 2. 이미지 압축
             compressed_image, ext = ImageService.compress_image(image_file)
 
-            # 3. S3 클라이언트 생성
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2'),
-            )
+            # 3. 공용 S3 클라이언트
+            s3_client = get_s3_client()
 
             # 4. 파일명 생성 (UUID + 확장자)
             file_name = f"{folder}/{uuid.uuid4()}.{ext}"
@@ -165,7 +163,8 @@ class ImageService:
                     'ContentType': f'image/{ext}',
                     'ACL': 'public-read',
                     'CacheControl': 'max-age=31536000',  # 1년 캐시
-                }
+                },
+                Config=get_transfer_config()
             )
 
             # 6. URL 생성
@@ -207,23 +206,24 @@ class ImageService:
         if len(image_files) > max_images:
             raise ValueError(f'최대 {max_images}장까지 업로드 가능합니다.')
 
-        uploaded_urls = []
-        failed_count = 0
-
-        for idx, image_file in enumerate(image_files):
+        def upload(indexed_file):
+            idx, image_file = indexed_file
             try:
                 url = ImageService.upload_to_s3(image_file, folder)
-                uploaded_urls.append(url)
                 logger.info(f"이미지 {idx + 1}/{len(image_files)} 업로드 완료")
-
+                return url
             except Exception as e:
-                failed_count += 1
                 logger.error(f"이미지 {idx + 1} 업로드 실패: {str(e)}")
+                return None
 
-                # 일부 실패해도 계속 진행
-                if failed_count >= len(image_files) / 2:
-                    # 50% 이상 실패 시 중단
-                    raise Exception(f"이미지 업로드 실패가 너무 많습니다. ({failed_count}/{len(image_files)})")
+        # 압축/업로드는 이미지 파이프라인 스레드 풀에서 병렬 처리 (결과 순서는 입력 순서 유지)
+        results = list(ImagePipeline.executor().map(upload, enumerate(image_files)))
+        uploaded_urls = [url for url in results if url]
+        failed_count = len(results) - len(uploaded_urls)
+
+        # 일부 실패는 허용하고, 50% 이상 실패 시 중단
+        if failed_count and failed_count >= len(image_files) / 2:
+            raise Exception(f"이미지 업로드 실패가 너무 많습니다. ({failed_count}/{len(image_files)})")
 
         if failed_count > 0:
             logger.warning(f"일부 이미지 업로드 실패: {failed_count}/{len(image_files)}")
@@ -251,13 +251,7 @@ class ImageService:
                 logger.warning(f"잘못된 S3 URL 형식: {image_url}")
                 return False
 
-            # S3 클라이언트 생성
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2'),
-            )
+            s3_client = get_s3_client()
 
             # 삭제
             s3_client.delete_object(
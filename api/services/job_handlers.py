@@ -0,0 +1,72 @@
+"""
+작업 큐 핸들러
+
+JobQueue.register로 등록된 함수가 payload를 키워드 인자로 받아 실행됩니다.
+예외를 발생시키면 백오프 후 재시도되므로, 일부만 성공해 재시도하면 중복 발송되는 작업은
+예외 없이 로그만 남깁니다.
+"""
+from django.contrib.auth import get_user_model
+from api.services.job_queue import JobQueue
+import logging
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+@JobQueue.register('push.notifications', concurrency=4, max_attempts=3)
+def deliver_push_notifications(notification_ids, title, data=None):
+    from api.services.notification_dispatcher import NotificationDispatcher
+
+    sent = NotificationDispatcher.deliver_push(notification_ids, title, data)
+    logger.info(f"푸시 발송 완료 - 알림 {len(notification_ids)}건, 디바이스 {sent}건")
+
+
+@JobQueue.register('sms.bulk', concurrency=2, max_attempts=3)
+def send_bulk_sms(phone_numbers, message, title='[둥지마켓]'):
+    from api.utils.sms_service import SMSService
+
+    success_count, fail_count = SMSService().send_bulk_sms(phone_numbers, message, title)
+    logger.info(f"SMS 대량 발송 완료 - 성공:{success_count}, 실패:{fail_count}")
+    # 전체 실패만 재시도 (일부 성공 후 재시도하면 성공한 번호에 중복 발송)
+    if success_count == 0 and fail_count > 0:
+        raise RuntimeError(f"SMS 대량 발송 전체 실패 ({fail_count}건)")
+
+
+@JobQueue.register('sms.custom_groupbuy_completion_seller', concurrency=2, max_attempts=3)
+def send_custom_groupbuy_completion_seller_sms(phone_number, title, participants_count, final_price=None,
+                                               discount_rate=None, user_id=None, custom_groupbuy_id=None):
+    from api.models_custom import CustomGroupBuy
+    from api.utils.sms_service import SMSService
+
+    success, error = SMSService().send_custom_groupbuy_completion_seller(
+        phone_number=phone_number,
+        title=title,
+        participants_count=participants_count,
+        final_price=final_price,
+        discount_rate=discount_rate,
+        user=User.objects.filter(id=user_id).first() if user_id else None,
+        custom_groupbuy=CustomGroupBuy.objects.filter(id=custom_groupbuy_id).first() if custom_groupbuy_id else None
+    )
+    if not success:
+        raise RuntimeError(f"판매자 SMS 발송 실패: {error}")
+
+
+@JobQueue.register('email.send', concurrency=4, max_attempts=5)
+def send_email(recipient_email, subject, template_name, context):
+    from api.utils.email_sender import EmailSender
+
+    if not EmailSender.send_notification_email(recipient_email, subject, template_name, context):
+        raise RuntimeError(f"이메일 발송 실패: {recipient_email}")
+
+
+# 참여자별 알림 생성 중 일부만 실패해도 재시도하면 중복 알림이 되므로 한 번만 실행
+@JobQueue.register('custom_groupbuy.completion_notifications', concurrency=2, max_attempts=1)
+def send_custom_groupbuy_completion_notifications(custom_groupbuy_id):
+    from api.models_custom import CustomGroupBuy
+
+    custom_groupbuy = CustomGroupBuy.objects.select_related('seller').filter(id=custom_groupbuy_id).first()
+    if not custom_groupbuy:
+        logger.warning(f"커스텀 공구 없음 - id:{custom_groupbuy_id}")
+        return
+    custom_groupbuy.send_completion_notifications()
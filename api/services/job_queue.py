@@ -0,0 +1,240 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from api.models import BackgroundJob
+import hashlib
+import os
+import random
+import socket
+import logging
+
+logger = logging.getLogger(__name__)
+
+# handler(**payload), 타입별 동시 실행 수, 최대 시도 횟수
+JobType = namedtuple('JobType', ['handler', 'concurrency', 'max_attempts'])
+
+
+class JobQueue:
+    """
+    BackgroundJob 테이블 기반 작업 큐
+
+    - enqueue: 호출한 트랜잭션과 함께 커밋되므로 롤백된 요청의 발송은 일어나지 않음
+    - idempotency_key: 같은 키의 작업은 한 번만 생성
+    - claim: SKIP LOCKED로 여러 워커가 겹치지 않게 가져가며, 작업 타입별 동시 실행 수를 제한
+    - 실패 시 지수 백오프로 재시도, max_attempts를 넘으면 failed
+    - 처리 중 워커가 죽어 LOCK_TIMEOUT이 지난 running 작업은 다시 가져감
+    - 끝난(succeeded/failed) 작업은 purge_finished로 보관 기간이 지나면 삭제
+    """
+
+    LOCK_TIMEOUT = timedelta(minutes=10)
+    BACKOFF_BASE_SECONDS = 30
+    BACKOFF_MAX_SECONDS = 60 * 60
+    # pg_advisory_xact_lock 네임스페이스 (작업 타입별 claim 직렬화)
+    ADVISORY_LOCK_NAMESPACE = 7001
+
+    # BackgroundJob.idempotency_key 길이 (초과하면 해시로 대체)
+    MAX_KEY_LENGTH = 200
+
+    FINISHED_STATUSES = ('succeeded', 'failed')
+    PURGE_BATCH_SIZE = 5000
+
+    _registry = {}
+
+    @classmethod
+    def register(cls, job_type, concurrency=4, max_attempts=5):
+        """작업 핸들러 등록 데코레이터"""
+        def decorator(handler):
+            cls._registry[job_type] = JobType(handler, concurrency, max_attempts)
+            return handler
+        return decorator
+
+    @classmethod
+    def job_types(cls):
+        # 핸들러 모듈이 아직 로드되지 않았으면 로드 (등록은 import 시점에 일어남)
+        import api.services.job_handlers  # noqa: F401
+        return cls._registry
+
+    @classmethod
+    def get_job_type(cls, job_type):
+        try:
+            return cls.job_types()[job_type]
+        except KeyError:
+            raise ValueError(f"등록되지 않은 작업 타입입니다: {job_type}")
+
+    @classmethod
+    def enqueue(cls, job_type, payload=None, idempotency_key=None, run_at=None):
+        """
+        작업 등록
+
+        Args:
+            job_type: 등록된 작업 타입
+            payload: 핸들러에 키워드 인자로 전달할 JSON 직렬화 가능한 dict
+            idempotency_key: 같은 키로 이미 등록된 작업이 있으면 새로 만들지 않음
+            run_at: 실행 예정 시각 (기본값: 즉시)
+
+        Returns:
+            BackgroundJob: 등록된(또는 기존) 작업
+        """
+        definition = cls.get_job_type(job_type)
+        defaults = {
+            'job_type': job_type,
+            'payload': payload or {},
+            'max_attempts': definition.max_attempts,
+            'run_at': run_at or timezone.now(),
+        }
+        if idempotency_key:
+            if len(idempotency_key) > cls.MAX_KEY_LENGTH:
+                idempotency_key = hashlib.sha256(idempotency_key.encode('utf-8')).hexdigest()
+            job, created = BackgroundJob.objects.get_or_create(idempotency_key=idempotency_key, defaults=defaults)
+            if not created:
+                logger.info(f"이미 등록된 작업 - key:{idempotency_key}, job:{job.id}")
+            return job
+        return BackgroundJob.objects.create(**defaults)
+
+    @classmethod
+    def _lock_job_type(cls, job_type):
+        """같은 타입의 claim을 직렬화해 동시 실행 수 계산이 겹치지 않도록 함 (PostgreSQL 전용)"""
+        if connection.vendor != 'postgresql':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_advisory_xact_lock(%s, hashtext(%s))',
+                [cls.ADVISORY_LOCK_NAMESPACE, job_type]
+            )
+
+    @classmethod
+    def claim(cls, worker_id, limit, job_types=None):
+        """
+        실행할 작업을 최대 limit개 가져와 running으로 표시
+
+        Returns:
+            list: 가져온 BackgroundJob 목록
+        """
+        registry = cls.job_types()
+        job_types = [job_type for job_type in (job_types or registry) if job_type in registry]
+        now = timezone.now()
+        stale_before = now - cls.LOCK_TIMEOUT
+        claimed_ids = []
+
+        for job_type in job_types:
+            if len(claimed_ids) >= limit:
+                break
+            with transaction.atomic():
+                cls._lock_job_type(job_type)
+                running = BackgroundJob.objects.filter(
+                    job_type=job_type, status='running', locked_at__gte=stale_before
+                ).count()
+                slots = min(limit - len(claimed_ids), registry[job_type].concurrency - running)
+                if slots <= 0:
+                    continue
+
+                ids = list(
+                    BackgroundJob.objects.filter(job_type=job_type)
+                    .filter(
+                        Q(status='pending', run_at__lte=now)
+                        | Q(status='running', locked_at__lt=stale_before)
+                    )
+                    .order_by('run_at', 'id')
+                    .select_for_update(skip_locked=True)
+                    .values_list('id', flat=True)[:slots]
+                )
+                if ids:
+                    BackgroundJob.objects.filter(id__in=ids).update(
+                        status='running',
+                        locked_at=now,
+                        locked_by=worker_id,
+                        attempts=F('attempts') + 1,
+                    )
+                    claimed_ids.extend(ids)
+
+        return list(BackgroundJob.objects.filter(id__in=claimed_ids).order_by('run_at', 'id'))
+
+    @classmethod
+    def backoff(cls, attempts):
+        """재시도 대기 시간 (지수 백오프 + 지터)"""
+        delay = min(cls.BACKOFF_MAX_SECONDS, cls.BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0))
+        return timedelta(seconds=delay + random.uniform(0, cls.BACKOFF_BASE_SECONDS))
+
+    @classmethod
+    def run_job(cls, job):
+        """
+        가져온 작업 하나 실행
+
+        Returns:
+            bool: 성공 여부
+        """
+        # 다른 워커가 시간 초과로 다시 가져간 경우 결과를 덮어쓰지 않도록 locked_by 조건 사용
+        owned = BackgroundJob.objects.filter(id=job.id, status='running', locked_by=job.locked_by)
+        try:
+            cls.get_job_type(job.job_type).handler(**job.payload)
+        except Exception as e:
+            logger.error(f"작업 실패 - {job.job_type} #{job.id} ({job.attempts}/{job.max_attempts}회): {str(e)}")
+            if job.attempts >= job.max_attempts:
+                owned.update(status='failed', last_error=str(e), completed_at=timezone.now())
+            else:
+                owned.update(status='pending', last_error=str(e), run_at=timezone.now() + cls.backoff(job.attempts))
+            return False
+
+        owned.update(status='succeeded', completed_at=timezone.now())
+        return True
+
+    @classmethod
+    def purge_finished(cls, older_than, batch_size=None):
+        """
+        완료 시각이 older_than(timedelta)보다 오래된 succeeded/failed 작업 삭제
+
+        한 번에 batch_size개(기본 PURGE_BATCH_SIZE)씩 나눠 삭제해 긴 잠금을 피합니다.
+        삭제된 작업의 idempotency_key는 다시 사용할 수 있게 되므로 보관 기간은 중복 발송을 막아야 하는 기간보다 길게 둡니다.
+
+        Returns:
+            int: 삭제한 작업 수
+        """
+        batch_size = batch_size or cls.PURGE_BATCH_SIZE
+        cutoff = timezone.now() - older_than
+        finished = BackgroundJob.objects.filter(status__in=cls.FINISHED_STATUSES, completed_at__lt=cutoff)
+        deleted = 0
+        while True:
+            ids = list(finished.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted += BackgroundJob.objects.filter(id__in=ids).delete()[0]
+        if deleted:
+            logger.info(f"끝난 작업 {deleted}건 삭제 (완료 후 {older_than} 경과)")
+        return deleted
+
+    @staticmethod
+    def default_worker_id():
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    @classmethod
+    def run_pending(cls, worker_id=None, batch_size=20, threads=1, job_types=None):
+        """
+        대기 중인 작업 한 배치를 실행
+
+        Returns:
+            dict: claimed(가져온 수), succeeded(성공 수), failed(실패 수)
+        """
+        worker_id = worker_id or cls.default_worker_id()
+        jobs = cls.claim(worker_id, batch_size, job_types)
+        if not jobs:
+            return {'claimed': 0, 'succeeded': 0, 'failed': 0}
+
+        if threads <= 1:
+            results = [cls.run_job(job) for job in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='job-worker') as executor:
+                results = list(executor.map(cls._run_job_in_thread, jobs))
+
+        succeeded = sum(1 for result in results if result)
+        return {'claimed': len(jobs), 'succeeded': succeeded, 'failed': len(jobs) - succeeded}
+
+    @classmethod
+    def _run_job_in_thread(cls, job):
+        try:
+            return cls.run_job(job)
+        finally:
+            # 스레드 전용 DB 연결 정리
+            connection.close()
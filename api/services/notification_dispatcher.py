@@ -0,0 +1,142 @@
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from api.models import GroupBuy, Notification, Participation, PushToken
+from api.services.job_queue import JobQueue
+from api.utils.push_notification import send_push_messages
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """
+    여러 사용자에게 같은 종류의 인앱 알림을 한 번에 생성하고 푸시 발송을 예약하는 서비스
+
+    - 수신자 조회: 한 번의 쿼리
+    - 중복 제거: 같은 (사용자, 공구, 알림 타입, 메시지) 알림이 dedupe 기간 안에 이미 있으면 생략
+    - 생성: bulk_create 한 번
+    - 푸시: 작업 큐(push.notifications)에 등록해 run_workers가 발송
+    """
+
+    BULK_BATCH_SIZE = 500
+
+    @staticmethod
+    def dedupe_window():
+        return timedelta(seconds=getattr(settings, 'NOTIFICATION_DEDUPE_WINDOW_SECONDS', 600))
+
+    @classmethod
+    def dispatch(cls, rows, notification_type='info', push_title='둥지마켓', push_data=None):
+        """
+        알림 생성
+
+        Args:
+            rows: (user_id, groupbuy_id, message) 목록
+            notification_type: 알림 타입 (Notification.NOTIFICATION_TYPES 참조)
+            push_title: 푸시 알림 제목
+            push_data: 푸시 알림 추가 데이터
+
+        Returns:
+            list: 새로 생성된 Notification 목록
+        """
+        # 같은 호출 안의 중복 제거 (순서 유지)
+        pending = list(dict.fromkeys(rows))
+        if not pending:
+            return []
+
+        since = timezone.now() - cls.dedupe_window()
+        existing = set(
+            Notification.objects.filter(
+                groupbuy_id__in={groupbuy_id for _, groupbuy_id, _ in pending},
+                notification_type=notification_type,
+                created_at__gte=since,
+            ).values_list('user_id', 'groupbuy_id', 'message')
+        )
+
+        notifications = [
+            Notification(
+                user_id=user_id,
+                groupbuy_id=groupbuy_id,
+                message=message,
+                notification_type=notification_type,
+            )
+            for user_id, groupbuy_id, message in pending
+            if (user_id, groupbuy_id, message) not in existing
+        ]
+        if not notifications:
+            return []
+
+        created = Notification.objects.bulk_create(notifications, batch_size=cls.BULK_BATCH_SIZE)
+        logger.info(
+            f"알림 {len(created)}건 생성 (타입: {notification_type}, 중복 생략 {len(pending) - len(created)}건)"
+        )
+        cls.enqueue_push([notification.id for notification in created if notification.id], push_title, push_data)
+        return created
+
+    @classmethod
+    def notify_groupbuy_status(cls, groupbuy_ids, status):
+        """공구 참여자 전체에 상태 변경 알림 (GroupBuy.build_status_message 사용)"""
+        if not groupbuy_ids:
+            return []
+        rows = Participation.objects.filter(groupbuy_id__in=groupbuy_ids).order_by('id').values_list(
+            'user_id', 'groupbuy_id', 'groupbuy__product__name', 'groupbuy__product_name'
+        )
+        return cls.dispatch(
+            [
+                (user_id, groupbuy_id, GroupBuy.build_status_message(product_name or backup_name, status))
+                for user_id, groupbuy_id, product_name, backup_name in rows
+            ],
+            push_title='공구 알림',
+            push_data={'type': 'groupbuy'},
+        )
+
+    @staticmethod
+    def enqueue_push(notification_ids, title, data=None):
+        """푸시 발송 작업 등록 (호출한 트랜잭션과 함께 커밋되므로 롤백되면 발송하지 않음)"""
+        if not notification_ids:
+            return None
+        return JobQueue.enqueue(
+            'push.notifications',
+            {'notification_ids': notification_ids, 'title': title, 'data': data or {}},
+            idempotency_key=f'push:notification:{notification_ids[0]}'
+        )
+
+    @staticmethod
+    def deliver_push(notification_ids, title, data=None):
+        """
+        알림 목록의 푸시 발송 (거래 알림을 끈 사용자는 마케팅 외 알림 제외)
+
+        모든 사용자의 (토큰, 내용)을 먼저 만든 뒤 한 번에 넘겨 사용자 간에도 동시에 발송합니다.
+
+        Returns:
+            int: 성공적으로 발송된 개수
+        """
+        notifications = list(
+            Notification.objects.filter(id__in=notification_ids)
+            .exclude(Q(user__notification_settings__trade_notifications=False) & ~Q(notification_type='marketing'))
+            .values_list('id', 'user_id', 'groupbuy_id', 'custom_groupbuy_id', 'message')
+        )
+        if not notifications:
+            return 0
+
+        tokens_by_user = defaultdict(list)
+        for push_token in PushToken.objects.filter(
+            user_id__in={user_id for _, user_id, _, _, _ in notifications}, is_active=True
+        ):
+            tokens_by_user[push_token.user_id].append(push_token)
+
+        messages = []
+        for notification_id, user_id, groupbuy_id, custom_groupbuy_id, message in notifications:
+            tokens = tokens_by_user.get(user_id)
+            if not tokens:
+                continue
+            payload = dict(data or {})
+            if groupbuy_id:
+                payload['groupbuy_id'] = str(groupbuy_id)
+            if custom_groupbuy_id:
+                payload['custom_groupbuy_id'] = str(custom_groupbuy_id)
+            payload['notification_id'] = str(notification_id)
+            messages.extend((push_token, title, message, payload) for push_token in tokens)
+        return send_push_messages(messages)
@@ -0,0 +1,122 @@
+from datetime import datetime
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce, TruncMonth
+from django.utils import timezone
+
+
+def _month_start(year, month):
+    return datetime(year, month, 1, tzinfo=timezone.now().tzinfo)
+
+
+def _shift_month(year, month, offset):
+    """(year, month)에서 offset개월 이동 (달력 기준)"""
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+class PartnerStats:
+    """
+    파트너 대시보드 요약과 월별 통계
+
+    - 요약(이번달 가입/활성 구독자/이번달 수익/정산 가능 금액)은 조건부 집계 한 번으로 조회
+    - 월별 통계는 TruncMonth로 묶어 최근 12개월을 한 번에 조회하고, 기록이 없는 달은 0으로 채움
+      (30일 단위가 아닌 달력 월 기준)
+    - 결과는 파트너별로 PARTNER_STATS_CACHE_TIMEOUT 동안 캐시
+    - 무효화: ReferralRecord 저장·삭제 시 커밋 후 해당 파트너 캐시 삭제
+      (queryset.update()로 정산 상태를 바꾸는 곳은 invalidate를 직접 호출, 월이 바뀌는 경우는 TTL로 반영)
+    """
+
+    KEY_PREFIX = 'partner_stats'
+    MONTHS = 12
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'PARTNER_STATS_CACHE_TIMEOUT', 300)
+
+    @classmethod
+    def _key(cls, partner_id, name):
+        return f'{cls.KEY_PREFIX}:{partner_id}:{name}'
+
+    @classmethod
+    def _cached(cls, partner, name, compute):
+        key = cls._key(partner.pk, name)
+        data = cache.get(key)
+        if data is None:
+            data = compute(partner)
+            cache.set(key, data, cls.timeout())
+        return data
+
+    @classmethod
+    def summary(cls, partner):
+        """대시보드 요약 (캐시에 없으면 집계 후 저장)"""
+        return cls._cached(partner, 'summary', cls.compute_summary)
+
+    @classmethod
+    def monthly(cls, partner):
+        """최근 12개월 월별 통계 (캐시에 없으면 집계 후 저장)"""
+        return cls._cached(partner, 'monthly', cls.compute_monthly)
+
+    @classmethod
+    def compute_summary(cls, partner):
+        """
+        대시보드 요약 집계 (쿼리 1개)
+
+        Returns:
+            dict: monthly_signup, active_subscribers, monthly_revenue, available_settlement
+        """
+        now = timezone.now()
+        month_start = _month_start(now.year, now.month)
+        this_month = Q(created_at__gte=month_start, created_at__lt=_month_start(*_shift_month(now.year, now.month, 1)))
+        return partner.referral_records.aggregate(
+            monthly_signup=Count('id', filter=this_month),
+            active_subscribers=Count('id', filter=Q(subscription_status='active')),
+            monthly_revenue=Coalesce(Sum('commission_amount', filter=this_month), 0),
+            # 정산 가능 금액 (미정산된 수수료 합계)
+            available_settlement=Coalesce(Sum('commission_amount', filter=Q(settlement_status='pending')), 0),
+        )
+
+    @classmethod
+    def compute_monthly(cls, partner):
+        """
+        최근 12개월(이번달 포함) 월별 가입 수, 수익, 활성 구독 수 (쿼리 1개)
+
+        Returns:
+            list: [{'period': 'YYYY-MM', 'signup_count', 'revenue', 'subscription_count'}] (오래된 달부터)
+        """
+        now = timezone.now()
+        months = [_shift_month(now.year, now.month, offset) for offset in range(1 - cls.MONTHS, 1)]
+        rows = (
+            partner.referral_records
+            .filter(created_at__gte=_month_start(*months[0]), created_at__lte=now)
+            .annotate(month=TruncMonth('created_at'))
+            .values('month')
+            .annotate(
+                signup_count=Count('id'),
+                revenue=Coalesce(Sum('commission_amount'), 0),
+                subscription_count=Count('id', filter=Q(subscription_status='active')),
+            )
+            .order_by()
+        )
+        buckets = {(row['month'].year, row['month'].month): row for row in rows}
+
+        stats = []
+        for year, month in months:
+            row = buckets.get((year, month), {})
+            stats.append({
+                'period': f'{year:04d}-{month:02d}',
+                'signup_count': row.get('signup_count', 0),
+                'revenue': row.get('revenue', 0),
+                'subscription_count': row.get('subscription_count', 0),
+            })
+        return stats
+
+    @classmethod
+    def invalidate(cls, partner_id):
+        """파트너 통계 캐시 삭제 (커밋 후 실행)"""
+        if partner_id is None:
+            return
+        keys = [cls._key(partner_id, name) for name in ('summary', 'monthly')]
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,129 @@
+from collections import namedtuple
+from datetime import timedelta
+from django.db import transaction
+from django.utils import timezone
+from api.models import BidToken, BidTokenBalance, BidTokenPurchase
+from api.models_payment import Payment
+from api.services.seller_summary import SellerSummary
+import logging
+
+logger = logging.getLogger(__name__)
+
+# settled: 이번 호출에서 정산(토큰 지급)했는지 여부 - False면 이미 처리된 결제
+SettlementResult = namedtuple('SettlementResult', ['payment', 'settled', 'token_count', 'subscription_expires_at'])
+
+
+class PaymentSettlementService:
+    """
+    견적이용권 결제 정산 (결제 완료 처리 + 이용권 지급 + 구매 내역 생성)
+
+    결제 승인 검증(verify_inicis_payment), 모바일 리턴 URL(inicis_return),
+    가상계좌 입금 웹훅(inicis_webhook)이 같은 결제에 대해 동시에 들어와도 한 번만 지급되도록
+    주문번호(order_id)를 멱등성 키로 사용합니다.
+
+    - Payment 행을 select_for_update로 잠근 뒤 완료 여부를 확인하고 같은 트랜잭션에서 지급
+      (먼저 들어온 요청이 커밋할 때까지 나머지는 대기하고, 대기 후에는 완료 상태를 보고 건너뜀)
+    - 단품 이용권은 bulk_create로 한 번에 생성
+    """
+
+    SUBSCRIPTION_PRICE = 59000  # 무제한 구독권 (30일)
+    SINGLE_TOKEN_PRICE = 1990  # 단품 이용권 1개
+    SUBSCRIPTION_DAYS = 30
+    SINGLE_TOKEN_DAYS = 90
+
+    @staticmethod
+    def is_subscription(payment):
+        """상품명으로 구독권 결제 여부 판단"""
+        name = payment.product_name
+        return '구독' in name or 'unlimited' in name.lower() or '무제한' in name
+
+    @classmethod
+    def token_count(cls, payment):
+        """결제 금액에 해당하는 지급 수량"""
+        if cls.is_subscription(payment):
+            return 1 if payment.amount >= cls.SUBSCRIPTION_PRICE else 0
+        return int(payment.amount // cls.SINGLE_TOKEN_PRICE)
+
+    @classmethod
+    def issue_tokens(cls, payment):
+        """
+        결제에 해당하는 이용권 생성 (트랜잭션 안에서 호출)
+
+        Returns:
+            tuple: (지급 수량, 구독권 만료일 또는 None)
+        """
+        user = payment.user
+        token_count = cls.token_count(payment)
+        if token_count == 0:
+            if cls.is_subscription(payment):
+                logger.warning(f"구독권 결제 금액 부족: {payment.amount}원 < {cls.SUBSCRIPTION_PRICE:,}원")
+            return 0, None
+
+        now = timezone.now()
+        if cls.is_subscription(payment):
+            # 기존 활성 구독권이 있으면 그 만료일 이후부터 30일
+            latest_expires_at = BidToken.objects.filter(
+                seller=user,
+                token_type='unlimited',
+                status='active',
+                expires_at__gt=now
+            ).order_by('-expires_at').values_list('expires_at', flat=True).first()
+            expires_at = (latest_expires_at or now) + timedelta(days=cls.SUBSCRIPTION_DAYS)
+            BidToken.objects.create(seller=user, token_type='unlimited', expires_at=expires_at)
+            return 1, expires_at
+
+        # 단품 이용권은 생성일로부터 90일 후 만료
+        expires_at = now + timedelta(days=cls.SINGLE_TOKEN_DAYS)
+        BidToken.objects.bulk_create(
+            BidToken(seller=user, token_type='single', expires_at=expires_at)
+            for _ in range(token_count)
+        )
+        # bulk_create는 post_save를 보내지 않으므로 잔액과 요약 캐시를 직접 갱신
+        BidTokenBalance.add_single(user.pk, token_count, expires_at)
+        SellerSummary.invalidate(user.pk)
+        return token_count, None
+
+    @classmethod
+    def settle(cls, order_id, allowed_statuses=None, update=None, payment_key=None):
+        """
+        결제를 완료 처리하고 이용권 지급 (멱등)
+
+        Args:
+            order_id: 주문번호 (멱등성 키)
+            allowed_statuses: 정산 가능한 결제 상태 (None이면 완료 이외 모든 상태)
+            update: 잠근 Payment에 승인 정보(tid, payment_data 등)를 반영하는 함수
+            payment_key: 구매 내역에 기록할 결제 키 (없으면 payment.tid)
+
+        Returns:
+            SettlementResult
+
+        Raises:
+            Payment.DoesNotExist: 주문번호에 해당하는 결제가 없는 경우
+        """
+        with transaction.atomic():
+            payment = Payment.objects.select_for_update(of=('self',)).select_related('user').get(order_id=order_id)
+            if payment.status == 'completed' or (allowed_statuses and payment.status not in allowed_statuses):
+                logger.info(f"정산 건너뜀: order_id={order_id}, status={payment.status}")
+                return SettlementResult(payment, False, cls.token_count(payment), None)
+
+            if update:
+                update(payment)
+            payment.status = 'completed'
+            payment.completed_at = timezone.now()
+            payment.save()
+
+            token_count, subscription_expires_at = cls.issue_tokens(payment)
+            is_subscription = cls.is_subscription(payment)
+            BidTokenPurchase.objects.create(
+                seller=payment.user,
+                token_type='unlimited' if is_subscription else 'single',
+                quantity=1 if is_subscription else token_count,
+                total_price=payment.amount,
+                payment_status='completed',
+                payment_date=timezone.now(),
+                order_id=order_id,
+                payment_key=payment_key or payment.tid
+            )
+
+        logger.info(f"결제 정산 완료: user={payment.user_id}, order_id={order_id}, amount={payment.amount}, tokens={token_count}")
+        return SettlementResult(payment, True, token_count, subscription_expires_at)
@@ -0,0 +1,255 @@
+from collections import defaultdict, namedtuple
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from api.models_region import Region, RegionClosure
+import csv
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+RegionEntry = namedtuple('RegionEntry', ['code', 'name', 'full_name', 'parent_code'])
+
+
+class RegionIndex:
+    """
+    지역 필터용 이름 → 코드 인덱스와 지역 클로저 테이블 관리
+
+    - 이름 인덱스: 워커 프로세스마다 한 번만 Region 전체를 읽어 메모리에 보관
+      (REGION_INDEX_TTL_SECONDS가 지나면 다시 읽어 다른 프로세스의 지역 추가도 반영)
+    - 클로저 테이블: 상위 지역 코드로 하위 지역 전체를 한 번의 조인으로 찾음
+    - 요청마다 Region을 조회하지 않고, 필터는 RegionClosure 세미 조인 하나로 처리
+    """
+
+    CLOSURE_BATCH_SIZE = 2000
+
+    # 전국행정구역정보(ACMM_ADMSECT_*.txt) 중 법정동 행 (Region 코드는 법정동코드 체계)
+    ADMSECT_LEGAL_GBN = 'L'
+    ADMSECT_ENCODING = 'cp949'
+
+    _lock = threading.Lock()
+    _index = None
+    _loaded_at = 0.0
+
+    @staticmethod
+    def ttl():
+        return getattr(settings, 'REGION_INDEX_TTL_SECONDS', 60 * 60)
+
+    @classmethod
+    def _load(cls):
+        entries = [
+            RegionEntry(*row)
+            for row in Region.objects.order_by('code').values_list('code', 'name', 'full_name', 'parent_id')
+        ]
+        by_name = defaultdict(list)
+        by_full_name = defaultdict(list)
+        top_level_by_name = defaultdict(list)
+        for entry in entries:
+            by_name[entry.name].append(entry.code)
+            by_full_name[entry.full_name].append(entry.code)
+            if entry.parent_code is None:
+                top_level_by_name[entry.name].append(entry.code)
+        return {
+            'entries': entries,
+            'by_name': dict(by_name),
+            'by_full_name': dict(by_full_name),
+            'top_level_by_name': dict(top_level_by_name),
+        }
+
+    @classmethod
+    def get_index(cls):
+        index = cls._index
+        if index is not None and time.monotonic() - cls._loaded_at < cls.ttl():
+            return index
+        with cls._lock:
+            if cls._index is None or time.monotonic() - cls._loaded_at >= cls.ttl():
+                cls._index = cls._load()
+                cls._loaded_at = time.monotonic()
+                logger.info(f"지역 이름 인덱스 로드: {len(cls._index['entries'])}개")
+            return cls._index
+
+    @classmethod
+    def invalidate(cls):
+        """이 프로세스의 이름 인덱스 폐기 (다음 조회 시 다시 로드)"""
+        with cls._lock:
+            cls._index = None
+
+    @classmethod
+    def top_level_codes(cls, name):
+        """이름이 정확히 일치하는 최상위 지역(시/도) 코드"""
+        return list(cls.get_index()['top_level_by_name'].get(name, []))
+
+    @classmethod
+    def exact_codes(cls, name):
+        """name 또는 full_name이 정확히 일치하는 지역 코드"""
+        index = cls.get_index()
+        return list(dict.fromkeys(index['by_name'].get(name, []) + index['by_full_name'].get(name, [])))
+
+    @classmethod
+    def containing_codes(cls, term):
+        """name 또는 full_name에 검색어가 포함된 지역 코드 (대소문자 무시)"""
+        term = term.lower()
+        return [
+            entry.code for entry in cls.get_index()['entries']
+            if term in entry.name.lower() or term in entry.full_name.lower()
+        ]
+
+    @staticmethod
+    def descendants(codes):
+        """지역 코드들과 그 하위 지역 코드 서브쿼리"""
+        return RegionClosure.objects.filter(ancestor_id__in=codes).values('descendant_id')
+
+    @classmethod
+    def region_q(cls, codes, link_model, link_field, region_field='region'):
+        """
+        대표 지역(region_field) 또는 다중 지역 연결 모델(link_model)이 codes의 하위 지역에 속하는 조건
+
+        Args:
+            codes: 기준 지역 코드 목록
+            link_model: 다중 지역 연결 모델 (GroupBuyRegion, UsedPhoneRegion 등)
+            link_field: link_model에서 대상 모델을 가리키는 FK 이름
+            region_field: 대상 모델의 대표 지역 FK 이름
+        """
+        descendants = cls.descendants(codes)
+        linked = link_model.objects.filter(**{link_field: OuterRef('pk'), 'region_id__in': descendants})
+        return Q(**{f'{region_field}_id__in': descendants}) | Exists(linked)
+
+    @staticmethod
+    def build_closure_rows(parents):
+        """
+        {코드: 상위 코드} 에서 (ancestor, descendant, depth) 목록 생성
+
+        부모가 목록에 없거나 순환이 있으면 그 지점에서 멈춤
+        """
+        rows = []
+        for code in parents:
+            ancestor, depth, seen = code, 0, set()
+            while ancestor in parents and ancestor not in seen:
+                seen.add(ancestor)
+                rows.append((ancestor, code, depth))
+                ancestor = parents[ancestor]
+                depth += 1
+        return rows
+
+    @classmethod
+    def rebuild_closure(cls):
+        """
+        Region 계층 전체로 클로저 테이블 재생성
+
+        Returns:
+            int: 생성된 행 수
+        """
+        parents = dict(Region.objects.values_list('code', 'parent_id'))
+        rows = cls.build_closure_rows(parents)
+        with transaction.atomic():
+            RegionClosure.objects.all().delete()
+            RegionClosure.objects.bulk_create(
+                [RegionClosure(ancestor_id=a, descendant_id=d, depth=depth) for a, d, depth in rows],
+                batch_size=cls.CLOSURE_BATCH_SIZE,
+            )
+        cls.invalidate()
+        logger.info(f"지역 클로저 재생성: 지역 {len(parents)}개, {len(rows)}행")
+        return len(rows)
+
+    @classmethod
+    def link_region(cls, region, created=False):
+        """
+        지역 한 건이 추가/수정됐을 때 클로저 갱신
+
+        이름만 바뀐 경우는 이름 인덱스만 폐기하고, 새 지역(또는 하위 지역이 없는 지역)은
+        부모의 조상 목록으로 자신의 행만 다시 만들며, 하위 지역이 있는 지역의 부모가 바뀌면 전체를 재생성합니다.
+        """
+        if not created:
+            linked = dict(
+                RegionClosure.objects.filter(descendant_id=region.pk, depth__lte=1).values_list('depth', 'ancestor_id')
+            )
+            if 0 in linked and linked.get(1) == region.parent_id:
+                cls.invalidate()
+                return
+            if Region.objects.filter(parent_id=region.pk).exists():
+                cls.rebuild_closure()
+                return
+
+        with transaction.atomic():
+            if not created:
+                RegionClosure.objects.filter(descendant_id=region.pk).delete()
+            rows = [RegionClosure(ancestor_id=region.pk, descendant_id=region.pk, depth=0)]
+            if region.parent_id:
+                rows.extend(
+                    RegionClosure(ancestor_id=ancestor_id, descendant_id=region.pk, depth=depth + 1)
+                    for ancestor_id, depth in RegionClosure.objects.filter(
+                        descendant_id=region.parent_id
+                    ).values_list('ancestor_id', 'depth')
+                )
+            RegionClosure.objects.bulk_create(rows)
+        cls.invalidate()
+
+    @staticmethod
+    def admsect_level(code):
+        """법정동코드 자리수로 레벨 결정 (0: 시/도, 1: 시/군/구, 2: 읍/면/동)"""
+        if code[2:] == '00000000':
+            return 0
+        if code[5:] == '00000':
+            return 1
+        return 2
+
+    @staticmethod
+    def admsect_parent_candidates(code):
+        """가까운 순서의 상위 지역 코드 후보 (예: 구 → 시 → 도)"""
+        candidates = [code[:5] + '00000', code[:4] + '000000', code[:2] + '00000000']
+        return [candidate for candidate in dict.fromkeys(candidates) if candidate != code]
+
+    @classmethod
+    def import_admin_sections(cls, paths, max_level=1):
+        """
+        전국행정구역정보 파일(파이프 구분, CP949)의 법정동 행을 Region에 반영하고 클로저를 재생성
+
+        Args:
+            paths: ACMM_ADMSECT_*.txt 파일 경로 목록
+            max_level: 가져올 최대 레벨 (0: 시/도, 1: 시/군/구, 2: 읍/면/동)
+
+        Returns:
+            int: 반영된 지역 수
+        """
+        sections = {}
+        for path in paths:
+            with open(path, 'r', encoding=cls.ADMSECT_ENCODING) as file:
+                for row in csv.DictReader(file, delimiter='|'):
+                    code = (row.get('ADM_CD') or '').strip()
+                    # 폐지된 지역, 행정동 행은 건너뜀
+                    if row.get('ADM_SECT_GBN') != cls.ADMSECT_LEGAL_GBN or (row.get('DEL_YMD') or '').strip():
+                        continue
+                    if len(code) != 10 or cls.admsect_level(code) > max_level:
+                        continue
+                    sections[code] = (row['ADM_SECT_NM'].strip(), row['LOWEST_ADM_SECT_NM'].strip())
+
+        known_codes = set(Region.objects.values_list('code', flat=True)) | set(sections)
+        by_level = defaultdict(list)
+        for code, (full_name, lowest_name) in sorted(sections.items()):
+            level = cls.admsect_level(code)
+            parent_code = next(
+                (candidate for candidate in cls.admsect_parent_candidates(code) if candidate in known_codes), None
+            ) if level > 0 else None
+            by_level[level].append(Region(
+                code=code,
+                name=lowest_name.split()[-1],
+                full_name=full_name,
+                parent_id=parent_code,
+                level=level,
+                is_active=True,
+            ))
+
+        with transaction.atomic():
+            # 상위 지역이 먼저 존재하도록 레벨 순서로 저장
+            for level in sorted(by_level):
+                Region.objects.bulk_create(
+                    by_level[level],
+                    batch_size=cls.CLOSURE_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=['code'],
+                    update_fields=['name', 'full_name', 'parent', 'level', 'is_active'],
+                )
+            cls.rebuild_closure()
+        return len(sections)
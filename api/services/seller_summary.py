@@ -0,0 +1,113 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+
+class SellerSummary:
+    """
+    판매자 홈/마이페이지 요약 (견적 현황, 정산, 제안권, 평점)
+
+    - 모델별로 조건부 집계(Count(filter=Q(...))) 한 번씩만 조회
+      (Bid / Settlement / BidToken + 만료 예정 제안권 / UserTradeStats)
+    - 결과는 판매자별로 짧은 TTL(SELLER_SUMMARY_CACHE_TIMEOUT) 동안 캐시
+    - 무효화: Bid/BidToken/Settlement/Review 저장·삭제 시 커밋 후 해당 판매자 캐시 삭제
+      (공구 상태 변경처럼 판매자를 특정하기 어려운 변경은 TTL로 반영)
+    """
+
+    KEY_PREFIX = 'seller_summary'
+    EXPIRING_DAYS = 7  # 만료 7일 전부터 만료 예정으로 표시
+
+    @staticmethod
+    def timeout():
+        return getattr(settings, 'SELLER_SUMMARY_CACHE_TIMEOUT', 30)
+
+    @classmethod
+    def _key(cls, user_id):
+        return f'{cls.KEY_PREFIX}:{user_id}'
+
+    @classmethod
+    def get(cls, user):
+        """판매자 요약 (캐시에 없으면 집계 후 저장)"""
+        key = cls._key(user.pk)
+        summary = cache.get(key)
+        if summary is None:
+            summary = cls.compute(user)
+            cache.set(key, summary, cls.timeout())
+        return summary
+
+    @classmethod
+    def compute(cls, user):
+        """
+        판매자 요약 집계
+
+        Returns:
+            dict: active_bids, pending_selection, pending_sales, completed_sales, rating,
+                  single_tokens, has_unlimited, unlimited_expires_at,
+                  expiring_tokens [(id, token_type, expires_at)]
+        """
+        from api.models import Bid, BidToken, Settlement, UserTradeStats
+
+        now = timezone.now()
+
+        bids = Bid.objects.filter(seller=user).aggregate(
+            # 제안기록 - 모든 제안
+            active_bids=Count('id'),
+            # 최종선택 대기중 - 선정되어 판매자 최종선택이 필요한 견적
+            pending_selection=Count('id', filter=Q(
+                status='selected',
+                final_decision='pending',
+                groupbuy__status='final_selection_seller',
+            )),
+            # 판매 확정했지만 아직 정산 완료되지 않은 견적
+            pending_sales=Count('id', filter=Q(
+                status='selected',
+                final_decision='confirmed',
+                groupbuy__status='completed',
+            ) & ~Q(settlement__payment_status='completed')),
+        )
+
+        completed_sales = Settlement.objects.filter(seller=user, payment_status='completed').count()
+
+        # 유효한 제안권: 활성 상태이고 만료일이 없거나 현재 시간보다 미래
+        valid = Q(status='active') & (Q(expires_at__isnull=True) | Q(expires_at__gt=now))
+        single = valid & Q(token_type='single')
+        unlimited = valid & Q(token_type='unlimited')
+        tokens = BidToken.objects.filter(seller=user).aggregate(
+            single_tokens=Count('id', filter=single),
+            unlimited_count=Count('id', filter=unlimited),
+            unlimited_without_expiry=Count('id', filter=unlimited & Q(expires_at__isnull=True)),
+            unlimited_expires_at=Max('expires_at', filter=unlimited),
+        )
+
+        expiring_tokens = list(
+            BidToken.objects.filter(
+                seller=user,
+                status='active',
+                expires_at__gt=now,
+                expires_at__lte=now + timedelta(days=cls.EXPIRING_DAYS),
+            ).order_by('expires_at', 'id').values_list('id', 'token_type', 'expires_at')
+        )
+
+        return {
+            'active_bids': bids['active_bids'],
+            'pending_selection': bids['pending_selection'],
+            'pending_sales': bids['pending_sales'],
+            'completed_sales': completed_sales,
+            'rating': UserTradeStats.for_user(user).seller_review_average or 0,
+            'single_tokens': tokens['single_tokens'],
+            'has_unlimited': tokens['unlimited_count'] > 0,
+            # 만료일 없는 구독권이 있으면 만료일 없음(None)
+            'unlimited_expires_at': None if tokens['unlimited_without_expiry'] else tokens['unlimited_expires_at'],
+            'expiring_tokens': expiring_tokens,
+        }
+
+    @classmethod
+    def invalidate(cls, user_id):
+        """판매자 요약 캐시 삭제 (커밋 전에 삭제하면 다른 요청이 이전 데이터를 다시 캐시할 수 있으므로 커밋 후 실행)"""
+        if user_id is None:
+            return
+        key = cls._key(user_id)
+        transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,252 @@
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from collections import defaultdict
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CacheLog:
+    """
+    캐시 위의 추가 전용 로그 (순번 기반)
+
+    - append: 순번을 incr로 받은 뒤 해당 순번 키에 값 저장
+    - drain: 마지막 처리 위치 이후의 항목을 읽고 처리 표시(TOMBSTONE)
+    - 순번만 받고 아직 저장되지 않은 항목은 GAP_GRACE_SECONDS 동안 기다렸다가 건너뜀
+    - drain은 동시에 실행하지 않아야 함 (cron에서 flock으로 단일 실행)
+    """
+
+    KEY_PREFIX = 'cache_log'
+    GAP_GRACE_SECONDS = 60
+    TOMBSTONE = False
+    TOMBSTONE_TIMEOUT = 3600
+
+    def __init__(self, name):
+        self.name = name
+
+    def _key(self, suffix):
+        return f'{self.KEY_PREFIX}:{self.name}:{suffix}'
+
+    def append(self, value):
+        seq_key = self._key('seq')
+        cache.add(seq_key, 0, None)
+        seq = cache.incr(seq_key)
+        cache.set(self._key(f'entry:{seq}'), value, None)
+
+    def drain(self, limit=5000):
+        """처리하지 않은 항목을 순서대로 반환"""
+        position = cache.get(self._key('position'), 0)
+        end = min(cache.get(self._key('seq'), 0), position + limit)
+        if end <= position:
+            return []
+
+        seqs = range(position + 1, end + 1)
+        keys = [self._key(f'entry:{seq}') for seq in seqs]
+        entries = cache.get_many(keys)
+
+        now = time.time()
+        values, processed = [], []
+        new_position, blocked = position, False
+        for seq, key in zip(seqs, keys):
+            if key not in entries:
+                # 순번만 받고 아직 저장 전이거나 캐시에서 밀려난 항목
+                gap_key = self._key(f'gap:{seq}')
+                cache.add(gap_key, now, self.GAP_GRACE_SECONDS * 10)
+                if now - cache.get(gap_key, now) < self.GAP_GRACE_SECONDS:
+                    blocked = True
+                elif not blocked:
+                    new_position = seq
+                continue
+            if entries[key] is not self.TOMBSTONE:
+                values.append(entries[key])
+                processed.append(key)
+            if not blocked:
+                new_position = seq
+
+        if processed:
+            cache.set_many({key: self.TOMBSTONE for key in processed}, self.TOMBSTONE_TIMEOUT)
+        if new_position > position:
+            cache.delete_many([self._key(f'entry:{seq}') for seq in range(position + 1, new_position + 1)])
+            cache.set(self._key('position'), new_position, None)
+        return values
+
+
+class ViewCounter:
+    """
+    상세 조회수 지연 쓰기 (write-behind)
+
+    조회 시에는 캐시(운영: Redis)의 상품별 증가분만 올리고, flush_view_counts 명령이
+    주기적으로 증가분을 모아 DB에 일괄 반영합니다. 인기 상품 행에 조회마다
+    UPDATE가 몰려 생기는 행 잠금 경합을 없애기 위함입니다.
+
+    - 상세 응답의 조회수 = DB 값 + 아직 반영되지 않은 증가분
+    - 증가분이 0 → 1이 될 때 해당 상품 id를 모델별 로그에 추가해 flush 대상으로 표시
+    - 업체 조회 기록(LocalBusinessView)도 로그에 모았다가 bulk_create
+    - 캐시가 프로세스 안에만 있는 경우(LocMemCache 등, REDIS_URL 미설정)에는 워커별 버퍼를
+      cron의 flush가 볼 수 없으므로 버퍼링하지 않고 조회마다 DB에 바로 반영
+    """
+
+    KEY_PREFIX = 'view_counter'
+    MODELS = (
+        'used_phones.UsedPhone',
+        'used_electronics.UsedElectronics',
+        'api.CustomGroupBuy',
+        'api.LocalBusiness',
+    )
+    BUSINESS_VIEW_LOG = 'local_business_views'
+    # 프로세스마다 따로 저장되어 다른 프로세스(flush 명령)와 공유되지 않는 캐시 백엔드
+    PROCESS_LOCAL_BACKENDS = (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.dummy.DummyCache',
+    )
+
+    @classmethod
+    def is_buffered(cls):
+        """캐시 버퍼링 사용 여부 (VIEW_COUNT_BUFFERING 미설정 시 공유 캐시일 때만 사용)"""
+        buffering = getattr(settings, 'VIEW_COUNT_BUFFERING', None)
+        if buffering is not None:
+            return buffering
+        return settings.CACHES['default']['BACKEND'] not in cls.PROCESS_LOCAL_BACKENDS
+
+    @staticmethod
+    def _label(model):
+        return model._meta.label
+
+    @classmethod
+    def _delta_key(cls, label, pk):
+        return f'{cls.KEY_PREFIX}:{label}:{pk}'
+
+    @classmethod
+    def _dirty_log(cls, label):
+        return CacheLog(f'{cls.KEY_PREFIX}:dirty:{label}')
+
+    @classmethod
+    def increment(cls, instance):
+        """조회수 증가분 +1 (반환: 아직 DB에 반영되지 않은 증가분)"""
+        label = cls._label(type(instance))
+        key = cls._delta_key(label, instance.pk)
+        cache.add(key, 0, None)
+        delta = cache.incr(key)
+        if delta == 1:
+            cls._dirty_log(label).append(instance.pk)
+        return delta
+
+    @classmethod
+    def pending(cls, instance):
+        """아직 DB에 반영되지 않은 증가분"""
+        if not cls.is_buffered():
+            return 0
+        return cache.get(cls._delta_key(cls._label(type(instance)), instance.pk), 0)
+
+    @classmethod
+    def record_view(cls, instance):
+        """조회 1회를 기록하고 instance.view_count를 응답용 값(DB 값 + 증가분)으로 설정"""
+        if not cls.is_buffered():
+            type(instance).objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
+            instance.refresh_from_db(fields=['view_count'])
+            return instance.view_count
+        delta = cls.increment(instance)
+        instance.view_count = (instance.view_count or 0) + delta
+        return instance.view_count
+
+    @classmethod
+    def log_business_view(cls, business, user, ip_address):
+        """업체 조회 기록을 버퍼에 추가 (flush 시 bulk_create, 버퍼링하지 않으면 바로 저장)"""
+        user_id = user.pk if user is not None and user.is_authenticated else None
+        if not cls.is_buffered():
+            from api.models_local_business import LocalBusinessView
+            LocalBusinessView.objects.create(business=business, user_id=user_id, ip_address=ip_address)
+            return
+        CacheLog(cls.BUSINESS_VIEW_LOG).append((business.pk, user_id, ip_address, timezone.now()))
+
+    @classmethod
+    def flush_model(cls, label):
+        """모델 하나의 증가분을 DB에 반영 (반환: 반영한 조회수 합계)"""
+        model = apps.get_model(label)
+        dirty_log = cls._dirty_log(label)
+        pks = set(dirty_log.drain())
+        if not pks:
+            return 0
+
+        keys = {pk: cls._delta_key(label, pk) for pk in pks}
+        deltas = cache.get_many(keys.values())
+
+        pks_by_delta = defaultdict(list)
+        for pk, key in keys.items():
+            delta = deltas.get(key) or 0
+            if delta <= 0:
+                continue
+            try:
+                remaining = cache.decr(key, delta)
+            except ValueError:
+                continue
+            # 읽은 뒤 들어온 조회분은 다음 flush 대상으로 다시 표시
+            if remaining > 0:
+                dirty_log.append(pk)
+            pks_by_delta[delta].append(pk)
+
+        total = 0
+        for delta, delta_pks in pks_by_delta.items():
+            try:
+                model.objects.filter(pk__in=sorted(delta_pks)).update(view_count=F('view_count') + delta)
+            except Exception as e:
+                # DB 반영에 실패한 증가분은 되돌려 다음 flush에서 다시 시도
+                logger.error(f"조회수 반영 실패 ({label}): {e}")
+                for pk in delta_pks:
+                    if cls._restore(label, pk, delta) == delta:
+                        dirty_log.append(pk)
+                continue
+            total += delta * len(delta_pks)
+        return total
+
+    @classmethod
+    def _restore(cls, label, pk, delta):
+        key = cls._delta_key(label, pk)
+        cache.add(key, 0, None)
+        return cache.incr(key, delta)
+
+    @classmethod
+    def flush_business_views(cls, batch_size=500):
+        """버퍼에 모인 업체 조회 기록을 일괄 저장 (반환: 저장한 행 수)"""
+        from api.models_local_business import LocalBusiness, LocalBusinessView
+
+        rows = CacheLog(cls.BUSINESS_VIEW_LOG).drain()
+        if not rows:
+            return 0
+
+        # 버퍼에 있는 동안 삭제된 업체의 기록은 제외하고, 탈퇴한 사용자는 비회원 조회로 저장
+        business_ids = set(
+            LocalBusiness.objects.filter(pk__in={row[0] for row in rows}).values_list('pk', flat=True)
+        )
+        user_ids = set(
+            get_user_model().objects.filter(pk__in={row[1] for row in rows if row[1]}).values_list('pk', flat=True)
+        )
+        views = [
+            LocalBusinessView(
+                business_id=business_id,
+                user_id=user_id if user_id in user_ids else None,
+                ip_address=ip_address,
+                viewed_at=viewed_at,
+            )
+            for business_id, user_id, ip_address, viewed_at in rows
+            if business_id in business_ids
+        ]
+        LocalBusinessView.objects.bulk_create(views, batch_size=batch_size)
+        return len(views)
+
+    @classmethod
+    def flush(cls):
+        """
+        모든 모델의 증가분과 업체 조회 기록을 DB에 반영
+
+        Returns:
+            dict: {모델 라벨: 반영한 조회수, 'views': 저장한 조회 기록 수}
+        """
+        result = {label: cls.flush_model(label) for label in cls.MODELS}
+        result['views'] = cls.flush_business_views()
+        return result
@@ -1,5 +1,6 @@
 from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage
+from api.utils.s3_utils import get_s3_resource, get_transfer_config
 import logging
 import os
 
@@ -24,9 +25,23 @@ class MediaStorage(S3Boto3Storage):
                     logger.error(f"  {key} = {value}")
             raise ValueError("AWS_STORAGE_BUCKET_NAME이 설정되지 않았습니다. .env 파일을 확인해주세요.")
 
+        kwargs.setdefault('transfer_config', get_transfer_config())
         super().__init__(*args, **kwargs)
         logger.info(f"MediaStorage 초기화: bucket={self.bucket_name}, location={self.location}")
 
+    @property
+    def connection(self):
+        """
+        스레드별 S3 리소스 - 요청은 공용 클라이언트(커넥션 풀)로 전송
+
+        리소스 객체는 스레드 안전하지 않아 스레드마다 만들지만,
+        세션/클라이언트는 새로 만들지 않고 헬퍼 함수들과 같은 프로세스 공용 클라이언트를 사용합니다.
+        """
+        connection = getattr(self._connections, 'connection', None)
+        if connection is None:
+            connection = self._connections.connection = get_s3_resource()
+        return connection
+
     def _save(self, name, content):
         """파일 저장 시 로깅 추가"""
         logger.info(f"S3에 파일 저장 시작: {name}")
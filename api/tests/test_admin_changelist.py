@@ -0,0 +1,95 @@
+"""
+Query-count tests for the User/GroupBuy admin changelists and the estimated-count paginator.
+"""
+from datetime import timedelta
+from unittest import mock
+from django.db import connection
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from api.admin_pagination import EstimatedCountPaginator
+from api.models import Bid, BidToken, Category, GroupBuy, GroupBuyRegion, Product
+from api.models_region import Region
+
+User = get_user_model()
+
+
+# 관리자 페이지 렌더링에 collectstatic이 필요 없도록 manifest 없는 정적 파일 스토리지 사용
+@override_settings(STORAGES={
+    **settings.STORAGES,
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class AdminChangelistQueryTestCase(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username='admin', email='admin@test.com', password='testpass')
+        self.client.force_login(self.admin)
+        category = Category.objects.create(name='Electronics')
+        self.product = Product.objects.create(name='Test Product', slug='test-product', category=category, base_price=100000)
+        self.region = Region.objects.create(code='11', name='서울', full_name='서울특별시', level=0)
+        self.created = 0
+
+    def _create_rows(self, count):
+        for _ in range(count):
+            self.created += 1
+            n = self.created
+            seller = User.objects.create_user(
+                username=f'seller{n}', email=f'seller{n}@test.com', password='testpass', role='seller'
+            )
+            BidToken.objects.create(seller=seller, token_type='single')
+            BidToken.objects.create(seller=seller, token_type='unlimited', expires_at=timezone.now() + timedelta(days=10))
+            groupbuy = GroupBuy.objects.create(
+                title=f'GroupBuy {n}',
+                product=self.product,
+                creator=self.admin,
+                min_participants=1,
+                max_participants=10,
+                end_time=timezone.now() + timedelta(hours=12),
+            )
+            GroupBuyRegion.objects.create(groupbuy=groupbuy, region=self.region)
+            Bid.objects.create(groupbuy=groupbuy, seller=seller, amount=90000, status='selected')
+
+    def _changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx.captured_queries)
+
+    def test_user_changelist_query_count_is_constant(self):
+        """회원 목록은 입찰권/구독권/전문가 업종을 행마다 조회하지 않음"""
+        self._create_rows(2)
+        _, small_queries = self._changelist_queries('/admin/api/user/')
+
+        self._create_rows(6)
+        response, queries = self._changelist_queries('/admin/api/user/')
+        self.assertEqual(queries, small_queries)
+        self.assertContains(response, '1개')
+        self.assertContains(response, '일 남음')
+
+    def test_groupbuy_changelist_query_count_is_constant(self):
+        """공구 목록은 지역/선정 판매자를 행마다 조회하지 않음"""
+        self._create_rows(2)
+        _, small_queries = self._changelist_queries('/admin/api/groupbuy/')
+
+        self._create_rows(6)
+        response, queries = self._changelist_queries('/admin/api/groupbuy/')
+        self.assertEqual(queries, small_queries)
+        self.assertContains(response, '서울특별시')
+        self.assertContains(response, 'seller8 (seller8@test.com)')
+
+    def test_estimated_count_paginator(self):
+        """필터 없는 목록만 통계 추정치를 사용하고, 작은 추정치나 필터가 있으면 정확히 셈"""
+        self._create_rows(3)
+        with mock.patch.object(EstimatedCountPaginator, 'EXACT_COUNT_THRESHOLD', 0):
+            unfiltered = EstimatedCountPaginator(GroupBuy.objects.order_by('id'), 30)
+            filtered = EstimatedCountPaginator(GroupBuy.objects.filter(title='GroupBuy 1').order_by('id'), 30)
+            self.assertEqual(filtered.count, 1)
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(f'ANALYZE {GroupBuy._meta.db_table}')
+                with CaptureQueriesContext(connection) as ctx:
+                    self.assertEqual(unfiltered.count, 3)
+                self.assertIn('reltuples', ctx.captured_queries[0]['sql'])
+
+        self.assertEqual(EstimatedCountPaginator(GroupBuy.objects.order_by('id'), 30).count, 3)
@@ -0,0 +1,96 @@
+"""
+Tests for the snapshot-backed admin dashboard statistics.
+"""
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models import Bid, BidToken, Category, GroupBuy, Product, StatsSnapshot
+from api.services.admin_statistics import AdminStatistics
+
+User = get_user_model()
+
+
+class AdminStatisticsTestCase(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', email='admin@test.com', password='testpass', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        self.buyer = User.objects.create_user(username='buyer', email='buyer@test.com', password='testpass', role='buyer')
+        self.sellers = [
+            User.objects.create_user(
+                username=f'seller{i}', email=f'seller{i}@test.com', password='testpass', role='seller',
+                business_reg_number='1234567890' if i < 2 else '', is_business_verified=(i == 0)
+            )
+            for i in range(3)
+        ]
+        category = Category.objects.create(name='Electronics')
+        product = Product.objects.create(name='Test Product', slug='test-product', category=category, base_price=100000)
+        for i, status in enumerate(['recruiting', 'bidding', 'completed']):
+            groupbuy = GroupBuy.objects.create(
+                title=f'GroupBuy {i}',
+                product=product,
+                creator=self.buyer,
+                min_participants=1,
+                max_participants=10,
+                end_time=timezone.now() + timedelta(hours=12),
+                status=status
+            )
+            Bid.objects.create(
+                groupbuy=groupbuy, seller=self.sellers[i], amount=90000,
+                status='selected' if status == 'completed' else 'pending'
+            )
+
+    def test_compute_uses_one_query_per_table(self):
+        """회원/공구/입찰을 테이블당 한 번의 조건부 집계로 계산"""
+        with CaptureQueriesContext(connection) as ctx:
+            data = AdminStatistics.compute()
+        self.assertEqual(len(ctx.captured_queries), 3)
+        self.assertEqual(data['users'], {
+            'total': 5, 'buyers': 1, 'sellers': 3, 'verified_sellers': 1, 'pending_verifications': 1
+        })
+        self.assertEqual(data['groupbuys'], {'total': 3, 'active': 2, 'completed': 1})
+        self.assertEqual(data['bids'], {'total': 3, 'successful': 1, 'success_rate': 33.33})
+
+    def test_dashboard_serves_snapshot_and_live(self):
+        """대시보드는 스냅샷을 응답하고 ?live=1이면 바로 집계"""
+        call_command('refresh_admin_statistics', stdout=StringIO())
+        User.objects.create_user(username='late', email='late@test.com', password='testpass', role='buyer')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/admin/statistics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['users']['total'], 5)
+        self.assertFalse(any('COUNT' in q['sql'] for q in ctx.captured_queries))
+
+        response = self.client.get('/api/admin/statistics/', {'live': '1'})
+        self.assertEqual(response.data['users']['total'], 6)
+
+        # 오래된 스냅샷은 요청 시 다시 집계
+        StatsSnapshot.objects.update(computed_at=timezone.now() - timedelta(hours=1))
+        response = self.client.get('/api/admin/statistics/')
+        self.assertEqual(response.data['users']['buyers'], 2)
+        self.assertEqual(StatsSnapshot.objects.get().data['users']['total'], 6)
+
+    def test_sellers_with_details_without_per_seller_queries(self):
+        """판매회원 목록은 판매자 수와 관계없이 쿼리 1개로 구독권 만료일까지 조회"""
+        expires_at = timezone.now() + timedelta(days=5)
+        BidToken.objects.create(seller=self.sellers[0], token_type='single')
+        BidToken.objects.create(seller=self.sellers[1], token_type='unlimited', expires_at=expires_at)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/admin/sellers_with_details/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len([q for q in ctx.captured_queries if 'api_bidtoken' in q['sql']]), 1)
+
+        rows = {row['id']: row for row in response.data}
+        self.assertEqual(rows[self.sellers[0].id]['bid_tokens_count'], 1)
+        self.assertFalse(rows[self.sellers[0].id]['has_subscription'])
+        self.assertTrue(rows[self.sellers[1].id]['has_subscription'])
+        self.assertEqual(rows[self.sellers[1].id]['subscription_expires_at'], expires_at)
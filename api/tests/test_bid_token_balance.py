@@ -0,0 +1,246 @@
+"""
+Tests and concurrency benchmark for the per-seller bid token balance.
+"""
+import threading
+import unittest
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models import Bid, BidToken, BidTokenBalance, Category, GroupBuy, Product
+
+User = get_user_model()
+
+
+def _create_seller(username='seller'):
+    return User.objects.create_user(
+        username=username,
+        email=f'{username}@test.com',
+        password='testpass',
+        nickname=username,
+        role='seller',
+        seller_category='telecom'
+    )
+
+
+def _create_groupbuys(count, creator):
+    category = Category.objects.create(name='Electronics')
+    product = Product.objects.create(name='Test Product', slug='test-product', category=category, base_price=100000)
+    return [
+        GroupBuy.objects.create(
+            title=f'Test GroupBuy {i}',
+            product=product,
+            creator=creator,
+            min_participants=1,
+            max_participants=10,
+            end_time=timezone.now() + timedelta(hours=12),
+            status='bidding'
+        )
+        for i in range(count)
+    ]
+
+
+def _bid(seller, groupbuy, amount=95000):
+    client = APIClient()
+    client.force_authenticate(seller)
+    return client.post('/api/bids/', {'groupbuy': groupbuy.id, 'seller': seller.id, 'bid_type': 'price', 'amount': amount}, format='json')
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', '잔액 차감은 PostgreSQL 데이터 변경 CTE를 사용')
+class BidTokenBalanceTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.seller = _create_seller()
+        self.buyer = User.objects.create_user(username='buyer', email='buyer@test.com', password='testpass')
+        self.groupbuys = _create_groupbuys(4, self.buyer)
+
+    def assertBalanceConsistent(self):
+        stored = BidTokenBalance.objects.filter(seller=self.seller).values('single_count', 'unlimited_expires_at').get()
+        expected = BidTokenBalance.compute([self.seller.id])[self.seller.id]
+        self.assertEqual(stored['single_count'], expected['single_count'])
+        self.assertEqual(stored['unlimited_expires_at'], expected['unlimited_expires_at'])
+
+    def test_bid_consumes_soonest_expiring_single_token(self):
+        """입찰 시 잔액 차감과 이용권 사용 처리가 한 문장으로 처리"""
+        later = BidToken.objects.create(seller=self.seller, token_type='single', expires_at=None)
+        sooner = BidToken.objects.create(
+            seller=self.seller, token_type='single', expires_at=timezone.now() + timedelta(days=3)
+        )
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 2)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = _bid(self.seller, self.groupbuys[0])
+        self.assertEqual(response.status_code, 201)
+        token_queries = [q for q in ctx.captured_queries if 'api_bidtoken' in q['sql']]
+        self.assertEqual(len(token_queries), 1)
+        self.assertIn('bid_token_balance', token_queries[0]['sql'])
+
+        bid = Bid.objects.get(pk=response.data['id'])
+        sooner.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual(bid.bid_token_id, sooner.id)
+        self.assertEqual((sooner.status, sooner.used_for_id), ('used', bid.id))
+        self.assertEqual(later.status, 'active')
+        self.assertBalanceConsistent()
+
+        self.assertEqual(_bid(self.seller, self.groupbuys[1]).status_code, 201)
+        response = _bid(self.seller, self.groupbuys[2])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('사용 가능한 입찰권이 없습니다', response.data['detail'])
+        self.assertFalse(Bid.objects.filter(groupbuy=self.groupbuys[2]).exists())
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 0)
+
+    def test_unlimited_subscription_is_not_consumed(self):
+        """유효한 구독권이 있으면 단품 이용권을 쓰지 않고 사용처만 기록"""
+        single = BidToken.objects.create(seller=self.seller, token_type='single')
+        unlimited = BidToken.objects.create(
+            seller=self.seller, token_type='unlimited', expires_at=timezone.now() + timedelta(days=10)
+        )
+
+        response = _bid(self.seller, self.groupbuys[0])
+        self.assertEqual(response.status_code, 201)
+
+        unlimited.refresh_from_db()
+        single.refresh_from_db()
+        self.assertEqual(unlimited.status, 'active')
+        self.assertEqual(unlimited.used_for_id, response.data['id'])
+        self.assertEqual(single.status, 'active')
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 1)
+
+        # 구독권이 만료되면 단품 이용권 사용
+        BidToken.objects.filter(pk=unlimited.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+        self.assertEqual(_bid(self.seller, self.groupbuys[1]).status_code, 201)
+        single.refresh_from_db()
+        self.assertEqual(single.status, 'used')
+
+    def test_stale_balance_is_recomputed(self):
+        """잔액 행이 없거나 만료된 이용권이 남아 있으면 다시 집계 후 처리"""
+        expired = BidToken.objects.create(
+            seller=self.seller, token_type='single', expires_at=timezone.now() + timedelta(days=1)
+        )
+        BidToken.objects.bulk_create([BidToken(seller=self.seller, token_type='single')])
+        BidToken.objects.filter(pk=expired.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+        BidTokenBalance.objects.all().delete()
+
+        response = _bid(self.seller, self.groupbuys[0])
+        self.assertEqual(response.status_code, 201)
+        expired.refresh_from_db()
+        self.assertEqual(expired.status, 'active')
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 0)
+
+    def test_cancel_restores_balance(self):
+        """입찰 취소로 이용권이 복구되면 잔액도 증가"""
+        BidToken.objects.create(seller=self.seller, token_type='single')
+        response = _bid(self.seller, self.groupbuys[0])
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 0)
+        # 다른 판매자의 대기 입찰이 남아 있는 공구 (단독 입찰 취소 알림 경로 제외)
+        Bid.objects.create(groupbuy=self.groupbuys[0], seller=_create_seller('other'), amount=96000)
+
+        client = APIClient()
+        client.force_authenticate(self.seller)
+        response = client.delete(f"/api/bids/{response.data['id']}/cancel/")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 1)
+        self.assertBalanceConsistent()
+
+    def test_backfill_command(self):
+        """기존 BidToken 행에서 잔액 생성 및 불일치 수정"""
+        expires_at = timezone.now() + timedelta(days=30)
+        BidToken.objects.bulk_create([
+            BidToken(seller=self.seller, token_type='single'),
+            BidToken(seller=self.seller, token_type='single', status='used'),
+            BidToken(seller=self.seller, token_type='unlimited', expires_at=expires_at),
+        ])
+        other = _create_seller('other')
+        BidToken.objects.bulk_create([BidToken(seller=other, token_type='single')] * 3)
+        BidTokenBalance.objects.create(seller=other, single_count=7)
+
+        out = StringIO()
+        call_command('backfill_bid_token_balances', '--check', stdout=out)
+        self.assertIn('불일치 1명', out.getvalue())
+        self.assertFalse(BidTokenBalance.objects.filter(seller=self.seller).exists())
+
+        call_command('backfill_bid_token_balances', '--batch-size', '1', stdout=StringIO())
+        balance = BidTokenBalance.objects.get(seller=self.seller)
+        self.assertEqual((balance.single_count, balance.unlimited_expires_at), (1, expires_at))
+        self.assertEqual(BidTokenBalance.objects.get(seller=other).single_count, 3)
+
+
+class BidTokenBalanceDeleteTestCase(TestCase):
+    """BidToken 삭제 신호 (데이터 변경 CTE를 쓰지 않으므로 모든 DB에서 실행)"""
+
+    def test_token_delete_refreshes_existing_balance(self):
+        """이용권 삭제 시 있는 잔액 행은 원본 기준으로 갱신"""
+        seller = _create_seller()
+        expires_at = timezone.now() + timedelta(days=30)
+        single = BidToken.objects.create(seller=seller, token_type='single')
+        unlimited = BidToken.objects.create(seller=seller, token_type='unlimited', expires_at=expires_at)
+        balance = BidTokenBalance.objects.get(seller=seller)
+        self.assertEqual((balance.single_count, balance.unlimited_expires_at), (1, expires_at))
+
+        single.delete()
+        unlimited.delete()
+        balance.refresh_from_db()
+        self.assertEqual((balance.single_count, balance.unlimited_expires_at), (0, None))
+
+    def test_seller_delete_does_not_recreate_balance(self):
+        """판매자 삭제 CASCADE 중 이용권 삭제가 삭제된 판매자의 잔액 행을 다시 만들지 않음"""
+        seller = _create_seller()
+        BidToken.objects.create(seller=seller, token_type='single')
+        BidToken.objects.create(seller=seller, token_type='unlimited', expires_at=timezone.now() + timedelta(days=30))
+        self.assertTrue(BidTokenBalance.objects.filter(seller=seller).exists())
+
+        seller_id = seller.id
+        seller.delete()
+
+        connection.check_constraints()
+        self.assertFalse(BidTokenBalance.objects.filter(seller_id=seller_id).exists())
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', '행 잠금 동시성 테스트는 PostgreSQL에서만 실행')
+class BidTokenBalanceConcurrencyBenchmark(TransactionTestCase):
+    """한 판매자의 동시 입찰에서 이용권 수만큼만 입찰되고 같은 이용권이 두 번 쓰이지 않는지 확인"""
+
+    PARALLEL_BIDS = 12
+    TOKENS = 5
+
+    def setUp(self):
+        cache.clear()
+        self.seller = _create_seller()
+        buyer = User.objects.create_user(username='buyer', email='buyer@test.com', password='testpass')
+        self.groupbuys = _create_groupbuys(self.PARALLEL_BIDS, buyer)
+        for _ in range(self.TOKENS):
+            BidToken.objects.create(seller=self.seller, token_type='single')
+
+    def test_parallel_bids_use_each_token_once(self):
+        barrier = threading.Barrier(self.PARALLEL_BIDS)
+        status_codes = []
+        lock = threading.Lock()
+
+        def bid(groupbuy):
+            try:
+                barrier.wait()
+                response = _bid(self.seller, groupbuy)
+                with lock:
+                    status_codes.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=bid, args=(groupbuy,)) for groupbuy in self.groupbuys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(status_codes.count(201), self.TOKENS)
+        self.assertEqual(Bid.objects.filter(seller=self.seller).count(), self.TOKENS)
+        used = BidToken.objects.filter(seller=self.seller, status='used')
+        self.assertEqual(used.count(), self.TOKENS)
+        self.assertEqual(len(set(used.values_list('used_for_id', flat=True))), self.TOKENS)
+        self.assertEqual(BidTokenBalance.objects.get(seller=self.seller).single_count, 0)
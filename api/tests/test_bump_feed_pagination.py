@@ -0,0 +1,89 @@
+"""
+Tests for the persisted effective_date bump ordering and cursor pagination.
+"""
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from used_phones.models import UsedPhone
+
+User = get_user_model()
+
+
+class BumpFeedPaginationTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            role='seller'
+        )
+        now = timezone.now()
+        self.phones = []
+        for i in range(5):
+            phone = UsedPhone.objects.create(
+                seller=self.seller,
+                brand='samsung',
+                model=f'Galaxy S{20 + i}',
+                price=300000 + i * 10000,
+                condition_grade='A',
+                description='상태 좋은 중고폰 판매합니다.',
+            )
+            # 오래된 순서대로 등록된 것으로 조정 (effective_date도 함께)
+            created_at = now - timedelta(days=5 - i)
+            UsedPhone.objects.filter(id=phone.id).update(created_at=created_at, effective_date=created_at)
+            self.phones.append(phone.id)
+        self.newest_first = list(reversed(self.phones))
+
+    def _list(self, **params):
+        response = self.client.get('/api/used/phones/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_effective_date_follows_bump(self):
+        """생성 시 등록 시각, 끌올 시 끌올 시각으로 정렬 기준이 바뀜"""
+        phone = UsedPhone.objects.get(id=self.phones[0])
+        phone.last_bumped_at = timezone.now()
+        phone.save(update_fields=['last_bumped_at'])
+        phone.refresh_from_db()
+        self.assertEqual(phone.effective_date, phone.last_bumped_at)
+
+        ids = [item['id'] for item in self._list()['results']]
+        self.assertEqual(ids, [self.phones[0]] + self.newest_first[:-1])
+
+    def test_bump_endpoint_moves_item_to_top(self):
+        """끌올 API는 effective_date도 함께 갱신"""
+        self.client.force_authenticate(self.seller)
+        response = self.client.post(f'/api/used/phones/{self.phones[1]}/bump/')
+        self.assertEqual(response.status_code, 200)
+
+        ids = [item['id'] for item in self._list()['results']]
+        self.assertEqual(ids[0], self.phones[1])
+
+    def test_cursor_pagination_walks_all_pages(self):
+        """pagination=cursor 요청은 next 커서로 중복/누락 없이 이어서 조회"""
+        data = self._list(pagination='cursor', limit=2)
+        self.assertNotIn('count', data)
+        ids = [item['id'] for item in data['results']]
+        pages = 1
+        while data['next']:
+            response = self.client.get(data['next'])
+            self.assertEqual(response.status_code, 200)
+            data = response.data
+            ids.extend(item['id'] for item in data['results'])
+            pages += 1
+
+        self.assertEqual(ids, self.newest_first)
+        self.assertEqual(pages, 3)
+
+    def test_offset_pagination_is_default(self):
+        """커서를 요청하지 않거나 가격순 정렬이면 기존 limit/offset 응답"""
+        data = self._list(limit=2, offset=2)
+        self.assertEqual(data['count'], 5)
+        self.assertEqual([item['id'] for item in data['results']], self.newest_first[2:4])
+
+        data = self._list(pagination='cursor', ordering='price', limit=2)
+        self.assertEqual(data['count'], 5)
+        self.assertEqual([item['id'] for item in data['results']], self.phones[:2])
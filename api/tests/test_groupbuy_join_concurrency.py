@@ -0,0 +1,145 @@
+"""
+Concurrency benchmark and admission tests for GroupBuyViewSet.join.
+"""
+import threading
+import time
+import unittest
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import GroupBuy, Participation, Product, Category
+
+User = get_user_model()
+
+
+def _create_groupbuy(max_participants, suffix=''):
+    creator = User.objects.create_user(
+        username=f'creator{suffix}', email=f'creator{suffix}@test.com', password='testpass', role='buyer'
+    )
+    category = Category.objects.create(name=f'Electronics{suffix}', slug=f'electronics{suffix}')
+    product = Product.objects.create(
+        name=f'Test Product{suffix}', slug=f'test-product{suffix}', category=category, base_price=100000
+    )
+    groupbuy = GroupBuy.objects.create(
+        title='Flash Deal',
+        product=product,
+        creator=creator,
+        min_participants=1,
+        max_participants=max_participants,
+        end_time=timezone.now() + timedelta(hours=1),
+        status='recruiting'
+    )
+    return groupbuy
+
+
+class GroupBuyJoinTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.groupbuy = _create_groupbuy(max_participants=2)
+        self.users = [
+            User.objects.create_user(username=f'buyer{i}', email=f'buyer{i}@test.com', password='testpass', role='buyer')
+            for i in range(3)
+        ]
+
+    def _join(self, user, groupbuy=None):
+        self.client.force_authenticate(user=user)
+        return self.client.post(f'/api/groupbuys/{(groupbuy or self.groupbuy).id}/join/')
+
+    def test_join_fills_exactly_and_rejects_overflow(self):
+        """정원까지만 참여되고 초과 요청은 거절"""
+        self.assertEqual(self._join(self.users[0]).status_code, 201)
+        response = self._join(self.users[1])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['current_participants'], 2)
+
+        response = self._join(self.users[2])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['error'], '최대 참여자 수에 도달했습니다.')
+
+        self.groupbuy.refresh_from_db()
+        self.assertEqual(self.groupbuy.current_participants, 2)
+        self.assertEqual(Participation.objects.filter(groupbuy=self.groupbuy).count(), 2)
+
+    def test_duplicate_checks_use_single_query(self):
+        """중복 참여 / 동일 상품 공구 참여를 한 번의 조회로 거절"""
+        self._join(self.users[0])
+        other = GroupBuy.objects.create(
+            title='Same Product',
+            product=self.groupbuy.product,
+            creator=self.groupbuy.creator,
+            min_participants=1,
+            max_participants=10,
+            end_time=timezone.now() + timedelta(hours=1),
+            status='recruiting'
+        )
+
+        response = self._join(self.users[0])
+        self.assertEqual(response.data['error'], '이미 참여 중인 공구입니다.')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._join(self.users[0], other)
+        self.assertEqual(response.data['error'], '이미 동일한 상품의 다른 공구에 참여중입니다.')
+        participation_queries = [q for q in ctx.captured_queries if 'FROM "api_participation"' in q['sql']]
+        self.assertEqual(len(participation_queries), 1)
+
+    def test_closed_groupbuy_is_rejected_without_reservation(self):
+        """마감된 공구는 참여자 수가 증가하지 않음"""
+        GroupBuy.objects.filter(pk=self.groupbuy.pk).update(end_time=timezone.now() - timedelta(minutes=1))
+        response = self._join(self.users[0])
+        self.assertEqual(response.status_code, 400)
+        self.groupbuy.refresh_from_db()
+        self.assertEqual(self.groupbuy.current_participants, 0)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', '행 잠금 동시성 테스트는 PostgreSQL에서만 실행')
+class GroupBuyJoinConcurrencyBenchmark(TransactionTestCase):
+    """N개의 동시 참여 요청에서 정확히 max_participants만큼만 참여되는지 확인"""
+
+    PARALLEL_JOINS = 40
+    MAX_PARTICIPANTS = 15
+
+    def setUp(self):
+        cache.clear()
+        self.groupbuy = _create_groupbuy(max_participants=self.MAX_PARTICIPANTS)
+        self.users = [
+            User.objects.create_user(username=f'flash{i}', email=f'flash{i}@test.com', password='testpass', role='buyer')
+            for i in range(self.PARALLEL_JOINS)
+        ]
+
+    def test_parallel_joins_fill_exactly(self):
+        barrier = threading.Barrier(self.PARALLEL_JOINS)
+        status_codes = []
+        lock = threading.Lock()
+
+        def join(user):
+            client = APIClient()
+            client.force_authenticate(user=user)
+            try:
+                barrier.wait()
+                response = client.post(f'/api/groupbuys/{self.groupbuy.id}/join/')
+                with lock:
+                    status_codes.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=join, args=(user,)) for user in self.users]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        self.groupbuy.refresh_from_db()
+        self.assertEqual(status_codes.count(201), self.MAX_PARTICIPANTS)
+        self.assertEqual(status_codes.count(400), self.PARALLEL_JOINS - self.MAX_PARTICIPANTS)
+        self.assertEqual(self.groupbuy.current_participants, self.MAX_PARTICIPANTS)
+        self.assertEqual(Participation.objects.filter(groupbuy=self.groupbuy).count(), self.MAX_PARTICIPANTS)
+        # 행 잠금 대기 시간이 누적되어도 요청당 수십 ms 수준이어야 함
+        self.assertLess(elapsed, 30)
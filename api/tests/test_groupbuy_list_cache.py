@@ -0,0 +1,102 @@
+"""
+Tests for the versioned GroupBuy list response cache.
+"""
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import GroupBuy, Participation, Product, Category
+
+User = get_user_model()
+
+
+class GroupBuyListCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='buyer1',
+            email='buyer1@test.com',
+            password='testpass',
+            role='buyer'
+        )
+        self.category = Category.objects.create(name='Electronics')
+        self.other_category = Category.objects.create(name='Books', slug='books')
+        self.product = Product.objects.create(
+            name='Test Product',
+            slug='test-product',
+            category=self.category,
+            base_price=100000
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.groupbuy = GroupBuy.objects.create(
+                title='Test GroupBuy',
+                product=self.product,
+                creator=self.user,
+                min_participants=1,
+                max_participants=10,
+                end_time=timezone.now() + timedelta(hours=12),
+                status='recruiting'
+            )
+
+    def _get(self, path, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(path, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, len(ctx.captured_queries)
+
+    def test_repeated_request_is_served_from_cache(self):
+        """같은 요청은 DB 조회 없이 캐시에서 응답"""
+        _, first_queries = self._get('/api/groupbuys/', {'status': 'active'})
+        self.assertGreater(first_queries, 0)
+
+        response, cached_queries = self._get('/api/groupbuys/', {'status': 'active'})
+        self.assertEqual(cached_queries, 0)
+        self.assertEqual(response.data['results'][0]['id'], self.groupbuy.id)
+
+    def test_remaining_seconds_recomputed_at_serve_time(self):
+        """캐시된 응답도 remaining_seconds는 응답 시점 기준"""
+        first, _ = self._get('/api/groupbuys/recent/')
+        later = timezone.now() + timedelta(hours=1)
+        with patch('api.views.timezone.now', return_value=later):
+            second, queries = self._get('/api/groupbuys/recent/')
+
+        self.assertEqual(queries, 0)
+        self.assertAlmostEqual(
+            first.data[0]['remaining_seconds'] - second.data[0]['remaining_seconds'],
+            3600,
+            delta=5
+        )
+
+    def test_normalized_params_share_cache_entry(self):
+        """합집합 필터 값의 순서가 달라도 같은 캐시 사용"""
+        self._get('/api/groupbuys/', {'status': 'recruiting,bidding'})
+        _, queries = self._get('/api/groupbuys/', {'status': 'bidding, recruiting'})
+        self.assertEqual(queries, 0)
+
+    def test_search_is_not_cached(self):
+        """검색 요청은 캐시하지 않음"""
+        self._get('/api/groupbuys/', {'search': 'Test'})
+        _, queries = self._get('/api/groupbuys/', {'search': 'Test'})
+        self.assertGreater(queries, 0)
+
+    def test_participation_invalidates_category_and_all(self):
+        """참여 발생 시 해당 카테고리와 전체 목록 캐시가 무효화"""
+        self._get('/api/groupbuys/')
+        self._get('/api/groupbuys/', {'category': self.category.id})
+        self._get('/api/groupbuys/', {'category': self.other_category.id})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Participation.objects.create(user=self.user, groupbuy=self.groupbuy)
+
+        _, all_queries = self._get('/api/groupbuys/')
+        _, category_queries = self._get('/api/groupbuys/', {'category': self.category.id})
+        _, other_queries = self._get('/api/groupbuys/', {'category': self.other_category.id})
+        self.assertGreater(all_queries, 0)
+        self.assertGreater(category_queries, 0)
+        self.assertEqual(other_queries, 0)
@@ -0,0 +1,94 @@
+"""
+Query-count regression tests for the GroupBuy list serializer.
+"""
+from django.db import connection
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import GroupBuy, GroupBuyRegion, GroupBuyTelecomDetail, Product, Category, Region
+
+User = get_user_model()
+
+
+class GroupBuyListQueryCountTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.category = Category.objects.create(name='휴대폰', slug='phone')
+        self.parent_region = Region.objects.create(code='11', name='서울특별시', full_name='서울특별시', level=0)
+        self.region = Region.objects.create(
+            code='11680', name='강남구', full_name='서울특별시 강남구', parent=self.parent_region, level=1
+        )
+
+    def _create_groupbuys(self, count):
+        for i in range(count):
+            creator = User.objects.create_user(
+                username=f'creator{GroupBuy.objects.count()}',
+                email=f'creator{GroupBuy.objects.count()}@test.com',
+                password='testpass',
+                nickname=f'creator{GroupBuy.objects.count()}'
+            )
+            product = Product.objects.create(
+                name=f'Product {GroupBuy.objects.count()}',
+                slug=f'product-{GroupBuy.objects.count()}',
+                category=self.category,
+                base_price=100000
+            )
+            groupbuy = GroupBuy.objects.create(
+                title=f'GroupBuy {i}',
+                product=product,
+                creator=creator,
+                min_participants=1,
+                max_participants=10,
+                end_time=timezone.now() + timedelta(hours=12),
+                status='recruiting'
+            )
+            GroupBuyRegion.objects.create(groupbuy=groupbuy, region=self.region)
+            GroupBuyTelecomDetail.objects.create(
+                groupbuy=groupbuy,
+                telecom_carrier='SKT',
+                subscription_type='new',
+                plan_info='5G_standard'
+            )
+
+    def _count_list_queries(self, limit):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/groupbuys/', {'limit': limit})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), limit)
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_is_constant(self):
+        """공구 수와 무관하게 목록 한 페이지의 쿼리 수가 일정해야 함"""
+        self._create_groupbuys(20)
+
+        small_page_queries, _ = self._count_list_queries(5)
+        full_page_queries, response = self._count_list_queries(20)
+
+        self.assertEqual(small_page_queries, full_page_queries)
+        self.assertLessEqual(full_page_queries, 10)
+
+        item = response.data['results'][0]
+        self.assertEqual(item['regions'][0]['full_name'], '서울특별시 강남구')
+        self.assertEqual(item['telecom_detail']['telecom_carrier'], 'SKT')
+        self.assertEqual(item['product_details']['telecom_detail']['carrier'], 'SKT')
+        self.assertEqual(item['product_info']['active_groupbuy']['id'], item['id'])
+
+    def test_list_matches_detail_serializer(self):
+        """목록 직렬화 결과는 기존 GroupBuySerializer와 동일해야 함"""
+        from api.serializers import GroupBuySerializer, GroupBuyListSerializer
+
+        self._create_groupbuys(3)
+        groupbuys = list(GroupBuy.objects.order_by('id'))
+
+        expected = GroupBuySerializer(groupbuys, many=True).data
+        actual = GroupBuyListSerializer(groupbuys, many=True).data
+
+        self.assertEqual(
+            [dict(item) for item in actual],
+            [dict(item) for item in expected]
+        )
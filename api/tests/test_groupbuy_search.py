@@ -0,0 +1,135 @@
+"""
+Tests for the denormalized GroupBuy search document and search modes.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import GroupBuy, GroupBuyRegion, GroupBuyTelecomDetail, Product, Category, Region
+from api.services.groupbuy_search import GroupBuySearch
+
+User = get_user_model()
+
+
+class GroupBuySearchTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='creator',
+            email='creator@test.com',
+            password='testpass',
+            role='buyer'
+        )
+        self.category = Category.objects.create(name='휴대폰')
+        self.galaxy = Product.objects.create(
+            name='갤럭시 S24 Ultra',
+            slug='galaxy-s24-ultra',
+            category=self.category,
+            base_price=1500000
+        )
+        self.iphone = Product.objects.create(
+            name='아이폰 15 Pro',
+            slug='iphone-15-pro',
+            category=self.category,
+            base_price=1550000
+        )
+        self.seoul = Region.objects.create(code='11', name='서울특별시', full_name='서울특별시', level=0)
+        self.gangnam = Region.objects.create(
+            code='11680', name='강남구', full_name='서울특별시 강남구', parent=self.seoul, level=1
+        )
+        self.mapo = Region.objects.create(
+            code='11440', name='마포구', full_name='서울특별시 마포구', parent=self.seoul, level=1
+        )
+
+        self.galaxy_groupbuy = self._create_groupbuy('강남 갤럭시 번호이동 공구', self.galaxy, [self.gangnam], 'SKT')
+        self.iphone_groupbuy = self._create_groupbuy('아이폰 같이 사요', self.iphone, [self.mapo], 'LGU')
+        self.nationwide_groupbuy = self._create_groupbuy(
+            '전국 비대면 갤럭시 공구', self.galaxy, [self.gangnam], 'KT', region_type='nationwide'
+        )
+
+    def _create_groupbuy(self, title, product, regions, carrier, **extra):
+        groupbuy = GroupBuy.objects.create(
+            title=title,
+            product=product,
+            creator=self.user,
+            min_participants=1,
+            max_participants=10,
+            end_time=timezone.now() + timedelta(hours=12),
+            status='recruiting',
+            **extra
+        )
+        for region in regions:
+            GroupBuyRegion.objects.create(groupbuy=groupbuy, region=region)
+        GroupBuyTelecomDetail.objects.create(
+            groupbuy=groupbuy,
+            telecom_carrier=carrier,
+            subscription_type='transfer',
+            plan_info='5만원대'
+        )
+        return groupbuy
+
+    def _search_ids(self, **params):
+        response = self.client.get('/api/groupbuys/', params)
+        self.assertEqual(response.status_code, 200)
+        return [item['id'] for item in response.data['results']]
+
+    def test_document_includes_related_names(self):
+        """지역/통신 정보가 나중에 저장돼도 검색 문서에 반영"""
+        groupbuy = GroupBuy.objects.get(id=self.galaxy_groupbuy.id)
+        self.assertIn('갤럭시 s24 ultra', groupbuy.search_document)
+        self.assertIn('강남구', groupbuy.search_document)
+        self.assertIn('skt', groupbuy.search_document)
+        self.assertEqual(groupbuy.region_search_document, '강남구')
+
+        GroupBuyRegion.objects.filter(groupbuy=groupbuy).delete()
+        groupbuy.refresh_from_db()
+        self.assertEqual(groupbuy.region_search_document, '')
+        self.assertNotIn('강남구', groupbuy.search_document)
+
+    def test_korean_substring_search(self):
+        """한글 부분 문자열과 대소문자 구분 없는 검색"""
+        self.assertCountEqual(
+            self._search_ids(search='갤럭'),
+            [self.galaxy_groupbuy.id, self.nationwide_groupbuy.id]
+        )
+        self.assertEqual(self._search_ids(search='같이'), [self.iphone_groupbuy.id])
+        self.assertEqual(self._search_ids(search='마포'), [self.iphone_groupbuy.id])
+        self.assertEqual(self._search_ids(search='lg u+'), [self.iphone_groupbuy.id])
+        self.assertCountEqual(
+            self._search_ids(search='ULTRA'),
+            [self.galaxy_groupbuy.id, self.nationwide_groupbuy.id]
+        )
+        # 여러 단어는 모두 포함된 공구만 (필드가 달라도 됨)
+        self.assertEqual(self._search_ids(search='갤럭시 skt'), [self.galaxy_groupbuy.id])
+
+    def test_title_update_refreshes_document(self):
+        """update_fields로 제목만 저장해도 검색 문서 갱신"""
+        groupbuy = GroupBuy.objects.get(id=self.iphone_groupbuy.id)
+        groupbuy.title = '마감임박 특가'
+        groupbuy.save(update_fields=['title'])
+
+        self.assertEqual(self._search_ids(search='특가'), [self.iphone_groupbuy.id])
+        self.assertEqual(self._search_ids(search='같이'), [])
+
+    def test_region_search_excludes_nationwide(self):
+        """지역 검색은 지역명만 대상으로 하고 전국 비대면 공구는 제외"""
+        self.assertEqual(self._search_ids(region_search='강남'), [self.galaxy_groupbuy.id])
+        self.assertEqual(self._search_ids(region_search='갤럭시'), [])
+
+    def test_ranked_mode_orders_by_relevance(self):
+        """랭킹 모드는 최신순보다 검색어와 더 잘 맞는 공구를 먼저 반환"""
+        GroupBuy.objects.filter(id=self.nationwide_groupbuy.id).update(
+            start_time=timezone.now() + timedelta(minutes=1)
+        )
+        self.assertEqual(
+            self._search_ids(search='강남'),
+            [self.nationwide_groupbuy.id, self.galaxy_groupbuy.id]
+        )
+        # 제목에 '강남'이 있는 공구가 지역명(강남구)만 일치하는 공구보다 앞
+        self.assertEqual(
+            self._search_ids(search='강남', search_mode=GroupBuySearch.RANKED_MODE),
+            [self.galaxy_groupbuy.id, self.nationwide_groupbuy.id]
+        )
@@ -0,0 +1,166 @@
+"""
+Tests for the next_deadline driven group-buy transition worker.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import GroupBuy, Product, Category, Bid
+from api.services.groupbuy_transition_service import GroupBuyTransitionService
+
+User = get_user_model()
+
+
+class GroupBuyTransitionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.buyer = User.objects.create_user(
+            username='buyer1',
+            email='buyer1@test.com',
+            password='testpass',
+            role='buyer'
+        )
+        self.seller = User.objects.create_user(
+            username='seller1',
+            email='seller1@test.com',
+            password='testpass',
+            role='seller'
+        )
+        self.category = Category.objects.create(name='Electronics')
+        self.product = Product.objects.create(
+            name='Test Product',
+            slug='test-product',
+            category=self.category,
+            base_price=100000
+        )
+
+    def _create_groupbuy(self, end_time):
+        return GroupBuy.objects.create(
+            title='Test GroupBuy',
+            product=self.product,
+            creator=self.buyer,
+            min_participants=1,
+            max_participants=10,
+            start_time=timezone.now() - timedelta(hours=2),
+            end_time=end_time,
+            status='recruiting'
+        )
+
+    def test_next_deadline_follows_status(self):
+        """상태에 따라 next_deadline이 해당 마감 시간으로 설정"""
+        groupbuy = self._create_groupbuy(timezone.now() + timedelta(hours=1))
+        self.assertEqual(groupbuy.next_deadline, groupbuy.end_time)
+
+        groupbuy.status = 'final_selection_buyers'
+        groupbuy.final_selection_end = timezone.now() + timedelta(hours=12)
+        groupbuy.save(update_fields=['status', 'final_selection_end'])
+        groupbuy.refresh_from_db()
+        self.assertEqual(groupbuy.next_deadline, groupbuy.final_selection_end)
+
+        groupbuy.status = 'cancelled'
+        groupbuy.save()
+        groupbuy.refresh_from_db()
+        self.assertIsNone(groupbuy.next_deadline)
+
+    def test_worker_transitions_only_due_groupbuys(self):
+        """마감된 공구만 전환되고 진행중 공구는 그대로 유지"""
+        expired = self._create_groupbuy(timezone.now() - timedelta(minutes=1))
+        Bid.objects.create(groupbuy=expired, seller=self.seller, amount=10000)
+        expired_no_bid = self._create_groupbuy(timezone.now() - timedelta(minutes=1))
+        active = self._create_groupbuy(timezone.now() + timedelta(hours=1))
+
+        result = GroupBuyTransitionService.process_all_due()
+
+        self.assertEqual(result['transitioned'], 2)
+        expired.refresh_from_db()
+        expired_no_bid.refresh_from_db()
+        active.refresh_from_db()
+        self.assertEqual(expired.status, 'final_selection_buyers')
+        self.assertEqual(expired.next_deadline, expired.final_selection_end)
+        self.assertEqual(expired_no_bid.status, 'cancelled')
+        self.assertEqual(active.status, 'recruiting')
+
+        # 다시 실행해도 처리할 공구가 없음
+        self.assertEqual(GroupBuyTransitionService.process_all_due()['processed'], 0)
+
+    def test_stuck_groupbuys_do_not_block_queue(self):
+        """전환할 수 없는 공구가 배치 크기보다 많이 앞에 있어도 뒤의 공구까지 처리"""
+        stuck_deadline = timezone.now() - timedelta(days=1)
+        batch_size = GroupBuyTransitionService.DEFAULT_BATCH_SIZE
+        # bulk_create는 save()를 거치지 않으므로 queryset.update()로 상태만 바뀐 공구처럼
+        # 마감 필드 없이 지난 next_deadline이 남아있음
+        GroupBuy.objects.bulk_create([
+            GroupBuy(
+                title=f'Stuck GroupBuy {i}',
+                product=self.product,
+                creator=self.buyer,
+                min_participants=1,
+                max_participants=10,
+                end_time=stuck_deadline - timedelta(hours=12),
+                status='final_selection_buyers',
+                final_selection_end=None,
+                next_deadline=stuck_deadline - timedelta(minutes=i)
+            )
+            for i in range(batch_size + 5)
+        ])
+        bidding = self._create_groupbuy(timezone.now() - timedelta(minutes=2))
+        GroupBuy.objects.filter(id=bidding.id).update(status='bidding')
+        expired = self._create_groupbuy(timezone.now() - timedelta(minutes=1))
+
+        result = GroupBuyTransitionService.process_all_due()
+
+        self.assertEqual(result['rescheduled'], batch_size + 5)
+        self.assertEqual(result['transitioned'], 2)
+        bidding.refresh_from_db()
+        expired.refresh_from_db()
+        self.assertEqual(bidding.status, 'cancelled')
+        self.assertEqual(expired.status, 'cancelled')
+        self.assertFalse(GroupBuy.objects.filter(status='final_selection_buyers', next_deadline__isnull=False).exists())
+        self.assertEqual(GroupBuyTransitionService.process_all_due()['processed'], 0)
+
+    def test_list_does_not_write(self):
+        """목록 조회는 상태를 변경하지 않고 calculated_status로만 보정"""
+        expired = self._create_groupbuy(timezone.now() - timedelta(minutes=1))
+
+        response = self.client.get('/api/groupbuys/')
+
+        self.assertEqual(response.status_code, 200)
+        expired.refresh_from_db()
+        self.assertEqual(expired.status, 'recruiting')
+        results = response.data['results'] if isinstance(response.data, dict) else response.data
+        item = next(r for r in results if r['id'] == expired.id)
+        self.assertEqual(item['calculated_status'], 'cancelled')
+        self.assertEqual(item['remaining_seconds'], 0)
+
+    def test_update_command_selects_top_bid_in_bulk(self):
+        """관리 명령은 최고 입찰을 낙찰로, 나머지는 미선정으로 일괄 처리"""
+        from django.core.management import call_command
+        from io import StringIO
+
+        expired = self._create_groupbuy(timezone.now() - timedelta(minutes=1))
+        other_seller = User.objects.create_user(
+            username='seller2',
+            email='seller2@test.com',
+            password='testpass',
+            role='seller'
+        )
+        low_bid = Bid.objects.create(groupbuy=expired, seller=self.seller, amount=10000)
+        high_bid = Bid.objects.create(groupbuy=expired, seller=other_seller, amount=20000)
+
+        # dry-run은 변경하지 않음
+        call_command('update_groupbuy_status', '--dry-run', stdout=StringIO())
+        expired.refresh_from_db()
+        self.assertEqual(expired.status, 'recruiting')
+
+        call_command('update_groupbuy_status', '--batch-size', '1', stdout=StringIO())
+        expired.refresh_from_db()
+        low_bid.refresh_from_db()
+        high_bid.refresh_from_db()
+        self.assertEqual(expired.status, 'final_selection_buyers')
+        self.assertEqual(expired.next_deadline, expired.end_time + timedelta(hours=12))
+        self.assertEqual(high_bid.status, 'selected')
+        self.assertTrue(high_bid.is_selected)
+        self.assertEqual(low_bid.status, 'not_selected')
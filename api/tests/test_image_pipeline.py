@@ -0,0 +1,169 @@
+"""
+Tests for the WebP variant pipeline used by used phone / electronics image uploads.
+"""
+import io
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from PIL import Image, JpegImagePlugin
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from api.services.image_pipeline import ImagePipeline
+from used_phones.models import UsedPhone, UsedPhoneImage
+from used_phones.serializers import UsedPhoneListImageSerializer
+from used_electronics.models import UsedElectronics, ElectronicsImage
+
+User = get_user_model()
+
+
+def make_jpeg(name='photo.jpg', size=(2000, 1500)):
+    output = io.BytesIO()
+    Image.new('RGB', size, (200, 120, 40)).save(output, format='JPEG', quality=90)
+    return SimpleUploadedFile(name, output.getvalue(), content_type='image/jpeg')
+
+
+class ImagePipelineTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        # 기본 스토리지는 항상 S3(MediaStorage)이므로 로컬 파일 스토리지로 교체
+        self.settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            USE_S3=False,
+            STORAGES={
+                **settings.STORAGES,
+                'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            },
+        )
+        self.settings_override.enable()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            nickname='seller'
+        )
+        self.phone = UsedPhone.objects.create(
+            seller=self.seller,
+            brand='samsung',
+            model='Galaxy S24',
+            price=500000,
+            condition_grade='A',
+            description='상태 좋은 중고폰 판매합니다.',
+        )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def _open(self, field_file):
+        field_file.open('rb')
+        try:
+            img = Image.open(field_file)
+            img.load()
+            return img
+        finally:
+            field_file.close()
+
+    def test_phone_image_variants(self):
+        """업로드 원본 대신 상세/목록/썸네일 WebP 변형이 저장됨"""
+        image = UsedPhoneImage.objects.create(phone=self.phone, image=make_jpeg(), order=0)
+        image.refresh_from_db()
+
+        detail = self._open(image.image)
+        list_variant = self._open(image.list_image)
+        thumb = self._open(image.thumbnail)
+        self.assertEqual(detail.format, 'WEBP')
+        self.assertTrue(image.image.name.endswith('.webp'))
+        self.assertEqual(max(detail.size), 1280)
+        self.assertEqual(max(list_variant.size), 640)
+        self.assertEqual(max(thumb.size), 320)
+        self.assertEqual((image.width, image.height), (2000, 1500))
+        self.assertEqual(image.file_size, image.image.size)
+
+    def test_jpeg_uses_draft_decoding(self):
+        """JPEG는 draft로 필요한 크기까지만 디코딩"""
+        draft_method = JpegImagePlugin.JpegImageFile.draft
+        with patch.object(JpegImagePlugin.JpegImageFile, 'draft', autospec=True, side_effect=draft_method) as draft:
+            ImagePipeline.render(make_jpeg())
+        self.assertTrue(draft.called)
+        self.assertEqual(draft.call_args_list[0][0][2], (1280, 1280))
+
+    def test_create_kwargs_keeps_order_and_falls_back(self):
+        """여러 파일 병렬 처리 시 입력 순서 유지, 이미지가 아니면 원본 저장"""
+        broken = SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg')
+        files = [make_jpeg('a.jpg', (800, 600)), broken, make_jpeg('c.jpg', (600, 800))]
+
+        kwargs = ImagePipeline.create_kwargs(UsedPhoneImage, files)
+
+        self.assertEqual(len(kwargs), 3)
+        self.assertEqual((kwargs[0]['width'], kwargs[0]['height']), (800, 600))
+        self.assertEqual(kwargs[1], {'image': broken})
+        self.assertEqual((kwargs[2]['width'], kwargs[2]['height']), (600, 800))
+        self.assertTrue(kwargs[0]['list_image'].endswith('.webp'))
+
+        kwargs = ImagePipeline.create_kwargs(ElectronicsImage, [make_jpeg()])
+        self.assertNotIn('width', kwargs[0])
+        electronics = UsedElectronics.objects.create(
+            seller=self.seller,
+            subcategory='laptop',
+            brand='LG',
+            model_name='Gram',
+            condition_grade='A',
+            price=800000,
+            description='상태 좋은 노트북 판매합니다.',
+        )
+        image = ElectronicsImage.objects.create(electronics=electronics, order=0, **kwargs[0])
+        self.assertEqual(max(self._open(image.thumbnail).size), 320)
+
+    def test_fallback_is_not_processed_again_on_save(self):
+        """변환에 실패해 원본으로 저장하는 파일은 save()에서 다시 디코딩/업로드하지 않음"""
+        broken = SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg')
+        with patch.object(ImagePipeline, 'render', wraps=ImagePipeline.render) as render:
+            kwargs = ImagePipeline.create_kwargs(UsedPhoneImage, [broken])
+            image = UsedPhoneImage.objects.create(phone=self.phone, order=0, **kwargs[0])
+        self.assertEqual(render.call_count, 1)
+        self.assertTrue(image.image.name.endswith('broken.jpg'))
+
+    def test_original_fallback_keeps_metadata(self):
+        """원본으로 저장할 때도 크기/파일 크기와 (S3 사용 시) 이미지 URL 기록"""
+        upload = make_jpeg(size=(900, 700))
+        with patch.object(ImagePipeline, '_store', side_effect=IOError('upload failed')), \
+                override_settings(USE_S3=True):
+            image = UsedPhoneImage.objects.create(phone=self.phone, image=upload, order=0)
+        image.refresh_from_db()
+        self.assertTrue(image.image.name.endswith('.jpg'))
+        self.assertEqual((image.width, image.height), (900, 700))
+        self.assertEqual(image.file_size, upload.size)
+        self.assertEqual(image.image_url, image.image.url)
+
+        broken = SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg')
+        image = UsedPhoneImage.objects.create(phone=self.phone, image=broken, order=1)
+        self.assertEqual((image.width, image.height, image.file_size), (None, None, len(b'not an image')))
+
+    def test_partial_upload_failure_discards_uploaded_variants(self):
+        """변형 일부만 업로드에 실패하면 올라간 변형을 지우고 원본으로 저장"""
+        store = ImagePipeline._store
+
+        def fail_thumbnail(field, name, data):
+            if field.name == 'thumbnail':
+                raise IOError('upload failed')
+            return store(field, name, data)
+
+        upload = make_jpeg()
+        with patch.object(ImagePipeline, '_store', fail_thumbnail):
+            kwargs = ImagePipeline.create_kwargs(UsedPhoneImage, [upload])
+
+        self.assertEqual(kwargs, [{'image': upload}])
+        leftovers = [name for _, _, files in os.walk(self.media_root) for name in files if name.endswith('.webp')]
+        self.assertEqual(leftovers, [])
+
+    def test_list_serializer_serves_list_variant(self):
+        """목록 시리얼라이저의 imageUrl은 목록용, thumbnailUrl은 썸네일 변형"""
+        image = UsedPhoneImage.objects.create(phone=self.phone, image=make_jpeg(), order=0)
+        data = UsedPhoneListImageSerializer(image).data
+
+        self.assertEqual(data['imageUrl'], image.list_image.url)
+        self.assertEqual(data['thumbnailUrl'], image.thumbnail.url)
+        self.assertNotEqual(data['imageUrl'], data['thumbnailUrl'])
@@ -0,0 +1,111 @@
+"""
+Tests for the DB-backed background job queue.
+"""
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from api.models import BackgroundJob, Notification
+from api.services.job_queue import JobQueue
+from api.utils.email_sender import EmailSender
+from api.utils.notification_helper import send_notification
+
+User = get_user_model()
+
+
+class JobQueueTestCase(TestCase):
+    def _email_job(self, key=None):
+        return JobQueue.enqueue(
+            'email.send',
+            {'recipient_email': 'buyer@test.com', 'subject': '제목', 'template_name': 'emails/bid_reminder.html', 'context': {}},
+            idempotency_key=key
+        )
+
+    def test_idempotency_key_creates_single_job(self):
+        """같은 키로 여러 번 등록해도 작업은 하나"""
+        first = self._email_job('email:test:1')
+        second = self._email_job('email:test:1')
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(BackgroundJob.objects.count(), 1)
+
+    def test_failed_job_retries_with_backoff_then_fails(self):
+        """실패하면 백오프 후 재시도하고 최대 시도 횟수를 넘으면 failed"""
+        job = self._email_job()
+
+        with patch.object(EmailSender, 'send_notification_email', return_value=False):
+            for attempt in range(1, job.max_attempts + 1):
+                result = JobQueue.run_pending(worker_id='test-worker')
+                self.assertEqual(result['failed'], 1)
+                job.refresh_from_db()
+                self.assertEqual(job.attempts, attempt)
+                if attempt < job.max_attempts:
+                    self.assertEqual(job.status, 'pending')
+                    self.assertGreater(job.run_at, timezone.now())
+                    # 백오프 대기 중에는 가져가지 않음
+                    self.assertEqual(JobQueue.run_pending(worker_id='test-worker')['claimed'], 0)
+                    BackgroundJob.objects.filter(id=job.id).update(run_at=timezone.now())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'failed')
+        self.assertIn('이메일 발송 실패', job.last_error)
+
+    def test_concurrency_limit_per_job_type(self):
+        """작업 타입별 동시 실행 수를 넘겨 가져가지 않음"""
+        concurrency = JobQueue.get_job_type('sms.bulk').concurrency
+        for i in range(concurrency + 3):
+            JobQueue.enqueue('sms.bulk', {'phone_numbers': ['01012345678'], 'message': f'msg {i}'})
+        self._email_job()
+
+        claimed = JobQueue.claim('worker-1', limit=50)
+        sms_jobs = [job for job in claimed if job.job_type == 'sms.bulk']
+        self.assertEqual(len(sms_jobs), concurrency)
+        self.assertEqual(len(claimed), concurrency + 1)
+
+        # 실행 중인 작업이 끝나기 전에는 다른 워커도 가져가지 않음
+        self.assertEqual(JobQueue.claim('worker-2', limit=50), [])
+
+        # 처리 도중 워커가 죽어 잠금 시간이 지난 작업은 다시 가져감
+        BackgroundJob.objects.filter(id=sms_jobs[0].id).update(
+            locked_at=timezone.now() - JobQueue.LOCK_TIMEOUT - timedelta(seconds=1)
+        )
+        reclaimed = JobQueue.claim('worker-2', limit=50)
+        self.assertIn(sms_jobs[0].id, [job.id for job in reclaimed])
+
+    def test_send_notification_queues_push(self):
+        """send_notification은 인앱 알림만 만들고 푸시는 작업으로 등록"""
+        user = User.objects.create_user(username='buyer1', email='buyer1@test.com', password='testpass')
+
+        with patch('api.services.notification_dispatcher.send_push_messages') as send:
+            notification = send_notification(user, 'trade_completed', '거래가 완료되었습니다.', item_type='phone', item_id=1)
+            self.assertFalse(send.called)
+
+        job = BackgroundJob.objects.get(job_type='push.notifications')
+        self.assertEqual(job.payload['notification_ids'], [notification.id])
+        self.assertEqual(job.payload['data']['item_id'], '1')
+        self.assertTrue(Notification.objects.filter(id=notification.id).exists())
+
+    def test_purge_removes_only_old_finished_jobs(self):
+        """보관 기간이 지난 succeeded/failed 작업만 삭제하고 대기/처리중 작업은 유지"""
+        old = timezone.now() - timedelta(days=15)
+        jobs = {name: self._email_job(f'email:purge:{name}') for name in ('succeeded', 'failed', 'recent', 'pending', 'running')}
+        BackgroundJob.objects.filter(id__in=[jobs['succeeded'].id, jobs['recent'].id]).update(status='succeeded')
+        BackgroundJob.objects.filter(id=jobs['failed'].id).update(status='failed')
+        BackgroundJob.objects.filter(id=jobs['running'].id).update(status='running', locked_at=old)
+        BackgroundJob.objects.filter(id__in=[jobs['succeeded'].id, jobs['failed'].id]).update(completed_at=old)
+        BackgroundJob.objects.filter(id=jobs['recent'].id).update(completed_at=timezone.now() - timedelta(days=1))
+        BackgroundJob.objects.filter(id=jobs['pending'].id).update(created_at=old)
+
+        out = StringIO()
+        with patch.object(JobQueue, 'PURGE_BATCH_SIZE', 1):
+            call_command('run_workers', '--purge-older-than', '14', stdout=out)
+
+        self.assertIn('2개 삭제', out.getvalue())
+        self.assertEqual(
+            set(BackgroundJob.objects.values_list('id', flat=True)),
+            {jobs['recent'].id, jobs['pending'].id, jobs['running'].id}
+        )
+        # 삭제된 작업의 키는 다시 등록 가능
+        self.assertNotEqual(self._email_job('email:purge:succeeded').id, jobs['succeeded'].id)
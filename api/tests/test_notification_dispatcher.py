@@ -0,0 +1,148 @@
+"""
+Tests for the batched group-buy status notification dispatcher.
+"""
+import threading
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from api.models import (
+    GroupBuy, Participation, Product, Category, Notification, PushToken, NotificationSetting, BackgroundJob
+)
+from api.services.job_queue import JobQueue
+from api.services.notification_dispatcher import NotificationDispatcher
+from api.utils.push_notification import PUSH_SENT, PUSH_UNREGISTERED
+
+User = get_user_model()
+
+
+class NotificationDispatcherTestCase(TestCase):
+    def setUp(self):
+        self.creator = User.objects.create_user(
+            username='creator',
+            email='creator@test.com',
+            password='testpass',
+            role='buyer'
+        )
+        self.category = Category.objects.create(name='Electronics')
+        self.product = Product.objects.create(
+            name='Test Product',
+            slug='test-product',
+            category=self.category,
+            base_price=100000
+        )
+        self.groupbuy = GroupBuy.objects.create(
+            title='Test GroupBuy',
+            product=self.product,
+            creator=self.creator,
+            min_participants=1,
+            max_participants=100,
+            end_time=timezone.now() + timedelta(hours=12),
+            status='recruiting'
+        )
+
+    def _add_participants(self, count, start=0):
+        users = []
+        for i in range(start, start + count):
+            user = User.objects.create_user(
+                username=f'buyer{i}',
+                email=f'buyer{i}@test.com',
+                password='testpass',
+                role='buyer'
+            )
+            Participation.objects.create(user=user, groupbuy=self.groupbuy)
+            users.append(user)
+        return users
+
+    def _change_status(self, status):
+        groupbuy = GroupBuy.objects.get(id=self.groupbuy.id)
+        groupbuy.status = status
+        with CaptureQueriesContext(connection) as ctx:
+            groupbuy.save()
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT INTO "api_notification"')]
+        return groupbuy, len(ctx.captured_queries), len(inserts)
+
+    def test_status_change_uses_single_insert(self):
+        """참여자 수와 무관하게 쿼리 수가 일정하고 알림 INSERT는 한 번"""
+        self._add_participants(3)
+        _, small_queries, small_inserts = self._change_status('final_selection_buyers')
+
+        self._add_participants(17, start=3)
+        _, large_queries, large_inserts = self._change_status('cancelled')
+
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(small_inserts, 1)
+        self.assertEqual(large_inserts, 1)
+        self.assertEqual(Notification.objects.filter(groupbuy=self.groupbuy).count(), 3 + 20)
+
+    def test_unrelated_save_does_not_notify(self):
+        """상태가 바뀌지 않은 저장(참여자 수 동기화 등)은 알림을 만들지 않음"""
+        self._add_participants(2)
+        groupbuy = GroupBuy.objects.get(id=self.groupbuy.id)
+        groupbuy.current_participants = 2
+        groupbuy.save()
+        groupbuy.save(update_fields=['current_participants'])
+
+        self.assertFalse(Notification.objects.filter(groupbuy=self.groupbuy).exists())
+
+    def test_duplicate_within_window_is_skipped(self):
+        """저장 신호와 명시적 호출이 겹쳐도 같은 알림은 한 번만 생성"""
+        self._add_participants(2)
+        groupbuy, _, _ = self._change_status('final_selection_buyers')
+        groupbuy.notify_status_change()
+
+        self.assertEqual(Notification.objects.filter(groupbuy=self.groupbuy).count(), 2)
+
+        # dedupe 기간이 지나면 다시 생성
+        Notification.objects.filter(groupbuy=self.groupbuy).update(
+            created_at=timezone.now() - NotificationDispatcher.dedupe_window() - timedelta(seconds=1)
+        )
+        groupbuy.notify_status_change()
+        self.assertEqual(Notification.objects.filter(groupbuy=self.groupbuy).count(), 4)
+
+    def test_push_is_enqueued_as_job(self):
+        """푸시는 작업 큐에 한 건으로 등록되며, 거래 알림을 끈 사용자는 발송에서 제외"""
+        users = self._add_participants(2)
+        for user in users:
+            PushToken.objects.create(user=user, token=f'token-{user.id}', platform='android')
+        NotificationSetting.objects.create(user=users[1], trade_notifications=False)
+
+        self._change_status('final_selection_buyers')
+        job = BackgroundJob.objects.get(job_type='push.notifications')
+        self.assertEqual(len(job.payload['notification_ids']), 2)
+
+        with patch('api.services.notification_dispatcher.send_push_messages', return_value=1) as send:
+            self.assertTrue(JobQueue.run_job(JobQueue.claim('test-worker', 10)[0]))
+
+        self.assertEqual(send.call_count, 1)
+        messages = send.call_args[0][0]
+        self.assertEqual([push_token.user_id for push_token, _, _, _ in messages], [users[0].id])
+
+    def test_push_to_different_users_is_sent_concurrently(self):
+        """여러 참여자의 푸시를 한 번에 스레드 풀에 넣어 사용자 간에도 동시에 발송"""
+        users = self._add_participants(4)
+        for user in users:
+            PushToken.objects.create(user=user, token=f'token-{user.id}', platform='android')
+        notifications = NotificationDispatcher.dispatch(
+            [(user.id, self.groupbuy.id, '공구가 마감되었습니다.') for user in users]
+        )
+
+        # 사용자별로 차례대로 발송하면 첫 발송이 barrier에서 시간 초과로 실패함
+        barrier = threading.Barrier(len(users), timeout=5)
+
+        def send(push_token, title, body, data):
+            barrier.wait()
+            return PUSH_UNREGISTERED if push_token.user_id == users[0].id else PUSH_SENT
+
+        with patch('api.utils.push_notification._send_to_push_token', side_effect=send), \
+                CaptureQueriesContext(connection) as ctx:
+            sent = NotificationDispatcher.deliver_push([n.id for n in notifications], '공구 알림')
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(len([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE "api_pushtoken"')]), 1)
+        self.assertEqual(
+            list(PushToken.objects.filter(is_active=False).values_list('user_id', flat=True)), [users[0].id]
+        )
@@ -98,8 +98,9 @@ class NotificationSchedulerTestCase(TestCase):
     def test_send_bid_reminders_notification_type(self):
         """Test that bid reminders have the correct notification_type."""
         # Set the end_time to be within the next 12 hours
+        # (reminders are sent at whole-hour marks, so keep hours_left at exactly 6)
         self.groupbuy.status = 'bidding'
-        self.groupbuy.end_time = timezone.now() + timedelta(hours=6)
+        self.groupbuy.end_time = timezone.now() + timedelta(hours=6, minutes=30)
         self.groupbuy.save()
         
         # Call the method
@@ -108,8 +109,8 @@ class NotificationSchedulerTestCase(TestCase):
         # Check that a notification was created with the correct type
         notifications = Notification.objects.filter(groupbuy=self.groupbuy)
         self.assertTrue(notifications.exists())
-        # Check that the notification_type is 'info' as actually created
-        self.assertEqual(notifications.first().notification_type, 'info')
+        # Saving without a status change no longer creates an 'info' notification
+        self.assertEqual(notifications.first().notification_type, 'reminder')
 
     def test_send_bid_confirmation_reminders_notification_type(self):
         """Test that bid confirmation reminders have the correct notification_type."""
@@ -0,0 +1,122 @@
+"""
+Tests for the single-query, cached partner dashboard summary and monthly statistics.
+"""
+from datetime import datetime
+from unittest import mock
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models_partner import Partner, ReferralRecord
+from api.services.partner_stats import PartnerStats
+
+User = get_user_model()
+
+NOW = datetime(2026, 3, 31, 12, 0)
+
+
+class PartnerStatsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        partner_user = User.objects.create_user(username='partner', email='partner@test.com', password='testpass')
+        self.partner = Partner.objects.create(user=partner_user, partner_name='테스트파트너')
+        self.client = APIClient()
+        self.client.force_authenticate(partner_user)
+        self.members = 0
+
+        now_patcher = mock.patch('api.services.partner_stats.timezone.now', return_value=NOW)
+        now_patcher.start()
+        self.addCleanup(now_patcher.stop)
+
+    def _record(self, created_at, commission=1000, status='active', settlement_status='pending'):
+        self.members += 1
+        member = User.objects.create_user(
+            username=f'member{self.members}', email=f'member{self.members}@test.com', password='testpass'
+        )
+        record = ReferralRecord.objects.create(
+            partner=self.partner, referred_user=member, subscription_status=status,
+            settlement_status=settlement_status
+        )
+        # auto_now_add/save()의 수수료 자동 계산을 피해 원하는 값으로 고정
+        ReferralRecord.objects.filter(pk=record.pk).update(created_at=created_at, commission_amount=commission)
+        return record
+
+    def test_monthly_uses_calendar_months_in_one_query(self):
+        """12개월을 달력 월 기준으로 한 번에 집계하고 빈 달은 0으로 채움"""
+        self._record(datetime(2025, 4, 1, 0, 0), commission=500)
+        self._record(datetime(2025, 3, 31, 23, 59))  # 12개월 범위 밖
+        self._record(datetime(2026, 1, 31, 10, 0), commission=2000, status='cancelled')
+        self._record(datetime(2026, 2, 1, 9, 0), commission=3000)
+        self._record(datetime(2026, 3, 31, 11, 0), commission=4000)
+        self._record(datetime(2026, 3, 1, 0, 0), commission=1000, status='paused')
+
+        with CaptureQueriesContext(connection) as ctx:
+            stats = PartnerStats.compute_monthly(self.partner)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        self.assertEqual([row['period'] for row in stats], [
+            '2025-04', '2025-05', '2025-06', '2025-07', '2025-08', '2025-09',
+            '2025-10', '2025-11', '2025-12', '2026-01', '2026-02', '2026-03',
+        ])
+        by_period = {row['period']: row for row in stats}
+        self.assertEqual(by_period['2025-04'], {
+            'period': '2025-04', 'signup_count': 1, 'revenue': 500, 'subscription_count': 1
+        })
+        self.assertEqual(by_period['2025-05']['signup_count'], 0)
+        self.assertEqual((by_period['2026-01']['revenue'], by_period['2026-01']['subscription_count']), (2000, 0))
+        self.assertEqual(by_period['2026-02']['revenue'], 3000)
+        self.assertEqual(by_period['2026-03'], {
+            'period': '2026-03', 'signup_count': 2, 'revenue': 5000, 'subscription_count': 1
+        })
+
+    def test_summary_in_one_query(self):
+        """대시보드 요약은 조건부 집계 한 번"""
+        self._record(datetime(2026, 3, 2, 10, 0), commission=1000)
+        self._record(datetime(2026, 2, 28, 10, 0), commission=2000, settlement_status='requested')
+        self._record(datetime(2026, 3, 5, 10, 0), commission=3000, status='cancelled')
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = PartnerStats.compute_summary(self.partner)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(summary, {
+            'monthly_signup': 2,
+            'active_subscribers': 2,
+            'monthly_revenue': 4000,
+            'available_settlement': 4000,
+        })
+
+    def test_endpoints_are_cached_and_invalidated(self):
+        """파트너별 캐시 후 추천 기록 저장/정산 요청 시 무효화"""
+        record = self._record(datetime(2026, 3, 2, 10, 0), commission=1000)
+
+        response = self.client.get('/api/partners/dashboard/summary/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['available_settlement'], 1000)
+        response = self.client.get('/api/partners/statistics/')
+        self.assertEqual(len(response.data), 12)
+        self.assertEqual(response.data[-1]['signup_count'], 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/partners/dashboard/summary/')
+            self.client.get('/api/partners/statistics/')
+        self.assertFalse(any('api_referralrecord' in q['sql'] for q in ctx.captured_queries))
+
+        # 정산 요청은 queryset.update()로 상태를 바꾸므로 직접 무효화
+        self.partner.bank_name = '국민은행'
+        self.partner.account_number = '123456789'
+        self.partner.account_holder = '테스트'
+        self.partner.minimum_settlement_amount = 0
+        self.partner.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/partners/settlements/request/', {'settlement_amount': 1000}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.client.get('/api/partners/dashboard/summary/').data['available_settlement'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            record.refresh_from_db()
+            record.subscription_status = 'cancelled'
+            record.save()
+        self.assertEqual(self.client.get('/api/partners/statistics/').data[-1]['subscription_count'], 0)
+        self.assertEqual(self.client.get('/api/partners/dashboard/summary/').data['active_subscribers'], 0)
@@ -0,0 +1,158 @@
+"""
+Tests and concurrency benchmark for idempotent INICIS payment settlement.
+"""
+import threading
+import time
+import unittest
+from decimal import Decimal
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models import BidToken, BidTokenPurchase
+from api.models_payment import Payment
+from api.services.payment_settlement import PaymentSettlementService
+
+User = get_user_model()
+
+
+def _create_payment(user, order_id, amount, product_name='견적이용권 100개', status='pending'):
+    return Payment.objects.create(
+        user=user,
+        order_id=order_id,
+        payment_method='inicis',
+        amount=Decimal(amount),
+        product_name=product_name,
+        status=status
+    )
+
+
+class PaymentSettlementTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            nickname='seller',
+            role='seller'
+        )
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', '잔액 차감은 PostgreSQL 데이터 변경 CTE를 사용')
+    def test_single_tokens_are_bulk_inserted(self):
+        """100개 묶음도 토큰 INSERT는 한 번"""
+        _create_payment(self.seller, 'ORDER-100', 1990 * 100)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = PaymentSettlementService.settle('ORDER-100')
+
+        token_inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT INTO "api_bidtoken"')]
+        self.assertEqual(len(token_inserts), 1)
+        self.assertTrue(any('FOR UPDATE' in q['sql'] for q in ctx.captured_queries))
+        self.assertTrue(result.settled)
+        self.assertEqual(result.token_count, 100)
+        self.assertEqual(BidToken.objects.filter(seller=self.seller, token_type='single').count(), 100)
+        self.assertEqual(BidTokenPurchase.objects.get(order_id='ORDER-100').quantity, 100)
+
+    def test_settle_is_idempotent_across_entry_points(self):
+        """승인 검증 후 리턴 URL이 다시 들어와도 추가 지급하지 않음"""
+        _create_payment(self.seller, 'ORDER-5', 1990 * 5)
+
+        response = self.client.post('/api/payments/inicis/verify/', {
+            'orderId': 'ORDER-5',
+            'authResultCode': '0000',
+            'authToken': 'token',
+            'authUrl': 'https://example.com/auth',
+            'allParams': {'P_REQ_URL': 'https://example.com/req', 'P_TID': 'TID-5'},
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['token_count'], 5)
+        self.assertEqual(response.data['total_tokens'], 5)
+
+        self.client.force_authenticate(self.seller)
+        response = self.client.get('/api/payments/inicis/return/', {'resultCode': '00', 'oid': 'ORDER-5'})
+        self.assertEqual(response.status_code, 200)
+
+        result = PaymentSettlementService.settle('ORDER-5')
+        self.assertFalse(result.settled)
+        self.assertEqual(BidToken.objects.filter(seller=self.seller).count(), 5)
+        self.assertEqual(BidTokenPurchase.objects.filter(order_id='ORDER-5').count(), 1)
+
+        payment = Payment.objects.get(order_id='ORDER-5')
+        self.assertEqual(payment.status, 'completed')
+        self.assertEqual(payment.tid, 'ORDER-5')
+        self.assertEqual(payment.payment_data['payMethod'], 'CARD')
+
+    def test_webhook_only_settles_waiting_deposit(self):
+        """가상계좌 웹훅은 입금대기 결제만 한 번 정산"""
+        _create_payment(self.seller, 'ORDER-PENDING', 1990)
+        _create_payment(self.seller, 'ORDER-VBANK', 59000, product_name='무제한 구독권', status='waiting_deposit')
+
+        for order_id in ('ORDER-PENDING', 'ORDER-VBANK', 'ORDER-VBANK'):
+            response = self.client.post(
+                '/api/payments/inicis/webhook/', {'type': 'vbank', 'oid': order_id, 'tid': 'TID-V'}, format='json'
+            )
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(Payment.objects.get(order_id='ORDER-PENDING').status, 'pending')
+        payment = Payment.objects.get(order_id='ORDER-VBANK')
+        self.assertEqual(payment.status, 'completed')
+        self.assertTrue(payment.payment_data['deposit_confirmed'])
+        self.assertEqual(list(BidToken.objects.filter(seller=self.seller).values_list('token_type', flat=True)), ['unlimited'])
+        self.assertEqual(BidTokenPurchase.objects.get(order_id='ORDER-VBANK').payment_key, 'TID-V')
+
+    def test_subscription_extends_existing(self):
+        """구독권 재구매는 기존 구독 만료일 이후 30일"""
+        _create_payment(self.seller, 'SUB-1', 59000, product_name='무제한 구독권')
+        _create_payment(self.seller, 'SUB-2', 59000, product_name='무제한 구독권')
+
+        first = PaymentSettlementService.settle('SUB-1')
+        second = PaymentSettlementService.settle('SUB-2')
+        self.assertEqual((second.subscription_expires_at - first.subscription_expires_at).days, 30)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', '행 잠금 동시성 테스트는 PostgreSQL에서만 실행')
+class PaymentSettlementConcurrencyBenchmark(TransactionTestCase):
+    """같은 주문의 승인 검증/리턴 URL이 동시에 들어와도 100개 묶음이 한 번만 지급되는지 확인"""
+
+    PARALLEL_REQUESTS = 8
+    TOKEN_COUNT = 100
+
+    def setUp(self):
+        cache.clear()
+        self.seller = User.objects.create_user(
+            username='seller', email='seller@test.com', password='testpass', role='seller'
+        )
+        _create_payment(self.seller, 'ORDER-RACE', 1990 * self.TOKEN_COUNT)
+
+    def test_parallel_settlement_grants_once(self):
+        barrier = threading.Barrier(self.PARALLEL_REQUESTS)
+        results = []
+        lock = threading.Lock()
+
+        def settle():
+            try:
+                barrier.wait()
+                result = PaymentSettlementService.settle('ORDER-RACE')
+                with lock:
+                    results.append(result.settled)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=settle) for _ in range(self.PARALLEL_REQUESTS)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(results.count(False), self.PARALLEL_REQUESTS - 1)
+        self.assertEqual(BidToken.objects.filter(seller=self.seller).count(), self.TOKEN_COUNT)
+        self.assertEqual(BidTokenPurchase.objects.filter(order_id='ORDER-RACE').count(), 1)
+        # 100개 묶음 지급(단일 INSERT)과 잠금 대기를 포함해도 수 초 이내
+        self.assertLess(elapsed, 10)
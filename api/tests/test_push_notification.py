@@ -0,0 +1,77 @@
+"""
+Tests for the pooled FCM push sender.
+"""
+from unittest.mock import patch, MagicMock
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from api.models import PushToken
+from api.utils import push_notification
+
+User = get_user_model()
+
+
+def _response(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body or {}
+    response.text = str(body)
+    return response
+
+
+class PushNotificationTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='buyer1',
+            email='buyer1@test.com',
+            password='testpass',
+            role='buyer'
+        )
+        self.tokens = [
+            PushToken.objects.create(user=self.user, token=f'token-{i}', platform='android')
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        push_notification._credentials = None
+
+    def test_access_token_refreshed_only_when_invalid(self):
+        """인증 정보는 한 번만 로드하고 유효한 토큰은 재사용"""
+        credentials = MagicMock()
+        credentials.valid = False
+        credentials.token = 'access-token'
+
+        def refresh(request):
+            credentials.valid = True
+        credentials.refresh.side_effect = refresh
+
+        with patch.object(push_notification, '_load_credentials', return_value=credentials) as load:
+            tokens = [push_notification.get_access_token() for _ in range(3)]
+
+        self.assertEqual(tokens, ['access-token'] * 3)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(credentials.refresh.call_count, 1)
+
+    def test_unregistered_tokens_are_deactivated(self):
+        """UNREGISTERED 응답을 받은 토큰만 비활성화"""
+        unregistered = _response(404, {
+            'error': {
+                'status': 'NOT_FOUND',
+                'details': [{'@type': 'type.googleapis.com/google.firebase.fcm.v1.FcmError', 'errorCode': 'UNREGISTERED'}],
+            }
+        })
+
+        def post(url, headers, json, timeout):
+            if json['message']['token'] in ('token-1', 'token-3'):
+                return unregistered
+            return _response(200, {'name': 'projects/x/messages/1'})
+
+        with patch.object(push_notification, 'get_access_token', return_value='access-token'), \
+                patch.object(push_notification._session, 'post', side_effect=post) as mock_post:
+            sent = push_notification.send_push_to_user(self.user, '제목', '본문', {'type': 'groupbuy'})
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(mock_post.call_count, 5)
+        self.assertEqual(
+            set(PushToken.objects.filter(is_active=False).values_list('token', flat=True)),
+            {'token-1', 'token-3'}
+        )
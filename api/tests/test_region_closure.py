@@ -0,0 +1,194 @@
+"""
+Tests for the region closure table and the in-process region name index.
+"""
+import os
+import tempfile
+from unittest.mock import patch
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import GroupBuy, GroupBuyRegion, Product, Category, Region, RegionClosure
+from api.services.region_index import RegionIndex
+from used_phones.models import UsedPhone, UsedPhoneRegion
+
+User = get_user_model()
+
+
+class RegionClosureTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        RegionIndex.invalidate()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='creator',
+            email='creator@test.com',
+            password='testpass',
+            role='buyer'
+        )
+        self.category = Category.objects.create(name='휴대폰')
+        self.product = Product.objects.create(
+            name='Test Product',
+            slug='test-product',
+            category=self.category,
+            base_price=100000
+        )
+        self.seoul = Region.objects.create(code='1100000000', name='서울특별시', full_name='서울특별시', level=0)
+        self.gangnam = Region.objects.create(
+            code='1168000000', name='강남구', full_name='서울특별시 강남구', parent=self.seoul, level=1
+        )
+        self.mapo = Region.objects.create(
+            code='1144000000', name='마포구', full_name='서울특별시 마포구', parent=self.seoul, level=1
+        )
+        self.gyeonggi = Region.objects.create(code='4100000000', name='경기도', full_name='경기도', level=0)
+        self.seongnam = Region.objects.create(
+            code='4113000000', name='성남시', full_name='경기도 성남시', parent=self.gyeonggi, level=1
+        )
+        self.bundang = Region.objects.create(
+            code='4113500000', name='분당구', full_name='경기도 성남시 분당구', parent=self.seongnam, level=1
+        )
+
+        self.gangnam_groupbuy = self._create_groupbuy('강남 공구', regions=[self.gangnam])
+        self.mapo_groupbuy = self._create_groupbuy('마포 공구', region=self.mapo)
+        self.bundang_groupbuy = self._create_groupbuy('분당 공구', regions=[self.bundang])
+        self.nationwide_groupbuy = self._create_groupbuy('전국 공구', region_type='nationwide')
+
+    def _create_groupbuy(self, title, regions=(), **extra):
+        groupbuy = GroupBuy.objects.create(
+            title=title,
+            product=self.product,
+            creator=self.user,
+            min_participants=1,
+            max_participants=10,
+            end_time=timezone.now() + timedelta(hours=12),
+            status='recruiting',
+            **extra
+        )
+        for region in regions:
+            GroupBuyRegion.objects.create(groupbuy=groupbuy, region=region)
+        return groupbuy
+
+    def _groupbuy_ids(self, region):
+        response = self.client.get('/api/groupbuys/', {'region': region})
+        self.assertEqual(response.status_code, 200)
+        return sorted(item['id'] for item in response.data['results'])
+
+    def test_closure_is_maintained_on_save(self):
+        """지역 추가 시 모든 상위 지역과의 행이 생성되고 재생성 결과와 같음"""
+        self.assertEqual(
+            dict(RegionClosure.objects.filter(descendant=self.bundang).values_list('ancestor_id', 'depth')),
+            {self.bundang.code: 0, self.seongnam.code: 1, self.gyeonggi.code: 2}
+        )
+        incremental = set(RegionClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+        RegionIndex.rebuild_closure()
+        self.assertEqual(set(RegionClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth')), incremental)
+
+        # 하위 지역이 있는 지역의 부모가 바뀌면 자손 행도 함께 이동
+        self.seongnam.parent = self.seoul
+        self.seongnam.save()
+        self.assertTrue(
+            RegionClosure.objects.filter(ancestor=self.seoul, descendant=self.bundang, depth=2).exists()
+        )
+        self.assertFalse(RegionClosure.objects.filter(ancestor=self.gyeonggi, descendant=self.bundang).exists())
+
+    def test_groupbuy_top_level_region_includes_all_descendants(self):
+        """시/도 필터는 하위 지역 전체(다단계 포함)와 전국 공구를 반환"""
+        self.assertEqual(
+            self._groupbuy_ids('서울특별시'),
+            sorted([self.gangnam_groupbuy.id, self.mapo_groupbuy.id, self.nationwide_groupbuy.id])
+        )
+        self.assertEqual(
+            self._groupbuy_ids('경기도'),
+            sorted([self.bundang_groupbuy.id, self.nationwide_groupbuy.id])
+        )
+
+    def test_groupbuy_exact_region(self):
+        """하위 지역은 name 또는 full_name 정확히 일치"""
+        self.assertEqual(
+            self._groupbuy_ids('강남구'),
+            sorted([self.gangnam_groupbuy.id, self.nationwide_groupbuy.id])
+        )
+        self.assertEqual(
+            self._groupbuy_ids('경기도 성남시'),
+            sorted([self.bundang_groupbuy.id, self.nationwide_groupbuy.id])
+        )
+        self.assertEqual(self._groupbuy_ids('강남'), [self.nationwide_groupbuy.id])
+
+    def test_filter_does_not_query_region_table(self):
+        """이름 인덱스는 한 번만 로드되고 요청 중에는 Region 조회 없이 세미 조인 하나로 필터"""
+        with patch.object(RegionIndex, '_load', wraps=RegionIndex._load) as load:
+            self._groupbuy_ids('서울특별시')
+            with CaptureQueriesContext(connection) as ctx:
+                self._groupbuy_ids('마포구')
+        self.assertEqual(load.call_count, 1)
+
+        sqls = [query['sql'] for query in ctx.captured_queries]
+        self.assertFalse([sql for sql in sqls if sql.startswith('SELECT') and 'FROM "api_region" WHERE' in sql])
+        filtered = [sql for sql in sqls if '"api_regionclosure"' in sql]
+        self.assertTrue(filtered)
+        self.assertFalse([sql for sql in filtered if 'DISTINCT' in sql])
+
+    def test_used_phone_region_filter(self):
+        """중고폰은 시/도 또는 이름 부분 일치 지역과 그 하위 지역"""
+        seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            role='seller'
+        )
+        phones = {}
+        for name, region in [('gangnam', self.gangnam), ('bundang', self.bundang)]:
+            phone = UsedPhone.objects.create(
+                seller=seller,
+                brand='samsung',
+                model=f'Galaxy {name}',
+                price=500000,
+                condition_grade='A',
+                description='상태 좋은 중고폰 판매합니다.',
+                region=region if name == 'gangnam' else None,
+            )
+            if name == 'bundang':
+                UsedPhoneRegion.objects.create(used_phone=phone, region=region)
+            phones[name] = phone.id
+
+        def phone_ids(region):
+            response = self.client.get('/api/used/phones/', {'region': region})
+            self.assertEqual(response.status_code, 200)
+            results = response.data['results'] if isinstance(response.data, dict) else response.data
+            return sorted(item['id'] for item in results)
+
+        self.assertEqual(phone_ids('서울특별시'), [phones['gangnam']])
+        self.assertEqual(phone_ids('경기도'), [phones['bundang']])
+        self.assertEqual(phone_ids('성남'), [phones['bundang']])
+        self.assertEqual(phone_ids('서울특별시 강남'), [phones['gangnam']])
+        self.assertEqual(phone_ids('부산'), [])
+
+    def test_import_admin_sections(self):
+        """전국행정구역정보 법정동 행을 반영하고 가까운 상위 지역으로 연결"""
+        lines = [
+            'ADM_SECT_GBN|ADM_CD|ADM_SECT_NM|LOWEST_ADM_SECT_NM|DEL_YMD|CHG_BEF_ADM_SECT_GBN|CRE_YMD|CHG_BEF_ADM_SECT_CD|COL_ADM_SECT_CD',
+            'A|4300000000|충청북도|충청북도|||19880423||26110',
+            'L|4300000000|충청북도|충청북도||L|19880423|15000000|26110',
+            'L|4311000000|충청북도 청주시|청주시||L|19880423|15120000|26110',
+            'L|4311100000|충청북도 청주시 상당구|청주시 상당구||L|19950101|4311000000|26110',
+            'L|4311110100|충청북도 청주시 상당구 영동|영동||L|19980201|4311010100|26110',
+            'L|4312000000|충청북도 폐지시|폐지시|20100101|L|19880423||26110',
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'ACMM_ADMSECT_43_202404.txt')
+            with open(path, 'w', encoding='cp949') as file:
+                file.write('\n'.join(lines) + '\n')
+            self.assertEqual(RegionIndex.import_admin_sections([path], max_level=1), 3)
+
+        sangdang = Region.objects.get(code='4311100000')
+        self.assertEqual((sangdang.name, sangdang.parent_id, sangdang.level), ('상당구', '4311000000', 1))
+        self.assertFalse(Region.objects.filter(code__in=['4311110100', '4312000000']).exists())
+        self.assertEqual(
+            set(RegionClosure.objects.filter(descendant=sangdang).values_list('ancestor_id', flat=True)),
+            {'4311100000', '4311000000', '4300000000'}
+        )
+        self.assertEqual(RegionIndex.top_level_codes('충청북도'), ['4300000000'])
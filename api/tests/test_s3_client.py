@@ -0,0 +1,111 @@
+"""
+Tests for the shared S3 client, the concurrent uploader and MediaStorage client reuse.
+"""
+import os
+import threading
+from unittest.mock import patch
+from botocore.stub import Stubber
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from api.storage_backends import MediaStorage
+from api.utils import s3_utils
+from api.utils.s3_upload import upload_many_to_s3
+from api.utils.s3_utils import get_s3_client, reset_s3_client, upload_fileobjs
+
+
+@override_settings(
+    USE_S3=True,
+    AWS_ACCESS_KEY_ID='testing',
+    AWS_SECRET_ACCESS_KEY='testing',
+    AWS_S3_REGION_NAME='ap-northeast-2',
+    AWS_STORAGE_BUCKET_NAME='test-bucket',
+    AWS_DEFAULT_ACL=None,
+    AWS_S3_MAX_POOL_CONNECTIONS=20,
+)
+class SharedS3ClientTestCase(SimpleTestCase):
+    def setUp(self):
+        reset_s3_client()
+        self.addCleanup(reset_s3_client)
+
+    def _stub(self, responses):
+        stubber = Stubber(get_s3_client())
+        for _ in range(responses):
+            stubber.add_response('put_object', {'ETag': '"etag"'})
+        stubber.activate()
+        self.addCleanup(stubber.deactivate)
+        return stubber
+
+    def test_client_is_shared_across_threads(self):
+        """모든 스레드가 한 번만 생성된 같은 클라이언트를 사용"""
+        clients = []
+        with patch.object(s3_utils.boto3.session.Session, 'client', autospec=True,
+                          side_effect=s3_utils.boto3.session.Session.client) as create_client:
+            threads = [threading.Thread(target=lambda: clients.append(get_s3_client())) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(create_client.call_count, 1)
+        self.assertEqual(len({id(client) for client in clients}), 1)
+        self.assertEqual(clients[0].meta.config.max_pool_connections, 20)
+
+    def test_upload_fileobjs_keeps_order(self):
+        """여러 파일을 동시에 업로드하고 입력 순서대로 키 반환"""
+        stubber = self._stub(4)
+        uploads = [
+            (ContentFile(f'file {i}'.encode()), f'uploads/{i}.txt', {'ContentType': 'text/plain'})
+            for i in range(4)
+        ]
+
+        keys = upload_fileobjs(uploads)
+
+        self.assertEqual(keys, [f'uploads/{i}.txt' for i in range(4)])
+        stubber.assert_no_pending_responses()
+
+    def test_upload_failure_returns_none(self):
+        """업로드에 실패한 파일은 None"""
+        stubber = Stubber(get_s3_client())
+        stubber.add_client_error('put_object', service_error_code='AccessDenied', http_status_code=403)
+        stubber.activate()
+        self.addCleanup(stubber.deactivate)
+
+        self.assertEqual(upload_fileobjs([(ContentFile(b'x'), 'uploads/x.txt', None)]), [None])
+
+    def test_upload_many_to_s3_urls(self):
+        """파일별 폴더에 업로드하고 URL 목록 반환"""
+        self._stub(2)
+        files = [
+            (SimpleUploadedFile('a.png', b'a', content_type='image/png'), 'events/thumbnails'),
+            (SimpleUploadedFile('b.png', b'b', content_type='image/png'), 'events/content'),
+        ]
+
+        urls = upload_many_to_s3(files)
+
+        self.assertTrue(urls[0].startswith('https://test-bucket.s3.ap-northeast-2.amazonaws.com/events/thumbnails/'))
+        self.assertTrue(urls[1].startswith('https://test-bucket.s3.ap-northeast-2.amazonaws.com/events/content/'))
+        self.assertTrue(urls[1].endswith('.png'))
+
+    @patch.dict(os.environ, {'AWS_STORAGE_BUCKET_NAME': 'test-bucket'})
+    def test_media_storage_uses_shared_client(self):
+        """MediaStorage도 공용 클라이언트로 요청을 보냄"""
+        storage = MediaStorage(bucket_name='test-bucket', access_key='testing', secret_key='testing')
+        self.assertIs(storage.connection.meta.client, get_s3_client())
+        self.assertIs(storage.bucket.meta.client, get_s3_client())
+
+        # 다른 스레드는 리소스만 새로 만들고 세션/클라이언트는 만들지 않음
+        connections = []
+        with patch('boto3.session.Session') as session_cls, patch('boto3.client') as create_client:
+            thread = threading.Thread(target=lambda: connections.append(storage.connection))
+            thread.start()
+            thread.join()
+        session_cls.assert_not_called()
+        create_client.assert_not_called()
+        self.assertIsNot(connections[0], storage.connection)
+        self.assertIs(connections[0].meta.client, get_s3_client())
+
+        stubber = self._stub(1)
+        name = storage._save('products/a.txt', ContentFile(b'hello'))
+        self.assertEqual(name, 'products/a.txt')
+        stubber.assert_no_pending_responses()
@@ -0,0 +1,141 @@
+"""
+Tests for the aggregated, briefly cached seller home summary.
+"""
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models import Bid, BidToken, Category, GroupBuy, Product, Review, Settlement
+from api.services.seller_summary import SellerSummary
+
+User = get_user_model()
+
+
+class SellerSummaryTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            nickname='seller',
+            role='seller'
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@test.com',
+            password='testpass',
+            nickname='buyer'
+        )
+        category = Category.objects.create(name='Electronics')
+        self.product = Product.objects.create(
+            name='Test Product',
+            slug='test-product',
+            category=category,
+            base_price=100000
+        )
+
+    def _create_bid(self, groupbuy_status, **kwargs):
+        groupbuy = GroupBuy.objects.create(
+            title='Test GroupBuy',
+            product=self.product,
+            creator=self.buyer,
+            min_participants=1,
+            max_participants=10,
+            end_time=timezone.now() + timedelta(hours=12),
+            status=groupbuy_status
+        )
+        return Bid.objects.create(groupbuy=groupbuy, seller=self.seller, amount=95000, **kwargs)
+
+    def _create_fixtures(self):
+        now = timezone.now()
+        self._create_bid('recruiting')
+        self._create_bid('final_selection_seller', status='selected', final_decision='pending')
+        self._create_bid('completed', status='selected', final_decision='confirmed')
+        settled = self._create_bid('completed', status='selected', final_decision='confirmed')
+        Settlement.objects.create(
+            seller=self.seller,
+            groupbuy=settled.groupbuy,
+            bid=settled,
+            total_amount=100000,
+            fee_amount=5000,
+            net_amount=95000,
+            settlement_date=now,
+            payment_status='completed'
+        )
+        Review.objects.create(groupbuy=settled.groupbuy, user=self.buyer, seller=self.seller, rating=4, content='좋아요')
+
+        BidToken.objects.create(seller=self.seller, token_type='single', expires_at=None)
+        BidToken.objects.create(seller=self.seller, token_type='single', expires_at=now + timedelta(days=3))
+        BidToken.objects.create(seller=self.seller, token_type='single', expires_at=now - timedelta(days=1))
+        BidToken.objects.create(seller=self.seller, token_type='single', status='used')
+        BidToken.objects.create(seller=self.seller, token_type='unlimited', expires_at=now + timedelta(days=2))
+        return BidToken.objects.create(seller=self.seller, token_type='unlimited', expires_at=now + timedelta(days=20))
+
+    def test_compute_matches_sources(self):
+        """모델별 조건부 집계 결과가 기존 개별 조회와 같은 의미"""
+        latest_unlimited = self._create_fixtures()
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = SellerSummary.compute(self.seller)
+        self.assertLessEqual(len(ctx.captured_queries), 5)
+
+        self.assertEqual(summary['active_bids'], 4)
+        self.assertEqual(summary['pending_selection'], 1)
+        self.assertEqual(summary['pending_sales'], 1)
+        self.assertEqual(summary['completed_sales'], 1)
+        self.assertEqual(summary['rating'], 4.0)
+        # 만료일 없는 단품 제안권도 유효
+        self.assertEqual(summary['single_tokens'], 2)
+        self.assertTrue(summary['has_unlimited'])
+        self.assertEqual(summary['unlimited_expires_at'], latest_unlimited.expires_at)
+        self.assertEqual([token_type for _, token_type, _ in summary['expiring_tokens']], ['unlimited', 'single'])
+
+    def test_home_screen_uses_cache(self):
+        """반복 조회 시 요약은 캐시에서 읽고 제안권 변경 시 다시 집계"""
+        self._create_fixtures()
+        self.client.force_authenticate(self.seller)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/users/me/seller-profile/')
+        self.assertEqual(response.status_code, 200)
+        first_queries = len(ctx.captured_queries)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/users/me/seller-profile/')
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(ctx.captured_queries), 3)
+        self.assertLess(len(ctx.captured_queries), first_queries)
+        self.assertEqual(response.data['remainingBids'], 2)
+        self.assertEqual(response.data['pendingSales'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            BidToken.objects.create(seller=self.seller, token_type='single', expires_at=None)
+
+        response = self.client.get('/api/users/me/seller-profile/')
+        self.assertEqual(response.data['remainingBids'], 3)
+
+    def test_bid_tokens_endpoint(self):
+        """제안권 조회 API는 요약 캐시와 최근 구매 내역만 조회"""
+        latest_unlimited = self._create_fixtures()
+        self.client.force_authenticate(self.seller)
+        self.client.get('/api/bid-tokens/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/bid-tokens/')
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(ctx.captured_queries), 2)
+
+        self.assertEqual(response.data['single_tokens'], 2)
+        self.assertTrue(response.data['unlimited_subscription'])
+        self.assertEqual(response.data['unlimited_expires_at'], latest_unlimited.expires_at)
+        self.assertEqual(response.data['total_tokens'], 3)
+        self.assertEqual(
+            [(token['type'], token['quantity']) for token in response.data['expiring_tokens']],
+            [('unlimited', 1), ('single', 1)]
+        )
@@ -0,0 +1,163 @@
+"""
+Tests and memory benchmark for the streaming CSV/XLSX export engine (partner referral export).
+"""
+import io
+import time
+import tracemalloc
+import zipfile
+from datetime import timedelta
+from django.http import FileResponse, StreamingHttpResponse
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models_partner import Partner, ReferralRecord
+from api.utils.streaming_export import export_response
+
+User = get_user_model()
+
+
+def _close_file(response):
+    # response.close()는 request_finished 신호로 테스트 DB 연결까지 닫으므로 임시 파일만 닫음
+    if getattr(response, 'file_to_stream', None):
+        response.file_to_stream.close()
+
+
+def _csv_lines(response):
+    content = b''.join(response.streaming_content).decode('utf-8')
+    return content.splitlines()
+
+
+class StreamingExportTestCase(TestCase):
+    def setUp(self):
+        partner_user = User.objects.create_user(username='partner', email='partner@test.com', password='testpass')
+        self.partner = Partner.objects.create(user=partner_user, partner_name='테스트파트너')
+        self.client = APIClient()
+        self.client.force_authenticate(partner_user)
+
+        self.members = [
+            User.objects.create_user(
+                username=f'member{i}', email=f'member{i}@test.com', password='testpass',
+                nickname=nickname, phone_number=f'0101234567{i}'
+            )
+            for i, nickname in enumerate(['홍길동', '김철수'])
+        ]
+        ReferralRecord.objects.create(
+            partner=self.partner, referred_user=self.members[0],
+            subscription_amount=59000, ticket_count=5, ticket_amount=9950
+        )
+        ReferralRecord.objects.create(
+            partner=self.partner, referred_user=self.members[1], subscription_status='cancelled'
+        )
+
+    def test_csv_export_streams_masked_rows(self):
+        """CSV는 스트리밍 응답으로 마스킹된 행을 필터 조건대로 내보냄"""
+        response = self.client.get('/api/partners/export/', {'format': 'csv', 'status_filter': 'active'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertIn("filename*=utf-8''%ED%85%8C%EC%8A%A4%ED%8A%B8%ED%8C%8C%ED%8A%B8%EB%84%88_referral_data.csv", response['Content-Disposition'])
+
+        lines = _csv_lines(response)
+        self.assertEqual(lines[0], '﻿가입일자,회원정보,전화번호,구독권,구독금액,견적티켓,티켓금액,총 결제,예정수수료,상태')
+        self.assertEqual(len(lines), 2)
+        self.assertIn('홍○동,010-****-5670,✓,"59,000원",5개,"9,950원","68,950원"', lines[1])
+        self.assertTrue(lines[1].endswith(',활성'))
+
+    def test_xlsx_export_uses_temp_file(self):
+        """XLSX는 임시 파일에 기록한 뒤 파일 응답으로 전송"""
+        response = self.client.get('/api/partners/export/', {'format': 'excel'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, FileResponse)
+        self.assertIn('_referral_data.xlsx', response['Content-Disposition'])
+
+        content = b''.join(response.streaming_content)
+        _close_file(response)
+        with zipfile.ZipFile(io.BytesIO(content)) as workbook:
+            sheet = workbook.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertIn('김○수', sheet)
+        self.assertIn('해지', sheet)
+
+    def test_admin_action_reuses_engine(self):
+        """관리자 CSV 내보내기도 같은 엔진 사용"""
+        admin_user = User.objects.create_superuser(username='admin', email='admin@test.com', password='testpass')
+        self.client.force_login(admin_user)
+        response = self.client.post('/admin/api/referralrecord/', {
+            'action': 'export_as_csv',
+            '_selected_action': list(ReferralRecord.objects.values_list('pk', flat=True)),
+        })
+        self.assertIsInstance(response, StreamingHttpResponse)
+        lines = _csv_lines(response)
+        self.assertEqual(len(lines), 3)
+        self.assertIn('테스트파트너,member1,cancelled', lines[1])
+
+
+class StreamingExportBenchmark(TestCase):
+    """10만 건 내보내기에서 메모리 사용량이 행 수와 무관하게 일정한지 확인"""
+
+    RECORDS = 100000
+
+    @classmethod
+    def setUpTestData(cls):
+        partner_user = User.objects.create_user(username='partner', email='partner@test.com', password='testpass')
+        cls.partner = Partner.objects.create(user=partner_user, partner_name='대형파트너')
+        member = User.objects.create_user(
+            username='member', email='member@test.com', password='testpass', nickname='홍길동', phone_number='01012345678'
+        )
+        created_at = timezone.now() - timedelta(days=1)
+        ReferralRecord.objects.bulk_create(
+            (
+                ReferralRecord(
+                    partner=cls.partner, referred_user=member, subscription_amount=59000,
+                    total_amount=59000, commission_amount=5900, created_at=created_at
+                )
+                for _ in range(cls.RECORDS)
+            ),
+            batch_size=5000
+        )
+
+    def _export(self, export_format, trace_memory=False):
+        from api.views_partner import REFERRAL_EXPORT_FIELDS, REFERRAL_EXPORT_HEADERS, _format_referral_row
+
+        if trace_memory:
+            tracemalloc.start()
+        started = time.monotonic()
+        try:
+            response = export_response(
+                self.partner.referral_records.order_by('-created_at'),
+                REFERRAL_EXPORT_FIELDS,
+                REFERRAL_EXPORT_HEADERS,
+                filename='benchmark',
+                export_format=export_format,
+                format_row=_format_referral_row
+            )
+            content = io.BytesIO() if export_format != 'csv' else None
+            size = 0
+            lines = 0
+            for chunk in response.streaming_content:
+                size += len(chunk)
+                lines += chunk.count(b'\n')
+                if content is not None:
+                    content.write(chunk)
+            _close_file(response)
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        finally:
+            if trace_memory:
+                tracemalloc.stop()
+        return lines, size, peak, time.monotonic() - started, content
+
+    def test_csv_export_memory_is_bounded(self):
+        lines, size, peak, elapsed, _ = self._export('csv', trace_memory=True)
+        self.assertEqual(lines, self.RECORDS + 1)
+        # 전체 CSV(약 8MB)를 메모리에 올리지 않고 청크 단위로만 유지
+        self.assertGreater(size, 5 * 1024 * 1024)
+        self.assertLess(peak, 5 * 1024 * 1024)
+        self.assertLess(elapsed, 60)
+
+    def test_xlsx_export_writes_all_rows(self):
+        # xlsxwriter 자체가 행당 비용이 커서 tracemalloc 없이 시간과 행 수만 확인 (메모리는 constant_memory 모드)
+        _, size, _, elapsed, content = self._export('excel')
+        with zipfile.ZipFile(content) as workbook:
+            with workbook.open('xl/worksheets/sheet1.xml') as sheet:
+                head = sheet.read(1024).decode('utf-8')
+        self.assertIn(f'<dimension ref="A1:J{self.RECORDS + 1}"/>', head)
+        self.assertLess(elapsed, 120)
@@ -0,0 +1,160 @@
+"""
+Tests for the polymorphic bulk loader behind UnifiedFavorite / UnifiedBump get_item().
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models_unified_simple import UnifiedFavorite, UnifiedBump
+from api.utils.unified_items import bulk_get_items
+from used_phones.models import UsedPhone, UsedPhoneImage
+from used_electronics.models import UsedElectronics, ElectronicsImage
+
+User = get_user_model()
+
+
+# 기본 스토리지(S3)와 manifest 정적 파일 스토리지 대신 로컬 스토리지 사용 (이미지 URL, 관리자 페이지 렌더링)
+@override_settings(STORAGES={
+    **settings.STORAGES,
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class UnifiedItemLoaderTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            nickname='seller'
+        )
+        self.user = User.objects.create_user(
+            username='buyer',
+            email='buyer@test.com',
+            password='testpass',
+            nickname='buyer'
+        )
+
+    def _create_favorites(self, count):
+        phones, electronics = [], []
+        for i in range(count):
+            phone = UsedPhone.objects.create(
+                seller=self.seller,
+                brand='samsung',
+                model=f'Galaxy {i}',
+                price=500000,
+                condition_grade='A',
+                description='상태 좋은 중고폰 판매합니다.',
+            )
+            item = UsedElectronics.objects.create(
+                seller=self.seller,
+                subcategory='laptop',
+                brand='LG',
+                model_name=f'Gram {i}',
+                condition_grade='A',
+                price=800000,
+                description='상태 좋은 노트북 판매합니다.',
+            )
+            UnifiedFavorite.objects.create(user=self.user, item_type='phone', item_id=phone.id)
+            UnifiedFavorite.objects.create(user=self.user, item_type='electronics', item_id=item.id)
+            phones.append(phone)
+            electronics.append(item)
+
+        UsedPhoneImage.objects.bulk_create(
+            UsedPhoneImage(phone=phone, image=f'used_phones/{phone.id}.jpg', order=0) for phone in phones
+        )
+        ElectronicsImage.objects.bulk_create(
+            ElectronicsImage(electronics=item, image=f'electronics/{item.id}.jpg', order=0) for item in electronics
+        )
+        return phones, electronics
+
+    def _my_favorites(self):
+        self.client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/unified/favorites/my/')
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.data
+
+    def test_my_favorites_query_count_is_constant(self):
+        """찜 수와 무관하게 찜 목록 조회 쿼리 수가 일정해야 함"""
+        self._create_favorites(2)
+        small_queries, _ = self._my_favorites()
+
+        phones, electronics = self._create_favorites(8)
+        UsedPhone.objects.filter(id=phones[0].id).update(status='deleted')
+        full_queries, data = self._my_favorites()
+
+        self.assertEqual(small_queries, full_queries)
+        self.assertLessEqual(full_queries, 5)
+        self.assertEqual(data['count'], 19)
+
+        by_key = {(item['item_type'], item['item_id']): item for item in data['favorites']}
+        self.assertNotIn(('phone', phones[0].id), by_key)
+        self.assertEqual(by_key[('phone', phones[1].id)]['model'], 'Galaxy 1')
+        self.assertTrue(by_key[('phone', phones[1].id)]['image_url'].endswith(f'used_phones/{phones[1].id}.jpg'))
+        self.assertEqual(by_key[('electronics', electronics[2].id)]['model_name'], 'Gram 2')
+
+    def test_bulk_get_items_attaches_items(self):
+        """타입별 한 번의 조회 후 get_item()은 추가 쿼리 없이 붙여 둔 상품을 반환"""
+        phones, electronics = self._create_favorites(3)
+        bumps = [
+            UnifiedBump.objects.create(user=self.seller, item_type='phone', item_id=phones[0].id),
+            UnifiedBump.objects.create(user=self.seller, item_type='electronics', item_id=electronics[1].id),
+            UnifiedBump.objects.create(user=self.seller, item_type='custom_groupbuy', item_id=999999),
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            items = bulk_get_items(bumps, select_related=(), prefetch_related=())
+        self.assertEqual(len(ctx.captured_queries), 3)
+        self.assertEqual(len(items), 2)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(bumps[0].get_item(), phones[0])
+            self.assertEqual(bumps[1].get_item(), electronics[1])
+            self.assertIsNone(bumps[2].get_item())
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_admin_changelist_loads_items_once(self):
+        """찜/끌올 관리자 목록은 상품을 행마다 조회하지 않음"""
+        admin = User.objects.create_superuser(username='admin', email='admin@test.com', password='testpass')
+        self.client.force_login(admin)
+
+        self._create_favorites(2)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/admin/api/unifiedfavorite/')
+        self.assertEqual(response.status_code, 200)
+        small_queries = len(ctx.captured_queries)
+
+        self._create_favorites(6)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/admin/api/unifiedfavorite/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), small_queries)
+        self.assertContains(response, 'Gram 5')
+
+    def test_bump_status_uses_item_model(self):
+        """끌올 상태 조회/실행은 item_type별 모델에서 상품을 찾고 본인 여부 확인"""
+        phone = UsedPhone.objects.create(
+            seller=self.seller,
+            brand='samsung',
+            model='Galaxy S24',
+            price=500000,
+            condition_grade='A',
+            description='상태 좋은 중고폰 판매합니다.',
+        )
+        self.client.force_authenticate(self.user)
+        response = self.client.get(f'/api/used/phones/{phone.id}/bump/status/')
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_authenticate(self.seller)
+        response = self.client.get(f'/api/used/phones/{phone.id}/bump/status/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['can_bump'])
+
+        response = self.client.post(f'/api/used/phones/{phone.id}/bump/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_bump_count'], 1)
@@ -0,0 +1,156 @@
+"""
+Query-count regression tests for the used phone / electronics list serializers.
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models_unified_simple import UnifiedFavorite, UnifiedReview
+from used_phones.models import UsedPhone, UsedPhoneOffer, UsedPhoneTransaction
+from used_electronics.models import UsedElectronics, ElectronicsOffer, ElectronicsTransaction
+
+User = get_user_model()
+
+
+class UsedGoodsListQueryCountTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.viewer = User.objects.create_user(
+            username='viewer',
+            email='viewer@test.com',
+            password='testpass',
+            nickname='viewer'
+        )
+        self.client.force_authenticate(self.viewer)
+        self.user_seq = 0
+
+    def _create_user(self):
+        self.user_seq += 1
+        return User.objects.create_user(
+            username=f'user{self.user_seq}',
+            email=f'user{self.user_seq}@test.com',
+            password='testpass',
+            nickname=f'user{self.user_seq}'
+        )
+
+    def _create_phones(self, count):
+        """판매중 / 제안 있음 / 거래완료(후기 작성) 상품을 번갈아 생성"""
+        phones = []
+        for i in range(count):
+            seller = self._create_user()
+            phone = UsedPhone.objects.create(
+                seller=seller,
+                brand='samsung',
+                model=f'Galaxy {i}',
+                price=500000,
+                condition_grade='A',
+                description='상태 좋은 중고폰 판매합니다.',
+            )
+            for buyer in (self.viewer, self._create_user()):
+                UsedPhoneOffer.objects.create(phone=phone, buyer=buyer, offered_price=450000)
+            if i % 2:
+                buyer = self._create_user()
+                offer = UsedPhoneOffer.objects.create(
+                    phone=phone, buyer=buyer, offered_price=470000, status='accepted'
+                )
+                trade = UsedPhoneTransaction.objects.create(
+                    phone=phone, offer=offer, seller=seller, buyer=buyer,
+                    final_price=470000, status='completed'
+                )
+                UsedPhone.objects.filter(id=phone.id).update(status='sold')
+                UnifiedReview.objects.create(
+                    item_type='phone', transaction_id=trade.id, reviewer=self.viewer,
+                    reviewee=seller, rating=5, comment='좋아요'
+                )
+            UnifiedFavorite.objects.create(user=self.viewer, item_type='phone', item_id=phone.id)
+            phones.append(phone)
+        return phones
+
+    def _create_electronics(self, count):
+        items = []
+        for i in range(count):
+            seller = self._create_user()
+            item = UsedElectronics.objects.create(
+                seller=seller,
+                subcategory='laptop',
+                brand='LG',
+                model_name=f'Gram {i}',
+                condition_grade='A',
+                price=800000,
+                description='상태 좋은 노트북 판매합니다.',
+            )
+            ElectronicsOffer.objects.create(electronics=item, buyer=self.viewer, offer_price=700000)
+            if i % 2:
+                buyer = self._create_user()
+                ElectronicsTransaction.objects.create(
+                    electronics=item, seller=seller, buyer=buyer, final_price=750000, status='in_progress'
+                )
+                UsedElectronics.objects.filter(id=item.id).update(status='trading')
+            UnifiedFavorite.objects.create(user=self.viewer, item_type='electronics', item_id=item.id)
+            items.append(item)
+        return items
+
+    def _count_list_queries(self, path, limit):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(path, {'limit': limit, 'include_completed': 'true'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), limit)
+        return len(ctx.captured_queries), response.data['results']
+
+    def test_phone_list_query_count_is_constant(self):
+        """중고폰 수와 무관하게 목록 한 페이지의 쿼리 수가 일정해야 함"""
+        phones = self._create_phones(8)
+
+        small_page_queries, _ = self._count_list_queries('/api/used/phones/', 2)
+        full_page_queries, results = self._count_list_queries('/api/used/phones/', 8)
+        self.assertEqual(small_page_queries, full_page_queries)
+        self.assertLessEqual(full_page_queries, 8)
+
+        by_id = {item['id']: item for item in results}
+        for i, phone in enumerate(phones):
+            item = by_id[phone.id]
+            self.assertTrue(item['is_favorite'])
+            if i % 2:
+                trade = UsedPhoneTransaction.objects.get(phone=phone)
+                self.assertEqual(item['offer_count'], 3)
+                self.assertEqual(item['final_price'], 470000)
+                self.assertEqual(item['final_offer_price'], 470000)
+                self.assertEqual(item['transaction_id'], trade.id)
+                self.assertEqual(item['buyer'], {'id': trade.buyer_id, 'nickname': trade.buyer.nickname})
+                self.assertTrue(item['has_review'])
+            else:
+                self.assertEqual(item['offer_count'], 2)
+                self.assertIsNone(item['final_price'])
+                self.assertIsNone(item['transaction_id'])
+                self.assertIsNone(item['buyer'])
+                self.assertFalse(item['has_review'])
+
+    def test_electronics_list_query_count_is_constant(self):
+        """전자제품 수와 무관하게 목록 한 페이지의 쿼리 수가 일정해야 함"""
+        items = self._create_electronics(8)
+
+        small_page_queries, _ = self._count_list_queries('/api/used/electronics/', 2)
+        full_page_queries, results = self._count_list_queries('/api/used/electronics/', 8)
+        self.assertEqual(small_page_queries, full_page_queries)
+        self.assertLessEqual(full_page_queries, 10)
+
+        by_id = {item['id']: item for item in results}
+        for i, electronics in enumerate(items):
+            item = by_id[electronics.id]
+            self.assertTrue(item['is_favorited'])
+            self.assertTrue(item['has_my_offer'])
+            self.assertFalse(item['is_mine'])
+            self.assertEqual(item['seller']['sell_count'], 0)
+            if i % 2:
+                trade = ElectronicsTransaction.objects.get(electronics=electronics)
+                self.assertEqual(item['transaction_id'], trade.id)
+                self.assertEqual(item['buyer_id'], trade.buyer_id)
+                self.assertEqual(item['buyer']['username'], trade.buyer.username)
+                self.assertEqual(item['final_price'], 750000)
+            else:
+                self.assertIsNone(item['buyer'])
+                self.assertIsNone(item['transaction_id'])
+                self.assertIsNone(item['final_price'])
@@ -0,0 +1,122 @@
+"""
+Tests for the scheduled used-phone trade auto-completion and the read-only list path.
+"""
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
+from rest_framework.test import APIClient
+from api.models import JobCheckpoint
+from used_phones.models import UsedPhone, UsedPhoneOffer, UsedPhoneTransaction
+
+User = get_user_model()
+
+
+class UsedTradeSweeperTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            role='seller'
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@test.com',
+            password='testpass',
+            role='buyer'
+        )
+
+    def _create_trade(self, days_ago):
+        phone = UsedPhone.objects.create(
+            seller=self.seller,
+            brand='samsung',
+            model=f'Galaxy {days_ago}',
+            price=500000,
+            condition_grade='A',
+            description='상태 좋은 중고폰 판매합니다.',
+            status='trading',
+        )
+        offer = UsedPhoneOffer.objects.create(
+            phone=phone, buyer=self.buyer, offered_price=480000, status='accepted'
+        )
+        trade = UsedPhoneTransaction.objects.create(
+            phone=phone, offer=offer, seller=self.seller, buyer=self.buyer, final_price=480000
+        )
+        UsedPhoneTransaction.objects.filter(id=trade.id).update(
+            created_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return trade
+
+    def _sweep(self, *args):
+        call_command('auto_complete_used_phone_trades', *args, stdout=StringIO())
+
+    def test_sweeper_completes_expired_trades(self):
+        """14일 경과한 거래중 거래만 완료되고 상품은 판매완료 처리"""
+        expired = [self._create_trade(20), self._create_trade(15)]
+        recent = self._create_trade(3)
+
+        self._sweep('--batch-size', '1')
+
+        for trade in expired:
+            trade.refresh_from_db()
+            trade.phone.refresh_from_db()
+            self.assertEqual(trade.status, 'completed')
+            self.assertIsNotNone(trade.completed_at)
+            self.assertEqual(trade.phone.status, 'sold')
+            self.assertIsNotNone(trade.phone.sold_at)
+
+        recent.refresh_from_db()
+        self.assertEqual(recent.status, 'trading')
+        self.assertEqual(UsedPhone.objects.get(id=recent.phone_id).status, 'trading')
+        self.assertIsNotNone(JobCheckpoint.get_position('used_phones.auto_complete_trades'))
+
+    def test_sweeper_respects_watermark(self):
+        """워터마크 이전 거래는 --full 실행에서만 다시 확인"""
+        self._sweep()
+        stale = self._create_trade(30)
+
+        self._sweep()
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, 'trading')
+
+        self._sweep('--full')
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, 'completed')
+
+    def test_list_and_retrieve_are_read_only(self):
+        """목록/상세 조회는 거래 자동완료 쓰기와 진단용 COUNT 없이 처리"""
+        trade = self._create_trade(20)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/used/phones/', {'pagination': 'cursor', 'include_completed': 'true'})
+            self.assertEqual(response.status_code, 200)
+            response = self.client.get(f'/api/used/phones/{trade.phone_id}/')
+            self.assertEqual(response.status_code, 200)
+
+        sqls = [query['sql'] for query in ctx.captured_queries]
+        # 상세 조회의 조회수 증가 외에는 쓰기 없음 (공유 캐시가 없는 환경에서는 조회수를 바로 반영)
+        writes = [sql for sql in sqls if sql.startswith(('UPDATE', 'INSERT', 'DELETE'))]
+        self.assertFalse([sql for sql in writes if '"view_count"' not in sql])
+        # 판매자별 집계(시리얼라이저)가 아닌 전체 목록 COUNT가 없어야 함
+        self.assertFalse([
+            sql for sql in sqls
+            if 'COUNT(*)' in sql and 'FROM "used_phones"' in sql and '"seller_id"' not in sql
+        ])
+        trade.refresh_from_db()
+        self.assertEqual(trade.status, 'trading')
+
+    @override_settings(USED_GOODS_DEBUG_COUNTS=True)
+    def test_debug_counts_flag(self):
+        """USED_GOODS_DEBUG_COUNTS 설정 시에만 진단용 COUNT 실행"""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/used/phones/', {'pagination': 'cursor'})
+            self.assertEqual(response.status_code, 200)
+        self.assertTrue([query['sql'] for query in ctx.captured_queries if 'COUNT(*)' in query['sql']])
@@ -0,0 +1,175 @@
+"""
+Tests for the incrementally maintained per-user trade statistics.
+"""
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models import Bid, UserTradeStats
+from api.models_unified_simple import UnifiedFavorite, UnifiedReview
+from used_phones.models import UsedPhone, UsedPhoneOffer
+
+User = get_user_model()
+
+
+class UserTradeStatsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            nickname='seller',
+            role='seller'
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@test.com',
+            password='testpass',
+            nickname='buyer'
+        )
+
+    def _create_phone(self, model='Galaxy S24'):
+        return UsedPhone.objects.create(
+            seller=self.seller,
+            brand='samsung',
+            model=model,
+            price=500000,
+            condition_grade='A',
+            description='상태 좋은 중고폰 판매합니다.',
+        )
+
+    def assertStatsConsistent(self, *users):
+        for user in users:
+            stored = UserTradeStats.objects.filter(user=user).values(*UserTradeStats.COUNTER_FIELDS).get()
+            self.assertEqual(stored, UserTradeStats.compute([user.id])[user.id])
+
+    def test_counters_follow_trade_lifecycle(self):
+        """상품 등록 → 제안 → 수락 → 판매완료 → 후기까지 통계가 원본과 일치"""
+        phone = self._create_phone()
+        offer = UsedPhoneOffer.objects.create(phone=phone, buyer=self.buyer, offered_price=450000)
+        UnifiedFavorite.objects.create(user=self.buyer, item_type='phone', item_id=phone.id)
+        self.assertStatsConsistent(self.seller, self.buyer)
+
+        stats = UserTradeStats.objects.get(user=self.seller)
+        self.assertEqual(stats.phone_active_count, 1)
+        self.assertEqual(stats.phone_received_offer_count, 1)
+
+        offer.status = 'accepted'
+        offer.save()
+        phone.status = 'trading'
+        phone.save(update_fields=['status'])
+        self.assertStatsConsistent(self.seller, self.buyer)
+
+        phone.status = 'sold'
+        phone.save()
+        UnifiedReview.objects.create(
+            item_type='phone', transaction_id=1, reviewer=self.buyer, reviewee=self.seller, rating=4, comment='좋아요'
+        )
+        self.assertStatsConsistent(self.seller, self.buyer)
+
+        stats = UserTradeStats.objects.get(user=self.seller)
+        self.assertEqual(stats.phone_sold_count, 1)
+        self.assertEqual(stats.review_average, 4.0)
+        self.assertEqual(UserTradeStats.objects.get(user=self.buyer).phone_accepted_offer_count, 1)
+
+    def test_pending_offers_leave_received_count_when_phone_closes(self):
+        """상품이 판매중/거래중에서 벗어나면 받은 대기 제안 수에서 제외"""
+        phone = self._create_phone()
+        other_buyer = User.objects.create_user(username='other', email='other@test.com', password='testpass')
+        for buyer in (self.buyer, other_buyer):
+            UsedPhoneOffer.objects.create(phone=phone, buyer=buyer, offered_price=450000)
+        self.assertEqual(UserTradeStats.objects.get(user=self.seller).phone_received_offer_count, 2)
+
+        phone.status = 'deleted'
+        phone.save(update_fields=['status'])
+        self.assertEqual(UserTradeStats.objects.get(user=self.seller).phone_received_offer_count, 0)
+        self.assertStatsConsistent(self.seller)
+
+        phone.delete()
+        self.assertStatsConsistent(self.seller, self.buyer, other_buyer)
+
+    def test_existing_rows_are_updated_in_place(self):
+        """통계 행이 있으면 원본을 다시 집계하지 않고 변경분만 반영"""
+        UserTradeStats.for_user(self.buyer)
+        with CaptureQueriesContext(connection) as ctx:
+            favorite = UnifiedFavorite.objects.create(user=self.buyer, item_type='electronics', item_id=1)
+            favorite.delete()
+        stats_queries = [q['sql'] for q in ctx.captured_queries if 'user_trade_stats' in q['sql']]
+        self.assertEqual(len(stats_queries), 2)
+        self.assertTrue(all(sql.startswith('UPDATE') for sql in stats_queries))
+        self.assertEqual(UserTradeStats.objects.get(user=self.buyer).electronics_favorite_count, 0)
+
+    def test_deleting_user_does_not_recreate_stats(self):
+        """회원 삭제 CASCADE 중 삭제된 회원의 통계 행을 다시 만들지 않고, 상대방 통계만 갱신"""
+        phone = self._create_phone()
+        UsedPhoneOffer.objects.create(phone=phone, buyer=self.buyer, offered_price=450000)
+        UnifiedFavorite.objects.create(user=self.seller, item_type='phone', item_id=phone.id)
+        UnifiedReview.objects.create(
+            item_type='phone', transaction_id=1, reviewer=self.buyer, reviewee=self.seller, rating=5, comment='좋아요'
+        )
+        Bid.objects.create(seller=self.seller, amount=1000)
+        self.assertTrue(UserTradeStats.objects.filter(user=self.seller).exists())
+
+        seller_id = self.seller.id
+        self.seller.delete()
+
+        connection.check_constraints()
+        self.assertFalse(UserTradeStats.objects.filter(user_id=seller_id).exists())
+        self.assertStatsConsistent(self.buyer)
+
+        # 통계 행이 없는 사용자의 상품 삭제도 행을 만들지 않음 (조회 시 for_user()가 집계)
+        phone = UsedPhone.objects.create(
+            seller=self.buyer, brand='apple', model='iPhone 15', price=700000,
+            condition_grade='A', description='상태 좋은 중고폰 판매합니다.',
+        )
+        UserTradeStats.objects.filter(user=self.buyer).delete()
+        phone.delete()
+        self.assertFalse(UserTradeStats.objects.filter(user=self.buyer).exists())
+
+    def test_bids_and_bulk_updates(self):
+        """입찰 상태 변경과 queryset.update() 이후 재집계"""
+        bids = [Bid.objects.create(seller=self.seller, amount=1000 * i) for i in range(3)]
+        bids[0].status = 'selected'
+        bids[0].save()
+        Bid.objects.filter(id=bids[1].id).update(status='rejected')
+        UserTradeStats.recompute([self.seller.id])
+
+        stats = UserTradeStats.objects.get(user=self.seller)
+        self.assertEqual(
+            (stats.bid_count, stats.bid_pending_count, stats.bid_selected_count, stats.bid_rejected_count),
+            (3, 1, 1, 1)
+        )
+
+    def test_mypage_stats_reads_one_row(self):
+        """마이페이지 통계는 통계 행 하나만 조회"""
+        phone = self._create_phone()
+        UsedPhoneOffer.objects.create(phone=phone, buyer=self.buyer, offered_price=450000)
+        UnifiedFavorite.objects.create(user=self.seller, item_type='phone', item_id=phone.id)
+
+        self.client.force_authenticate(self.seller)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/mypage/stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(response.data['sales']['active'], 1)
+        self.assertEqual(response.data['sales']['received_offers'], 1)
+        self.assertEqual(response.data['purchases']['favorites'], 1)
+
+    def test_reconcile_detects_and_fixes_drift(self):
+        """점검 명령은 불일치를 보고하고 --fix로 바로잡음"""
+        self._create_phone()
+        UserTradeStats.objects.filter(user=self.seller).update(phone_active_count=7)
+
+        out = StringIO()
+        call_command('reconcile_user_trade_stats', stdout=out)
+        self.assertIn('phone_active_count 7→1', out.getvalue())
+        self.assertEqual(UserTradeStats.objects.get(user=self.seller).phone_active_count, 7)
+
+        call_command('reconcile_user_trade_stats', '--fix', stdout=StringIO())
+        self.assertStatsConsistent(self.seller)
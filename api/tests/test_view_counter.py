@@ -0,0 +1,163 @@
+"""
+Tests for the write-behind view counter and the buffered local business view log.
+"""
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from api.models_local_business import LocalBusinessCategory, LocalBusiness, LocalBusinessView
+from api.services.view_counter import CacheLog, ViewCounter
+from used_phones.models import UsedPhone
+
+User = get_user_model()
+
+
+@override_settings(VIEW_COUNT_BUFFERING=True)
+class ViewCounterTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@test.com',
+            password='testpass',
+            nickname='seller'
+        )
+        self.viewer = User.objects.create_user(
+            username='viewer',
+            email='viewer@test.com',
+            password='testpass',
+            nickname='viewer'
+        )
+        self.phone = UsedPhone.objects.create(
+            seller=self.seller,
+            brand='samsung',
+            model='Galaxy S24',
+            price=500000,
+            condition_grade='A',
+            description='상태 좋은 중고폰 판매합니다.',
+        )
+
+    def _flush(self):
+        call_command('flush_view_counts', stdout=StringIO())
+
+    def test_detail_view_does_not_write(self):
+        """상세 조회는 DB 쓰기 없이 DB 값 + 대기 중인 증가분을 응답"""
+        for expected in (1, 2, 3):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(f'/api/used/phones/{self.phone.id}/')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['view_count'], expected)
+            self.assertFalse([
+                query['sql'] for query in ctx.captured_queries
+                if query['sql'].startswith(('UPDATE', 'INSERT', 'DELETE'))
+            ])
+
+        self.phone.refresh_from_db()
+        self.assertEqual(self.phone.view_count, 0)
+
+        self._flush()
+        self.phone.refresh_from_db()
+        self.assertEqual(self.phone.view_count, 3)
+        self.assertEqual(ViewCounter.pending(self.phone), 0)
+
+        response = self.client.get(f'/api/used/phones/{self.phone.id}/')
+        self.assertEqual(response.data['view_count'], 4)
+        self._flush()
+        self.phone.refresh_from_db()
+        self.assertEqual(self.phone.view_count, 4)
+
+    def test_flush_batches_updates(self):
+        """증가분이 같은 상품들은 UPDATE 한 번으로 반영"""
+        phones = [self.phone] + [
+            UsedPhone.objects.create(
+                seller=self.seller,
+                brand='apple',
+                model=f'iPhone {i}',
+                price=700000,
+                condition_grade='A',
+                description='상태 좋은 중고폰 판매합니다.',
+            )
+            for i in range(4)
+        ]
+        for phone in phones:
+            ViewCounter.increment(phone)
+        ViewCounter.increment(phones[0])
+
+        with CaptureQueriesContext(connection) as ctx:
+            flushed = ViewCounter.flush_model('used_phones.UsedPhone')
+        self.assertEqual(flushed, 6)
+        self.assertEqual(len([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]), 2)
+        self.assertEqual(
+            dict(UsedPhone.objects.filter(id__in=[p.id for p in phones]).values_list('id', 'view_count')),
+            {phone.id: 2 if phone is phones[0] else 1 for phone in phones}
+        )
+
+    def test_local_business_view_logs_are_bulk_inserted(self):
+        """업체 상세 조회 기록은 버퍼에 모였다가 한 번에 저장"""
+        category = LocalBusinessCategory.objects.create(name='청소 전문', name_en='cleaning', google_place_type='cleaning')
+        business = LocalBusiness.objects.create(
+            category=category,
+            region_name='서울특별시 강남구',
+            name='깨끗한 청소',
+            address='서울특별시 강남구 테헤란로 1',
+            google_place_id='place-1',
+        )
+
+        self.client.get(f'/api/local-businesses/{business.id}/')
+        self.client.force_authenticate(self.viewer)
+        response = self.client.get(f'/api/local-businesses/{business.id}/', HTTP_X_FORWARDED_FOR='10.0.0.1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['view_count'], 2)
+        self.assertFalse(LocalBusinessView.objects.exists())
+
+        with CaptureQueriesContext(connection) as ctx:
+            self._flush()
+        self.assertEqual(len([q for q in ctx.captured_queries if q['sql'].startswith('INSERT')]), 1)
+
+        business.refresh_from_db()
+        self.assertEqual(business.view_count, 2)
+        views = list(LocalBusinessView.objects.order_by('viewed_at'))
+        self.assertEqual([view.user_id for view in views], [None, self.viewer.id])
+        self.assertEqual(views[1].ip_address, '10.0.0.1')
+
+    @override_settings(VIEW_COUNT_BUFFERING=None)
+    def test_process_local_cache_writes_directly(self):
+        """LocMemCache처럼 프로세스 간 공유되지 않는 캐시에서는 버퍼링하지 않고 바로 반영"""
+        self.assertFalse(ViewCounter.is_buffered())
+        category = LocalBusinessCategory.objects.create(name='청소 전문', name_en='cleaning', google_place_type='cleaning')
+        business = LocalBusiness.objects.create(
+            category=category,
+            region_name='서울특별시 강남구',
+            name='깨끗한 청소',
+            address='서울특별시 강남구 테헤란로 1',
+            google_place_id='place-1',
+        )
+
+        self.assertEqual(self.client.get(f'/api/used/phones/{self.phone.id}/').data['view_count'], 1)
+        self.assertEqual(self.client.get(f'/api/local-businesses/{business.id}/').data['view_count'], 1)
+
+        self.phone.refresh_from_db()
+        business.refresh_from_db()
+        self.assertEqual((self.phone.view_count, business.view_count), (1, 1))
+        self.assertEqual(LocalBusinessView.objects.filter(business=business).count(), 1)
+        self.assertEqual(ViewCounter.pending(self.phone), 0)
+
+    def test_cache_log_waits_for_unwritten_entries(self):
+        """순번만 받고 아직 저장되지 않은 항목은 유예 시간 동안 위치를 넘기지 않음"""
+        log = CacheLog('test')
+        log.append('a')
+        cache.incr(log._key('seq'))  # 저장 전인 항목
+        log.append('c')
+
+        self.assertEqual(log.drain(), ['a', 'c'])
+        self.assertEqual(cache.get(log._key('position')), 1)
+
+        cache.set(log._key('entry:2'), 'b', None)
+        self.assertEqual(log.drain(), ['b'])
+        self.assertEqual(cache.get(log._key('position')), 3)
+        self.assertEqual(log.drain(), [])
@@ -30,8 +30,8 @@ def update_groupbuy_status(groupbuy):
     changed = False
     
     # v3.0: bidding 상태 제거 - recruiting에서 바로 final_selection_buyers로
-    # 공구 마감 시간이 지났으면 final_selection_buyers로 변경
-    if groupbuy.status == 'recruiting' and now > groupbuy.end_time:
+    # 공구 마감 시간이 지났으면 final_selection_buyers로 변경 (남아있는 bidding 공구도 동일하게 처리)
+    if groupbuy.status in ['recruiting', 'bidding'] and now > groupbuy.end_time:
         from api.models import Bid, Notification
         # 입찰이 있는 경우만 final_selection_buyers로, 없으면 cancelled
         bids = Bid.objects.filter(groupbuy=groupbuy).order_by('-amount', 'created_at')
@@ -64,13 +64,13 @@ def update_groupbuy_status(groupbuy):
             groupbuy.status = 'final_selection_buyers'
             groupbuy.final_selection_end = groupbuy.end_time + timedelta(hours=12)
             groupbuy.save()
-            logger.info(f"공구 '{groupbuy.title}' 상태 변경: recruiting -> final_selection_buyers")
+            logger.info(f"공구 '{groupbuy.title}' 상태 변경: {original_status} -> final_selection_buyers")
             groupbuy.notify_status_change()
             changed = True
         else:
             groupbuy.status = 'cancelled'
             groupbuy.save()
-            logger.info(f"공구 '{groupbuy.title}' 상태 변경: recruiting -> cancelled (제안 없음)")
+            logger.info(f"공구 '{groupbuy.title}' 상태 변경: {original_status} -> cancelled (제안 없음)")
             changed = True
     
     # 구매자 최종선택 단계 -> 판매자 최종선택 또는 취소
@@ -0,0 +1,14 @@
+from django.utils import timezone
+
+
+def sync_effective_date(instance, save_kwargs):
+    """
+    끌올 목록 정렬 기준(effective_date)을 마지막 끌올 시각(없으면 등록 시각)으로 맞춤
+
+    UsedPhone / UsedElectronics / CustomGroupBuy의 save()에서 super().save() 직전에 호출합니다.
+    update_fields로 last_bumped_at만 저장하는 경우에도 effective_date를 함께 저장하도록 추가합니다.
+    """
+    instance.effective_date = instance.last_bumped_at or instance.created_at or timezone.now()
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None and 'last_bumped_at' in update_fields and 'effective_date' not in update_fields:
+        save_kwargs['update_fields'] = [*update_fields, 'effective_date']
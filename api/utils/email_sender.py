@@ -11,6 +11,7 @@ class EmailSender:
     이메일 발송 유틸리티 클래스
     
     다양한 알림 이메일을 발송하는 기능을 제공합니다.
+    알림성 이메일은 작업 큐(email.send)에 등록되고 run_workers가 send_notification_email로 발송합니다.
     """
     
     @staticmethod
@@ -54,6 +55,39 @@ class EmailSender:
             logger.error(f"이메일 발송 실패: {recipient_email}, 제목: {subject}, 오류: {str(e)}")
             return False
     
+    @staticmethod
+    def queue_notification_email(recipient_email, subject, template_name, context, idempotency_key=None):
+        """
+        알림 이메일을 작업 큐에 등록합니다. (실패 시 run_workers가 백오프 후 재시도)
+        
+        Args:
+            recipient_email (str): 수신자 이메일
+            subject (str): 이메일 제목
+            template_name (str): 이메일 템플릿 이름
+            context (dict): 템플릿에 전달할 컨텍스트 (JSON 직렬화 가능해야 함)
+            idempotency_key (str): 같은 키로 이미 등록된 이메일이 있으면 다시 등록하지 않음
+            
+        Returns:
+            bool: 등록 성공 여부
+        """
+        from api.services.job_queue import JobQueue
+
+        try:
+            JobQueue.enqueue(
+                'email.send',
+                {
+                    'recipient_email': recipient_email,
+                    'subject': subject,
+                    'template_name': template_name,
+                    'context': context,
+                },
+                idempotency_key=idempotency_key
+            )
+            return True
+        except Exception as e:
+            logger.error(f"이메일 발송 등록 실패: {recipient_email}, 제목: {subject}, 오류: {str(e)}")
+            return False
+    
     @staticmethod
     def send_bid_reminder(user_email, groupbuy_title, groupbuy_id, hours_left):
         """
@@ -66,7 +100,7 @@ class EmailSender:
             hours_left (int): 남은 시간(시간)
             
         Returns:
-            bool: 이메일 발송 성공 여부
+            bool: 이메일 발송 등록 성공 여부
         """
         subject = f"[둥지마켓] 제안 마감 {hours_left}시간 전 알림"
         context = {
@@ -75,11 +109,12 @@ class EmailSender:
             'hours_left': hours_left,
             'site_url': settings.SITE_URL,
         }
-        return EmailSender.send_notification_email(
+        return EmailSender.queue_notification_email(
             user_email, 
             subject, 
             'emails/bid_reminder.html', 
-            context
+            context,
+            idempotency_key=f'email:bid_reminder:{groupbuy_id}:{hours_left}:{user_email}'
         )
     
     @staticmethod
@@ -94,7 +129,7 @@ class EmailSender:
             hours_left (int): 남은 시간(시간)
             
         Returns:
-            bool: 이메일 발송 성공 여부
+            bool: 이메일 발송 등록 성공 여부
         """
         subject = f"[둥지마켓] 제안 확정 {hours_left}시간 전 알림"
         context = {
@@ -103,11 +138,12 @@ class EmailSender:
             'hours_left': hours_left,
             'site_url': settings.SITE_URL,
         }
-        return EmailSender.send_notification_email(
+        return EmailSender.queue_notification_email(
             user_email, 
             subject, 
             'emails/bid_confirmation_reminder.html', 
-            context
+            context,
+            idempotency_key=f'email:bid_confirmation_reminder:{groupbuy_id}:{hours_left}:{user_email}'
         )
     
     @staticmethod
@@ -122,7 +158,7 @@ class EmailSender:
             hours_left (int): 남은 시간(시간)
             
         Returns:
-            bool: 이메일 발송 성공 여부
+            bool: 이메일 발송 등록 성공 여부
         """
         subject = f"[둥지마켓] 판매자 확정 {hours_left}시간 전 알림"
         context = {
@@ -131,9 +167,10 @@ class EmailSender:
             'hours_left': hours_left,
             'site_url': settings.SITE_URL,
         }
-        return EmailSender.send_notification_email(
+        return EmailSender.queue_notification_email(
             user_email, 
             subject, 
             'emails/seller_confirmation_reminder.html', 
-            context
+            context,
+            idempotency_key=f'email:seller_confirmation_reminder:{groupbuy_id}:{hours_left}:{user_email}'
         )
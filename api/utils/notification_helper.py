@@ -5,7 +5,6 @@
 import logging
 from typing import Optional, Dict, Any
 from api.models import Notification, NotificationSetting
-from api.utils.push_notification import send_push_to_user
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +22,17 @@ def format_price(price: int) -> str:
     return f"{price:,}원"
 
 
+def enqueue_push(notification: Notification, title: str, data: Dict[str, Any]):
+    """
+    인앱 알림의 푸시 발송을 작업 큐에 등록 (run_workers가 발송)
+    호출한 트랜잭션이 롤백되면 발송 작업도 함께 취소됩니다.
+    """
+    from api.services.notification_dispatcher import NotificationDispatcher
+
+    NotificationDispatcher.enqueue_push([notification.id], title, data)
+    logger.info(f"Push queued for notification {notification.id} (user {notification.user_id})")
+
+
 def send_notification(
     user,
     notification_type: str,
@@ -78,7 +88,6 @@ def send_notification(
 
         # 3. 푸시 알림 발송
         title = push_title or "둥지마켓"
-        body = message
         data = push_data or {}
 
         # 알림 타입별 추가 데이터
@@ -89,12 +98,7 @@ def send_notification(
             data['item_id'] = str(item_id)
         data['notification_id'] = str(notification.id)
 
-        success_count = send_push_to_user(user, title, body, data)
-
-        if success_count > 0:
-            logger.info(f"Push sent to {success_count} devices for user {user.id}")
-        else:
-            logger.warning(f"No push sent for user {user.id} (no active tokens or push failed)")
+        enqueue_push(notification, title, data)
 
         return notification
 
@@ -175,19 +179,13 @@ def send_custom_groupbuy_notification(
 
         # 푸시 알림 발송
         title = push_title or "커스텀 공구 알림"
-        body = message
         data = {
             'type': 'custom_groupbuy',
             'custom_groupbuy_id': str(custom_groupbuy.id),
             'notification_id': str(notification.id)
         }
 
-        success_count = send_push_to_user(user, title, body, data)
-
-        if success_count > 0:
-            logger.info(f"Push sent to {success_count} devices for user {user.id}")
-        else:
-            logger.warning(f"No push sent for user {user.id} (no active tokens or push failed)")
+        enqueue_push(notification, title, data)
 
         return notification
 
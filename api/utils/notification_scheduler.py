@@ -213,7 +213,7 @@ class NotificationScheduler:
                     
                     # 이메일 발송
                     if winning_bid.seller.email:
-                        EmailSender.send_notification_email(
+                        EmailSender.queue_notification_email(
                             winning_bid.seller.email,
                             "[둥지마켓] 판매자 최종선택 시작 안내",
                             'emails/seller_selection_start.html',
@@ -223,7 +223,8 @@ class NotificationScheduler:
                                 'confirmed_count': confirmed_count,
                                 'total_count': total_count,
                                 'site_url': 'https://dungji-market.com',
-                            }
+                            },
+                            idempotency_key=f'email:seller_selection_start:{groupbuy.id}'
                         )
             else:
                 # 확정한 참여자가 없으면 공구 취소
@@ -1,136 +1,206 @@
 """
 푸시 알림 발송 유틸리티
 FCM (Firebase Cloud Messaging) 및 APNs (Apple Push Notification service) 연동
+
+- 서비스 계정 인증 정보는 프로세스당 한 번 로드하고, access token은 만료가 임박했을 때만 갱신
+- HTTP 연결은 모듈 단위 requests.Session으로 재사용
+- 여러 디바이스 발송은 PUSH_MAX_CONCURRENCY 개의 스레드로 동시 처리
+- FCM이 UNREGISTERED로 응답한 토큰은 자동 비활성화
 """
 import json
 import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
 from typing import Optional, Dict, Any
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request
+from requests.adapters import HTTPAdapter
 import os
 
 logger = logging.getLogger(__name__)
 
+FCM_PROJECT_ID = "dungji-market-7c0e0"
+FCM_SEND_URL = f"https://fcm.googleapis.com/v1/projects/{FCM_PROJECT_ID}/messages:send"
+FCM_SCOPES = ['https://www.googleapis.com/auth/firebase.messaging']
 
-def get_access_token():
+# 발송 결과
+PUSH_SENT = 'sent'
+PUSH_FAILED = 'failed'
+PUSH_UNREGISTERED = 'unregistered'
+
+PUSH_MAX_CONCURRENCY = getattr(settings, 'PUSH_MAX_CONCURRENCY', 20)
+
+_credentials = None
+_credentials_lock = threading.Lock()
+
+# 연결 풀 크기를 동시 발송 수에 맞춰 모든 스레드가 keep-alive 연결을 재사용하도록 설정
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=PUSH_MAX_CONCURRENCY))
+
+# 동시 발송 수 제한 (프로세스 전체 공유)
+_send_executor = ThreadPoolExecutor(max_workers=PUSH_MAX_CONCURRENCY, thread_name_prefix='fcm-send')
+
+
+def _load_credentials():
     """
-    Firebase Service Account를 사용하여 Access Token 생성
+    Firebase Service Account 인증 정보 로드
     환경변수 또는 파일에서 읽기
     """
-    try:
-        # 1. 환경변수에서 읽기 (Vercel 등 클라우드 환경)
-        service_account_json = os.getenv('FIREBASE_SERVICE_ACCOUNT')
-
-        if service_account_json:
-            logger.info("Using Firebase credentials from environment variable")
-            service_account_info = json.loads(service_account_json)
-            credentials = service_account.Credentials.from_service_account_info(
-                service_account_info,
-                scopes=['https://www.googleapis.com/auth/firebase.messaging']
-            )
-        else:
-            # 2. 파일에서 읽기 (로컬 개발 환경)
-            service_account_path = os.path.join(settings.BASE_DIR, 'firebase-service-account.json')
+    # 1. 환경변수에서 읽기 (Vercel 등 클라우드 환경)
+    service_account_json = os.getenv('FIREBASE_SERVICE_ACCOUNT')
+
+    if service_account_json:
+        logger.info("Using Firebase credentials from environment variable")
+        service_account_info = json.loads(service_account_json)
+        return service_account.Credentials.from_service_account_info(
+            service_account_info,
+            scopes=FCM_SCOPES
+        )
+
+    # 2. 파일에서 읽기 (로컬 개발 환경)
+    service_account_path = os.path.join(settings.BASE_DIR, 'firebase-service-account.json')
+
+    if not os.path.exists(service_account_path):
+        logger.warning("Firebase credentials not found in environment or file. Skipping push notification.")
+        return None
 
-            if not os.path.exists(service_account_path):
-                logger.warning("Firebase credentials not found in environment or file. Skipping push notification.")
-                return None
+    logger.info("Using Firebase credentials from file")
+    return service_account.Credentials.from_service_account_file(
+        service_account_path,
+        scopes=FCM_SCOPES
+    )
 
-            logger.info("Using Firebase credentials from file")
-            credentials = service_account.Credentials.from_service_account_file(
-                service_account_path,
-                scopes=['https://www.googleapis.com/auth/firebase.messaging']
-            )
 
-        credentials.refresh(Request())
-        return credentials.token
+def get_access_token():
+    """
+    Firebase Service Account를 사용하여 Access Token 반환
+    토큰이 없거나 만료가 임박한 경우에만 갱신 (google-auth의 refresh threshold 기준)
+    """
+    global _credentials
+
+    try:
+        with _credentials_lock:
+            if _credentials is None:
+                _credentials = _load_credentials()
+                if _credentials is None:
+                    return None
+
+            if not _credentials.valid:
+                _credentials.refresh(Request())
+            return _credentials.token
     except Exception as e:
         logger.error(f"Error getting access token: {str(e)}")
         return None
 
 
-def send_fcm_push(token: str, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> bool:
-    """
-    FCM HTTP v1 API를 통해 푸시 알림 발송 (Android/Web/iOS)
+def _build_fcm_message(token: str, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """FCM HTTP v1 메시지 페이로드 생성"""
+    # 알림 타입에 따라 URL 결정
+    if data:
+        notification_type = data.get('type')
+        if notification_type == 'used':
+            link_url = "https://www.dungjimarket.com/used/mypage"
+        elif notification_type == 'groupbuy':
+            link_url = "https://www.dungjimarket.com/mypage"
+        else:
+            link_url = "https://www.dungjimarket.com/mypage"
+    else:
+        link_url = "https://www.dungjimarket.com/mypage"
+
+    # data 페이로드 준비 (모든 값은 문자열이어야 함)
+    payload_data = {}
+    if data:
+        # 기존 data의 모든 값을 문자열로 변환
+        for key, value in data.items():
+            payload_data[key] = str(value)
+
+    # URL 추가
+    payload_data['url'] = link_url
+
+    return {
+        "message": {
+            "token": token,
+            "notification": {
+                "title": title,
+                "body": body,
+            },
+            "data": payload_data,
+            "webpush": {
+                "fcm_options": {
+                    "link": link_url
+                }
+            }
+        }
+    }
 
-    Args:
-        token: FCM 디바이스 토큰
-        title: 알림 제목
-        body: 알림 본문
-        data: 추가 데이터 (선택)
+
+def _is_unregistered(response) -> bool:
+    """FCM 오류 응답이 앱 삭제/토큰 만료(UNREGISTERED)인지 확인"""
+    try:
+        error = response.json().get('error', {})
+    except ValueError:
+        return False
+    for detail in error.get('details', []):
+        if detail.get('errorCode') == 'UNREGISTERED':
+            return True
+    return response.status_code == 404 and error.get('status') == 'NOT_FOUND'
+
+
+def _send_fcm_message(token: str, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> str:
+    """
+    FCM HTTP v1 API로 메시지 한 건 발송
 
     Returns:
-        bool: 발송 성공 여부
+        str: PUSH_SENT / PUSH_FAILED / PUSH_UNREGISTERED
     """
     try:
         access_token = get_access_token()
         if not access_token:
-            return False
-
-        project_id = "dungji-market-7c0e0"
-        url = f"https://fcm.googleapis.com/v1/projects/{project_id}/messages:send"
+            return PUSH_FAILED
 
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json; UTF-8",
         }
+        payload = _build_fcm_message(token, title, body, data)
 
-        # 알림 타입에 따라 URL 결정
-        if data:
-            notification_type = data.get('type')
-            if notification_type == 'used':
-                link_url = "https://www.dungjimarket.com/used/mypage"
-            elif notification_type == 'groupbuy':
-                link_url = "https://www.dungjimarket.com/mypage"
-            else:
-                link_url = "https://www.dungjimarket.com/mypage"
-        else:
-            link_url = "https://www.dungjimarket.com/mypage"
+        response = _session.post(FCM_SEND_URL, headers=headers, json=payload, timeout=10)
 
-        # data 페이로드 준비 (모든 값은 문자열이어야 함)
-        payload_data = {}
-        if data:
-            # 기존 data의 모든 값을 문자열로 변환
-            for key, value in data.items():
-                payload_data[key] = str(value)
-
-        # URL 추가
-        payload_data['url'] = link_url
-
-        payload = {
-            "message": {
-                "token": token,
-                "notification": {
-                    "title": title,
-                    "body": body,
-                },
-                "data": payload_data,
-                "webpush": {
-                    "fcm_options": {
-                        "link": link_url
-                    }
-                }
-            }
-        }
+        if response.status_code == 200:
+            logger.debug(f"FCM SUCCESS - token: {token[:30]}..., title: {title}")
+            return PUSH_SENT
 
-        logger.info(f"Sending FCM to token: {token[:30]}... with title: {title}")
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        if _is_unregistered(response):
+            logger.info(f"FCM token unregistered: {token[:30]}...")
+            return PUSH_UNREGISTERED
 
-        if response.status_code == 200:
-            logger.info(f"✅ FCM SUCCESS - Status: {response.status_code}, Response: {response.text[:200]}")
-            return True
-        else:
-            logger.error(f"❌ FCM FAILED - Status: {response.status_code}, Response: {response.text}")
-            return False
+        logger.error(f"❌ FCM FAILED - Status: {response.status_code}, Response: {response.text}")
+        return PUSH_FAILED
 
     except requests.exceptions.Timeout:
         logger.error("FCM request timeout")
-        return False
+        return PUSH_FAILED
     except Exception as e:
         logger.error(f"Error sending FCM push: {str(e)}")
-        return False
+        return PUSH_FAILED
+
+
+def send_fcm_push(token: str, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    FCM HTTP v1 API를 통해 푸시 알림 발송 (Android/Web/iOS)
+
+    Args:
+        token: FCM 디바이스 토큰
+        title: 알림 제목
+        body: 알림 본문
+        data: 추가 데이터 (선택)
+
+    Returns:
+        bool: 발송 성공 여부
+    """
+    return _send_fcm_message(token, title, body, data) == PUSH_SENT
 
 
 def send_apns_push(token: str, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> bool:
@@ -166,6 +236,65 @@ def send_apns_push(token: str, title: str, body: str, data: Optional[Dict[str, A
         return False
 
 
+def _send_to_push_token(push_token, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> str:
+    """PushToken 한 건 발송 (플랫폼별 분기)"""
+    try:
+        if push_token.platform == 'ios':
+            success = send_apns_push(push_token.token, title, body, data)
+            return PUSH_SENT if success else PUSH_FAILED
+        # android or web
+        return _send_fcm_message(push_token.token, title, body, data)
+    except Exception as e:
+        logger.error(f"Error sending push to token {push_token.id}: {str(e)}")
+        return PUSH_FAILED
+
+
+def send_push_messages(messages) -> int:
+    """
+    (PushToken, 제목, 본문, 데이터) 목록을 한 번에 동시 발송
+    여러 사용자에게 서로 다른 내용을 보낼 때도 모든 메시지를 같은 스레드 풀에 함께 넣어 처리하고,
+    FCM이 UNREGISTERED로 응답한 토큰은 한 번의 UPDATE로 비활성화합니다.
+
+    Args:
+        messages: (push_token, title, body, data) 튜플 목록
+
+    Returns:
+        int: 성공적으로 발송된 개수
+    """
+    from api.models import PushToken
+
+    messages = list(messages)
+    if not messages:
+        return 0
+
+    results = list(_send_executor.map(lambda message: _send_to_push_token(*message), messages))
+
+    unregistered_ids = [
+        message[0].id for message, result in zip(messages, results) if result == PUSH_UNREGISTERED
+    ]
+    if unregistered_ids:
+        PushToken.objects.filter(id__in=unregistered_ids).update(is_active=False)
+        logger.info(f"Deactivated {len(unregistered_ids)} unregistered push tokens")
+
+    return sum(1 for result in results if result == PUSH_SENT)
+
+
+def send_push_to_tokens(push_tokens, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> int:
+    """
+    이미 조회한 PushToken 목록에 같은 푸시 알림 동시 발송
+
+    Args:
+        push_tokens: PushToken 인스턴스 목록
+        title: 알림 제목
+        body: 알림 본문
+        data: 추가 데이터 (선택)
+
+    Returns:
+        int: 성공적으로 발송된 개수
+    """
+    return send_push_messages((push_token, title, body, data) for push_token in push_tokens)
+
+
 def send_push_to_user(user, title: str, body: str, data: Optional[Dict[str, Any]] = None) -> int:
     """
     특정 사용자의 모든 활성 디바이스에 푸시 알림 발송
@@ -182,24 +311,4 @@ def send_push_to_user(user, title: str, body: str, data: Optional[Dict[str, Any]
     from api.models import PushToken
 
     tokens = PushToken.objects.filter(user=user, is_active=True)
-    success_count = 0
-
-    for push_token in tokens:
-        try:
-            if push_token.platform == 'ios':
-                success = send_apns_push(push_token.token, title, body, data)
-            else:  # android or web
-                success = send_fcm_push(push_token.token, title, body, data)
-
-            if success:
-                success_count += 1
-            else:
-                # 푸시 발송 실패 시 토큰 비활성화 (선택)
-                # push_token.is_active = False
-                # push_token.save()
-                pass
-
-        except Exception as e:
-            logger.error(f"Error sending push to token {push_token.id}: {str(e)}")
-
-    return success_count
+    return send_push_to_tokens(tokens, title, body, data)
@@ -1,57 +1,85 @@
-import boto3
 import os
 import uuid
 from django.conf import settings
 from datetime import datetime
 import logging
+from .s3_utils import get_s3_client, get_transfer_config, upload_fileobjs
 
 logger = logging.getLogger(__name__)
 
 
+def _build_upload(file_field, folder_name):
+    """업로드할 (파일, S3 키, ExtraArgs) 생성"""
+    # 파일 이름 생성
+    ext = file_field.name.split('.')[-1]
+    file_name = f"{folder_name}/{uuid.uuid4().hex}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
+
+    # S3에 업로드 (ACL 제거)
+    extra_args = {
+        'ContentType': file_field.content_type if hasattr(file_field, 'content_type') else 'application/octet-stream'
+    }
+
+    # ACL이 필요한 경우에만 추가
+    if settings.AWS_DEFAULT_ACL:
+        extra_args['ACL'] = settings.AWS_DEFAULT_ACL
+
+    return file_field, file_name, extra_args
+
+
+def _object_url(file_name):
+    return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{file_name}"
+
+
 def upload_to_s3(file_field, folder_name='uploads'):
     """파일을 S3에 업로드하고 URL을 반환"""
     if not settings.USE_S3:
         return None
-        
+
     try:
-        # S3 클라이언트 초기화
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            region_name=settings.AWS_S3_REGION_NAME
-        )
-        
-        # 파일 이름 생성
-        ext = file_field.name.split('.')[-1]
-        file_name = f"{folder_name}/{uuid.uuid4().hex}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
-        
+        file_field, file_name, extra_args = _build_upload(file_field, folder_name)
+
         # 파일 포인터를 처음으로 되돌리기
         if hasattr(file_field, 'seek'):
             file_field.seek(0)
-        
-        # S3에 업로드 (ACL 제거)
-        extra_args = {
-            'ContentType': file_field.content_type if hasattr(file_field, 'content_type') else 'application/octet-stream'
-        }
-        
-        # ACL이 필요한 경우에만 추가
-        if settings.AWS_DEFAULT_ACL:
-            extra_args['ACL'] = settings.AWS_DEFAULT_ACL
-            
-        s3_client.upload_fileobj(
+
+        get_s3_client().upload_fileobj(
             file_field,
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
-            ExtraArgs=extra_args
+            ExtraArgs=extra_args,
+            Config=get_transfer_config()
         )
-        
+
         # URL 생성
-        url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{file_name}"
+        url = _object_url(file_name)
         logger.info(f"File uploaded to S3: {url}")
-        
+
         return url
-        
+
     except Exception as e:
         logger.error(f"S3 upload error: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+
+def upload_many_to_s3(files):
+    """
+    여러 파일을 동시에 S3에 업로드하고 URL 목록을 반환
+
+    Args:
+        files: (파일, 폴더명) 목록
+
+    Returns:
+        list: 입력 순서대로 URL (실패한 파일은 None)
+    """
+    files = list(files)
+    if not settings.USE_S3:
+        return [None] * len(files)
+
+    uploads = [_build_upload(file_field, folder_name) for file_field, folder_name in files]
+    urls = []
+    for file_name in upload_fileobjs(uploads):
+        url = _object_url(file_name) if file_name else None
+        if url:
+            logger.info(f"File uploaded to S3: {url}")
+        urls.append(url)
+    return urls
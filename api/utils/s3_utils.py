@@ -1,20 +1,130 @@
 import os
 import uuid
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
+_client = None
+_session = None
+_resource_cls = None
+_transfer_config = None
+_client_lock = threading.Lock()
+
+
 def get_s3_client():
     """
-    S3 클라이언트 객체를 반환합니다.
+    프로세스 공용 S3 클라이언트 객체를 반환합니다.
+
+    boto3 클라이언트는 스레드 안전하므로 한 번만 생성해 재사용합니다.
+    (호출마다 생성하면 자격 증명 탐색, 엔드포인트 설정, TLS 핸드셰이크 비용이 반복됨)
+    AWS_S3_ENDPOINT_URL을 지정하면 minio 등 S3 호환 서버로 연결합니다.
+    """
+    global _client, _session
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # 기본 세션은 스레드 안전하지 않으므로 전용 세션에서 생성
+                _session = session = boto3.session.Session()
+                _client = session.client(
+                    's3',
+                    aws_access_key_id=getattr(settings, 'AWS_ACCESS_KEY_ID', None),
+                    aws_secret_access_key=getattr(settings, 'AWS_SECRET_ACCESS_KEY', None),
+                    region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2'),
+                    endpoint_url=getattr(settings, 'AWS_S3_ENDPOINT_URL', None),
+                    config=Config(
+                        max_pool_connections=getattr(settings, 'AWS_S3_MAX_POOL_CONNECTIONS', 50),
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                    ),
+                )
+    return _client
+
+
+def get_s3_resource():
+    """
+    공용 클라이언트로 요청을 보내는 S3 리소스 객체를 반환합니다.
+
+    리소스 객체는 스레드 안전하지 않아 호출할 때마다 새로 만들지만,
+    리소스 클래스는 공용 세션에서 한 번만 만들고 공용 클라이언트를 넘기므로
+    세션/클라이언트를 새로 생성하지 않습니다.
+    """
+    global _resource_cls
+    client = get_s3_client()
+    if _resource_cls is None:
+        with _client_lock:
+            if _resource_cls is None:
+                _resource_cls = type(_session.resource(
+                    's3',
+                    region_name=getattr(settings, 'AWS_S3_REGION_NAME', 'ap-northeast-2'),
+                    endpoint_url=getattr(settings, 'AWS_S3_ENDPOINT_URL', None),
+                ))
+    return _resource_cls(client=client)
+
+
+def get_transfer_config():
+    """업로드용 TransferConfig (큰 파일은 멀티파트로 나눠 병렬 전송)"""
+    global _transfer_config
+    if _transfer_config is None:
+        _transfer_config = TransferConfig(
+            multipart_threshold=getattr(settings, 'AWS_S3_MULTIPART_THRESHOLD', 8 * 1024 * 1024),
+            max_concurrency=getattr(settings, 'AWS_S3_UPLOAD_CONCURRENCY', 8),
+        )
+    return _transfer_config
+
+
+def reset_s3_client():
+    """공용 클라이언트/전송 설정 초기화 (설정 변경 후 또는 테스트용)"""
+    global _client, _session, _resource_cls, _transfer_config
+    with _client_lock:
+        _client = None
+        _session = None
+        _resource_cls = None
+        _transfer_config = None
+
+
+def upload_fileobjs(uploads, bucket=None):
+    """
+    여러 파일을 공용 클라이언트로 동시에 S3에 업로드합니다.
+
+    Args:
+        uploads: (파일 객체, S3 키, ExtraArgs) 목록
+        bucket: 버킷 이름 (기본: AWS_STORAGE_BUCKET_NAME)
+
+    Returns:
+        list: 입력 순서대로 업로드된 S3 키 (실패한 파일은 None)
     """
-    return boto3.client(
-        's3',
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME
-    )
+    uploads = list(uploads)
+    if not uploads:
+        return []
+
+    client = get_s3_client()
+    transfer_config = get_transfer_config()
+    bucket = bucket or settings.AWS_STORAGE_BUCKET_NAME
+
+    def upload(item):
+        file_obj, key, extra_args = item
+        try:
+            if hasattr(file_obj, 'seek'):
+                file_obj.seek(0)
+            client.upload_fileobj(file_obj, bucket, key, ExtraArgs=extra_args or None, Config=transfer_config)
+            return key
+        except Exception as e:
+            logger.error(f"S3 업로드 오류 ({key}): {e}")
+            return None
+
+    if len(uploads) == 1:
+        return [upload(uploads[0])]
+
+    max_workers = min(len(uploads), getattr(settings, 'AWS_S3_UPLOAD_CONCURRENCY', 8))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='s3-upload') as executor:
+        return list(executor.map(upload, uploads))
 
 def upload_file_to_s3(file_obj, folder='products'):
     """
@@ -50,7 +160,8 @@ def upload_file_to_s3(file_obj, folder='products'):
             s3_path,
             ExtraArgs={
                 'ContentType': file_obj.content_type,
-            }
+            },
+            Config=get_transfer_config()
         )
         
         # 업로드된 파일의 URL 생성
@@ -319,6 +319,54 @@ class SMSService:
                     fail_count += 1
             return success_count, fail_count
 
+    @staticmethod
+    def enqueue_bulk_sms(phone_numbers: list, message: str, title: str = '[둥지마켓]',
+                         idempotency_key: Optional[str] = None):
+        """대량 SMS를 작업 큐에 등록 (run_workers가 send_bulk_sms로 발송)
+
+        Args:
+            phone_numbers: 수신자 전화번호 리스트
+            message: 메시지 내용
+            title: LMS 제목
+            idempotency_key: 같은 키로 이미 등록된 발송이 있으면 다시 등록하지 않음
+
+        Returns:
+            BackgroundJob: 등록된 작업
+        """
+        from api.services.job_queue import JobQueue
+
+        return JobQueue.enqueue(
+            'sms.bulk',
+            {'phone_numbers': list(phone_numbers), 'message': message, 'title': title},
+            idempotency_key=idempotency_key
+        )
+
+    @staticmethod
+    def enqueue_custom_groupbuy_completion_seller(phone_number: str, title: str,
+                                                  participants_count: int, final_price: int = None,
+                                                  discount_rate: int = None,
+                                                  user=None, custom_groupbuy=None):
+        """판매자용 커스텀 공구 마감 SMS를 작업 큐에 등록 (공구당 한 번)
+
+        Returns:
+            BackgroundJob: 등록된 작업
+        """
+        from api.services.job_queue import JobQueue
+
+        return JobQueue.enqueue(
+            'sms.custom_groupbuy_completion_seller',
+            {
+                'phone_number': phone_number,
+                'title': title,
+                'participants_count': participants_count,
+                'final_price': final_price,
+                'discount_rate': discount_rate,
+                'user_id': user.id if user else None,
+                'custom_groupbuy_id': custom_groupbuy.id if custom_groupbuy else None,
+            },
+            idempotency_key=f'sms:custom_groupbuy:{custom_groupbuy.id}:completed_seller' if custom_groupbuy else None
+        )
+
     def _send_aligo_bulk_sms(self, receivers: str, message: str, title: str, msg_type: str) -> Tuple[int, int]:
         """알리고 대량 SMS 발송"""
         import requests
@@ -0,0 +1,53 @@
+from collections import defaultdict
+
+
+def get_item_model(item_type):
+    """통합 모델(찜/끌올/신고)의 item_type에 해당하는 상품 모델 (알 수 없는 타입이면 None)"""
+    if item_type == 'phone':
+        from used_phones.models import UsedPhone
+        return UsedPhone
+    if item_type == 'electronics':
+        from used_electronics.models import UsedElectronics
+        return UsedElectronics
+    if item_type == 'custom_groupbuy':
+        from api.models_custom import CustomGroupBuy
+        return CustomGroupBuy
+    return None
+
+
+def bulk_get_items(rows, exclude_status=None, select_related=('seller',), prefetch_related=('images',)):
+    """
+    UnifiedFavorite / UnifiedBump / UnifiedReport 목록의 상품을 타입별 한 번의 쿼리로 조회
+
+    item_type별로 item_id를 모아 in_bulk로 조회하고, 결과를 각 행에 붙여 두어
+    이후 get_item() 호출은 추가 쿼리 없이 붙여 둔 상품(없으면 None)을 반환합니다.
+
+    Args:
+        rows: item_type, item_id 속성을 가진 모델 인스턴스 목록
+        exclude_status: 제외할 상품 상태 (예: 찜 목록의 'deleted')
+        select_related: 상품 조회 시 함께 가져올 FK
+        prefetch_related: 상품 조회 시 함께 가져올 역참조 (기본: 이미지)
+
+    Returns:
+        dict: {(item_type, item_id): 상품}
+    """
+    rows = list(rows)
+    ids_by_type = defaultdict(set)
+    for row in rows:
+        if row.item_type and row.item_id:
+            ids_by_type[row.item_type].add(row.item_id)
+
+    items = {}
+    for item_type, item_ids in ids_by_type.items():
+        model = get_item_model(item_type)
+        if model is None:
+            continue
+        queryset = model.objects.select_related(*select_related).prefetch_related(*prefetch_related)
+        if exclude_status:
+            queryset = queryset.exclude(status=exclude_status)
+        for item_id, item in queryset.in_bulk(item_ids).items():
+            items[(item_type, item_id)] = item
+
+    for row in rows:
+        row._prefetched_item = items.get((row.item_type, row.item_id))
+    return items
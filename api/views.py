@@ -21,11 +21,14 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.authtoken.models import Token
-from .models import Category, Product, GroupBuy, Participation, Wishlist, Review, Bid
+from .models import Category, Product, GroupBuy, GroupBuyRegion, Participation, Wishlist, Review, Bid, UserTradeStats
 from .models_region import Region
-from .serializers import CategorySerializer, ProductSerializer, GroupBuySerializer, ParticipationSerializer, WishlistSerializer, ReviewSerializer, BidSerializer
+from .serializers import CategorySerializer, ProductSerializer, GroupBuySerializer, GroupBuyListSerializer, ParticipationSerializer, WishlistSerializer, ReviewSerializer, BidSerializer
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from .utils import update_groupbuy_status
+from .services.groupbuy_list_cache import GroupBuyListCache
+from .services.groupbuy_admission_service import GroupBuyAdmissionService, JoinRejected
+from .services.groupbuy_search import GroupBuySearch
+from .services.region_index import RegionIndex
 import json
 import logging
 
@@ -880,16 +883,37 @@ class GroupBuyViewSet(ModelViewSet):
     queryset = GroupBuy.objects.all()
     permission_classes = [IsAuthenticated]
 
-    def get_queryset(self):
-        queryset = GroupBuy.objects.select_related(
-            'product', 
+    LIST_ACTIONS = ('list', 'popular', 'recent')
+
+    def get_serializer_class(self):
+        if self.action in self.LIST_ACTIONS:
+            return GroupBuyListSerializer
+        return super().get_serializer_class()
+
+    @staticmethod
+    def optimize_list_queryset(queryset):
+        """GroupBuyListSerializer가 추가 쿼리 없이 직렬화할 수 있도록 연관 데이터를 미리 로드"""
+        return queryset.select_related(
+            'product',
             'product__category',
-            'region'
+            # ProductSerializer의 카테고리별 상세 정보
+            'product__telecom_detail',
+            'product__electronics_detail',
+            'product__rental_detail',
+            'product__subscription_detail',
+            'product__standard_detail',
+            'creator',
+            'region',
+            'telecom_detail',
+            'internet_detail',
         ).prefetch_related(
             'product__custom_values',
             'product__custom_values__field',
-            'regions__region'  # 다중 지역 정보 prefetch
-        ).all()
+            'regions__region__parent'  # 다중 지역 정보 prefetch
+        )
+
+    def get_queryset(self):
+        queryset = self.optimize_list_queryset(GroupBuy.objects.all())
         status_param = self.request.query_params.get('status', None)
         category_id = self.request.query_params.get('category', None)
         sort_param = self.request.query_params.get('sort', None)
@@ -955,7 +979,6 @@ class GroupBuyViewSet(ModelViewSet):
                 int(category_id)
                 queryset = queryset.filter(product__category_id=category_id)
                 # 카테고리 이름 가져오기
-                from api.models_product import Category
                 cat_obj = Category.objects.filter(id=category_id).first()
                 if cat_obj:
                     category = cat_obj.name
@@ -1144,60 +1167,24 @@ class GroupBuyViewSet(ModelViewSet):
                 queryset = queryset.filter(seller_completed=False)
         
         # 통합 검색 처리
+        # 제목, 상품명, 지역명, 통신사, 설명을 합친 검색 문서(search_document)에서 부분 일치 검색
         if search:
-            # 제목, 상품명, 지역명, 통신사 등 여러 필드에서 검색
-            queryset = queryset.filter(
-                Q(title__icontains=search) |  # 공구 제목
-                Q(product__name__icontains=search) |  # 상품명
-                Q(product_name__icontains=search) |  # 백업된 상품명
-                Q(regions__region__name__icontains=search) |  # 지역명
-                Q(region__name__icontains=search) |  # 단일 지역명
-                Q(region_name__icontains=search) |  # 백업 지역명
-                Q(telecom_detail__telecom_carrier__icontains=search) |  # 통신사
-                Q(description__icontains=search)  # 설명
-            ).distinct()
+            queryset = GroupBuySearch.filter(queryset, search)
         
         # 지역 검색 처리
+        # 지역명(시/도 또는 시/군/구 이름)에 검색어가 포함된 공구, 전국 비대면 공구는 제외
         if region_search:
-            # 지역명으로 검색 (시/도 또는 시/군/구 이름 포함)
-            # 1. 전국 비대면 공구는 제외
-            # 2. 지역 이름에 검색어가 포함된 공구 필터링
-            queryset = queryset.filter(
-                Q(regions__region__name__icontains=region_search) |  # GroupBuyRegion을 통해 Region의 name 검색
-                Q(region__name__icontains=region_search) |  # 직접 연결된 region의 name 검색
-                Q(region_name__icontains=region_search)  # 구 region_name 필드 (호환성)
-            ).exclude(region_type='nationwide').distinct()  # 전국 비대면 제외 및 중복 제거
+            queryset = GroupBuySearch.filter_region(queryset, region_search)
         
         # 내지역 필터 처리 (정확한 지역 매칭 + 하위 지역 포함)
         if region:
-            # 상위 지역(시/도)인 경우 하위 지역도 포함
-            from api.models import Region
-            
-            # 입력된 지역이 상위 지역인지 확인
-            parent_region = Region.objects.filter(
-                name=region,
-                parent_id__isnull=True  # parent_id가 null이면 상위 지역
-            ).first()
-            
-            if parent_region:
-                # 상위 지역인 경우: 해당 지역과 모든 하위 지역 포함
-                sub_regions = Region.objects.filter(parent_id=parent_region.pk)
-                region_ids = [parent_region.pk] + list(sub_regions.values_list('pk', flat=True))
-                
-                queryset = queryset.filter(
-                    Q(regions__region_id__in=region_ids) |  # 해당 지역 및 하위 지역
-                    Q(region_id__in=region_ids) |  # 직접 연결된 region
-                    Q(region_type='nationwide')  # 전국 비대면 공구도 포함
-                ).distinct()
-            else:
-                # 하위 지역이거나 정확한 매칭
-                queryset = queryset.filter(
-                    Q(regions__region__name=region) |  # GroupBuyRegion을 통한 정확한 매칭
-                    Q(regions__region__full_name=region) |  # full_name으로도 매칭
-                    Q(region__name=region) |  # 직접 연결된 region의 정확한 매칭
-                    Q(region_name=region) |  # 백업 지역명 정확한 매칭
-                    Q(region_type='nationwide')  # 전국 비대면 공구도 포함
-                ).distinct()
+            # 상위 지역(시/도)이면 모든 하위 지역, 아니면 name/full_name이 일치하는 지역과 그 하위 지역
+            # 이름 → 코드는 프로세스 내 인덱스로 찾고 하위 지역은 RegionClosure 조인으로 처리 (요청마다 Region 조회 없음)
+            region_codes = RegionIndex.top_level_codes(region) or RegionIndex.exact_codes(region)
+            region_filter = Q(region_name=region) | Q(region_type='nationwide')  # 백업 지역명, 전국 비대면 공구도 포함
+            if region_codes:
+                region_filter |= RegionIndex.region_q(region_codes, GroupBuyRegion, 'groupbuy')
+            queryset = queryset.filter(region_filter)
             
         # 인터넷/인터넷+TV 카테고리의 경우 최고 지원금 순으로 정렬
         if category in ['인터넷', '인터넷+TV', 'internet', 'internet_tv']:
@@ -1241,10 +1228,12 @@ class GroupBuyViewSet(ModelViewSet):
                 # 최신순 (기본 정렬)
                 queryset = queryset.order_by('-start_time')
         
-        # 공구 상태 자동 업데이트 (최대 100개까지만 처리)
-        for groupbuy in queryset[:100]:
-            update_groupbuy_status(groupbuy)
-
+        # 랭킹 검색 모드: 검색어와의 관련도 순으로 정렬 (다른 정렬보다 우선)
+        if search and self.request.query_params.get('search_mode') == GroupBuySearch.RANKED_MODE:
+            queryset = GroupBuySearch.rank(queryset, search)
+        
+        # 상태 전환은 run_groupbuy_transitions 워커가 next_deadline 기준으로 처리
+        # 조회 API는 읽기 전용이며, 아직 전환되지 않은 공구는 calculated_status로 보정
         return queryset
         
     def create(self, request, *args, **kwargs):
@@ -1664,63 +1653,31 @@ class GroupBuyViewSet(ModelViewSet):
 
     @action(detail=False)
     def popular(self, request):
-        # 최종선택 이전 상태(recruiting, bidding)인 공구만 필터링
-        popular_groupbuys = GroupBuy.objects.annotate(
-            curent_participants=Count('participation')
-        ).filter(
-            end_time__gt=timezone.now(),
-            status__in=['recruiting', 'bidding']  # 최종선택 이전 상태만
-        ).order_by('-curent_participants')[:3]
-        
-        # 공구 상태 자동 업데이트
-        update_groupbuys_status(popular_groupbuys)
-        
-        serializer = self.get_serializer(popular_groupbuys, many=True)
-        data = serializer.data
-        
-        now = timezone.now()
-        
-        # 계산된 상태 및 남은 시간 추가
-        for item, instance in zip(data, popular_groupbuys):
-            end_time = instance.end_time
-            item['calculated_status'] = instance.status
+        def build():
+            # 최종선택 이전 상태(recruiting, bidding)인 공구만 필터링
+            popular_groupbuys = list(self.optimize_list_queryset(GroupBuy.objects.all()).annotate(
+                curent_participants=Count('participation')
+            ).filter(
+                end_time__gt=timezone.now(),
+                status__in=['recruiting', 'bidding']  # 최종선택 이전 상태만
+            ).order_by('-curent_participants')[:3])
             
-            # 남은 시간 계산 (초 단위)
-            if now < end_time:
-                remaining_seconds = int((end_time - now).total_seconds())
-                item['remaining_seconds'] = remaining_seconds
-            else:
-                item['remaining_seconds'] = 0
+            serializer = self.get_serializer(popular_groupbuys, many=True)
+            return serializer.data, popular_groupbuys
                 
-        return Response(data)
+        return self._cached_list_response(request, 'popular', build)
 
     @action(detail=False)
     def recent(self, request):
-        recent_groupbuys = GroupBuy.objects.filter(
-            end_time__gt=timezone.now()
-        ).order_by('-start_time')[:3]
-        
-        # 공구 상태 자동 업데이트
-        update_groupbuys_status(recent_groupbuys)
-        
-        serializer = self.get_serializer(recent_groupbuys, many=True)
-        data = serializer.data
-        
-        now = timezone.now()
-        
-        # 계산된 상태 및 남은 시간 추가
-        for item, instance in zip(data, recent_groupbuys):
-            end_time = instance.end_time
-            item['calculated_status'] = instance.status
+        def build():
+            recent_groupbuys = list(self.optimize_list_queryset(GroupBuy.objects.all()).filter(
+                end_time__gt=timezone.now()
+            ).order_by('-start_time')[:3])
             
-            # 남은 시간 계산 (초 단위)
-            if now < end_time:
-                remaining_seconds = int((end_time - now).total_seconds())
-                item['remaining_seconds'] = remaining_seconds
-            else:
-                item['remaining_seconds'] = 0
+            serializer = self.get_serializer(recent_groupbuys, many=True)
+            return serializer.data, recent_groupbuys
                 
-        return Response(data)  # Require authentication for creating group buys
+        return self._cached_list_response(request, 'recent', build)  # Require authentication for creating group buys
 
     def update(self, request, *args, **kwargs):
         """공구 정보 업데이트 메서드 - 다중 지역 처리 포함"""
@@ -1961,74 +1918,70 @@ class GroupBuyViewSet(ModelViewSet):
             return [AllowAny()]
         return [IsAuthenticated()]
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # 페이징 적용
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            data = serializer.data
-            now = timezone.now()
-            for item, instance in zip(data, page):
-                # 계산된 상태 추가
-                end_time = instance.end_time
-                if instance.status == 'recruiting' and now > end_time:
-                    if instance.current_participants >= instance.min_participants:
-                        item['calculated_status'] = 'completed'
-                    else:
-                        item['calculated_status'] = 'cancelled'
-                else:
-                    item['calculated_status'] = instance.status
-                # 남은 시간 계산 (초 단위)
-                if now < end_time:
-                    remaining_seconds = int((end_time - now).total_seconds())
-                    item['remaining_seconds'] = remaining_seconds
-                else:
-                    item['remaining_seconds'] = 0
-            return self.get_paginated_response(data)
-        
-        # 페이징이 없는 경우 (기존 로직 유지)
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
-        now = timezone.now()
-        for item, instance in zip(data, queryset):
-            # 계산된 상태 추가
-            end_time = instance.end_time
-            if instance.status == 'recruiting' and now > end_time:
-                if instance.current_participants >= instance.min_participants:
-                    item['calculated_status'] = 'completed'
-                else:
-                    item['calculated_status'] = 'cancelled'
-            else:
-                item['calculated_status'] = instance.status
-            # 남은 시간 계산 (초 단위)
-            if now < end_time:
-                remaining_seconds = int((end_time - now).total_seconds())
-                item['remaining_seconds'] = remaining_seconds
+    @staticmethod
+    def _add_calculated_fields(item, instance, now):
+        """
+        응답 데이터에 calculated_status와 remaining_seconds를 추가합니다.
+        상태 전환 워커가 아직 처리하지 않은 마감 공구도 화면에는 마감 이후 상태로 보이도록 보정합니다.
+        """
+        end_time = instance.end_time
+        if instance.status == 'recruiting' and now > end_time:
+            if instance.current_participants >= instance.min_participants:
+                item['calculated_status'] = 'completed'
             else:
-                item['remaining_seconds'] = 0
+                item['calculated_status'] = 'cancelled'
+        else:
+            item['calculated_status'] = instance.status
+
+        # 남은 시간 계산 (초 단위)
+        if now < end_time:
+            item['remaining_seconds'] = int((end_time - now).total_seconds())
+        else:
+            item['remaining_seconds'] = 0
+
+    def _cached_list_response(self, request, cache_action, build):
+        """
+        공구 목록 응답 캐시 처리
+        build()는 (응답 데이터, 공구 인스턴스 목록)을 반환합니다.
+        calculated_status / remaining_seconds는 캐시 여부와 관계없이 응답 시점에 계산합니다.
+        """
+        cache_key = GroupBuyListCache.build_key(request, cache_action)
+        cached = GroupBuyListCache.get(cache_key)
+        if cached is None:
+            data, states = build()
+            GroupBuyListCache.set(cache_key, data, states)
+        else:
+            data, states = cached['data'], cached['states']
+
+        items = data['results'] if isinstance(data, dict) else data
+        now = timezone.now()
+        for item, state in zip(items, states):
+            self._add_calculated_fields(item, state, now)
         return Response(data)
 
+    def list(self, request, *args, **kwargs):
+        def build():
+            queryset = self.filter_queryset(self.get_queryset())
+            
+            # 페이징 적용
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data).data, page
+            
+            # 페이징이 없는 경우 (기존 로직 유지)
+            instances = list(queryset)
+            serializer = self.get_serializer(instances, many=True)
+            return serializer.data, instances
+
+        return self._cached_list_response(request, 'list', build)
+
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        update_groupbuy_status(instance)
         serializer = self.get_serializer(instance)
         data = serializer.data
         now = timezone.now()
-        end_time = instance.end_time
-        if instance.status == 'recruiting' and now > end_time:
-            if instance.current_participants >= instance.min_participants:
-                data['calculated_status'] = 'completed'
-            else:
-                data['calculated_status'] = 'cancelled'
-        else:
-            data['calculated_status'] = instance.status
-        if now < end_time:
-            remaining_seconds = int((end_time - now).total_seconds())
-            data['remaining_seconds'] = remaining_seconds
-        else:
-            data['remaining_seconds'] = 0
+        self._add_calculated_fields(data, instance, now)
         
         # 입찰 정보 추가 (최종선택중인 경우)
         if instance.status in ['final_selection', 'seller_confirmation', 'completed', 'final_selection_buyers', 'final_selection_seller', 'in_progress']:
@@ -3020,7 +2973,7 @@ class GroupBuyViewSet(ModelViewSet):
     @action(detail=True, methods=['post'])
     def join(self, request, pk=None):
         """사용자가 공구에 참여하는 API"""
-        from django.db import transaction, IntegrityError
+        from django.db import IntegrityError
         from django.core.exceptions import ValidationError
         
         groupbuy = self.get_object()
@@ -3034,67 +2987,24 @@ class GroupBuyViewSet(ModelViewSet):
             user.save(update_fields=['username'])
             logger.info(f"사용자({user.id}) 닉네임이 '{username}'으로 업데이트되었습니다.")
         
-        # 이미 참여 중인지 확인
-        if Participation.objects.filter(user=user, groupbuy=groupbuy).exists():
-            return Response(
-                {'error': '이미 참여 중인 공구입니다.'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # 동일 상품의 다른 공구에 참여 중인지 확인
-        if Participation.objects.filter(
-            user=user,
-            groupbuy__product=groupbuy.product,
-            groupbuy__status__in=['recruiting', 'bidding']
-        ).exists():
-            return Response(
-                {'error': '이미 동일한 상품의 다른 공구에 참여중입니다.'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # 공구 상태 확인 - recruiting 또는 bidding 상태에서만 참여 가능
-        now = timezone.now()
-        if groupbuy.status not in ['recruiting', 'bidding'] or now > groupbuy.end_time:
-            return Response(
-                {'error': '참여할 수 없는 공구입니다. 모집이 종료되었거나 마감되었습니다.'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # 최대 참여자 수 확인 (최신 데이터로 다시 확인)
-        groupbuy.refresh_from_db()
-        if groupbuy.current_participants >= groupbuy.max_participants:
-            return Response(
-                {'error': '최대 참여자 수에 도달했습니다.'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
         try:
-            # 트랜잭션으로 참여 생성 및 참여자 수 업데이트를 원자적으로 처리
-            with transaction.atomic():
-                # 참여 생성
-                participation = Participation.objects.create(
-                    user=user,
-                    groupbuy=groupbuy,
-                    is_leader=False  # 일반 참여자
-                )
-                
-                # 현재 참여자 수 증가 (F 표현식 사용하여 race condition 방지)
-                GroupBuy.objects.filter(pk=groupbuy.id).update(
-                    current_participants=F('current_participants') + 1
-                )
-                
-                # 최신 데이터로 갱신
-                groupbuy.refresh_from_db()
-                
+            # 중복 참여 확인 + 조건부 자리 예약 + 참여 생성을 한 트랜잭션에서 처리 (정원 초과 방지)
+            participation, current_participants = GroupBuyAdmissionService.join(user, groupbuy)
+
             return Response({
                 'id': participation.id,
                 'user_id': user.id,
                 'groupbuy_id': groupbuy.id,
                 'joined_at': participation.joined_at,
-                'current_participants': groupbuy.current_participants,
+                'current_participants': current_participants,
                 'message': '공구 참여가 완료되었습니다.'
             }, status=status.HTTP_201_CREATED)
             
+        except JoinRejected as e:
+            return Response(
+                {'error': str(e)}, 
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except ValidationError as e:
             return Response(
                 {'error': str(e)}, 
@@ -3458,10 +3368,14 @@ class GroupBuyViewSet(ModelViewSet):
         try:
             with transaction.atomic():
                 # 기존 낙찰 취소
+                previous_sellers = list(
+                    Bid.objects.filter(groupbuy=groupbuy, is_selected=True).values_list('seller_id', flat=True)
+                )
                 Bid.objects.filter(groupbuy=groupbuy, is_selected=True).update(
                     is_selected=False,
                     status='pending'
                 )
+                UserTradeStats.recompute(previous_sellers)
                 
                 # 새로운 낙찰자 선정
                 bid = Bid.objects.get(id=bid_id, groupbuy=groupbuy)
@@ -2,10 +2,10 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from .models import Bid, Settlement, GroupBuy, BidToken
+from .models import Bid, Settlement, GroupBuy, BidTokenBalance, UserTradeStats
 from .serializers_bid import BidSerializer, SettlementSerializer
 from django.shortcuts import get_object_or_404
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 from django.core.exceptions import ValidationError
@@ -109,49 +109,17 @@ class BidViewSet(viewsets.ModelViewSet):
         견적 수정 시에도 견적티켓을 소모함 (기획 요구사항)
         """
         user = self.request.user
-        now = timezone.now()
         
         # 견적 수정 시에도 견적티켓 소모 (기획 요구사항에 따라 변경)
-        
-        # 무제한 입찰권 확인
-        unlimited_token = BidToken.objects.filter(
-            seller=user,
-            token_type='unlimited',
-            status='active',
-            expires_at__gt=now
-        ).first()
-        
-        if unlimited_token:
-            # 무제한 입찰권이 있으면 입찰권을 소비하지 않고 무제한 입찰권 정보만 추가
-            bid = serializer.save(seller=user, bid_token=unlimited_token)
-            # 무제한 입찰권은 소비하지 않지만 추적을 위해 used_for 필드는 설정
-            unlimited_token.used_for = bid
-            unlimited_token.save()
-            return
-        
-        # 단품 입찰권 확인
-        # 단품 입찰권은 유효기간이 없거나, 유효기간이 있는 경우 현재 시간보다 훨씬 만료일이 더 나중인 경우
-        single_token = BidToken.objects.filter(
-            seller=user,
-            token_type='single',
-            status='active',
-        ).filter(
-            # 유효기간이 없거나(None) 유효기간이 있는 경우 만료일이 현재보다 더 나중인 경우
-            Q(expires_at__isnull=True) | Q(expires_at__gt=now)
-        ).first()
-        
-        # 입찰권이 없으면 오류 발생
-        if not single_token:
-            raise ValidationError("사용 가능한 입찰권이 없습니다. 입찰권을 구매하신 후 다시 시도해주세요.")
-        
-        # 입찰권 사용 처리 및 연결
-        # 먼저 입찰을 저장하고, 그 다음에 입찰권을 사용 처리
-        bid = serializer.save(seller=user, bid_token=single_token)
-        
-        # 입찰권 사용 처리 - 실패 시 입찰을 롤백해야 함
-        if not single_token.use(bid):
-            bid.delete()
-            raise ValidationError("입찰권 사용 처리에 실패했습니다.")
+        # 입찰 저장 후 잔액 차감 + 입찰권 사용 처리 + 입찰 연결을 한 문장으로 처리
+        # (무제한 입찰권이 유효하면 소비하지 않고 추적용 used_for만 기록)
+        # 입찰권이 없으면 입찰 저장까지 함께 롤백
+        with transaction.atomic():
+            bid = serializer.save(seller=user)
+            token_id = BidTokenBalance.consume(user.id, bid.id)
+            if token_id is None:
+                raise ValidationError("사용 가능한 입찰권이 없습니다. 입찰권을 구매하신 후 다시 시도해주세요.")
+            bid.bid_token_id = token_id
 
     @action(detail=False, methods=['get'], url_path='seller')
     def seller_bids(self, request):
@@ -466,11 +434,14 @@ class BidViewSet(viewsets.ModelViewSet):
         bid.save()
         
         # 해당 공구의 다른 입찰 자동 포기 처리
-        Bid.objects.filter(
+        other_bids = Bid.objects.filter(
             Q(groupbuy=bid.groupbuy) & 
             ~Q(id=bid.id) & 
             Q(status='pending')
-        ).update(status='rejected')
+        )
+        other_sellers = list(other_bids.values_list('seller_id', flat=True))
+        other_bids.update(status='rejected')
+        UserTradeStats.recompute(other_sellers)
         
         serializer = self.get_serializer(bid)
         return Response(serializer.data)
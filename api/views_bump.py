@@ -10,8 +10,7 @@ from django.db.models import F
 from django.views.decorators.csrf import csrf_exempt
 from datetime import timedelta
 from .models_unified_simple import UnifiedBump
-from used_phones.models import UsedPhone
-from used_electronics.models import UsedElectronics
+from .utils.unified_items import get_item_model
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,21 +26,16 @@ def get_bump_status(request, item_type, item_id):
     """
     try:
         # 상품 존재 여부 확인
-        if item_type == 'phone':
-            item = UsedPhone.objects.filter(id=item_id).first()
-        elif item_type == 'electronics':
-            item = UsedElectronics.objects.filter(id=item_id).first()
-        elif item_type == 'custom_groupbuy':
-            from api.models_custom import CustomGroupBuy
-            item = CustomGroupBuy.objects.filter(id=item_id).first()
-        else:
+        item_model = get_item_model(item_type)
+        if item_model is None:
             return Response({'error': '잘못된 상품 타입입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        item = item_model.objects.filter(id=item_id).first()
 
         if not item:
             return Response({'error': '상품을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        # 본인 상품인지 확인
-        if item.seller.id != request.user.id:
+        # 본인 상품인지 확인 (판매자 조회 없이 FK 값으로 비교)
+        if item.seller_id != request.user.id:
             return Response({'error': '본인의 상품만 끌올할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
 
         # 활성 상태 확인
@@ -119,21 +113,16 @@ def perform_bump(request, item_type, item_id):
     """
     try:
         # 상품 조회
-        if item_type == 'phone':
-            item = UsedPhone.objects.filter(id=item_id).first()
-        elif item_type == 'electronics':
-            item = UsedElectronics.objects.filter(id=item_id).first()
-        elif item_type == 'custom_groupbuy':
-            from api.models_custom import CustomGroupBuy
-            item = CustomGroupBuy.objects.filter(id=item_id).first()
-        else:
+        item_model = get_item_model(item_type)
+        if item_model is None:
             return Response({'error': '잘못된 상품 타입입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        item = item_model.objects.filter(id=item_id).first()
 
         if not item:
             return Response({'error': '상품을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        # 본인 상품인지 확인
-        if item.seller.id != request.user.id:
+        # 본인 상품인지 확인 (판매자 조회 없이 FK 값으로 비교)
+        if item.seller_id != request.user.id:
             return Response({'error': '본인의 상품만 끌올할 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
 
         # 활성 상태 확인
@@ -176,31 +165,14 @@ def perform_bump(request, item_type, item_id):
 
         # 상품 업데이트
         now = timezone.now()
-        if item_type == 'phone':
-            UsedPhone.objects.filter(id=item_id).update(
-                last_bumped_at=now,
-                bump_count=F('bump_count') + 1
-            )
-        elif item_type == 'electronics':
-            UsedElectronics.objects.filter(id=item_id).update(
-                last_bumped_at=now,
-                bump_count=F('bump_count') + 1
-            )
-        elif item_type == 'custom_groupbuy':
-            from api.models_custom import CustomGroupBuy
-            CustomGroupBuy.objects.filter(id=item_id).update(
-                last_bumped_at=now,
-                bump_count=F('bump_count') + 1
-            )
-
-        # 업데이트된 상품 정보 다시 조회
-        if item_type == 'phone':
-            item = UsedPhone.objects.get(id=item_id)
-        elif item_type == 'electronics':
-            item = UsedElectronics.objects.get(id=item_id)
-        elif item_type == 'custom_groupbuy':
-            from api.models_custom import CustomGroupBuy
-            item = CustomGroupBuy.objects.get(id=item_id)
+        item_model.objects.filter(id=item_id).update(
+            last_bumped_at=now,
+            effective_date=now,
+            bump_count=F('bump_count') + 1
+        )
+
+        # 업데이트된 끌올 횟수 다시 조회
+        bump_count = item_model.objects.filter(id=item_id).values_list('bump_count', flat=True).get()
 
         return Response({
             'success': True,
@@ -208,7 +180,7 @@ def perform_bump(request, item_type, item_id):
             'bump_type': 'free',
             'remaining_free_bumps_today': 0,
             'next_bump_available_at': (now + timedelta(hours=24)).isoformat(),
-            'total_bump_count': item.bump_count,
+            'total_bump_count': bump_count,
             'bumped_at': now.isoformat()
         })
 
@@ -7,8 +7,7 @@ from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 from functools import wraps
-from .utils import update_groupbuys_status
-from .models import GroupBuy
+from .services.groupbuy_transition_service import GroupBuyTransitionService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -42,27 +41,15 @@ def update_groupbuy_status_cron(request):
     try:
         logger.info("Starting cron job for groupbuy status update")
         
-        # 업데이트가 필요한 공구들 조회 (v3.0: bidding 제거)
-        groupbuys_to_update = GroupBuy.objects.filter(
-            status__in=['recruiting', 'final_selection_buyers', 'final_selection_seller']
-        ).exclude(
-            status='completed'
-        ).exclude(
-            status='cancelled'
-        )
+        # 마감 시간(next_deadline)이 지난 공구만 상태 전환
+        result = GroupBuyTransitionService.process_all_due()
         
-        count = groupbuys_to_update.count()
-        logger.info(f"Found {count} groupbuys to check")
-        
-        # 상태 업데이트 실행
-        updated_count = update_groupbuys_status(groupbuys_to_update)
-        
-        logger.info(f"Updated {updated_count} groupbuys")
+        logger.info(f"Checked {result['processed']} groupbuys, updated {result['transitioned']}")
         
         return JsonResponse({
             'success': True,
-            'checked': count,
-            'updated': updated_count,
+            'checked': result['processed'],
+            'updated': result['transitioned'],
             'timestamp': timezone.now().isoformat()
         })
         
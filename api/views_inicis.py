@@ -16,8 +16,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 
-from api.models import User, BidToken, BidTokenPurchase
+from api.models import User, BidToken
 from api.models_payment import Payment
+from api.services.payment_settlement import PaymentSettlementService
 
 logger = logging.getLogger(__name__)
 
@@ -227,11 +228,8 @@ def verify_inicis_payment(request):
         # 이미 처리된 결제인지 확인
         if payment.status == 'completed':
             # 이미 처리된 결제의 토큰 정보 가져오기
-            is_subscription = '구독' in payment.product_name or 'unlimited' in payment.product_name.lower() or '무제한' in payment.product_name
-            if is_subscription:
-                token_count = 1 if payment.amount >= 59000 else 0
-            else:
-                token_count = int(payment.amount // 1990)
+            is_subscription = PaymentSettlementService.is_subscription(payment)
+            token_count = PaymentSettlementService.token_count(payment)
             
             # 단품 및 구독권 개수 계산
             single_tokens = BidToken.objects.filter(
@@ -471,13 +469,11 @@ def verify_inicis_payment(request):
                     })
             
             # 실시간 결제(카드, 계좌이체, 휴대폰) 처리
-            with transaction.atomic():
-                # Payment 업데이트
-                payment.status = 'completed'
+            # Payment 행 잠금 + 주문번호 멱등성으로 리턴 URL과 동시에 들어와도 한 번만 지급
+            def apply_approval(locked_payment):
                 # authToken이 너무 길므로 order_id를 tid로 사용
-                payment.tid = order_id[:200]  # 200자 제한
-                payment.completed_at = datetime.now()
-                payment.payment_data.update({
+                locked_payment.tid = order_id[:200]  # 200자 제한
+                locked_payment.payment_data.update({
                     'authToken': auth_token,  # 긴 토큰은 JSON 필드에 저장
                     'authResultCode': auth_result_code,
                     'originalTid': tid,
@@ -486,75 +482,17 @@ def verify_inicis_payment(request):
                     'idc_name': data.get('idc_name'),
                     'payMethod': current_pay_method,
                 })
-                payment.save()
-                
-                # 입찰권 지급 - 상품 유형에 따라 처리
-                # productName에서 구독권 여부 확인
-                is_subscription = '구독' in payment.product_name or 'unlimited' in payment.product_name.lower() or '무제한' in payment.product_name
-                
-                logger.info(f"상품명: {payment.product_name}, 구독권 여부: {is_subscription}, 금액: {payment.amount}")
-                
-                subscription_expires_at = None  # 초기화
-                
-                if is_subscription:
-                    # 무제한 구독권 (59,000원)
-                    if payment.amount >= 59000:
-                        # 기존 활성 구독권 확인
-                        existing_subscription = BidToken.objects.filter(
-                            seller=user,
-                            token_type='unlimited',
-                            status='active',
-                            expires_at__gt=datetime.now()  # 아직 만료되지 않은 구독권
-                        ).order_by('-expires_at').first()
-                        
-                        if existing_subscription:
-                            # 기존 구독권이 있으면 그 만료일 이후부터 시작
-                            start_date = existing_subscription.expires_at
-                            expires_at = start_date + timedelta(days=30)
-                            logger.info(f"구독권 추가: {start_date.strftime('%Y-%m-%d %H:%M')} ~ {expires_at.strftime('%Y-%m-%d %H:%M')} (기존 구독 이후)")
-                        else:
-                            # 기존 구독권이 없으면 현재부터 30일
-                            expires_at = datetime.now() + timedelta(days=30)
-                            logger.info(f"구독권 신규 구매: {datetime.now().strftime('%Y-%m-%d %H:%M')} ~ {expires_at.strftime('%Y-%m-%d %H:%M')}")
-                        
-                        new_subscription = BidToken.objects.create(
-                            seller=user,
-                            token_type='unlimited',
-                            expires_at=expires_at
-                        )
-                        token_count = 1
-                        # 응답에 포함할 구독권 정보 저장
-                        subscription_expires_at = expires_at
-                    else:
-                        token_count = 0
-                        logger.warning(f"구독권 결제 금액 부족: {payment.amount}원 < 59,000원")
-                else:
-                    # 단품 입찰권 (1,990원당 1개)
-                    token_count = int(payment.amount // 1990)
-                    if token_count > 0:
-                        # 단품 이용권은 생성일로부터 90일 후 만료
-                        expires_at = datetime.now() + timedelta(days=90)
-                        for _ in range(token_count):
-                            BidToken.objects.create(
-                                seller=user,
-                                token_type='single',
-                                expires_at=expires_at  # 90일 만료
-                            )
-                        logger.info(f"견적이용권 {token_count}개 생성: 만료일 {expires_at.strftime('%Y-%m-%d')}")
-                
-                # BidTokenPurchase 레코드 생성 (구매 내역용)
-                BidTokenPurchase.objects.create(
-                    seller=user,
-                    token_type='unlimited' if is_subscription else 'single',
-                    quantity=1 if is_subscription else token_count,
-                    total_price=payment.amount,
-                    payment_status='completed',
-                    payment_date=datetime.now(),
-                    order_id=order_id,
-                    payment_key=auth_token[:200] if auth_token else None
-                )
-                
-                logger.info(f"이니시스 결제 성공: user={user.id}, order_id={order_id}, amount={payment.amount}, tokens={token_count}")
+            
+            result = PaymentSettlementService.settle(
+                order_id,
+                update=apply_approval,
+                payment_key=auth_token[:200] if auth_token else None
+            )
+            payment = result.payment
+            is_subscription = PaymentSettlementService.is_subscription(payment)
+            token_count = result.token_count
+            subscription_expires_at = result.subscription_expires_at
+            logger.info(f"상품명: {payment.product_name}, 구독권 여부: {is_subscription}, 금액: {payment.amount}")
             
             # 사용자의 현재 총 입찰권 개수 계산
             # 단품 입찰권 개수
@@ -596,6 +534,9 @@ def verify_inicis_payment(request):
             else:
                 message = f'견적이용권 {token_count}개가 구매 완료되었습니다.'
             
+            if not result.settled:
+                message = '이미 처리된 결제입니다.'
+            
             response_data['message'] = message
             
             return Response(response_data)
@@ -678,7 +619,7 @@ def cancel_inicis_payment(request):
                 )
             
             # 입찰권 제거 (상품 유형에 따라 처리)
-            is_subscription = '구독' in payment.product_name or 'unlimited' in payment.product_name.lower() or '무제한' in payment.product_name
+            is_subscription = PaymentSettlementService.is_subscription(payment)
             
             if is_subscription:
                 # 구독권 취소 - 가장 마지막에 구매한 구독권 삭제 (만료일이 가장 늦은 것)
@@ -748,74 +689,19 @@ def inicis_webhook(request):
             tid = data.get('tid')
             
             try:
-                payment = Payment.objects.get(order_id=order_id)
+                def apply_deposit(locked_payment):
+                    locked_payment.tid = tid if tid else locked_payment.tid
+                    locked_payment.payment_data['deposit_confirmed'] = True
+                    locked_payment.payment_data['deposit_confirmed_at'] = datetime.now().isoformat()
                 
-                # waiting_deposit 상태의 결제만 처리
-                if payment.status == 'waiting_deposit':
-                    with transaction.atomic():
-                        # Payment 상태 업데이트
-                        payment.status = 'completed'
-                        payment.tid = tid if tid else payment.tid
-                        payment.completed_at = datetime.now()
-                        payment.payment_data['deposit_confirmed'] = True
-                        payment.payment_data['deposit_confirmed_at'] = datetime.now().isoformat()
-                        payment.save()
-                        
-                        # 입찰권 지급
-                        user = payment.user
-                        is_subscription = '구독' in payment.product_name or 'unlimited' in payment.product_name.lower() or '무제한' in payment.product_name
-                        
-                        if is_subscription:
-                            # 무제한 구독권 (59,000원)
-                            if payment.amount >= 59000:
-                                # 기존 활성 구독권 확인
-                                existing_subscription = BidToken.objects.filter(
-                                    seller=user,
-                                    token_type='unlimited',
-                                    status='active',
-                                    expires_at__gt=datetime.now()
-                                ).order_by('-expires_at').first()
-                                
-                                if existing_subscription:
-                                    # 기존 구독권이 있으면 그 만료일 이후부터 시작
-                                    expires_at = existing_subscription.expires_at + timedelta(days=30)
-                                else:
-                                    # 기존 구독권이 없으면 현재부터 30일
-                                    expires_at = datetime.now() + timedelta(days=30)
-                                
-                                BidToken.objects.create(
-                                    seller=user,
-                                    token_type='unlimited',
-                                    expires_at=expires_at
-                                )
-                                token_count = 1
-                            else:
-                                token_count = 0
-                        else:
-                            # 단품 입찰권 (1,990원당 1개)
-                            token_count = payment.amount // 1990
-                            if token_count > 0:
-                                expires_at = datetime.now() + timedelta(days=90)
-                                for _ in range(int(token_count)):
-                                    BidToken.objects.create(
-                                        seller=user,
-                                        token_type='single',
-                                        expires_at=expires_at  # 90일 만료
-                                    )
-                        
-                        # BidTokenPurchase 레코드 생성 (구매 내역용)
-                        BidTokenPurchase.objects.create(
-                            seller=user,
-                            token_type='unlimited' if is_subscription else 'single',
-                            quantity=1 if is_subscription else int(token_count),
-                            total_price=payment.amount,
-                            payment_status='completed',
-                            payment_date=datetime.now(),
-                            order_id=order_id,
-                            payment_key=payment.tid
-                        )
-                        
-                        logger.info(f"가상계좌 입금 완료: order_id={order_id}, amount={payment.amount}")
+                # waiting_deposit 상태의 결제만 처리 (Payment 행 잠금 + 주문번호 멱등성)
+                result = PaymentSettlementService.settle(
+                    order_id,
+                    allowed_statuses=('waiting_deposit',),
+                    update=apply_deposit
+                )
+                if result.settled:
+                    logger.info(f"가상계좌 입금 완료: order_id={order_id}, amount={result.payment.amount}")
                 
             except Payment.DoesNotExist:
                 logger.error(f"결제 정보를 찾을 수 없음: order_id={order_id}")
@@ -857,58 +743,10 @@ def inicis_return(request):
         # 모바일 결제 성공 시 바로 토큰 발급 처리
         if result_code == '00' and order_id:
             try:
-                # Payment 레코드 조회
-                payment = Payment.objects.get(order_id=order_id)
-                user = payment.user
-                
-                logger.info(f"모바일 결제 성공 처리 시작: payment_id={payment.id}, user_id={user.id}")
-                
-                if payment.status != 'completed':
-                    # 결제 완료 처리
-                    payment.status = 'completed'
-                    payment.completed_at = datetime.now()
-                    payment.save()
-                    
-                    # 토큰 발급
-                    is_subscription = '구독' in payment.product_name or 'unlimited' in payment.product_name.lower() or '무제한' in payment.product_name
-                    
-                    if is_subscription:
-                        # 구독권 (59,000원)
-                        if payment.amount >= 59000:
-                            expires_at = datetime.now() + timedelta(days=30)
-                            BidToken.objects.create(
-                                seller=user,
-                                token_type='unlimited',
-                                expires_at=expires_at
-                            )
-                            token_count = 1
-                        else:
-                            token_count = 0
-                    else:
-                        # 단품 입찰권 (1,990원당 1개)
-                        token_count = payment.amount // 1990
-                        if token_count > 0:
-                            expires_at = datetime.now() + timedelta(days=90)
-                            for _ in range(int(token_count)):
-                                BidToken.objects.create(
-                                    seller=user,
-                                    token_type='single',
-                                    expires_at=expires_at
-                                )
-                    
-                    # BidTokenPurchase 레코드 생성
-                    BidTokenPurchase.objects.create(
-                        seller=user,
-                        token_type='unlimited' if is_subscription else 'single',
-                        quantity=1 if is_subscription else int(token_count),
-                        total_price=payment.amount,
-                        payment_status='completed',
-                        payment_date=datetime.now(),
-                        order_id=order_id,
-                        payment_key=payment.tid or 'mobile_payment'
-                    )
-                    
-                    logger.info(f"모바일 결제 완료 및 토큰 발급: order_id={order_id}, tokens={token_count}")
+                # 결제 완료 처리 및 토큰 발급 (Payment 행 잠금 + 주문번호 멱등성으로 승인 검증과 중복 지급 방지)
+                result = PaymentSettlementService.settle(order_id)
+                if result.settled:
+                    logger.info(f"모바일 결제 완료 및 토큰 발급: order_id={order_id}, tokens={result.token_count}")
                 
             except Payment.DoesNotExist:
                 logger.error(f"결제 정보를 찾을 수 없음: order_id={order_id}")
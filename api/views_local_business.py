@@ -6,7 +6,6 @@ from rest_framework.decorators import action, api_view, permission_classes as pe
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import F
 from django.utils import timezone
 from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
@@ -17,14 +16,14 @@ logger = logging.getLogger(__name__)
 
 from api.models_local_business import (
     LocalBusinessCategory,
-    LocalBusiness,
-    LocalBusinessView
+    LocalBusiness
 )
 from api.serializers_local_business import (
     LocalBusinessCategorySerializer,
     LocalBusinessListSerializer,
     LocalBusinessDetailSerializer
 )
+from api.services.view_counter import ViewCounter
 
 
 class LocalBusinessCategoryViewSet(viewsets.ReadOnlyModelViewSet):
@@ -199,21 +198,9 @@ class LocalBusinessViewSet(viewsets.ModelViewSet):
         """상세 조회 시 조회수 증가"""
         instance = self.get_object()
 
-        # 조회수 증가
-        LocalBusiness.objects.filter(pk=instance.pk).update(
-            view_count=F('view_count') + 1
-        )
-
-        # 조회 로그 기록
-        ip_address = self.get_client_ip(request)
-        LocalBusinessView.objects.create(
-            business=instance,
-            user=request.user if request.user.is_authenticated else None,
-            ip_address=ip_address
-        )
-
-        # 인스턴스 새로고침 (view_count 업데이트 반영)
-        instance.refresh_from_db()
+        # 조회수 증가와 조회 로그는 캐시에 모았다가 flush_view_counts에서 일괄 반영
+        ViewCounter.record_view(instance)
+        ViewCounter.log_business_view(instance, request.user, self.get_client_ip(request))
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
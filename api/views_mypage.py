@@ -9,6 +9,7 @@ from django.db.models import Count, Q, Avg, Sum
 from django.contrib.auth import get_user_model
 from used_phones.models import UsedPhone, UsedPhoneOffer
 from api.models_unified_simple import UnifiedFavorite
+from api.models_user_stats import UserTradeStats
 import logging
 
 User = get_user_model()
@@ -111,49 +112,15 @@ def mypage_update_profile(request):
 @permission_classes([IsAuthenticated])
 def mypage_stats(request):
     """마이페이지 통계 정보 조회"""
-    user = request.user
-    
-    # 판매 통계
-    active_sales = UsedPhone.objects.filter(
-        seller=user,
-        status='active'
-    ).count()
-    
-    trading_sales = UsedPhone.objects.filter(
-        seller=user,
-        status='trading'
-    ).count()
-    
-    completed_sales = UsedPhone.objects.filter(
-        seller=user,
-        status='sold'
-    ).count()
-    
-    # 구매 통계
-    sent_offers = UsedPhoneOffer.objects.filter(
-        buyer=user,
-        status='pending'
-    ).count()
-    
-    accepted_offers = UsedPhoneOffer.objects.filter(
-        buyer=user,
-        status='accepted'
-    ).count()
-    
-    # 찜 통계
-    favorites_count = UnifiedFavorite.objects.filter(
-        user=user,
-        item_type='phone'
-    ).count()
-    
-    # 받은 제안 통계 (판매자인 경우)
-    received_offers_count = 0
-    if hasattr(user, 'used_phones'):
-        user_phones = user.used_phones.filter(status__in=['active', 'trading'])
-        received_offers_count = UsedPhoneOffer.objects.filter(
-            phone__in=user_phones,
-            status='pending'
-        ).count()
+    # 사용자별 거래 통계 한 행에서 조회 (원본 변경 시 신호로 증분 유지)
+    stats = UserTradeStats.for_user(request.user)
+    active_sales = stats.phone_active_count
+    trading_sales = stats.phone_trading_count
+    completed_sales = stats.phone_sold_count
+    received_offers_count = stats.phone_received_offer_count
+    sent_offers = stats.phone_pending_offer_count
+    accepted_offers = stats.phone_accepted_offer_count
+    favorites_count = stats.phone_favorite_count
     
     stats_data = {
         'sales': {
@@ -1,5 +1,6 @@
 from rest_framework import generics, permissions, status
-from rest_framework.decorators import api_view, permission_classes, authentication_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes, renderer_classes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from rest_framework_simplejwt.authentication import JWTAuthentication
@@ -7,12 +8,8 @@ from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.db.models import Q, Sum, Count
-from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from datetime import datetime, timedelta
-import csv
-import io
-import xlsxwriter
 
 from .models_partner import (
     Partner, ReferralRecord, PartnerSettlement, 
@@ -24,6 +21,8 @@ from .serializers_partner import (
     PartnerLinkSerializer, PartnerNotificationSerializer,
     ExportDataSerializer, PartnerAccountSerializer, PartnerAccountUpdateSerializer
 )
+from .services.partner_stats import PartnerStats
+from .utils.streaming_export import export_response
 from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
@@ -122,29 +121,9 @@ def partner_login(request):
 def dashboard_summary(request):
     """대시보드 요약 정보"""
     partner = request.user.partner_profile
-    now = timezone.now()
     
-    # 이번달 신규 가입자 수
-    monthly_signup = partner.referral_records.filter(
-        created_at__year=now.year,
-        created_at__month=now.month
-    ).count()
-    
-    # 활성 구독자 수
-    active_subscribers = partner.get_active_subscribers()
-    
-    # 이번달 수익
-    monthly_revenue = partner.get_monthly_revenue(now.year, now.month)
-    
-    # 정산 가능 금액
-    available_settlement = partner.get_available_settlement_amount()
-    
-    data = {
-        'monthly_signup': monthly_signup,
-        'active_subscribers': active_subscribers,
-        'monthly_revenue': monthly_revenue,
-        'available_settlement': available_settlement
-    }
+    # 이번달 가입자/활성 구독자/이번달 수익/정산 가능 금액을 한 번에 집계 (파트너별 캐시)
+    data = PartnerStats.summary(partner)
     
     serializer = DashboardSummarySerializer(data)
     return Response(serializer.data)
@@ -280,9 +259,25 @@ def request_settlement(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class _ExportFormatRenderer(JSONRenderer):
+    """
+    ?format=csv/excel 요청이 DRF 렌더러 선택 단계에서 404가 되지 않도록 등록하는 렌더러
+    (파일은 뷰가 직접 응답하고, 검증 오류 응답만 JSON으로 렌더링)
+    """
+
+
+class _CSVFormatRenderer(_ExportFormatRenderer):
+    format = 'csv'
+
+
+class _ExcelFormatRenderer(_ExportFormatRenderer):
+    format = 'excel'
+
+
 @api_view(['GET'])
 @authentication_classes([JWTAuthentication])
 @permission_classes([IsPartner])
+@renderer_classes([JSONRenderer, _CSVFormatRenderer, _ExcelFormatRenderer])
 def export_data(request):
     """데이터 내보내기"""
     partner = request.user.partner_profile
@@ -308,108 +303,62 @@ def export_data(request):
     if status_filter and status_filter != 'all':
         queryset = queryset.filter(subscription_status=status_filter)
     
-    # 개인정보 마스킹된 데이터 생성
-    records = []
-    for record in queryset.order_by('-created_at'):
-        # 이름 마스킹
-        name = record.referred_user.nickname or record.referred_user.username
-        if len(name) > 1:
-            masked_name = name[0] + "○" * (len(name) - 2) + (name[-1] if len(name) > 2 else "")
-        else:
-            masked_name = name
-        
-        # 전화번호 마스킹
-        phone = record.referred_user.phone_number or ""
-        if len(phone) >= 11:
-            masked_phone = phone[:3] + "-****-" + phone[-4:]
-        else:
-            masked_phone = phone
-        
-        records.append({
-            '가입일자': record.created_at.strftime('%Y.%m.%d'),
-            '회원정보': masked_name,
-            '전화번호': masked_phone,
-            '구독권': '✓' if record.subscription_status == 'active' else '✗',
-            '구독금액': f"{record.subscription_amount:,}원" if record.subscription_amount else '-',
-            '견적티켓': f"{record.ticket_count}개" if record.ticket_count else '-',
-            '티켓금액': f"{record.ticket_amount:,}원" if record.ticket_amount else '-',
-            '총 결제': f"{record.total_amount:,}원",
-            '예정수수료': f"{record.commission_amount:,}원",
-            '상태': {'active': '활성', 'cancelled': '해지', 'paused': '휴면'}.get(
-                record.subscription_status, record.subscription_status
-            )
-        })
-    
-    # 파일 생성
-    if export_format == 'csv':
-        return _generate_csv_response(records, partner.partner_name)
-    else:
-        return _generate_excel_response(records, partner.partner_name)
+    # 행을 리스트로 모으지 않고 나눠 읽으면서 바로 파일로 기록
+    return export_response(
+        queryset.order_by('-created_at'),
+        REFERRAL_EXPORT_FIELDS,
+        REFERRAL_EXPORT_HEADERS,
+        filename=f"{partner.partner_name}_referral_data",
+        export_format=export_format,
+        format_row=_format_referral_row,
+        sheet_name='추천회원데이터'
+    )
 
 
-def _generate_csv_response(records, partner_name):
-    """CSV 파일 생성"""
-    response = HttpResponse(content_type='text/csv; charset=utf-8')
-    response['Content-Disposition'] = f'attachment; filename="{partner_name}_referral_data.csv"'
-    
-    # UTF-8 BOM 추가 (Excel에서 한글이 깨지지 않도록)
-    response.write('\ufeff')
-    
-    writer = csv.writer(response)
-    
-    if records:
-        # 헤더 작성
-        writer.writerow(records[0].keys())
-        
-        # 데이터 작성
-        for record in records:
-            writer.writerow(record.values())
-    
-    return response
+REFERRAL_EXPORT_FIELDS = (
+    'created_at', 'referred_user__nickname', 'referred_user__username', 'referred_user__phone_number',
+    'subscription_status', 'subscription_amount', 'ticket_count', 'ticket_amount',
+    'total_amount', 'commission_amount',
+)
 
+REFERRAL_EXPORT_HEADERS = (
+    '가입일자', '회원정보', '전화번호', '구독권', '구독금액', '견적티켓', '티켓금액', '총 결제', '예정수수료', '상태',
+)
 
-def _generate_excel_response(records, partner_name):
-    """Excel 파일 생성"""
-    output = io.BytesIO()
-    workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-    worksheet = workbook.add_worksheet('추천회원데이터')
-    
-    # 스타일 정의
-    header_format = workbook.add_format({
-        'bold': True,
-        'bg_color': '#D7E4BD',
-        'border': 1
-    })
-    
-    cell_format = workbook.add_format({
-        'border': 1
-    })
-    
-    if records:
-        # 헤더 작성
-        headers = list(records[0].keys())
-        for col, header in enumerate(headers):
-            worksheet.write(0, col, header, header_format)
-        
-        # 데이터 작성
-        for row, record in enumerate(records, 1):
-            for col, value in enumerate(record.values()):
-                worksheet.write(row, col, value, cell_format)
-        
-        # 열 너비 자동 조정
-        for col, header in enumerate(headers):
-            max_length = max(len(str(header)), 15)
-            worksheet.set_column(col, col, max_length)
-    
-    workbook.close()
-    
-    response = HttpResponse(
-        output.getvalue(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename="{partner_name}_referral_data.xlsx"'
-    
-    return response
+REFERRAL_STATUS_LABELS = {'active': '활성', 'cancelled': '해지', 'paused': '휴면'}
+
+
+def _mask_name(name):
+    """이름 마스킹"""
+    if len(name) > 1:
+        return name[0] + "○" * (len(name) - 2) + (name[-1] if len(name) > 2 else "")
+    return name
+
+
+def _mask_phone(phone):
+    """전화번호 마스킹"""
+    phone = phone or ""
+    if len(phone) >= 11:
+        return phone[:3] + "-****-" + phone[-4:]
+    return phone
+
+
+def _format_referral_row(row):
+    """REFERRAL_EXPORT_FIELDS 순서의 values_list 행을 개인정보 마스킹된 출력 행으로 변환"""
+    (created_at, nickname, username, phone, subscription_status, subscription_amount,
+     ticket_count, ticket_amount, total_amount, commission_amount) = row
+    return [
+        created_at.strftime('%Y.%m.%d'),
+        _mask_name(nickname or username),
+        _mask_phone(phone),
+        '✓' if subscription_status == 'active' else '✗',
+        f"{subscription_amount:,}원" if subscription_amount else '-',
+        f"{ticket_count}개" if ticket_count else '-',
+        f"{ticket_amount:,}원" if ticket_amount else '-',
+        f"{total_amount:,}원",
+        f"{commission_amount:,}원",
+        REFERRAL_STATUS_LABELS.get(subscription_status, subscription_status),
+    ]
 
 
 class PartnerNotificationListView(generics.ListAPIView):
@@ -464,29 +413,11 @@ def statistics(request):
     partner = request.user.partner_profile
     period = request.query_params.get('period', 'month')
     
-    now = timezone.now()
     stats = []
     
     if period == 'month':
-        # 최근 12개월 데이터
-        for i in range(11, -1, -1):
-            month_start = (now - timedelta(days=30*i)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            if i == 0:
-                month_end = now
-            else:
-                month_end = (now - timedelta(days=30*(i-1))).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            
-            records = partner.referral_records.filter(
-                created_at__gte=month_start,
-                created_at__lt=month_end
-            )
-            
-            stats.append({
-                'period': month_start.strftime('%Y-%m'),
-                'signup_count': records.count(),
-                'revenue': records.aggregate(Sum('commission_amount'))['commission_amount__sum'] or 0,
-                'subscription_count': records.filter(subscription_status='active').count()
-            })
+        # 최근 12개월 데이터 (달력 월 기준, 한 번에 집계 후 파트너별 캐시)
+        stats = PartnerStats.monthly(partner)
     
     return Response(stats)
 
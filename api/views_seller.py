@@ -3,11 +3,11 @@
 """
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from django.db.models import Q, Count
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from .models import Bid, GroupBuy, BidToken, BidTokenPurchase, Settlement
+from .models import Bid, GroupBuy, BidToken, BidTokenPurchase, Settlement, UserTradeStats
+from .services.seller_summary import SellerSummary
 from django.utils import timezone
 from django.db import transaction
 from django.contrib.auth import get_user_model
@@ -41,57 +41,10 @@ class SellerProfileView(APIView):
         #         status=status.HTTP_403_FORBIDDEN
         #     )
         
-        # 활성 견적 제안 수 계산 (제안기록 - 모든 제안)
-        active_bids = Bid.objects.filter(seller=user).count()
-        
-        # 선택 대기 중인 견적 수 계산 (최종선택 대기중 - 선정되어 판매자 최종선택이 필요한 견적)
-        pending_selection = Bid.objects.filter(
-            seller=user,
-            status='selected',  # 선정된 견적만
-            final_decision='pending',  # 판매자가 아직 최종선택하지 않음
-            groupbuy__status='final_selection_seller'  # 판매자 최종선택 단계
-        ).count()
-        
-        # 판매 확정 대기 중인 건 수 계산 (판매 확정했지만 아직 거래 완료하지 않은 것)
-        # Settlement이 없거나 pending인 경우
-        pending_sales = Bid.objects.filter(
-            seller=user, 
-            status='selected',  # 선정된 견적
-            final_decision='confirmed',  # 판매자가 판매 확정한 것
-            groupbuy__status='completed'  # 공구가 완료된 상태
-        ).exclude(
-            settlement__payment_status='completed'  # 정산 완료된 것은 제외
-        ).count()
-        
-        # 판매 완료 건 수 계산 (거래 완료 - Settlement이 completed인 것)
-        completed_sales = Settlement.objects.filter(
-            seller=user,
-            payment_status='completed'  # 정산 완료
-        ).count()
-        
-        # 판매자 평점 계산 (리뷰가 있는 경우)
-        rating = 0
-        if hasattr(user, 'reviews_received'):
-            reviews = user.reviews_received.all()
-            if reviews.exists():
-                rating = sum(review.rating for review in reviews) / reviews.count()
-        
-        # 남은 제안권 및 무제한 제안권 여부 (실제 데이터)
+        # 견적/정산/제안권/평점 요약 (모델별 집계 1회, 짧은 TTL 캐시)
+        summary = SellerSummary.get(user)
         now = timezone.now()
         
-        # 활성 상태의 제안권 필터링
-        active_tokens = BidToken.objects.filter(
-            seller=user, 
-            status='active',
-            expires_at__gt=now
-        )
-        
-        # 기본 제안권 개수
-        remaining_bids = active_tokens.filter(token_type='single').count()
-        
-        # 무제한 제안권 보유 여부
-        has_unlimited_bids = active_tokens.filter(token_type='unlimited').exists()
-        
         # 응답 데이터 구성
         data = {
             "name": user.get_full_name() or user.username,
@@ -114,13 +67,13 @@ class SellerProfileView(APIView):
             } if user.address_region else None,
             "profileImage": user.profile_image if hasattr(user, 'profile_image') and user.profile_image else None,
             "isVip": hasattr(user, 'userprofile') and user.userprofile.is_vip,
-            "rating": rating,
-            "activeBids": active_bids,
-            "pendingSelection": pending_selection,
-            "pendingSales": pending_sales,
-            "completedSales": completed_sales,
-            "remainingBids": remaining_bids,
-            "hasUnlimitedBids": has_unlimited_bids,
+            "rating": summary['rating'],
+            "activeBids": summary['active_bids'],
+            "pendingSelection": summary['pending_selection'],
+            "pendingSales": summary['pending_sales'],
+            "completedSales": summary['completed_sales'],
+            "remainingBids": summary['single_tokens'],
+            "hasUnlimitedBids": summary['has_unlimited'],
             "notificationEnabled": True  # 기본값
         }
         
@@ -460,28 +413,11 @@ def get_bid_tokens(request):
     # 현재 시간
     now = timezone.now()
     
-    # 활성 상태의 입찰권 필터링
-    active_tokens = BidToken.objects.filter(
-        seller=user, 
-        status='active',
-    )
-    
-    # 유효한 토큰만 필터링 (만료일이 없거나 현재 시간보다 미래인 경우)
-    valid_tokens = active_tokens.filter(Q(expires_at__isnull=True) | Q(expires_at__gt=now))
-    
-    # 제안권 타입별 집계
-    single_tokens = valid_tokens.filter(token_type='single').count()
-    
-    # 무제한 구독권 확인
-    unlimited_subscription = False
-    unlimited_expires_at = None
-    
-    # 가장 만료일이 늦은 무제한 구독권 찾기
-    latest_unlimited = valid_tokens.filter(token_type='unlimited').order_by('-expires_at').first()
-    
-    if latest_unlimited:
-        unlimited_subscription = True
-        unlimited_expires_at = latest_unlimited.expires_at
+    # 제안권 집계 (유효한 제안권: 활성 상태이고 만료일이 없거나 현재 시간보다 미래)
+    summary = SellerSummary.get(user)
+    single_tokens = summary['single_tokens']
+    unlimited_subscription = summary['has_unlimited']
+    unlimited_expires_at = summary['unlimited_expires_at']
     
     # 최근 구매 내역
     recent_purchases = BidTokenPurchase.objects.filter(
@@ -500,42 +436,31 @@ def get_bid_tokens(request):
     } for purchase in recent_purchases]
     
     # 만료 예정 토큰 정보 추가 (만료 7일 전부터 표시 - 90일 토큰은 83일차부터)
+    # 무제한 구독권은 개별로, 개별 토큰은 만료일별 수량으로 표시
     expiring_tokens = []
-    expiring_date = now + timezone.timedelta(days=7)
-    
-    # 7일 이내에 만료 예정인 무제한 구독권
-    expiring_unlimited = valid_tokens.filter(
-        token_type='unlimited',
-        expires_at__lte=expiring_date,
-        expires_at__gt=now
-    )
-    
-    for token in expiring_unlimited:
-        days_remaining = (token.expires_at - now).days
-        expiring_tokens.append({
-            'id': token.id,
-            'type': 'unlimited',
-            'type_display': '견적 이용권',
-            'expires_at': token.expires_at,
-            'days_remaining': days_remaining,
-            'quantity': 1
-        })
-    
-    # 7일 이내에 만료 예정인 개별 토큰들
-    expiring_singles = valid_tokens.filter(
-        token_type='single',
-        expires_at__lte=expiring_date,
-        expires_at__gt=now
-    ).values('expires_at').annotate(count=Count('id')).order_by('expires_at')
+    expiring_singles = {}
+    for token_id, token_type, expires_at in summary['expiring_tokens']:
+        if expires_at <= now:
+            continue
+        if token_type == 'unlimited':
+            expiring_tokens.append({
+                'id': token_id,
+                'type': 'unlimited',
+                'type_display': '견적 이용권',
+                'expires_at': expires_at,
+                'days_remaining': (expires_at - now).days,
+                'quantity': 1
+            })
+        else:
+            expiring_singles[expires_at] = expiring_singles.get(expires_at, 0) + 1
     
-    for item in expiring_singles:
-        days_remaining = (item['expires_at'] - now).days
+    for expires_at, count in expiring_singles.items():
         expiring_tokens.append({
             'type': 'single',
             'type_display': '견적 이용권',
-            'expires_at': item['expires_at'],
-            'days_remaining': days_remaining,
-            'quantity': item['count']
+            'expires_at': expires_at,
+            'days_remaining': (expires_at - now).days,
+            'quantity': count
         })
     
     response_data = {
@@ -573,23 +498,22 @@ def get_bid_summary(request):
     #         status=status.HTTP_403_FORBIDDEN
     #     )
     
+    stats = UserTradeStats.for_user(user)
+
     # 전체 제안 수
-    total_bids = Bid.objects.filter(seller=user).count()
+    total_bids = stats.bid_count
     
     # 활성화된 제안 수 (pending 상태)
-    active_bids = Bid.objects.filter(seller=user, status='pending').count()
-    
-    # 완료된 제안 수 (confirmed 또는 rejected 상태)
-    completed_bids = Bid.objects.filter(
-        seller=user, 
-        status__in=['confirmed', 'rejected']
-    ).count()
+    active_bids = stats.bid_pending_count
     
-    # 수락된 제안 수 (confirmed 상태)
+    # 수락된 제안 수 (confirmed 상태 - 입찰 상태 값에는 없어 통계에서 집계하지 않음)
     accepted_bids = Bid.objects.filter(seller=user, status='confirmed').count()
     
     # 거절된 제안 수 (rejected 상태)
-    rejected_bids = Bid.objects.filter(seller=user, status='rejected').count()
+    rejected_bids = stats.bid_rejected_count
+    
+    # 완료된 제안 수 (confirmed 또는 rejected 상태)
+    completed_bids = accepted_bids + rejected_bids
     
     data = {
         "totalBids": total_bids,
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.db.models import Avg, Count, Q
 from .models_unified_simple import UnifiedFavorite, UnifiedReview
+from .utils.unified_items import bulk_get_items
 from used_phones.models import UsedPhone, UsedPhoneTransaction, UsedPhoneOffer
 from used_electronics.models import UsedElectronics, ElectronicsTransaction, ElectronicsOffer
 from django.contrib.auth import get_user_model
@@ -95,10 +96,15 @@ def my_favorites(request):
     if item_type != 'all':
         favorites = favorites.filter(item_type=item_type)
 
+    # 상품은 타입별로 한 번에 조회 (이미지 포함)
+    favorites = list(favorites)
+    bulk_get_items(favorites, exclude_status='deleted', select_related=())
+
     result = []
     for favorite in favorites:
         item = favorite.get_item()
         if item:
+            images = list(item.images.all())
             item_data = {
                 'favorite_id': favorite.id,
                 'item_type': favorite.item_type,
@@ -114,7 +120,7 @@ def my_favorites(request):
                     'price': item.price,
                     'status': item.status,
                     'condition_grade': item.condition_grade,
-                    'image_url': item.images.first().image.url if item.images.exists() else None,
+                    'image_url': images[0].image.url if images else None,
                 })
             else:  # electronics
                 item_data.update({
@@ -124,7 +130,7 @@ def my_favorites(request):
                     'price': item.price,
                     'status': item.status,
                     'condition_grade': item.condition_grade,
-                    'image_url': item.images.first().image.url if item.images.exists() else None,
+                    'image_url': images[0].image.url if images else None,
                 })
 
             result.append(item_data)
@@ -206,6 +206,51 @@ DATABASES = {
 }
 
 
+# Cache
+# REDIS_URL이 있으면 Redis(운영), 없으면 프로세스 로컬 메모리(개발/테스트) 사용
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "dungji",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "dungji-default",
+        }
+    }
+
+# 상세 조회수/업체 조회 기록 캐시 버퍼링 (true/false, 미설정 시 REDIS_URL로 공유 캐시를 쓸 때만 버퍼링)
+# 프로세스 로컬 캐시(LocMemCache)에 버퍼링하면 flush_view_counts 명령이 워커의 버퍼를 볼 수 없어 유실됨
+VIEW_COUNT_BUFFERING = {'true': True, 'false': False}.get(os.getenv('VIEW_COUNT_BUFFERING', '').lower())
+
+# 공구 목록(list/popular/recent) 응답 캐시 TTL (초)
+GROUPBUY_LIST_CACHE_TIMEOUT = int(os.getenv('GROUPBUY_LIST_CACHE_TIMEOUT', '30'))
+
+# 판매자 홈 요약(견적/정산/제안권) 캐시 TTL (초)
+SELLER_SUMMARY_CACHE_TIMEOUT = int(os.getenv('SELLER_SUMMARY_CACHE_TIMEOUT', '30'))
+
+# 같은 사용자/공구/알림 타입/메시지의 알림을 중복 생성하지 않는 기간 (초)
+NOTIFICATION_DEDUPE_WINDOW_SECONDS = int(os.getenv('NOTIFICATION_DEDUPE_WINDOW_SECONDS', '600'))
+
+# FCM 푸시 동시 발송 수 (연결 풀 크기와 동일)
+PUSH_MAX_CONCURRENCY = int(os.getenv('PUSH_MAX_CONCURRENCY', '20'))
+
+# 지역 이름 → 코드 인덱스를 워커 프로세스에서 다시 읽는 주기 (초)
+REGION_INDEX_TTL_SECONDS = int(os.getenv('REGION_INDEX_TTL_SECONDS', '3600'))
+
+# 중고거래 목록/상세 조회 시 진단용 COUNT 로그 (요청마다 COUNT 쿼리 2개가 추가되므로 기본 비활성)
+USED_GOODS_DEBUG_COUNTS = os.getenv('USED_GOODS_DEBUG_COUNTS', 'False').lower() == 'true'
+
+# 중고거래 이미지 WebP 변환/업로드 스레드 풀 크기 (프로세스 공용)
+IMAGE_PIPELINE_WORKERS = int(os.getenv('IMAGE_PIPELINE_WORKERS', '4'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -274,6 +319,11 @@ if USE_S3:
     # AWS_DEFAULT_ACL = 'public-read'  # 최신 S3 버킷은 ACL을 지원하지 않는 경우가 많음
     AWS_DEFAULT_ACL = None  # ACL을 사용하지 않도록 설정
     AWS_LOCATION = 'media'
+    # S3 호환 서버(minio 등) 사용 시 엔드포인트 지정 (django-storages와 공용 클라이언트가 함께 사용)
+    AWS_S3_ENDPOINT_URL = os.getenv('AWS_S3_ENDPOINT_URL') or None
+    # 프로세스 공용 S3 클라이언트의 커넥션 풀 크기 / 동시 업로드 수
+    AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv('AWS_S3_MAX_POOL_CONNECTIONS', '50'))
+    AWS_S3_UPLOAD_CONCURRENCY = int(os.getenv('AWS_S3_UPLOAD_CONCURRENCY', '8'))
     
     logger.info(f"Settings: S3 enabled with bucket {AWS_STORAGE_BUCKET_NAME}")
 else:
@@ -18,6 +18,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dungji_market_backend.settings'
 django.setup()
 
 from api.models_region import Region
+from api.services.region_index import RegionIndex
 
 def import_regions_from_csv(csv_file_path, max_level=2):
     """
@@ -149,6 +150,10 @@ if __name__ == "__main__":
         print(f"CSV 파일 경로나 데이터 디렉토리가 지정되지 않았습니다. 기본 경로 사용: {data_dir}")
         import_all_region_files(data_dir, args.max_level)
     print("완료: Region 모델에 지역 데이터가 추가되었습니다.")
+
+    # 지역 필터용 클로저 테이블 재생성
+    closure_count = RegionIndex.rebuild_closure()
+    print(f"지역 클로저 {closure_count}행을 재생성했습니다.")
     
     # Region 모델 확인
     regions_count = Region.objects.count()
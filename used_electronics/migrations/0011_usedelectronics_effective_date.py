@@ -0,0 +1,31 @@
+# 끌올 목록 정렬 기준(effective_date = COALESCE(last_bumped_at, created_at))을 컬럼으로 저장하고
+# (status, effective_date DESC, id DESC) 복합 인덱스 추가 - 목록이 매번 전체 정렬하지 않고 커서 페이지네이션 가능
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+import django.utils.timezone
+
+
+def backfill_effective_date(apps, schema_editor):
+    UsedElectronics = apps.get_model('used_electronics', 'UsedElectronics')
+    UsedElectronics.objects.update(effective_date=Coalesce('last_bumped_at', 'created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('used_electronics', '0010_update_condition_grade_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usedelectronics',
+            name='effective_date',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, verbose_name='목록 정렬 기준'),
+        ),
+        migrations.RunPython(backfill_effective_date, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='usedelectronics',
+            index=models.Index(fields=['status', '-effective_date', '-id'], name='idx_electronics_feed'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# 이미지 파이프라인의 목록용/썸네일 WebP 변형 저장 필드
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('used_electronics', '0011_usedelectronics_effective_date'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='electronicsimage',
+            name='list_image',
+            field=models.ImageField(blank=True, null=True, upload_to='electronics/list/%Y/%m/%d/', verbose_name='목록용 이미지'),
+        ),
+        migrations.AddField(
+            model_name='electronicsimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, null=True, upload_to='electronics/thumbs/%Y/%m/%d/', verbose_name='썸네일'),
+        ),
+    ]
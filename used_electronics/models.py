@@ -6,6 +6,9 @@ from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator, MinLengthValidator
 from api.models import Region
 from django.conf import settings
+from django.utils import timezone
+from api.utils.bump import sync_effective_date
+from api.services.image_pipeline import ImagePipeline
 import logging
 
 User = get_user_model()
@@ -140,6 +143,7 @@ class UsedElectronics(models.Model):
     # ========== 끌올 관련 ==========
     last_bumped_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 끌올')
     bump_count = models.PositiveIntegerField(default=0, verbose_name='끌올 횟수')
+    effective_date = models.DateTimeField(default=timezone.now, editable=False, verbose_name='목록 정렬 기준')  # 마지막 끌올 또는 등록 시각
 
     # ========== 타임스탬프 ==========
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록일')
@@ -155,6 +159,7 @@ class UsedElectronics(models.Model):
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['seller', 'status']),
             models.Index(fields=['subcategory', 'status']),
+            models.Index(fields=['status', '-effective_date', '-id'], name='idx_electronics_feed'),
         ]
 
     def __str__(self):
@@ -164,6 +169,7 @@ class UsedElectronics(models.Model):
         """저장 시 지역명 백업"""
         if self.region:
             self.region_name = str(self.region)
+        sync_effective_date(self, kwargs)
         super().save(*args, **kwargs)
 
     @property
@@ -181,10 +187,19 @@ class ElectronicsImage(models.Model):
     """전자제품 이미지"""
     electronics = models.ForeignKey(UsedElectronics, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='electronics/%Y/%m/%d/', verbose_name='이미지')
+    list_image = models.ImageField(upload_to='electronics/list/%Y/%m/%d/', null=True, blank=True, verbose_name='목록용 이미지')
+    thumbnail = models.ImageField(upload_to='electronics/thumbs/%Y/%m/%d/', null=True, blank=True, verbose_name='썸네일')
     is_primary = models.BooleanField(default=False, verbose_name='대표이미지')
     order = models.IntegerField(default=0, verbose_name='순서')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='업로드일')
 
+    # ImagePipeline 변형별 저장 필드 (파일 필드, URL 필드)
+    IMAGE_VARIANT_FIELDS = {
+        'detail': ('image', None),
+        'list': ('list_image', None),
+        'thumb': ('thumbnail', None),
+    }
+
     class Meta:
         db_table = 'used_electronics_images'
         verbose_name = '전자제품 이미지'
@@ -194,6 +209,12 @@ class ElectronicsImage(models.Model):
     def __str__(self):
         return f"{self.electronics.model_name} - 이미지 {self.order + 1}"
 
+    def save(self, *args, **kwargs):
+        """새 업로드는 WebP 변형(상세/목록/썸네일)으로 변환해 병렬 업로드 후 한 번에 저장"""
+        if self.image and not self.image._committed:
+            ImagePipeline.apply(self)
+        super().save(*args, **kwargs)
+
 
 class ElectronicsOffer(models.Model):
     """전자제품 가격제안"""
@@ -4,12 +4,14 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Count, Exists, OuterRef, Subquery
 from .models import (
     UsedElectronics, ElectronicsRegion, ElectronicsImage,
     ElectronicsOffer, ElectronicsTransaction
 )
 from api.models import Region
-from api.models_unified_simple import UnifiedFavorite
+from api.models_unified_simple import UnifiedFavorite, UnifiedReview
+from api.services.image_pipeline import ImagePipeline
 import logging
 
 User = get_user_model()
@@ -19,21 +21,36 @@ logger = logging.getLogger(__name__)
 class ElectronicsImageSerializer(serializers.ModelSerializer):
     """전자제품 이미지 시리얼라이저"""
     imageUrl = serializers.SerializerMethodField()
+    thumbnailUrl = serializers.SerializerMethodField()
 
     class Meta:
         model = ElectronicsImage
-        fields = ['id', 'image', 'imageUrl', 'is_primary', 'order']
+        fields = ['id', 'image', 'imageUrl', 'thumbnailUrl', 'is_primary', 'order']
         read_only_fields = ['id']
 
-    def get_imageUrl(self, obj):
-        """이미지 URL 반환"""
-        if obj.image:
+    def _file_url(self, file):
+        if file and hasattr(file, 'url'):
             request = self.context.get('request')
-            if request and hasattr(obj.image, 'url'):
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url if hasattr(obj.image, 'url') else None
+            if request:
+                return request.build_absolute_uri(file.url)
+            return file.url
         return None
 
+    def get_imageUrl(self, obj):
+        """이미지 URL 반환"""
+        return self._file_url(obj.image)
+
+    def get_thumbnailUrl(self, obj):
+        """썸네일 URL (없으면 원본 이미지 URL)"""
+        return self._file_url(obj.thumbnail) or self.get_imageUrl(obj)
+
+
+class ElectronicsListImageSerializer(ElectronicsImageSerializer):
+    """목록용 이미지 시리얼라이저 - imageUrl은 목록용 WebP 변형(없으면 원본)"""
+
+    def get_imageUrl(self, obj):
+        return self._file_url(obj.list_image) or super().get_imageUrl(obj)
+
 
 class SellerSerializer(serializers.ModelSerializer):
     """판매자 정보 시리얼라이저"""
@@ -45,7 +62,10 @@ class SellerSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'username', 'nickname']
 
     def get_sell_count(self, obj):
-        """판매 완료 수"""
+        """판매 완료 수 (목록에서는 페이지 단위로 미리 집계한 값 사용)"""
+        sell_counts = self.context.get('electronics_sell_counts')
+        if sell_counts is not None and obj.id in sell_counts:
+            return sell_counts[obj.id]
         return obj.used_electronics.filter(status='sold').count()
 
 
@@ -56,9 +76,23 @@ class RegionSerializer(serializers.ModelSerializer):
         fields = ['code', 'name', 'full_name', 'level']
 
 
+class ElectronicsListListSerializer(serializers.ListSerializer):
+    """페이지 전체를 한 번에 준비한 뒤 각 전자제품을 직렬화하는 ListSerializer"""
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.child.prepare_page(items)
+        return [self.child.to_representation(item) for item in items]
+
+
 class ElectronicsListSerializer(serializers.ModelSerializer):
-    """전자제품 목록 시리얼라이저"""
-    images = ElectronicsImageSerializer(many=True, read_only=True)
+    """
+    전자제품 목록 시리얼라이저
+
+    annotate_queryset()으로 준비된 쿼리셋이면 거래 정보/내 제안/후기 여부를 어노테이션에서 읽고,
+    찜 여부, 구매자, 판매 완료 수는 페이지 단위로 한 번에 조회합니다. (준비되지 않은 객체는 개별 조회)
+    """
+    images = ElectronicsListImageSerializer(many=True, read_only=True)
     seller = SellerSerializer(read_only=True)
     regions = serializers.SerializerMethodField()
     subcategory_display = serializers.CharField(source='get_subcategory_display', read_only=True)
@@ -74,6 +108,7 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UsedElectronics
+        list_serializer_class = ElectronicsListListSerializer
         fields = [
             'id', 'subcategory', 'subcategory_display', 'brand', 'model_name',
             'price', 'accept_offers', 'min_offer_price', 'condition_grade', 'condition_display',
@@ -84,6 +119,76 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
             'created_at', 'last_bumped_at', 'bump_count'
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._favorite_ids = None
+        self._buyers = None
+
+    @staticmethod
+    def annotate_queryset(queryset, user=None):
+        """
+        목록 필드에 필요한 값을 서브쿼리 어노테이션으로 추가
+
+        Args:
+            queryset: UsedElectronics 쿼리셋
+            user: 요청 사용자 (로그인 사용자면 내 제안/후기 작성 여부도 추가)
+        """
+        transactions = ElectronicsTransaction.objects.filter(electronics=OuterRef('pk')).order_by('-created_at')
+        active = transactions.filter(status__in=['in_progress', 'completed'])
+
+        queryset = queryset.annotate(
+            list_transaction_id=Subquery(active.values('id')[:1]),
+            list_buyer_id=Subquery(active.values('buyer_id')[:1]),
+            list_completed_transaction_id=Subquery(transactions.filter(status='completed').values('id')[:1]),
+            list_transaction_price=Subquery(transactions.values('final_price')[:1]),
+            list_accepted_offer_price=Subquery(
+                ElectronicsOffer.objects.filter(electronics=OuterRef('pk'), status='accepted')
+                .order_by('-created_at').values('offer_price')[:1]
+            ),
+        )
+        if user is not None and user.is_authenticated:
+            queryset = queryset.annotate(
+                list_has_my_offer=Exists(ElectronicsOffer.objects.filter(
+                    electronics=OuterRef('pk'), buyer=user, status='pending'
+                )),
+                list_has_review=Exists(UnifiedReview.objects.filter(
+                    item_type='electronics',
+                    transaction_id=OuterRef('list_completed_transaction_id'),
+                    reviewer=user
+                )),
+            )
+        return queryset
+
+    def prepare_page(self, items):
+        """페이지의 찜 여부, 구매자, 판매자/구매자 판매 완료 수를 한 번에 조회"""
+        request = self.context.get('request')
+        if request and request.user.is_authenticated and items:
+            self._favorite_ids = set(UnifiedFavorite.objects.filter(
+                user=request.user,
+                item_type='electronics',
+                item_id__in=[item.id for item in items]
+            ).values_list('item_id', flat=True))
+        else:
+            self._favorite_ids = set()
+
+        if not items or not hasattr(items[0], 'list_buyer_id'):
+            self._buyers = None
+            return
+
+        buyer_ids = {
+            item.list_buyer_id for item in items
+            if item.status in ['trading', 'sold'] and item.list_buyer_id
+        }
+        self._buyers = User.objects.in_bulk(buyer_ids) if buyer_ids else {}
+
+        user_ids = buyer_ids | {item.seller_id for item in items}
+        sell_counts = dict.fromkeys(user_ids, 0)
+        sell_counts.update(
+            UsedElectronics.objects.filter(seller_id__in=user_ids, status='sold').order_by()
+            .values('seller_id').annotate(count=Count('id')).values_list('seller_id', 'count')
+        )
+        self.context['electronics_sell_counts'] = sell_counts
+
     def get_regions(self, obj):
         """거래 지역 목록"""
         regions = []
@@ -99,6 +204,8 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
         """현재 사용자의 찜 여부"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            if self._favorite_ids is not None:
+                return obj.id in self._favorite_ids
             # 통합 찜 모델 사용
             return UnifiedFavorite.objects.filter(
                 user=request.user,
@@ -111,21 +218,25 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
         """내 상품 여부"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return obj.seller == request.user
+            return obj.seller_id == request.user.id
         return False
 
     def get_has_my_offer(self, obj):
         """내 제안 존재 여부"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            if hasattr(obj, 'list_has_my_offer'):
+                return obj.list_has_my_offer
             return obj.offers.filter(buyer=request.user, status='pending').exists()
         return False
 
     def get_buyer(self, obj):
         """구매자 정보"""
         if obj.status in ['trading', 'sold']:
+            if self._buyers is not None and hasattr(obj, 'list_buyer_id'):
+                buyer = self._buyers.get(obj.list_buyer_id)
+                return SellerSerializer(buyer, context=self.context).data if buyer else None
             # 거래 테이블에서 구매자 정보 조회
-            from used_electronics.models import ElectronicsTransaction
             transaction = ElectronicsTransaction.objects.filter(
                 electronics=obj,
                 status__in=['in_progress', 'completed']
@@ -136,13 +247,16 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
 
     def get_buyer_id(self, obj):
         """구매자 ID"""
+        if hasattr(obj, 'list_buyer_id'):
+            return obj.list_buyer_id if obj.status in ['trading', 'sold'] else None
         buyer = self.get_buyer(obj)
         return buyer['id'] if buyer else None
 
     def get_transaction_id(self, obj):
         """거래 ID"""
         if obj.status in ['trading', 'sold']:
-            from used_electronics.models import ElectronicsTransaction
+            if hasattr(obj, 'list_transaction_id'):
+                return obj.list_transaction_id
             transaction = ElectronicsTransaction.objects.filter(
                 electronics=obj,
                 status__in=['in_progress', 'completed']
@@ -153,8 +267,11 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
     def get_final_price(self, obj):
         """거래중 또는 거래완료된 경우 실제 거래 금액 반환"""
         if obj.status in ['trading', 'sold']:
+            if hasattr(obj, 'list_transaction_price'):
+                if obj.list_transaction_price is not None:
+                    return obj.list_transaction_price
+                return obj.list_accepted_offer_price
             # 거래 중인 경우 transaction에서 final_price 가져오기
-            from .models import ElectronicsTransaction
             transaction = ElectronicsTransaction.objects.filter(electronics=obj).first()
             if transaction:
                 return transaction.final_price
@@ -171,8 +288,8 @@ class ElectronicsListSerializer(serializers.ModelSerializer):
             return False
 
         if obj.status == 'sold':
-            from .models import ElectronicsTransaction
-            from api.models_unified_simple import UnifiedReview
+            if hasattr(obj, 'list_has_review'):
+                return obj.list_has_review
 
             transaction = ElectronicsTransaction.objects.filter(
                 electronics=obj,
@@ -423,13 +540,13 @@ class ElectronicsCreateUpdateSerializer(serializers.ModelSerializer):
             except Region.DoesNotExist:
                 continue
 
-        # 이미지 저장
-        for idx, image in enumerate(images_data):
+        # 이미지 저장 (WebP 변형 변환/업로드는 전체 이미지를 병렬로 처리)
+        for idx, image_fields in enumerate(ImagePipeline.create_kwargs(ElectronicsImage, images_data)):
             ElectronicsImage.objects.create(
                 electronics=electronics,
-                image=image,
                 is_primary=(idx == 0),
-                order=idx
+                order=idx,
+                **image_fields
             )
 
         return electronics
@@ -486,22 +603,22 @@ class ElectronicsCreateUpdateSerializer(serializers.ModelSerializer):
                 # 기존 이미지의 최대 order 값 찾기
                 max_order = instance.images.aggregate(max_order=models.Max('order'))['max_order'] or -1
 
-                for idx, image in enumerate(new_images_data):
+                for idx, image_fields in enumerate(ImagePipeline.create_kwargs(ElectronicsImage, new_images_data)):
                     ElectronicsImage.objects.create(
                         electronics=instance,
-                        image=image,
                         is_primary=(max_order == -1 and idx == 0),  # 기존 이미지가 없으면 첫 번째를 primary로
-                        order=max_order + idx + 1
+                        order=max_order + idx + 1,
+                        **image_fields
                     )
         elif images_data is not None:
             # 기존 방식 호환 (images 필드로 온 경우)
             instance.images.all().delete()
-            for idx, image in enumerate(images_data):
+            for idx, image_fields in enumerate(ImagePipeline.create_kwargs(ElectronicsImage, images_data)):
                 ElectronicsImage.objects.create(
                     electronics=instance,
-                    image=image,
                     is_primary=(idx == 0),
-                    order=idx
+                    order=idx,
+                    **image_fields
                 )
 
         # 나머지 필드 업데이트
@@ -6,13 +6,17 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
 from django.db.models import Q, Count, Exists, OuterRef
-from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
 from .models import (
     UsedElectronics, ElectronicsImage, ElectronicsOffer,
-    ElectronicsTransaction
+    ElectronicsTransaction, ElectronicsRegion
 )
+from api.pagination import BumpFeedPagination
+from api.services.region_index import RegionIndex
+from api.utils.unified_items import bulk_get_items
+from api.services.view_counter import ViewCounter
 from api.models_unified_simple import (
     UnifiedFavorite, UnifiedReview, UnifiedDeletePenalty,
     UnifiedReport, UnifiedPenalty
@@ -59,23 +63,21 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]  # OrderingFilter 제거 (get_queryset에서 직접 처리)
     search_fields = ['brand', 'model_name', 'description']
     # ordering은 get_queryset에서 직접 처리
+    pagination_class = BumpFeedPagination
 
     def get_queryset(self):
         """쿼리셋 반환 - UsedPhone과 동일한 로직 적용"""
         # list, retrieve, 조회 관련 액션은 sold 포함 (조회는 가능)
         if self.action in ['list', 'retrieve', 'my_offer', 'active_offers_count', 'offer_count', 'offers']:
-            # 디버깅 로그 추가
-            logger.info(f"[UsedElectronicsViewSet] Action: {self.action}")
-            logger.info(f"[UsedElectronicsViewSet] Including sold items in queryset")
+            logger.debug(f"[UsedElectronicsViewSet] Action: {self.action}")
 
-            queryset = UsedElectronics.objects.exclude(status='deleted').annotate(
-                effective_date=Coalesce('last_bumped_at', 'created_at')
-            )
+            queryset = UsedElectronics.objects.exclude(status='deleted')
 
-            # 쿼리셋 상태 확인
-            logger.info(f"[UsedElectronicsViewSet] Queryset count: {queryset.count()}")
-            sold_count = queryset.filter(status='sold').count()
-            logger.info(f"[UsedElectronicsViewSet] Sold items in queryset: {sold_count}")
+            # 쿼리셋 상태 확인 (COUNT 쿼리가 추가되므로 USED_GOODS_DEBUG_COUNTS 설정 시에만)
+            if getattr(settings, 'USED_GOODS_DEBUG_COUNTS', False):
+                logger.info(f"[UsedElectronicsViewSet] Queryset count: {queryset.count()}")
+                sold_count = queryset.filter(status='sold').count()
+                logger.info(f"[UsedElectronicsViewSet] Sold items in queryset: {sold_count}")
         else:
             # 다른 액션들(update, delete 등)은 active와 trading만 접근 가능
             queryset = UsedElectronics.objects.filter(
@@ -108,35 +110,14 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
         if condition:
             queryset = queryset.filter(condition_grade=condition)
 
-        # 지역 필터링 - UsedPhone과 동일한 방식 적용
+        # 지역 필터링 - UsedPhone과 동일한 방식 적용 (RegionIndex 이름 인덱스 + RegionClosure 조인)
         region = self.request.query_params.get('region', None)
         if region:
-            from api.models import Region
-            from django.db.models import Q
-
-            # 상위 지역(시/도)인지 확인
-            parent_region = Region.objects.filter(
-                name=region,
-                parent_id__isnull=True  # parent_id가 null이면 상위 지역
-            ).first()
-
-            if parent_region:
-                # 상위 지역인 경우: 해당 지역과 모든 하위 지역 포함
-                sub_regions = Region.objects.filter(parent_id=parent_region.pk)
-                region_codes = [parent_region.pk] + list(sub_regions.values_list('pk', flat=True))
-
-                queryset = queryset.filter(
-                    Q(regions__region__code__in=region_codes) |  # ElectronicsRegion을 통한 다중 지역
-                    Q(region__code__in=region_codes)  # 메인 region 필드
-                ).distinct()
+            region_codes = RegionIndex.top_level_codes(region) or RegionIndex.containing_codes(region)
+            if region_codes:
+                queryset = queryset.filter(RegionIndex.region_q(region_codes, ElectronicsRegion, 'electronics'))
             else:
-                # 하위 지역이거나 정확한 매칭
-                queryset = queryset.filter(
-                    Q(regions__region__name__icontains=region) |  # name으로 검색
-                    Q(regions__region__full_name__icontains=region) |  # full_name으로 검색
-                    Q(region__name__icontains=region) |  # 메인 region의 name
-                    Q(region__full_name__icontains=region)  # 메인 region의 full_name
-                ).distinct()
+                queryset = queryset.none()
 
         # include_completed 파라미터 처리 (거래완료 포함/제외)
         # retrieve 액션(상세조회)에서는 include_completed 파라미터 무시
@@ -154,20 +135,18 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
 
         # 끌올 기준 정렬 (list 액션인 경우)
         if self.action == 'list':
-            # annotate가 이미 되어있지 않으면 추가
-            if not hasattr(queryset, 'effective_date'):
-                queryset = queryset.annotate(
-                    effective_date=Coalesce('last_bumped_at', 'created_at')
-                )
-
             # ordering 파라미터 확인
             ordering_param = self.request.query_params.get('ordering')
             if ordering_param and ordering_param in ['price', '-price']:
                 # 가격 정렬이 명시적으로 요청된 경우 가격으로 정렬
                 queryset = queryset.order_by(ordering_param)
             else:
-                # 그 외의 경우 끌올 기준 정렬 (기본값)
-                queryset = queryset.order_by('-effective_date')
+                # 그 외의 경우 끌올 기준 정렬 (기본값, 커서 페이지네이션 가능)
+                queryset = queryset.order_by('-effective_date', '-id')
+
+        if self.action == 'list':
+            # 목록 필드(거래 정보, 내 제안, 후기 여부)는 행별 조회 대신 서브쿼리로 함께 조회
+            queryset = ElectronicsListSerializer.annotate_queryset(queryset, self.request.user)
 
         return queryset
 
@@ -213,10 +192,9 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
 
         # 조회수 증가 (본인 제외)
         if request.user != instance.seller:
-            from django.db.models import F
-            instance.view_count = F('view_count') + 1
-            instance.save(update_fields=['view_count'])
-            instance.refresh_from_db()
+            ViewCounter.record_view(instance)
+        else:
+            instance.view_count += ViewCounter.pending(instance)
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -287,9 +265,7 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
     def my_list(self, request):
         """내 상품 목록"""
         # my_list는 내 상품이므로 모든 status를 포함해야 함
-        queryset = UsedElectronics.objects.filter(seller=request.user).annotate(
-            effective_date=Coalesce('last_bumped_at', 'created_at')
-        )
+        queryset = UsedElectronics.objects.filter(seller=request.user)
 
         # 관련 데이터 미리 로드
         queryset = queryset.select_related('seller')
@@ -301,7 +277,8 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(status=status_filter)
 
         # 끌올 우선, 최신순으로 정렬
-        queryset = queryset.order_by('-effective_date')
+        queryset = queryset.order_by('-effective_date', '-id')
+        queryset = ElectronicsListSerializer.annotate_queryset(queryset, request.user)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -648,6 +625,10 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
             item_type='electronics'
         )
 
+        # 상품은 한 번에 조회 (판매자, 이미지, 지역 포함)
+        favorites = list(favorites)
+        bulk_get_items(favorites, exclude_status='deleted', prefetch_related=('images', 'regions__region'))
+
         # 찜 목록 데이터 구성
         result = []
         for favorite in favorites:
@@ -793,6 +774,9 @@ class UsedElectronicsViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(status=status_filter)
 
         queryset = queryset.order_by('-created_at')
+        queryset = ElectronicsListSerializer.annotate_queryset(
+            queryset.select_related('seller').prefetch_related('images', 'regions__region'), request.user
+        )
         page = self.paginate_queryset(queryset)
 
         if page is not None:
@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from datetime import timedelta
+from api.models import JobCheckpoint, UserTradeStats
+from used_phones.models import UsedPhone, UsedPhoneTransaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '거래중 상태에서 일정 기간(기본 14일) 경과한 중고폰 거래를 자동 완료 처리합니다'
+
+    CHECKPOINT_NAME = 'used_phones.auto_complete_trades'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=14,
+            help='자동 완료까지의 거래중 기간 (일)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 완료 처리할 거래 수'
+        )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='워터마크를 무시하고 전체 거래중 거래를 확인'
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        # 실행 중 새로 기준을 넘는 거래는 다음 실행에서 처리하도록 기준 시각을 고정
+        cutoff = now - timedelta(days=options['days'])
+        watermark = None if options['full'] else JobCheckpoint.get_position(self.CHECKPOINT_NAME)
+
+        expired = UsedPhoneTransaction.objects.filter(status='trading', created_at__lt=cutoff)
+        if watermark:
+            # 이전 실행 기준 시각 이전에 생성된 거래는 이미 모두 처리됨 (created_at은 변하지 않음)
+            expired = expired.filter(created_at__gte=watermark)
+
+        completed_count = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    expired.select_for_update()
+                    .order_by('created_at', 'id')
+                    .values_list('id', 'phone_id')[:options['batch_size']]
+                )
+                if not batch:
+                    break
+
+                transaction_ids = [transaction_id for transaction_id, _ in batch]
+                phone_ids = {phone_id for _, phone_id in batch}
+                completed_count += UsedPhoneTransaction.objects.filter(id__in=transaction_ids).update(
+                    status='completed',
+                    completed_at=now
+                )
+                UsedPhone.objects.filter(id__in=phone_ids).update(
+                    status='sold',
+                    sold_at=Coalesce(F('sold_at'), now)
+                )
+                # queryset.update()는 신호가 없으므로 판매자 거래 통계를 다시 집계
+                UserTradeStats.recompute(
+                    UsedPhone.objects.filter(id__in=phone_ids).values_list('seller_id', flat=True)
+                )
+
+        JobCheckpoint.set_position(self.CHECKPOINT_NAME, cutoff)
+
+        if completed_count:
+            logger.info(f"[자동 거래완료] {completed_count}건의 거래가 {options['days']}일 경과로 자동 완료 처리됨")
+        self.stdout.write(self.style.SUCCESS(f'자동 거래완료: {completed_count}건'))
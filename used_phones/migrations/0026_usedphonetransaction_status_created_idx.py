@@ -0,0 +1,17 @@
+# 14일 경과 거래 자동완료 스위퍼가 (status, created_at) 범위로 조회하도록 인덱스 추가
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('used_phones', '0025_usedphone_effective_date'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usedphonetransaction',
+            index=models.Index(fields=['status', 'created_at'], name='idx_usedphone_tx_status_ct'),
+        ),
+    ]
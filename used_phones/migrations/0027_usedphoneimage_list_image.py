@@ -0,0 +1,18 @@
+# 이미지 파이프라인의 목록용 WebP 변형 저장 필드
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('used_phones', '0026_usedphonetransaction_status_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usedphoneimage',
+            name='list_image',
+            field=models.ImageField(blank=True, null=True, upload_to='used_phones/list/%Y/%m/%d/', verbose_name='목록용 이미지'),
+        ),
+    ]
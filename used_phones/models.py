@@ -6,6 +6,10 @@ from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator, MinLengthValidator
 from api.models import Region
 from django.conf import settings
+from django.utils import timezone
+from api.utils.bump import sync_effective_date
+from api.services.image_pipeline import ImagePipeline
+from PIL import Image
 import logging
 
 User = get_user_model()
@@ -116,6 +120,7 @@ class UsedPhone(models.Model):
     # 끌올 관련 필드
     last_bumped_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 끌올')
     bump_count = models.PositiveIntegerField(default=0, verbose_name='끌올 횟수')
+    effective_date = models.DateTimeField(default=timezone.now, editable=False, verbose_name='목록 정렬 기준')  # 마지막 끌올 또는 등록 시각
 
     # 타임스탬프
     created_at = models.DateTimeField(auto_now_add=True)
@@ -127,10 +132,18 @@ class UsedPhone(models.Model):
         ordering = ['-created_at']
         verbose_name = '중고폰'
         verbose_name_plural = '중고폰'
+        indexes = [
+            # 끌올 목록 (status 필터 + effective_date, id 역순 커서 페이지네이션)
+            models.Index(fields=['status', '-effective_date', '-id'], name='idx_usedphone_feed'),
+        ]
     
     def __str__(self):
         return f"{self.model} - {self.seller.username}"
 
+    def save(self, *args, **kwargs):
+        sync_effective_date(self, kwargs)
+        super().save(*args, **kwargs)
+
 
 class UsedPhoneImage(models.Model):
     """중고폰 이미지"""
@@ -139,6 +152,7 @@ class UsedPhoneImage(models.Model):
     image_url = models.URLField(max_length=500, blank=True, verbose_name='이미지 URL')
     thumbnail = models.ImageField(upload_to='used_phones/thumbs/%Y/%m/%d/', null=True, blank=True, verbose_name='썸네일')
     thumbnail_url = models.URLField(max_length=500, blank=True, null=True, verbose_name='썸네일 URL')
+    list_image = models.ImageField(upload_to='used_phones/list/%Y/%m/%d/', null=True, blank=True, verbose_name='목록용 이미지')
     is_main = models.BooleanField(default=False, verbose_name='대표이미지')
     order = models.IntegerField(default=0, verbose_name='순서')
     width = models.IntegerField(null=True, blank=True, verbose_name='가로크기')
@@ -152,45 +166,39 @@ class UsedPhoneImage(models.Model):
         verbose_name = '중고폰 이미지'
         verbose_name_plural = '중고폰 이미지'
     
+    # ImagePipeline 변형별 저장 필드 (파일 필드, URL 필드)
+    IMAGE_VARIANT_FIELDS = {
+        'detail': ('image', 'image_url'),
+        'list': ('list_image', None),
+        'thumb': ('thumbnail', 'thumbnail_url'),
+    }
+
     def save(self, *args, **kwargs):
-        """S3 업로드 및 썸네일 생성"""
+        """새 업로드는 WebP 변형(상세/목록/썸네일)으로 변환해 병렬 업로드 후 한 번에 저장"""
+        original_upload = False
+        if self.image and not self.image._committed:
+            original_upload = not ImagePipeline.apply(self)
+            if original_upload:
+                self._set_original_metadata()
+        super().save(*args, **kwargs)
+
+        # 원본을 그대로 저장한 경우 업로드된 이름으로 URL 기록
+        if original_upload and getattr(settings, 'USE_S3', False):
+            self.image_url = self.image.url
+            super().save(update_fields=['image_url'])
+
+    def _set_original_metadata(self):
+        """변환 없이 원본을 저장할 때 크기/파일 크기 기록 (헤더만 읽고 전체 디코딩은 하지 않음)"""
+        upload = self.image.file
+        self.file_size = upload.size
         try:
-            # Django의 ImageField는 settings에 따라 자동으로 S3에 업로드됨
-            logger.info(f"UsedPhoneImage save: 이미지 처리 시작")
-            logger.info(f"USE_S3: {getattr(settings, 'USE_S3', False)}")
-            
-            if self.image:
-                # 이미지 메타데이터 저장
-                try:
-                    from PIL import Image
-                    img = Image.open(self.image)
-                    self.width, self.height = img.size
-                    logger.info(f"이미지 크기: {self.width}x{self.height}")
-                except Exception as e:
-                    logger.warning(f"이미지 메타데이터 추출 실패: {e}")
-                
-                # 파일 크기 저장
-                if hasattr(self.image, 'size'):
-                    self.file_size = self.image.size
-                    logger.info(f"파일 크기: {self.file_size} bytes")
-            
-            super().save(*args, **kwargs)
-            
-            # S3 사용 시 URL 업데이트
-            if settings.USE_S3 and self.image:
-                if hasattr(self.image, 'url'):
-                    self.image_url = self.image.url
-                    logger.info(f"이미지 URL: {self.image_url}")
-                    
-                    # URL만 업데이트 (무한 루프 방지)
-                    super().save(update_fields=['image_url'])
-                    
+            upload.seek(0)
+            with Image.open(upload) as img:
+                self.width, self.height = img.size
         except Exception as e:
-            logger.error(f"UsedPhoneImage save 오류: {e}")
-            # 오류가 있어도 저장은 완료
-            super().save(*args, **kwargs)
-
-
+            logger.warning(f"이미지 메타데이터 추출 실패: {e}")
+        finally:
+            upload.seek(0)
 
 
 class UsedPhoneOffer(models.Model):
@@ -319,6 +327,10 @@ class UsedPhoneTransaction(models.Model):
         ordering = ['-created_at']
         verbose_name = '중고폰 거래'
         verbose_name_plural = '중고폰 거래'
+        indexes = [
+            # 14일 경과 거래 자동완료 스위퍼 (auto_complete_used_phone_trades)
+            models.Index(fields=['status', 'created_at'], name='idx_usedphone_tx_status_ct'),
+        ]
 
     def complete_trade(self):
         """양방향 확인 시 거래 완료 처리"""
@@ -3,13 +3,17 @@ Used Phones Serializers
 """
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import models
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from .models import (
     UsedPhone, UsedPhoneImage, UsedPhoneOffer,
     UsedPhoneRegion, UsedPhoneTransaction,
     UsedPhoneReport, UsedPhonePenalty
 )
-from api.models import Region
+from api.models import Region, UserTradeStats
 from api.models_unified_simple import UnifiedFavorite, UnifiedReview
+from api.services.image_pipeline import ImagePipeline
 import logging
 
 User = get_user_model()
@@ -45,6 +49,15 @@ class UsedPhoneImageSerializer(serializers.ModelSerializer):
         return self.get_imageUrl(obj)
 
 
+class UsedPhoneListImageSerializer(UsedPhoneImageSerializer):
+    """목록용 이미지 시리얼라이저 - imageUrl은 목록용 WebP 변형(없으면 원본)"""
+
+    def get_imageUrl(self, obj):
+        if obj.list_image:
+            return obj.list_image.url
+        return super().get_imageUrl(obj)
+
+
 class SellerSerializer(serializers.ModelSerializer):
     """판매자 정보 시리얼라이저"""
     sell_count = serializers.SerializerMethodField()
@@ -57,14 +70,11 @@ class SellerSerializer(serializers.ModelSerializer):
     
     def get_sell_count(self, obj):
         """판매 완료 횟수"""
-        from .models import UsedPhone
-        return UsedPhone.objects.filter(seller=obj, status='sold').count()
+        return UserTradeStats.for_user(obj).phone_sold_count
     
     def get_buy_count(self, obj):
         """구매 완료 횟수 (수락된 제안)"""
-        from .models import UsedPhoneOffer
-        # 사용자가 제안했고 수락된 건수
-        return UsedPhoneOffer.objects.filter(buyer=obj, status='accepted').count()
+        return UserTradeStats.for_user(obj).phone_accepted_offer_count
     
     def get_total_trade_count(self, obj):
         """총 거래 횟수"""
@@ -73,9 +83,23 @@ class SellerSerializer(serializers.ModelSerializer):
         return sell_count + buy_count
 
 
+class UsedPhoneListListSerializer(serializers.ListSerializer):
+    """페이지 전체를 한 번에 준비한 뒤 각 중고폰을 직렬화하는 ListSerializer"""
+
+    def to_representation(self, data):
+        phones = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.child.prepare_page(phones)
+        return [self.child.to_representation(phone) for phone in phones]
+
+
 class UsedPhoneListSerializer(serializers.ModelSerializer):
-    """중고폰 목록 시리얼라이저"""
-    images = UsedPhoneImageSerializer(many=True, read_only=True)
+    """
+    중고폰 목록 시리얼라이저
+
+    annotate_queryset()으로 준비된 쿼리셋이면 제안 수/거래 정보/후기 여부를 어노테이션에서 읽고,
+    찜 여부는 페이지 단위로 한 번에 조회합니다. (준비되지 않은 객체는 개별 조회)
+    """
+    images = UsedPhoneListImageSerializer(many=True, read_only=True)
     is_favorite = serializers.SerializerMethodField()
     region_name = serializers.SerializerMethodField()
     regions = serializers.SerializerMethodField()
@@ -88,6 +112,7 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = UsedPhone
+        list_serializer_class = UsedPhoneListListSerializer
         fields = [
             'id', 'brand', 'model', 'storage', 'color', 'price', 'final_price', 'final_offer_price',
             'min_offer_price', 'accept_offers', 'condition_grade',
@@ -97,7 +122,62 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
             'has_earphones', 'meeting_place', 'is_modified', 'buyer', 'transaction_id', 'has_review',
             'last_bumped_at', 'bump_count'
         ]
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._favorite_ids = None
+
+    @staticmethod
+    def annotate_queryset(queryset, user=None):
+        """
+        목록 필드에 필요한 값을 서브쿼리 어노테이션으로 추가
+
+        Args:
+            queryset: UsedPhone 쿼리셋
+            user: 요청 사용자 (로그인 사용자면 후기 작성 여부도 추가)
+        """
+        offers = UsedPhoneOffer.objects.filter(phone=OuterRef('pk'))
+        transactions = UsedPhoneTransaction.objects.filter(phone=OuterRef('pk')).order_by('-created_at')
+        completed = transactions.filter(status='completed')
+
+        queryset = queryset.annotate(
+            list_offer_count=Coalesce(
+                Subquery(
+                    offers.filter(status__in=['pending', 'accepted']).order_by().values('phone')
+                    .annotate(count=Count('buyer', distinct=True)).values('count')
+                ),
+                0
+            ),
+            list_transaction_price=Subquery(transactions.values('final_price')[:1]),
+            list_accepted_offer_price=Subquery(
+                offers.filter(status='accepted').order_by('-created_at').values('offered_price')[:1]
+            ),
+            list_completed_transaction_id=Subquery(completed.values('id')[:1]),
+            list_buyer_id=Subquery(completed.values('buyer_id')[:1]),
+            list_buyer_nickname=Subquery(completed.values('buyer__nickname')[:1]),
+        )
+        if user is not None and user.is_authenticated:
+            queryset = queryset.annotate(
+                list_has_review=Exists(UnifiedReview.objects.filter(
+                    item_type='phone',
+                    transaction_id=OuterRef('list_completed_transaction_id'),
+                    reviewer=user
+                ))
+            )
+        return queryset
+
+    def prepare_page(self, phones):
+        """페이지의 찜 여부를 한 번에 조회"""
+        request = self.context.get('request')
+        if request and request.user.is_authenticated and phones:
+            self._favorite_ids = set(UnifiedFavorite.objects.filter(
+                user=request.user,
+                item_type='phone',
+                item_id__in=[phone.id for phone in phones]
+            ).values_list('item_id', flat=True))
+        else:
+            self._favorite_ids = set()
+
     def get_region_name(self, obj):
         """지역 이름 반환 - 안전하게 처리"""
         if hasattr(obj, 'region') and obj.region:
@@ -106,9 +186,9 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
     
     def get_regions(self, obj):
         """다중 지역 정보 반환"""
-        # prefetch_related를 사용하여 N+1 문제 해결
+        # prefetch_related(regions__region) 결과 사용 (N+1 방지)
         try:
-            phone_regions = obj.regions.select_related('region').all()
+            phone_regions = obj.regions.all()
             return [
                 {
                     'id': pr.id,
@@ -124,6 +204,8 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
     def get_is_favorite(self, obj):
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            if self._favorite_ids is not None:
+                return obj.id in self._favorite_ids
             # 통합 찜 모델 사용
             return UnifiedFavorite.objects.filter(
                 user=request.user,
@@ -135,8 +217,11 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
     def get_final_price(self, obj):
         """거래중 또는 거래완료된 경우 실제 거래 금액 반환"""
         if obj.status in ['trading', 'sold']:
+            if hasattr(obj, 'list_transaction_price'):
+                if obj.list_transaction_price is not None:
+                    return obj.list_transaction_price
+                return obj.list_accepted_offer_price
             # 거래 중인 경우 transaction에서 final_price 가져오기
-            from .models import UsedPhoneTransaction
             transaction = UsedPhoneTransaction.objects.filter(phone=obj).first()
             if transaction:
                 return transaction.final_price
@@ -152,7 +237,8 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
 
     def get_offer_count(self, obj):
         """전체 제안 수 계산 (취소된 제안 제외)"""
-        from .models import UsedPhoneOffer
+        if hasattr(obj, 'list_offer_count'):
+            return obj.list_offer_count
         return UsedPhoneOffer.objects.filter(
             phone=obj,
             status__in=['pending', 'accepted']
@@ -164,6 +250,11 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
             if obj.status != 'sold':
                 return None
 
+            if hasattr(obj, 'list_buyer_id'):
+                if obj.list_buyer_id is None:
+                    return None
+                return {'id': obj.list_buyer_id, 'nickname': obj.list_buyer_nickname}
+
             # prefetch된 transactions 사용
             transactions = obj.transactions.all() if hasattr(obj, 'transactions') else []
             for transaction in transactions:
@@ -174,7 +265,6 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
                     }
 
             # prefetch가 안된 경우 직접 쿼리 (fallback)
-            from .models import UsedPhoneTransaction
             transaction = UsedPhoneTransaction.objects.filter(
                 phone=obj,
                 status='completed'
@@ -192,7 +282,8 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
         """거래 완료된 경우 거래 ID 반환"""
         try:
             if obj.status == 'sold':
-                from .models import UsedPhoneTransaction
+                if hasattr(obj, 'list_completed_transaction_id'):
+                    return obj.list_completed_transaction_id
                 transaction = UsedPhoneTransaction.objects.filter(
                     phone=obj,
                     status='completed'
@@ -215,8 +306,10 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
             if obj.status != 'sold':
                 return False
 
+            if hasattr(obj, 'list_has_review'):
+                return obj.list_has_review
+
             # 거래 ID 가져오기
-            from .models import UsedPhoneTransaction
             transaction = UsedPhoneTransaction.objects.filter(
                 phone=obj,
                 status='completed'
@@ -225,16 +318,7 @@ class UsedPhoneListSerializer(serializers.ModelSerializer):
             if not transaction:
                 return False
 
-            # 현재 사용자가 이 거래에 대해 리뷰를 작성했는지 확인
-            # 판매자인 경우
-            if obj.seller == request.user:
-                return UnifiedReview.objects.filter(
-                    item_type='phone',
-                    transaction_id=transaction.id,
-                    reviewer=request.user
-                ).exists()
-
-            # 구매자인 경우
+            # 현재 사용자(판매자 또는 구매자)가 이 거래에 대해 리뷰를 작성했는지 확인
             return UnifiedReview.objects.filter(
                 item_type='phone',
                 transaction_id=transaction.id,
@@ -530,14 +614,14 @@ class UsedPhoneCreateSerializer(serializers.ModelSerializer):
             logger.error(f"Failed to create UsedPhone: {e}")
             raise
         
-        # 이미지 처리
-        for index, image in enumerate(images_data):
+        # 이미지 처리 (WebP 변형 변환/업로드는 전체 이미지를 병렬로 처리)
+        for index, image_fields in enumerate(ImagePipeline.create_kwargs(UsedPhoneImage, images_data)):
             try:
                 phone_image = UsedPhoneImage.objects.create(
                     phone=phone,
-                    image=image,
                     is_main=(index == 0),  # 첫 번째 이미지를 대표 이미지로 설정
-                    order=index
+                    order=index,
+                    **image_fields
                 )
                 
                 # 로깅
@@ -825,18 +909,12 @@ class UserRatingSerializer(serializers.ModelSerializer):
         ]
 
     def get_average_rating(self, obj):
-        """평균 평점 계산 - UnifiedReview 사용"""
-        from django.db.models import Avg
-        from api.models_unified_simple import UnifiedReview
-
-        # unified_reviews_received 관계 사용
-        avg = obj.unified_reviews_received.aggregate(avg_rating=Avg('rating'))['avg_rating']
-        return round(avg, 1) if avg else None
+        """평균 평점 - 받은 UnifiedReview 기준 (거래 통계 행에서 조회)"""
+        return UserTradeStats.for_user(obj).review_average
 
     def get_total_reviews(self, obj):
-        """총 리뷰 개수 - UnifiedReview 사용"""
-        from api.models_unified_simple import UnifiedReview
-        return obj.unified_reviews_received.count()
+        """총 리뷰 개수 - 받은 UnifiedReview 기준 (거래 통계 행에서 조회)"""
+        return UserTradeStats.for_user(obj).review_count
 
     def get_recent_reviews(self, obj):
         """최근 리뷰 3개 - UnifiedReview 사용"""
@@ -7,8 +7,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, F, Avg, Count
-from django.db.models.functions import Coalesce
+from django.db.models import Q, Avg, Count
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 from django_filters.rest_framework import DjangoFilterBackend
@@ -18,6 +18,12 @@ from .models import (
     UsedPhoneTransaction, TradeCancellation,
     UsedPhoneReport, UsedPhonePenalty, UsedPhoneRegion
 )
+from api.pagination import BumpFeedPagination
+from api.services.region_index import RegionIndex
+from api.utils.unified_items import bulk_get_items
+from api.services.image_pipeline import ImagePipeline
+from api.services.view_counter import ViewCounter
+from api.models_user_stats import UserTradeStats
 from api.models_unified_simple import (
     UnifiedFavorite, UnifiedReview, UnifiedDeletePenalty,
     UnifiedReport, UnifiedPenalty
@@ -71,6 +77,7 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
     filterset_fields = ['brand', 'condition_grade', 'accept_offers']
     search_fields = ['model', 'description', 'brand']
     # ordering은 get_queryset에서 직접 처리
+    pagination_class = BumpFeedPagination
 
     def get_serializer_context(self):
         """Serializer context에 request 포함"""
@@ -78,54 +85,24 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
         context['request'] = self.request
         return context
 
-    def _auto_complete_expired_trades(self):
-        """거래중 상태에서 14일 경과한 거래를 자동으로 완료 처리"""
-        expiry_date = timezone.now() - timedelta(days=14)
-
-        # 14일 경과한 거래중 상태의 Transaction 조회
-        expired_transactions = UsedPhoneTransaction.objects.filter(
-            status='trading',
-            created_at__lt=expiry_date
-        ).select_related('phone')
-
-        if expired_transactions.exists():
-            # 관련 UsedPhone 상태도 함께 업데이트
-            phone_ids = list(expired_transactions.values_list('phone_id', flat=True))
-
-            # Transaction 상태 업데이트
-            updated_count = expired_transactions.update(
-                status='completed',
-                completed_at=timezone.now()
-            )
-
-            # UsedPhone 상태 업데이트
-            UsedPhone.objects.filter(id__in=phone_ids).update(status='sold')
-
-            logger.info(f"[자동 거래완료] {updated_count}건의 거래가 14일 경과로 자동 완료 처리됨")
-
     def get_queryset(self):
         """지역 필터링 추가"""
-        # 거래중 14일 경과 시 자동 완료 처리
-        self._auto_complete_expired_trades()
-
+        # 거래중 14일 경과 자동 완료는 auto_complete_used_phone_trades 커맨드(cron)에서 처리
         # list, retrieve, 조회 관련 액션은 sold 포함 (조회는 가능)
         if self.action in ['list', 'retrieve', 'my_offer', 'active_offers_count', 'offer_count', 'offers']:
-            # 디버깅 로그 추가
-            logger.info(f"[UsedPhoneViewSet] Action: {self.action}")
-            logger.info(f"[UsedPhoneViewSet] Including sold items in queryset")
+            logger.debug(f"[UsedPhoneViewSet] Action: {self.action}")
 
-            queryset = UsedPhone.objects.exclude(status='deleted').annotate(
-                effective_date=Coalesce('last_bumped_at', 'created_at')
-            ).prefetch_related(
+            queryset = UsedPhone.objects.exclude(status='deleted').prefetch_related(
                 'regions__region',
                 'images',
                 'transactions'
             ).select_related('seller', 'region')
 
-            # 쿼리셋 상태 확인
-            logger.info(f"[UsedPhoneViewSet] Queryset count: {queryset.count()}")
-            sold_count = queryset.filter(status='sold').count()
-            logger.info(f"[UsedPhoneViewSet] Sold items in queryset: {sold_count}")
+            # 쿼리셋 상태 확인 (COUNT 쿼리가 추가되므로 USED_GOODS_DEBUG_COUNTS 설정 시에만)
+            if getattr(settings, 'USED_GOODS_DEBUG_COUNTS', False):
+                logger.info(f"[UsedPhoneViewSet] Queryset count: {queryset.count()}")
+                sold_count = queryset.filter(status='sold').count()
+                logger.info(f"[UsedPhoneViewSet] Sold items in queryset: {sold_count}")
         else:
             # 다른 액션들(update, delete 등)은 active와 trading만 접근 가능
             queryset = UsedPhone.objects.filter(
@@ -139,33 +116,14 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
         # 지역 필터링
         region = self.request.query_params.get('region')
         if region:
-            # 상위 지역(시/도)인 경우 하위 지역도 포함
-            from api.models import Region
-            
-            # 입력된 지역이 상위 지역인지 확인
-            parent_region = Region.objects.filter(
-                name=region,
-                parent_id__isnull=True  # parent_id가 null이면 상위 지역
-            ).first()
-            
-            if parent_region:
-                # 상위 지역인 경우: 해당 지역과 모든 하위 지역 포함
-                sub_regions = Region.objects.filter(parent_id=parent_region.pk)
-                region_ids = [parent_region.pk] + list(sub_regions.values_list('pk', flat=True))
-                
-                queryset = queryset.filter(
-                    Q(regions__region_id__in=region_ids) |  # UsedPhoneRegion을 통한 다중 지역
-                    Q(region_id__in=region_ids)  # 메인 region 필드
-                ).distinct()
+            # 상위 지역(시/도)이면 모든 하위 지역, 아니면 name/full_name에 검색어가 포함된 지역과 그 하위 지역
+            # ("서울특별시 성동구" 형태는 full_name으로 매칭)
+            # 이름 → 코드는 프로세스 내 인덱스로 찾고 하위 지역은 RegionClosure 조인으로 처리 (요청마다 Region 조회 없음)
+            region_codes = RegionIndex.top_level_codes(region) or RegionIndex.containing_codes(region)
+            if region_codes:
+                queryset = queryset.filter(RegionIndex.region_q(region_codes, UsedPhoneRegion, 'used_phone'))
             else:
-                # 하위 지역이거나 정확한 매칭
-                # "서울특별시 성동구" 형태로 검색하는 경우 full_name으로도 검색
-                queryset = queryset.filter(
-                    Q(regions__region__name__icontains=region) |  # name으로 검색
-                    Q(regions__region__full_name__icontains=region) |  # full_name으로 검색
-                    Q(region__name__icontains=region) |  # 메인 region의 name
-                    Q(region__full_name__icontains=region)  # 메인 region의 full_name
-                ).distinct()
+                queryset = queryset.none()
         
         # manufacturer 파라미터를 brand로 매핑
         manufacturer = self.request.query_params.get('manufacturer')
@@ -211,13 +169,11 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
                 # 가격 정렬이 명시적으로 요청된 경우 가격으로 정렬
                 queryset = queryset.order_by(ordering_param)
             else:
-                # 그 외의 경우 끌올 기준 정렬 (기본값)
-                # annotate가 이미 되어있지 않으면 추가
-                if not queryset.query.annotations.get('effective_date'):
-                    queryset = queryset.annotate(
-                        effective_date=Coalesce('last_bumped_at', 'created_at')
-                    )
-                queryset = queryset.order_by('-effective_date')
+                # 그 외의 경우 끌올 기준 정렬 (기본값, 커서 페이지네이션 가능)
+                queryset = queryset.order_by('-effective_date', '-id')
+
+            # 목록 필드(제안 수, 거래 정보, 후기 여부)는 행별 조회 대신 서브쿼리로 함께 조회
+            queryset = UsedPhoneListSerializer.annotate_queryset(queryset, self.request.user)
 
         return queryset
     
@@ -380,16 +336,12 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
                 'images',
                 'offers__buyer',
                 'transactions__buyer'
-            ).select_related('seller', 'region'),
+            ).select_related('seller', 'seller__trade_stats', 'region'),
             pk=kwargs.get('pk')
         )
 
-        # 조회수 증가
-        instance.view_count = F('view_count') + 1
-        instance.save(update_fields=['view_count'])
-
-        # F() expression 사용 후 객체 다시 로드
-        instance.refresh_from_db()
+        # 조회수 증가 (캐시에 모았다가 flush_view_counts에서 일괄 반영)
+        ViewCounter.record_view(instance)
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -702,14 +654,13 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
         
         queryset = UsedPhone.objects.filter(
             seller=request.user
-        ).exclude(status='deleted').annotate(
-            effective_date=Coalesce('last_bumped_at', 'created_at')
-        ).prefetch_related('images', 'offers', 'transactions').select_related('region')
+        ).exclude(status='deleted').prefetch_related('images', 'regions__region').select_related('region')
 
         if status_filter:
             queryset = queryset.filter(status=status_filter)
 
-        queryset = queryset.order_by('-effective_date')
+        queryset = queryset.order_by('-effective_date', '-id')
+        queryset = UsedPhoneListSerializer.annotate_queryset(queryset, request.user)
         
         # 페이지네이션 적용
         page = self.paginate_queryset(queryset)
@@ -777,7 +728,9 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
             )
             
             # 모든 제안을 취소 상태로 변경
+            buyer_ids = list(instance.offers.values_list('buyer_id', flat=True))
             instance.offers.update(status='cancelled')
+            UserTradeStats.recompute(buyer_ids + [instance.seller_id])
         
         # 상태를 deleted로 변경 (실제 삭제하지 않음)
         instance.status = 'deleted'
@@ -809,13 +762,13 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
                 logger.info(f"[이미지 수정] {deleted_count}개 기존 이미지 삭제")
 
                 images_data = self.request.FILES.getlist('images')
-                for index, image in enumerate(images_data):
+                for index, image_fields in enumerate(ImagePipeline.create_kwargs(UsedPhoneImage, images_data)):
                     try:
                         UsedPhoneImage.objects.create(
                             phone=instance,
-                            image=image,
                             is_main=(index == 0),
-                            order=index
+                            order=index,
+                            **image_fields
                         )
                     except Exception as e:
                         logger.error(f"[이미지 수정] 이미지 저장 실패: {e}")
@@ -839,13 +792,13 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
 
                 # 새 이미지 추가
                 existing_count = len(existing_image_ids) if existing_image_ids else 0
-                for index, image in enumerate(new_images):
+                for index, image_fields in enumerate(ImagePipeline.create_kwargs(UsedPhoneImage, new_images)):
                     try:
                         UsedPhoneImage.objects.create(
                             phone=instance,
-                            image=image,
                             is_main=(existing_count == 0 and index == 0),  # 기존 이미지가 없고 첫 번째면 대표
-                            order=existing_count + index  # 기존 이미지 다음 순서
+                            order=existing_count + index,  # 기존 이미지 다음 순서
+                            **image_fields
                         )
                         logger.info(f"[이미지 수정] 새 이미지 추가 {index + 1}/{len(new_images)}")
                     except Exception as e:
@@ -1437,10 +1390,13 @@ class UsedPhoneViewSet(viewsets.ModelViewSet):
                 phone.save(update_fields=['status'])
 
                 # 모든 제안을 취소 상태로 변경
-                UsedPhoneOffer.objects.filter(
+                open_offers = UsedPhoneOffer.objects.filter(
                     phone=phone,
                     status__in=['pending', 'accepted']
-                ).update(status='cancelled')
+                )
+                buyer_ids = list(open_offers.values_list('buyer_id', flat=True))
+                open_offers.update(status='cancelled')
+                UserTradeStats.recompute(buyer_ids)
 
                 message = '거래가 취소되고 상품이 삭제되었습니다.'
 
@@ -1960,12 +1916,17 @@ class UsedPhoneFavoriteViewSet(viewsets.ModelViewSet):
         """찜 목록 조회 (MyPage용)"""
         queryset = self.get_queryset()
 
+        # 상품은 한 번에 조회 (판매자, 이미지 포함)
+        favorites = list(queryset)
+        bulk_get_items(favorites, exclude_status='deleted')
+
         # 찜 데이터 직렬화
         favorites_data = []
-        for favorite in queryset:
+        for favorite in favorites:
             phone = favorite.get_item()
             if phone:
-                main_image = phone.images.filter(is_main=True).first() or phone.images.first()
+                images = list(phone.images.all())
+                main_image = next((image for image in images if image.is_main), images[0] if images else None)
 
                 favorites_data.append({
                     'id': favorite.id,